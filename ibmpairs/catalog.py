@@ -9,8 +9,15 @@ SPDX-License-Identifier: BSD-3-Clause
 
 # fold: Import Python Standard Library {{{
 # Python Standard Library:
+import hashlib
+import asyncio
+import bisect
 import json
 import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
 from typing import List, Any
 import re
 #}}}
@@ -33,6 +40,203 @@ except:
 from tableschema import Table
 #}}}
 
+#
+class _CatalogIndex:
+    
+    """
+    A lazily built hash index of the positions of the elements of a catalog list by 
+    an attribute. The index is rebuilt when the list is replaced or any of its elements 
+    is added, removed or replaced (the identities of the elements are compared), and when 
+    a lookup does not match (e.g. after an element was renamed in place).
+    
+    :param attribute: The attribute of the elements to index.
+    :type attribute:  str
+    :param warning:   A warning message to log once per build for each element without a value.
+    :type warning:    str
+    """
+    
+    #
+    def __init__(self,
+                 attribute: str,
+                 warning: str = None
+                ):
+        self._attribute = attribute
+        self._warning   = warning
+        self._items       = None
+        self._fingerprint = None
+        self._positions   = None
+    
+    #
+    def _build(self, items):
+        
+        positions = {}
+        
+        for position, item in enumerate(items):
+            value = getattr(item, self._attribute)
+            if value is not None:
+                positions.setdefault(str(value), []).append(position)
+            elif self._warning is not None:
+                logger.warning(self._warning)
+        
+        self._items       = items
+        self._fingerprint = tuple(map(id, items))
+        self._positions   = positions
+    
+    #
+    def positions(self, items, value):
+        
+        """
+        A method to get the positions of the elements with an attribute value.
+        
+        :param items: The list of elements.
+        :type items:  list
+        :param value: The attribute value to look up.
+        :type value:  str
+        :returns:     The positions of all matching elements.
+        :rtype:       List[int]
+        """
+        
+        if (self._positions is None) or (self._items is not items) or (self._fingerprint != tuple(map(id, items))):
+            self._build(items)
+            return self._positions.get(value, [])
+        
+        positions = self._positions.get(value, [])
+        
+        if (len(positions) == 0) or any(str(getattr(items[p], self._attribute)) != value for p in positions):
+            self._build(items)
+            positions = self._positions.get(value, [])
+        
+        return positions
+
+#
+def _catalog_data_frame(records: List[dict],
+                        columns: List[str],
+                        sort_by: str = None
+                       ):
+    
+    """
+    Builds a catalog pandas.DataFrame in a single pass from a list of records.
+    
+    :param records: A list of dictionaries (e.g. from to_dict() or the parsed json).
+    :type records:  List[dict]
+    :param columns: The columns to be returned in the pandas.DataFrame object.
+    :type columns:  List[str]
+    :param sort_by: A sort_by column.
+    :type sort_by:  str
+    :returns:       A pandas.DataFrame of the records.
+    :rtype:         pandas.DataFrame
+    """
+    
+    display_df = pd.DataFrame.from_records([{column: record[column] for column in columns if column in record} for record in records],
+                                           columns = columns
+                                          )
+    
+    if (sort_by is not None) and (sort_by in display_df.columns):
+        try:
+            display_df = display_df.sort_values(by = [sort_by], kind = 'stable')
+        except TypeError:
+            # mixed types, e.g. int and str ids
+            display_df = display_df.sort_values(by = [sort_by], kind = 'stable', key = lambda c: c.astype(str))
+    
+    display_df.reset_index(inplace=True, drop=True)
+    
+    return display_df
+
+# the merged catalog columns searched by Search.data_sets and Search.data_layers and their ranking weights
+_SEARCH_DATA_SET_FIELDS   = {'data_set_name': 3.0, 'data_set_description_short': 2.0, 'data_set_description_long': 1.0}
+_SEARCH_DATA_LAYER_FIELDS = {'data_layer_name': 3.0, 'data_layer_description_short': 2.0, 'data_layer_description_long': 1.0, 
+                             'data_layer_unit': 1.0, 'data_set_name': 1.0}
+_SEARCH_TOKEN_RE          = re.compile(r'\w+')
+
+#
+class _SearchIndex:
+    
+    """
+    An inverted token index over the text columns of a catalog pandas.DataFrame. Search 
+    terms are matched against whole tokens and token prefixes, rows have to match all 
+    terms and are ranked by the weights of the columns the terms were found in.
+    
+    :param frame:  The catalog to index.
+    :type frame:   pandas.DataFrame
+    :param fields: The columns to index and their ranking weights.
+    :type fields:  dict
+    """
+    
+    #
+    def __init__(self,
+                 frame: pd.DataFrame,
+                 fields: dict
+                ):
+        
+        postings = {}
+        texts    = [[] for _ in range(len(frame))]
+        
+        for column, weight in fields.items():
+            if column not in frame.columns:
+                continue
+            for row, text in enumerate(frame[column].tolist()):
+                if not isinstance(text, str) or (text == ''):
+                    continue
+                text = text.lower()
+                texts[row].append(text)
+                for token in set(_SEARCH_TOKEN_RE.findall(text)):
+                    row_weights = postings.setdefault(token, {})
+                    if row_weights.get(row, 0.0) < weight:
+                        row_weights[row] = weight
+        
+        self._postings = postings
+        self._tokens   = sorted(postings)
+        self._texts    = ['\n'.join(t) for t in texts]
+    
+    #
+    def _term_scores(self, term):
+        
+        scores = {}
+        
+        for i in range(bisect.bisect_left(self._tokens, term), len(self._tokens)):
+            token = self._tokens[i]
+            if not token.startswith(term):
+                break
+            # whole token matches rank above prefix matches
+            factor = 1.0 if token == term else 0.5
+            for row, weight in self._postings[token].items():
+                if scores.get(row, 0.0) < weight * factor:
+                    scores[row] = weight * factor
+        
+        return scores
+    
+    #
+    def search(self, search_term):
+        
+        """
+        A method to search the index.
+        
+        :param search_term: One or more search terms, the last may be incomplete.
+        :type search_term:  str
+        :returns:           The positions of the matching rows, best match first.
+        :rtype:             List[int]
+        """
+        
+        scores = None
+        
+        for term in _SEARCH_TOKEN_RE.findall(search_term.lower()):
+            term_scores = self._term_scores(term)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {row: scores[row] + score for row, score in term_scores.items() if row in scores}
+            if len(scores) == 0:
+                break
+        
+        if not scores:
+            # fall back to a literal substring match, e.g. for terms within words or punctuation
+            needle = search_term.strip().lower()
+            if needle == '':
+                return []
+            return [row for row, text in enumerate(self._texts) if needle in text]
+        
+        return sorted(scores, key = lambda row: (-scores[row], row))
+
 #
 class Category:
     #_id: int
@@ -170,7 +374,7 @@ class Category:
         if isinstance(category_json, dict):
             category = Category.from_dict(category_json)
         elif isinstance(category_json, str):
-            category_dict = json.loads(category_json)
+            category_dict = common.json_loads(category_json)
             category = Category.from_dict(category_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(category), "category")
@@ -423,7 +627,7 @@ class Properties:
         if isinstance(properties_json, dict):
             properties = Properties.from_dict(properties_json)
         elif isinstance(properties_json, str):
-            properties_dict = json.loads(properties_json)
+            properties_dict = common.json_loads(properties_json)
             properties = Properties.from_dict(properties_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(properties), "properties")
@@ -554,7 +758,7 @@ class SpatialCoverage:
         if isinstance(spatial_coverage_json, dict):
             spatial_coverage = SpatialCoverage.from_dict(spatial_coverage_json)
         elif isinstance(spatial_coverage_json, str):
-            spatial_coverage_dict = json.loads(spatial_coverage_json)
+            spatial_coverage_dict = common.json_loads(spatial_coverage_json)
             spatial_coverage = SpatialCoverage.from_dict(spatial_coverage_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(spatial_coverage), "spatial_coverage")
@@ -740,7 +944,7 @@ class DataSetReturn:
         if isinstance(data_set_return_json, dict):
             data_set_return = DataSetReturn.from_dict(data_set_return_json)
         elif isinstance(data_set_return_json, str):
-            data_set_return_dict = json.loads(data_set_return_json)
+            data_set_return_dict = common.json_loads(data_set_return_json)
             data_set_return = DataSetReturn.from_dict(data_set_return_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(data_set_return_json), "data_set_return_json")
@@ -2495,7 +2699,7 @@ class DataSet:
         if isinstance(data_set_json, dict):
             data_set = DataSet.from_dict(data_set_json)
         elif isinstance(data_set_json, str):
-            data_set_dict = json.loads(data_set_json)
+            data_set_dict = common.json_loads(data_set_json)
             data_set = DataSet.from_dict(data_set_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(data_set_json), "data_set_json")
@@ -2610,7 +2814,7 @@ class DataSet:
             logger.error(msg)
             raise common.PAWException(msg)
         else:
-            data_set_get = DataSet.from_dict(response.json())
+            data_set_get = DataSet.from_dict(common.response_json(response))
             return data_set_get
 
     #
@@ -2654,7 +2858,7 @@ class DataSet:
                 
             if response.json is not None:
                 try:
-                    self._data_set_response = data_set_return_from_dict(response.json())
+                    self._data_set_response = data_set_return_from_dict(common.response_json(response))
                     error_message = self._data_set_response.message
                 except:
                     msg = messages.INFO_CATALOG_RESPOSE_NOT_SUCCESSFUL_NO_ERROR_MESSAGE
@@ -2664,7 +2868,7 @@ class DataSet:
             logger.error(msg)
             raise common.PAWException(msg)
         else:
-            self._data_set_response = data_set_return_from_dict(response.json())
+            self._data_set_response = data_set_return_from_dict(common.response_json(response))
             self._id = self._data_set_response.data_set_id
 
             msg = messages.INFO_CATALOG_DATA_SET_CREATE_SUCCESS.format(str(self._data_set_response.data_set_id))
@@ -2724,7 +2928,7 @@ class DataSet:
             
             if response.json is not None:                
                 try:
-                    self._data_set_response = data_set_return_from_dict(response.json())
+                    self._data_set_response = data_set_return_from_dict(common.response_json(response))
                     error_message = self._data_set_response.message
                 except:
                     msg = messages.INFO_CATALOG_RESPOSE_NOT_SUCCESSFUL_NO_ERROR_MESSAGE
@@ -2735,7 +2939,7 @@ class DataSet:
             logger.error(msg)
             raise common.PAWException(msg)
         else:
-            self._data_set_response = data_set_return_from_dict(response.json())
+            self._data_set_response = data_set_return_from_dict(common.response_json(response))
 
             msg = messages.INFO_CATALOG_DATA_SET_UPDATE_SUCCESS.format(str(self._data_set_response.data_set_id))
             logger.info(msg)
@@ -2785,9 +2989,11 @@ class DataSet:
         if response.status_code != 200:
             error_message = 'failed'
           
-            if response.json() is not None:
+            response_dict = common.response_json(response)
+            
+            if response_dict is not None:
                 try:
-                    self._data_set_response = data_set_return_from_dict(response.json())
+                    self._data_set_response = data_set_return_from_dict(response_dict)
                     error_message = self._data_set_response.message
                 except:
                     msg = messages.INFO_CATALOG_RESPOSE_NOT_SUCCESSFUL_NO_ERROR_MESSAGE
@@ -2798,7 +3004,7 @@ class DataSet:
             logger.error(msg)
             raise common.PAWException(msg)
         else:
-            self._data_set_response = data_set_return_from_dict(response.json())
+            self._data_set_response = data_set_return_from_dict(common.response_json(response))
 
             msg = messages.INFO_CATALOG_DATA_SET_DELETE_SUCCESS.format(str(self._data_set_response.data_set_id))
             logger.info(msg)
@@ -2866,20 +3072,8 @@ class DataSets:
         if isinstance(data_set_name, int):
             return self._data_sets[data_set_name]
         elif isinstance(data_set_name, str):
-            index_list = []
-            index      = 0
-            foundCount = 0
-
-            for data_set in self._data_sets:
-                if data_set.name is not None:
-                    if (data_set.name == data_set_name):
-                        foundCount = foundCount + 1
-                        index_list.append(index)
-                else:
-                    msg = messages.WARN_CATALOG_DATA_SETS_DATA_SET_OBJECT_NO_NAME.format(data_set_name)
-                    logger.warning(msg)
-                  
-                index = index + 1
+            index_list = self._name_index.positions(self._data_sets, data_set_name)
+            foundCount = len(index_list)
 
             if foundCount == 0:
                 msg = messages.ERROR_CATALOG_DATA_SETS_NO_DATA_SET.format(data_set_name)
@@ -2897,14 +3091,43 @@ class DataSets:
             raise common.PAWException(msg)
       
         
+    #
+    def get_by_id(self, id):
+      
+        """
+        A method to get an element of the data_sets attribute by its id.
+        
+        :param id:         The id of the element to search for.
+        :type id:          int or str
+        :returns:          The element with the id.
+        :raises Exception: If less than one value is found, 
+                           if more than one value is found.
+        """
+        
+        index_list = self._id_index.positions(self._data_sets, str(id))
+        
+        if len(index_list) == 0:
+            msg = messages.ERROR_CATALOG_ID_NOT_FOUND.format('data_sets', id)
+            logger.error(msg)
+            raise common.PAWException(msg)
+        elif len(index_list) > 1:
+            msg = messages.ERROR_CATALOG_ID_MULTIPLE.format('data_sets', id)
+            logger.error(msg)
+            raise common.PAWException(msg)
+        
+        return self._data_sets[index_list[0]]
+
     #
     def __init__(self,
                  client: cl.Client        = None,
                  data_sets: List[DataSet] = None
                 ):
-        self._client    = common.set_client(input_client  = client,
-                                            global_client = cl.GLOBAL_PAIRS_CLIENT)
-        self._data_sets = data_sets
+        self._client        = common.set_client(input_client  = client,
+                                                global_client = cl.GLOBAL_PAIRS_CLIENT)
+        self._data_sets     = data_sets
+        self._name_index    = _CatalogIndex('name', messages.WARN_CATALOG_DATA_SETS_DATA_SET_OBJECT_NO_NAME)
+        self._id_index      = _CatalogIndex('id')
+        self._display_cache = None
     
     #
     def get_client(self):
@@ -2993,7 +3216,7 @@ class DataSets:
         if isinstance(data_sets_json, dict):
             data_sets = DataSets.from_dict(data_sets_json)
         elif isinstance(data_sets_json, str):
-            data_sets_dict = json.loads(data_sets_json)
+            data_sets_dict = common.json_loads(data_sets_json)
             data_sets = DataSets.from_dict(data_sets_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(data_sets_json), "data_sets_json")
@@ -3015,31 +3238,34 @@ class DataSets:
     #
     def display(self,
                 columns: List[str] = ['id', 'name', 'description_short', 'description_long'],
-                sort_by: str       = 'id'
+                sort_by: str       = 'id',
+                refresh: bool      = False
                ):
         
         """
-        A method to return a pandas.DataFrame object of get results.
+        A method to return a pandas.DataFrame object of get results. The result is cached 
+        until the data_sets list is replaced or changes its length.
         
         :param columns: The columns to be returned in the pandas.DataFrame object, defaults to ['id', 'name', 'description_short', 'description_long']
         :type columns:  List[str]
+        :param sort_by: A sort_by column
+        :type sort_by:  str
+        :param refresh: Rebuild the pandas.DataFrame, e.g. after Data Sets were changed in place.
+        :type refresh:  bool
         :returns:       A pandas.DataFrame of attributes from the data_sets attribute.
         :rtype:         pandas.DataFrame
         """
                 
-        display_df = None
+        cache_key = (len(self._data_sets), tuple(columns), sort_by)
         
-        for data_set in self._data_sets:
-            next_display = data_set.display(columns)
-            if display_df is None:
-                display_df = next_display
-            else:
-                display_df = pd.concat([display_df, next_display])
-                
-        display_df.reset_index(inplace=True, drop=True)
-        display_df.sort_values(by=[sort_by])
+        if refresh or (self._display_cache is None) or (self._display_cache[0] is not self._data_sets) or (self._display_cache[1] != cache_key):
+            display_df = _catalog_data_frame(records = [data_set.to_dict() for data_set in self._data_sets],
+                                             columns = columns,
+                                             sort_by = sort_by
+                                            )
+            self._display_cache = (self._data_sets, cache_key, display_df)
 
-        return display_df
+        return self._display_cache[2].copy()
     
     #
     def get(self,
@@ -3065,26 +3291,14 @@ class DataSets:
                                 global_client = cl.GLOBAL_PAIRS_CLIENT,
                                 self_client   = self._client)
         
-        try:
-            response = cli.get(url    = cli.get_host() +
-                                        constants.CATALOG_DATA_SETS_API_FULL,
-                               verify = verify
-                              )
-        except Exception as e:
-            msg = messages.ERROR_CLIENT_UNSPECIFIED_ERROR.format('GET', 'request', cli.get_host() + constants.CATALOG_DATA_SETS_API_FULL, e)
-            logger.error(msg)
-            raise common.PAWException(msg)
+        data_sets_dict = _catalog_get(cli    = cli,
+                                      url    = cli.get_host() + constants.CATALOG_DATA_SETS_API_FULL,
+                                      verify = verify
+                                     )
         
-        if response.status_code != 200:
-            error_message = 'failed'
-
-            msg = messages.ERROR_CATALOG_RESPOSE_NOT_SUCCESSFUL.format('GET', 'request', cli.get_host() + constants.CATALOG_DATA_SETS_API_FULL, response.status_code, error_message)
-            logger.error(msg)
-            raise common.PAWException(msg)
-        else:
-            data_sets_get = DataSets.from_dict(response.json())
-            self._data_sets = data_sets_get.data_sets
-            return data_sets_get
+        data_sets_get = DataSets.from_dict(data_sets_dict)
+        self._data_sets = data_sets_get.data_sets
+        return data_sets_get
 
 #
 class ColorTable:
@@ -3250,7 +3464,7 @@ class ColorTable:
         if isinstance(color_table_json, dict):
             color_table = ColorTable.from_dict(color_table_json)
         elif isinstance(color_table_json, str):
-            color_table_dict = json.loads(color_table_json)
+            color_table_dict = common.json_loads(color_table_json)
             color_table = ColorTable.from_dict(color_table_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(color_table_json), "color_table_json")
@@ -3476,7 +3690,7 @@ class DataLayerReturn:
         if isinstance(data_layer_return_json, dict):
             data_layer_return = DataLayerReturn.from_dict(data_layer_return_json)
         elif isinstance(data_layer_return_json, str):
-            data_layer_return_dict = json.loads(data_layer_return_json)
+            data_layer_return_dict = common.json_loads(data_layer_return_json)
             data_layer_return = DataLayerReturn.from_dict(data_layer_return_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(data_layer_return_json), "data_layer_return_json")
@@ -3663,7 +3877,7 @@ class DataLayerDimensionReturn:
         if isinstance(data_layer_dimension_return_json, dict):
             data_layer_dimension_return = DataLayerDimensionReturn.from_dict(data_layer_dimension_return_json)
         elif isinstance(data_layer_dimension_return_json, str):
-            data_layer_dimension_return_dict = json.loads(data_layer_dimension_return_json)
+            data_layer_dimension_return_dict = common.json_loads(data_layer_dimension_return_json)
             data_layer_dimension_return = DataLayerDimensionReturn.from_dict(data_layer_dimension_return_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(data_layer_dimension_return_json), "data_layer_dimension_return_json")
@@ -4068,7 +4282,7 @@ class DataLayerDimension:
         if isinstance(data_layer_dimension_json, dict):
             data_layer_dimension = DataLayerDimension.from_dict(data_layer_dimension_json)
         elif isinstance(data_layer_dimension_json, str):
-            data_layer_dimension_dict = json.loads(data_layer_dimension_json)
+            data_layer_dimension_dict = common.json_loads(data_layer_dimension_json)
             data_layer_dimension = DataLayerDimension.from_dict(data_layer_dimension_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(data_layer_dimension_json), "data_layer_dimension_json")
@@ -4172,7 +4386,7 @@ class DataLayerDimension:
             logger.error(msg)
             raise common.PAWException(msg)
         else:
-            data_layer_dimension_get = DataLayerDimension.from_dict(response.json())
+            data_layer_dimension_get = DataLayerDimension.from_dict(common.response_json(response))
             return data_layer_dimension_get
 
     #
@@ -4228,9 +4442,11 @@ class DataLayerDimension:
         if response.status_code != 200:
             error_message = 'failed'
                 
-            if response.json() is not None:
+            response_dict = common.response_json(response)
+            
+            if response_dict is not None:
                 try:
-                    data_layer_dimension_return = data_layer_dimension_return_from_dict(response.json())
+                    data_layer_dimension_return = data_layer_dimension_return_from_dict(response_dict)
                     error_message = data_layer_dimension_return.message
                 except:
                     msg = messages.INFO_CATALOG_RESPOSE_NOT_SUCCESSFUL_NO_ERROR_MESSAGE
@@ -4240,7 +4456,7 @@ class DataLayerDimension:
             logger.error(msg)
             raise common.PAWException(msg)
         else:
-            self._data_layer_dimension_response = data_layer_dimension_return_from_dict(response.json())
+            self._data_layer_dimension_response = data_layer_dimension_return_from_dict(common.response_json(response))
             self._id = common.check_str(self._data_layer_dimension_response._data_layer_dimension_id)
             msg = messages.INFO_CATALOG_DATA_LAYER_DIMENSIONS_CREATE_SUCCESS.format(str(self._data_layer_dimension_response._data_layer_dimension_id))
             logger.info(msg)
@@ -4311,20 +4527,8 @@ class DataLayerDimensions:
         if isinstance(data_layer_dimension_full_name, int):
             return self._data_layer_dimensions[data_layer_dimension_full_name]
         elif isinstance(data_layer_dimension_full_name, str):
-            index_list = []
-            index      = 0
-            foundCount = 0
-
-            for data_layer_dimension in self._data_layer_dimensions:
-                if (data_layer_dimension.full_name == data_layer_dimension_full_name):
-                    if (data_layer_dimension.full_name == data_layer_dimension_full_name):
-                        foundCount = foundCount + 1
-                        index_list.append(index)
-                else:
-                    msg = messages.WARN_CATALOG_DATA_LAYER_DIMENSIONS_OBJECT_NO_NAME.format(data_layer_dimension_full_name)
-                    logger.warning(msg)
-                  
-                index = index + 1
+            index_list = self._name_index.positions(self._data_layer_dimensions, data_layer_dimension_full_name)
+            foundCount = len(index_list)
 
             if foundCount == 0:
                 msg = messages.ERROR_CATALOG_DATA_LAYER_DIMENSIONS_NO_DATA_SET.format(data_layer_dimension_full_name)
@@ -4341,6 +4545,32 @@ class DataLayerDimensions:
             logger.error(msg)
             raise common.PAWException(msg)
         
+    #
+    def get_by_id(self, id):
+      
+        """
+        A method to get an element of the data_layer_dimensions attribute by its id.
+        
+        :param id:         The id of the element to search for.
+        :type id:          int or str
+        :returns:          The element with the id.
+        :raises Exception: If less than one value is found, 
+                           if more than one value is found.
+        """
+        
+        index_list = self._id_index.positions(self._data_layer_dimensions, str(id))
+        
+        if len(index_list) == 0:
+            msg = messages.ERROR_CATALOG_ID_NOT_FOUND.format('data_layer_dimensions', id)
+            logger.error(msg)
+            raise common.PAWException(msg)
+        elif len(index_list) > 1:
+            msg = messages.ERROR_CATALOG_ID_MULTIPLE.format('data_layer_dimensions', id)
+            logger.error(msg)
+            raise common.PAWException(msg)
+        
+        return self._data_layer_dimensions[index_list[0]]
+
     #
     def __init__(self,
                  client: cl.Client                               = None,
@@ -4350,6 +4580,8 @@ class DataLayerDimensions:
         self._client                = common.set_client(input_client  = client,
                                                         global_client = cl.GLOBAL_PAIRS_CLIENT)
         self._data_layer_dimensions = data_layer_dimensions
+        self._name_index            = _CatalogIndex('full_name', messages.WARN_CATALOG_DATA_LAYER_DIMENSIONS_OBJECT_NO_NAME)
+        self._id_index              = _CatalogIndex('id')
         self._data_layer_id         = data_layer_id
     
     #
@@ -4459,7 +4691,7 @@ class DataLayerDimensions:
         if isinstance(data_layer_dimensions_json, dict):
             data_layer_dimensions = DataLayerDimensions.from_dict(data_layer_dimensions_json)
         elif isinstance(data_layer_dimensions_json, str):
-            data_layer_dimensions_dict = json.loads(data_layer_dimensions_json)
+            data_layer_dimensions_dict = common.json_loads(data_layer_dimensions_json)
             data_layer_dimensions = DataLayerDimensions.from_dict(data_layer_dimensions_dict)
         else:
              msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(data_layer_dimensions_json), "data_layer_dimensions_json")
@@ -4565,7 +4797,7 @@ class DataLayerDimensions:
             logger.error(msg)
             raise common.PAWException(msg)
         else:
-            data_layer_dimensions_get   = DataLayerDimensions.from_dict(response.json())
+            data_layer_dimensions_get   = DataLayerDimensions.from_dict(common.response_json(response))
             self._data_layer_dimensions = data_layer_dimensions_get.data_layer_dimensions
 
             return data_layer_dimensions_get 
@@ -4738,7 +4970,7 @@ class DataLayerPropertyReturn:
         if isinstance(data_layer_property_return_json, dict):
             data_layer_property_return = DataLayerPropertyReturn.from_dict(data_layer_property_return_json)
         elif isinstance(data_layer_property_return_json, str):
-            data_layer_property_return_dict = json.loads(data_layer_property_return_json)
+            data_layer_property_return_dict = common.json_loads(data_layer_property_return_json)
             data_layer_property_return = DataLayerPropertyReturn.from_dict(data_layer_property_return_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(data_layer_property_return_json), "data_layer_property_return_json")
@@ -5144,7 +5376,7 @@ class DataLayerProperty:
         if isinstance(data_layer_property_json, dict):
             data_layer_property = DataLayerProperty.from_dict(data_layer_property_json)
         elif isinstance(data_layer_property_json, str):
-            data_layer_property_dict = json.loads(data_layer_property_json)
+            data_layer_property_dict = common.json_loads(data_layer_property_json)
             data_layer_property = DataLayerProperty.from_dict(data_layer_property_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(data_layer_property_json), "data_layer_property_json")
@@ -5248,7 +5480,7 @@ class DataLayerProperty:
             logger.error(msg)
             raise common.PAWException(msg)
         else: 
-            data_layer_property_get = DataLayerProperty.from_dict(response.json())
+            data_layer_property_get = DataLayerProperty.from_dict(common.response_json(response))
             return data_layer_property_get
         
     #
@@ -5304,9 +5536,11 @@ class DataLayerProperty:
         if response.status_code != 200:
             error_message = 'failed'
                 
-            if response.json() is not None:
+            response_dict = common.response_json(response)
+            
+            if response_dict is not None:
                 try:
-                    self._data_layer_property_return = data_layer_property_return_from_dict(response.json())
+                    self._data_layer_property_return = data_layer_property_return_from_dict(response_dict)
                     error_message = self._data_layer_property_return.message
                 except:
                     msg = messages.INFO_CATALOG_RESPOSE_NOT_SUCCESSFUL_NO_ERROR_MESSAGE
@@ -5316,7 +5550,7 @@ class DataLayerProperty:
             logger.error(msg)
             raise common.PAWException(msg)
         else:
-            self._data_layer_property_response = data_layer_property_return_from_dict(response.json())
+            self._data_layer_property_response = data_layer_property_return_from_dict(common.response_json(response))
             self._id = common.check_str(self._data_layer_property_response._data_layer_property_id)
             msg = messages.INFO_CATALOG_DATA_LAYER_PROPERTY_CREATE_SUCCESS.format(common.check_str(self._data_layer_property_response._data_layer_property_id))
             logger.info(msg) 
@@ -5387,20 +5621,8 @@ class DataLayerProperties:
         if isinstance(data_layer_property_full_name, int):
             return self._data_layer_properties[data_layer_property_full_name]
         elif isinstance(data_layer_property_full_name, str):
-            index_list = []
-            index      = 0
-            foundCount = 0
-
-            for data_layer_property in self._data_layer_properties:
-                if (data_layer_property.full_name == data_layer_property_full_name):
-                    if (data_layer_property.full_name == data_layer_property_full_name):
-                        foundCount = foundCount + 1
-                        index_list.append(index)
-                else:
-                    msg = messages.WARN_CATALOG_DATA_LAYER_PROPERTIES_OBJECT_NO_NAME.format(data_layer_property_full_name)
-                    logger.warning(msg)
-                  
-                index = index + 1
+            index_list = self._name_index.positions(self._data_layer_properties, data_layer_property_full_name)
+            foundCount = len(index_list)
 
             if foundCount == 0:
                 msg = messages.ERROR_CATALOG_DATA_LAYER_PROPERTIES_NO_DATA_SET.format(data_layer_property_full_name)
@@ -5417,6 +5639,32 @@ class DataLayerProperties:
             logger.error(msg)
             raise common.PAWException(msg)
         
+    #
+    def get_by_id(self, id):
+      
+        """
+        A method to get an element of the data_layer_properties attribute by its id.
+        
+        :param id:         The id of the element to search for.
+        :type id:          int or str
+        :returns:          The element with the id.
+        :raises Exception: If less than one value is found, 
+                           if more than one value is found.
+        """
+        
+        index_list = self._id_index.positions(self._data_layer_properties, str(id))
+        
+        if len(index_list) == 0:
+            msg = messages.ERROR_CATALOG_ID_NOT_FOUND.format('data_layer_properties', id)
+            logger.error(msg)
+            raise common.PAWException(msg)
+        elif len(index_list) > 1:
+            msg = messages.ERROR_CATALOG_ID_MULTIPLE.format('data_layer_properties', id)
+            logger.error(msg)
+            raise common.PAWException(msg)
+        
+        return self._data_layer_properties[index_list[0]]
+
     #
     def __init__(self,
                  client: cl.Client                              = None,
@@ -5426,6 +5674,8 @@ class DataLayerProperties:
         self._client                = common.set_client(input_client  = client,
                                                         global_client = cl.GLOBAL_PAIRS_CLIENT)
         self._data_layer_properties = data_layer_properties
+        self._name_index            = _CatalogIndex('full_name', messages.WARN_CATALOG_DATA_LAYER_PROPERTIES_OBJECT_NO_NAME)
+        self._id_index              = _CatalogIndex('id')
         self._data_layer_id         = data_layer_id
     
     #
@@ -5535,7 +5785,7 @@ class DataLayerProperties:
         if isinstance(data_layer_properties_json, dict):
             data_layer_properties = DataLayerProperties.from_dict(data_layer_properties_json)
         elif isinstance(data_layer_properties_json, str):
-            data_layer_properties_dict = json.loads(data_layer_properties_json)
+            data_layer_properties_dict = common.json_loads(data_layer_properties_json)
             data_layer_properties = DataLayerProperties.from_dict(data_layer_properties_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(data_layer_properties_json), "data_layer_properties_json")
@@ -5637,7 +5887,7 @@ class DataLayerProperties:
             logger.error(msg)
             raise common.PAWException(msg)
         else:
-            data_layer_properties_get   = DataLayerProperties.from_dict(response.json())
+            data_layer_properties_get   = DataLayerProperties.from_dict(common.response_json(response))
             self._data_layer_properties = data_layer_properties_get.data_layer_properties
 
             return data_layer_properties_get
@@ -5728,6 +5978,8 @@ class DataLayer:
     
     # Internal
     #_data_layer_response: DataLayerReturn
+    #_data_layer_dimensions: DataLayerDimensions
+    #_data_layer_properties: DataLayerProperties
     
     """
     An object to represent an IBM PAIRS Data Set.
@@ -5842,6 +6094,10 @@ class DataLayer:
     :type formula:                           str
     :param data_layer_response:              A server response to a executed Data Layer method call.
     :type data_layer_response:               ibmpairs.catalog.DataLayerReturn
+    :param data_layer_dimensions:            The Data Layer Dimensions of the Data Layer (e.g. from get_data_layers_full).
+    :type data_layer_dimensions:             ibmpairs.catalog.DataLayerDimensions
+    :param data_layer_properties:            The Data Layer Properties of the Data Layer (e.g. from get_data_layers_full).
+    :type data_layer_properties:             ibmpairs.catalog.DataLayerProperties
     :raises Exception:                       An ibmpairs.client.Client is not found.
     """
 
@@ -5929,7 +6185,9 @@ class DataLayer:
                  description_internal: str             = None,
                  description_internal_links: List[str] = None,
                  formula: str                          = None,
-                 data_layer_response: DataLayerReturn  = None
+                 data_layer_response: DataLayerReturn  = None,
+                 data_layer_dimensions: DataLayerDimensions = None,
+                 data_layer_properties: DataLayerProperties = None
                 ):
         self._client                           = common.set_client(input_client  = client,
                                                                    global_client = cl.GLOBAL_PAIRS_CLIENT)
@@ -5991,6 +6249,9 @@ class DataLayer:
             self._data_layer_response          = DataLayerReturn()
         else:
             self._data_layer_response          = data_layer_response
+        
+        self._data_layer_dimensions            = data_layer_dimensions
+        self._data_layer_properties            = data_layer_properties
 
     #
     def get_client(self):
@@ -6816,6 +7077,36 @@ class DataLayer:
     #    
     data_layer_response = property(get_data_layer_response, set_data_layer_response, del_data_layer_response)
     
+    #
+    def get_data_layer_dimensions(self):
+        return self._data_layer_dimensions
+
+    #
+    def set_data_layer_dimensions(self, data_layer_dimensions):
+        self._data_layer_dimensions = common.check_class(data_layer_dimensions, DataLayerDimensions)
+
+    #    
+    def del_data_layer_dimensions(self): 
+        del self._data_layer_dimensions
+
+    #    
+    data_layer_dimensions = property(get_data_layer_dimensions, set_data_layer_dimensions, del_data_layer_dimensions)
+    
+    #
+    def get_data_layer_properties(self):
+        return self._data_layer_properties
+
+    #
+    def set_data_layer_properties(self, data_layer_properties):
+        self._data_layer_properties = common.check_class(data_layer_properties, DataLayerProperties)
+
+    #    
+    def del_data_layer_properties(self): 
+        del self._data_layer_properties
+
+    #    
+    data_layer_properties = property(get_data_layer_properties, set_data_layer_properties, del_data_layer_properties)
+    
     #
     def from_dict(data_layer_dict: Any):
 
@@ -7438,7 +7729,7 @@ class DataLayer:
         if isinstance(data_layer_json, dict):
             data_layer = DataLayer.from_dict(data_layer_json)
         elif isinstance(data_layer_json, str):
-            data_layer_dict = json.loads(data_layer_json)
+            data_layer_dict = common.json_loads(data_layer_json)
             data_layer = DataLayer.from_dict(data_layer_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(data_layer_json), "data_layer_json")
@@ -7537,6 +7828,13 @@ class DataLayer:
                                 global_client = cl.GLOBAL_PAIRS_CLIENT,
                                 self_client   = self._client)
         
+        data_layer_dict = _catalog_cached_data_layer(cli = cli,
+                                                     id  = self._id
+                                                    )
+        
+        if data_layer_dict is not None:
+            return DataLayer.from_dict(data_layer_dict)
+        
         try:
            response = cli.get(url = cli.get_host() +
                                     constants.CATALOG_DATA_LAYERS_API + 
@@ -7555,7 +7853,7 @@ class DataLayer:
             logger.error(msg)
             raise common.PAWException(msg)    
         else:
-            data_layer_get = DataLayer.from_dict(response.json())
+            data_layer_get = DataLayer.from_dict(common.response_json(response))
 
             return data_layer_get
       
@@ -7656,9 +7954,11 @@ class DataLayer:
         if response.status_code != 200:
             error_message = 'failed'
             
-            if response.json() is not None:
+            response_dict = common.response_json(response)
+            
+            if response_dict is not None:
                 try:
-                    self._data_layer_response = data_layer_return_from_dict(response.json())
+                    self._data_layer_response = data_layer_return_from_dict(response_dict)
                     error_message = self._data_layer_response.message
                 except:
                     msg = messages.INFO_CATALOG_RESPOSE_NOT_SUCCESSFUL_NO_ERROR_MESSAGE
@@ -7669,7 +7969,7 @@ class DataLayer:
             logger.error(msg)
             raise common.PAWException(msg)
         else:
-            self._data_layer_response = data_layer_return_from_dict(response.json())
+            self._data_layer_response = data_layer_return_from_dict(common.response_json(response))
           
             msg = messages.INFO_CATALOG_DATA_LAYER_UPDATE_SUCCESS.format(self._data_layer_response.data_layer_ids)
             logger.info(msg)
@@ -7721,7 +8021,7 @@ class DataLayer:
           
             if response.json is not None:
                 try:
-                    self._data_layer_response = data_layer_return_from_dict(response.json())
+                    self._data_layer_response = data_layer_return_from_dict(common.response_json(response))
                     error_message = self._data_layer_response.message
                 except:
                     msg = messages.INFO_CATALOG_RESPOSE_NOT_SUCCESSFUL_NO_ERROR_MESSAGE
@@ -7732,7 +8032,7 @@ class DataLayer:
             logger.error(msg)
             raise common.PAWException(msg)
         else:
-            self._data_layer_response = data_layer_return_from_dict(response.json())
+            self._data_layer_response = data_layer_return_from_dict(common.response_json(response))
 
             msg = messages.INFO_CATALOG_DATA_LAYER_DELETE_SUCCESS.format(self._data_layer_response.id)
             logger.info(msg)
@@ -7939,20 +8239,8 @@ class DataLayers:
         if isinstance(data_layer_name, int):
             return self._data_layers[data_layer_name]
         elif isinstance(data_layer_name, str):
-            index_list = []
-            index      = 0
-            foundCount = 0
-
-            for data_layer in self._data_layers:
-                if data_layer.name is not None:
-                    if (data_layer.name == data_layer_name):
-                        foundCount = foundCount + 1
-                        index_list.append(index)
-                else:
-                    msg = messages.WARN_CATALOG_DATA_LAYERS_DATA_SET_OBJECT_NO_NAME.format(data_layer_name)
-                    logger.warning(msg)
-                  
-                index = index + 1
+            index_list = self._name_index.positions(self._data_layers, data_layer_name)
+            foundCount = len(index_list)
 
             if foundCount == 0:
                 msg = messages.ERROR_CATALOG_DATA_LAYERS_NO_DATA_SET.format(data_layer_name)
@@ -7969,6 +8257,32 @@ class DataLayers:
             logger.error(msg)
             raise common.PAWException(msg)
 
+    #
+    def get_by_id(self, id):
+      
+        """
+        A method to get an element of the data_layers attribute by its id.
+        
+        :param id:         The id of the element to search for.
+        :type id:          int or str
+        :returns:          The element with the id.
+        :raises Exception: If less than one value is found, 
+                           if more than one value is found.
+        """
+        
+        index_list = self._id_index.positions(self._data_layers, str(id))
+        
+        if len(index_list) == 0:
+            msg = messages.ERROR_CATALOG_ID_NOT_FOUND.format('data_layers', id)
+            logger.error(msg)
+            raise common.PAWException(msg)
+        elif len(index_list) > 1:
+            msg = messages.ERROR_CATALOG_ID_MULTIPLE.format('data_layers', id)
+            logger.error(msg)
+            raise common.PAWException(msg)
+        
+        return self._data_layers[index_list[0]]
+
     #
     def __init__(self,
                  client: cl.Client                    = None,
@@ -7986,6 +8300,9 @@ class DataLayers:
         self._group_id          = group_id
         self._layer_type        = layer_type
         self._data_layers       = data_layers
+        self._name_index        = _CatalogIndex('name', messages.WARN_CATALOG_DATA_LAYERS_DATA_LAYER_OBJECT_NO_NAME)
+        self._id_index          = _CatalogIndex('id')
+        self._display_cache     = None
         
         if data_layer_response is None:
             self._data_layer_response = DataLayerReturn()
@@ -8216,7 +8533,7 @@ class DataLayers:
         if isinstance(data_layers_json, dict):
             data_layers = DataLayers.from_dict(data_layers_json)
         elif isinstance(data_layers_json, str):
-            data_layers_dict = json.loads(data_layers_json)
+            data_layers_dict = common.json_loads(data_layers_json)
             data_layers = DataLayers.from_dict(data_layers_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(data_layers_json), "data_layers_json")
@@ -8293,33 +8610,36 @@ class DataLayers:
 
     def display(self,
                 columns: List[str] = ['dataset_id', 'id', 'name', 'description_short', 'description_long', 'level', 'type', 'unit'],
-                sort_by: str       = 'id'
+                sort_by: str       = 'id',
+                refresh: bool      = False
                ):
         
         """
-        A method to return a pandas.DataFrame object of get results.
+        A method to return a pandas.DataFrame object of get results. The result is cached 
+        until the data_layers list is replaced or changes its length.
         
         :param columns: The columns to be returned in the pandas.DataFrame object, defaults to ['dataset_id', 'id', 'name', 'description_short', 'description_long', 'level', 'type', 'unit']
         :type columns:  List[str]
         :param sort_by: A sort_by column
         :type sort_by:  str
+        :param refresh: Rebuild the pandas.DataFrame, e.g. after Data Layers were changed in place.
+        :type refresh:  bool
         :returns:       A pandas.DataFrame of attributes from the data_layers object.
         :rtype:         pandas.DataFrame
         """
                 
-        display_df = None
-      
-        for data_layer in self._data_layers:
-            next_display = data_layer.display(columns)
-            if display_df is None:
-                display_df = next_display
-            else:
-                display_df = pd.concat([display_df, next_display])
-                
-        display_df.reset_index(inplace=True, drop=True)
-        display_df.sort_values(by=[sort_by])
+        cache_key = (len(self._data_layers), tuple(columns), sort_by)
+        
+        if refresh or (self._display_cache is None) or (self._display_cache[0] is not self._data_layers) or (self._display_cache[1] != cache_key):
+            display_df = _catalog_data_frame(records = [data_layer.to_dict() for data_layer in self._data_layers],
+                                             columns = columns,
+                                             sort_by = sort_by
+                                            )
+            if 'type' in columns:
+                display_df["type"] = display_df["type"].map(lambda x: "Raster" if "R" in str(x) else "Vector" if "V" in str(x) else str(x))
+            self._display_cache = (self._data_layers, cache_key, display_df)
             
-        return display_df
+        return self._display_cache[2].copy()
         
     #
     def get(self,
@@ -8360,57 +8680,33 @@ class DataLayers:
                                 self_client   = self._client)
 
         if self._data_set_id is not None:
-            try:
-                response = cli.get(url = cli.get_host() +
-                                         constants.CATALOG_DATA_SETS_API + 
-                                         common.check_str(self._data_set_id) + 
-                                         constants.CATALOG_DATA_SETS_LAYERS_API,
-                                   verify = verify
-                                  )
-            except Exception as e:
-                msg = messages.ERROR_CLIENT_UNSPECIFIED_ERROR.format('GET', 'request', cli.get_host() + constants.CATALOG_DATA_SETS_API + common.check_str(self._data_set_id) + constants.CATALOG_DATA_SETS_LAYERS_API, e)
-                logger.error(msg)
-                raise common.PAWException(msg)
-
+            data_layers_dict = _catalog_get(cli    = cli,
+                                            url    = cli.get_host() + constants.CATALOG_DATA_SETS_API + common.check_str(self._data_set_id) + constants.CATALOG_DATA_SETS_LAYERS_API,
+                                            verify = verify
+                                           )
         else:
-            try:
-                response = cli.get(url = cli.get_host() +
-                                         constants.CATALOG_DATA_LAYERS_API_FULL,
-                                   verify = verify
-                                  )
-            except Exception as e:
-                msg = messages.ERROR_CLIENT_UNSPECIFIED_ERROR.format('GET', 'request', cli.get_host() + constants.CATALOG_DATA_LAYERS_API_FULL, e)
-                logger.error(msg)
-                raise common.PAWException(msg)
-
-        if response.status_code != 200:
-            error_message = 'failed'
-            
-            if self._data_set_id is not None:
-                msg = messages.ERROR_CATALOG_RESPOSE_NOT_SUCCESSFUL.format('GET', 'request', cli.get_host() + constants.CATALOG_DATA_SETS_API + common.check_str(self._data_set_id) + constants.CATALOG_DATA_SETS_LAYERS_API, response.status_code, error_message) 
-            else:
-                msg = messages.ERROR_CATALOG_RESPOSE_NOT_SUCCESSFUL.format('GET', 'request', cli.get_host() + constants.CATALOG_DATA_LAYERS_API_FULL, response.status_code, error_message)
-            
-            logger.error(msg)
-            raise common.PAWException(msg)
+            data_layers_dict = _catalog_get(cli    = cli,
+                                            url    = cli.get_host() + constants.CATALOG_DATA_LAYERS_API_FULL,
+                                            verify = verify
+                                           )
+
+        data_layers_get   = DataLayers.from_dict(data_layers_dict)
+        self._data_layers = data_layers_get.data_layers
+
+        if data_layer_group_id is not None:
+            self._data_layers = data_layers_get.filter_data_layers_by_attribute(attribute = 'id',
+                                                                                value = data_layer_group_id,
+                                                                                regex = "(?<=P)(.*?)(?=C)"
+                                                                               )
+        elif (data_layer_group_id is None) and (data_layer_group is not None):
+            self._data_layers = data_layers_get.filter_data_layers_by_attribute(attribute = 'name',
+                                                                                value = data_layer_group,
+                                                                                regex = ".+?(?=\.)"
+                                                                               )
         else:
-            data_layers_get   = DataLayers.from_dict(response.json())
             self._data_layers = data_layers_get.data_layers
-
-            if data_layer_group_id is not None:
-                self._data_layers = data_layers_get.filter_data_layers_by_attribute(attribute = 'id',
-                                                                                    value = data_layer_group_id,
-                                                                                    regex = "(?<=P)(.*?)(?=C)"
-                                                                                   )
-            elif (data_layer_group_id is None) and (data_layer_group is not None):
-                self._data_layers = data_layers_get.filter_data_layers_by_attribute(attribute = 'name',
-                                                                                    value = data_layer_group,
-                                                                                    regex = ".+?(?=\.)"
-                                                                                   )
-            else:
-                self._data_layers = data_layers_get.data_layers
-        
-            return self
+    
+        return self
 
     #
     def create(self,
@@ -8498,9 +8794,11 @@ class DataLayers:
             
             error_message = 'failed'
 
-            if response.json() is not None:
+            response_dict = common.response_json(response)
+            
+            if response_dict is not None:
                 try:
-                    self._data_layer_response = data_layer_return_from_dict(response.json())
+                    self._data_layer_response = data_layer_return_from_dict(response_dict)
                     error_message = self._data_layer_response.message
                 except:
                     msg = messages.INFO_CATALOG_RESPOSE_NOT_SUCCESSFUL_NO_ERROR_MESSAGE
@@ -8511,7 +8809,7 @@ class DataLayers:
             raise common.PAWException(msg)
         else:
           
-            self._data_layer_response = data_layer_return_from_dict(response.json())
+            self._data_layer_response = data_layer_return_from_dict(common.response_json(response))
             
             msg = messages.INFO_CATALOG_DATA_LAYERS_CREATE_SUCCESS.format(str(self._data_layer_response.data_layer_ids))
             logger.info(msg)
@@ -8553,6 +8851,7 @@ class Search:
                   
         self._data_sets   = data_sets
         self._data_layers = data_layers
+        self._snapshot    = None
     
     # 
     def get_data_sets(self):
@@ -8641,6 +8940,54 @@ class Search:
         catalog_merge.reset_index(inplace=True, drop=True)
         
         return catalog_merge
+    
+    #
+    def _snapshot_key(self):
+        
+        if (self._data_sets is None) or (self._data_layers is None):
+            return None
+        
+        data_sets   = self._data_sets.data_sets
+        data_layers = self._data_layers.data_layers
+        
+        return (id(self._data_sets), id(data_sets), len(data_sets) if data_sets is not None else 0,
+                id(self._data_layers), id(data_layers), len(data_layers) if data_layers is not None else 0)
+    
+    #
+    def _search_catalog(self,
+                        cli: cl.Client,
+                        verify: bool
+                       ):
+        
+        # the merged catalog and its search indexes are built once per catalog snapshot
+        key = self._snapshot_key()
+        if (self._snapshot is None) or (key is None) or (self._snapshot[0] != key):
+            catalog = self.get_catalog(client = cli,
+                                       verify = verify
+                                      )
+            self._snapshot = (self._snapshot_key(), catalog.fillna(""), {})
+        
+        return self._snapshot[1], self._snapshot[2]
+    
+    #
+    def _search(self,
+                search_term: str,
+                fields: dict,
+                cli: cl.Client,
+                verify: bool
+               ):
+        
+        catalog, indexes = self._search_catalog(cli, verify)
+        
+        index = indexes.get(id(fields))
+        if index is None:
+            index = _SearchIndex(catalog, fields)
+            indexes[id(fields)] = index
+        
+        search = catalog.iloc[index.search(search_term)]
+        search = search.reset_index(drop=True)
+        
+        return search
         
     def all(self,
             search_term: str,
@@ -8677,7 +9024,8 @@ class Search:
         
         frames = [ds, dl]
         union = pd.concat(frames)
-        union.drop_duplicates(subset=None, keep='first', inplace=False)
+        union = union.drop_duplicates(subset=None, keep='first')
+        union.reset_index(inplace=True, drop=True)
         
         return union
         
@@ -8688,7 +9036,9 @@ class Search:
                  ):
                   
         """
-        A method to search Data Sets.
+        A method to search Data Sets. A numeric search term is matched against the Data Set ID, 
+        otherwise the words of the search term are matched against whole words and word prefixes 
+        of the Data Set name and descriptions, and the best matches are returned first.
         
         :param search_term: A search term to be used.
         :type search_term:  str
@@ -8704,24 +9054,15 @@ class Search:
         cli = common.set_client(input_client  = client,
                                 global_client = cl.GLOBAL_PAIRS_CLIENT,
                                 self_client   = self._client)
-                
-        ds = self.get_catalog(client = cli,
-                              verify = verify
-                             )
-                            
-        ds = ds.fillna("")
-
-        try:
-            float(search_term) #check if searchterm is a number, if not search df for string
-            search = ds.query('data_set_id ==' + search_term, engine='python')
-        except:
-            name       = ds.query('data_set_name.str.contains("'+search_term+'", case = False)', engine='python')
-            desc_short = ds.query('data_set_description_short.str.contains("'+ search_term +'", case = False)', engine='python')
-            desc_long  = ds.query('data_set_description_long.str.contains("'+ search_term +'", case = False)', engine='python')
-            search = pd.concat([name, desc_short, desc_long])
-        
-        search.drop_duplicates(subset=None, keep='first', inplace=False)
-        search.reset_index(inplace=True, drop=True)
+        
+        search_term = str(search_term).strip()
+        
+        if search_term.isdigit():
+            ds, _ = self._search_catalog(cli, verify)
+            search = ds[ds['data_set_id'].astype(str) == search_term]
+            search = search.reset_index(drop=True)
+        else:
+            search = self._search(search_term, _SEARCH_DATA_SET_FIELDS, cli, verify)
                             
         return search
         
@@ -8732,7 +9073,10 @@ class Search:
                    ):
                     
         """
-        A method to search Data Layers.
+        A method to search Data Layers. A numeric search term is matched against the Data Layer ID, 
+        otherwise the words of the search term are matched against whole words and word prefixes 
+        of the Data Layer name, descriptions and unit and the Data Set name, and the best matches 
+        are returned first.
         
         :param search_term: A search term to be used.
         :type search_term:  str
@@ -8749,27 +9093,501 @@ class Search:
                                 global_client = cl.GLOBAL_PAIRS_CLIENT,
                                 self_client   = self._client)
         
-        dl = self.get_catalog(client = cli,
-                              verify = verify
-                             )
-                            
-        dl = dl.fillna("")
+        search_term = str(search_term).strip()
         
-        try:
-            float(search_term)
-            search = dl.query('data_layer_id.str.contains("'+search_term+'")', engine='python')
-        except:
-            name       = dl.query('data_layer_name.str.contains("'+search_term+'", case = False)', engine='python')
-            desc_short = dl.query('data_layer_description_short.str.contains("'+ search_term +'", case = False)', engine='python')
-            desc_long  = dl.query('data_layer_description_long.str.contains("'+ search_term +'", case = False)', engine='python')
-            search = pd.concat([name, desc_short, desc_long])
-
-        search.drop_duplicates(subset=None, keep='first', inplace=False)
-        search.reset_index(inplace=True, drop=True)
+        if search_term.isdigit():
+            dl, _ = self._search_catalog(cli, verify)
+            search = dl[dl['data_layer_id'].astype(str).str.contains(search_term, regex=False)]
+            search = search.reset_index(drop=True)
+        else:
+            search = self._search(search_term, _SEARCH_DATA_LAYER_FIELDS, cli, verify)
                             
         return search
 
 
+#
+class CatalogCache:
+    #_path: str
+    #_ttl: int
+    
+    """
+    An on-disk cache of catalog responses, shared between processes by a SQLite file. 
+    Entries are keyed by URL, tenant and user, are served while younger than the TTL 
+    and are revalidated with the server (ETag/Last-Modified) afterwards.
+    
+    :param path:       The path of the SQLite cache file, defaults to constants.CATALOG_CACHE_DIR/constants.CATALOG_CACHE_FILE_NAME.
+    :type path:        str
+    :param ttl:        The time in seconds an entry is served without revalidation, defaults to constants.CATALOG_CACHE_TTL.
+    :type ttl:         int
+    """
+    
+    #
+    def __init__(self,
+                 path: str = None,
+                 ttl: int  = None
+                ):
+        
+        self._path    = path if path is not None else os.path.join(constants.CATALOG_CACHE_DIR, constants.CATALOG_CACHE_FILE_NAME)
+        self._ttl     = ttl if ttl is not None else constants.CATALOG_CACHE_TTL
+        self._decoded = {}
+        self._lock    = threading.Lock()
+    
+    #
+    def get_path(self):
+        return self._path
+
+    #
+    def set_path(self, path):
+        self._path = common.check_str(path)
+
+    #    
+    def del_path(self): 
+        del self._path
+
+    #    
+    path = property(get_path, set_path, del_path)
+    
+    #
+    def get_ttl(self):
+        return self._ttl
+
+    #
+    def set_ttl(self, ttl):
+        self._ttl = common.check_int(ttl)
+
+    #    
+    def del_ttl(self): 
+        del self._ttl
+
+    #    
+    ttl = property(get_ttl, set_ttl, del_ttl)
+    
+    #
+    def _connect(self):
+        
+        directory = os.path.dirname(self._path)
+        if directory != '':
+            os.makedirs(directory, exist_ok = True)
+        
+        connection = sqlite3.connect(self._path, timeout = 30)
+        connection.execute('CREATE TABLE IF NOT EXISTS catalog ('
+                           'key TEXT PRIMARY KEY, url TEXT, etag TEXT, last_modified TEXT, '
+                           'fetched REAL, body BLOB)')
+        return connection
+    
+    #
+    def key(self,
+            client: cl.Client,
+            url: str
+           ):
+        
+        """
+        A method to compute the cache key of a request, the catalog a user can see depends 
+        on the host, the tenant and the user.
+        
+        :param client: An IBM PAIRS Client.
+        :type client:  ibmpairs.client.Client
+        :param url:    The requested URL.
+        :type url:     str
+        :returns:      The cache key.
+        :rtype:        str
+        """
+        
+        tenant_id = getattr(client, '_tenant_id', None)
+        
+        username = None
+        authentication = getattr(client, '_authentication', None)
+        if hasattr(authentication, 'get_username'):
+            username = authentication.get_username()
+        
+        identity = json.dumps([url, str(tenant_id), str(username)])
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+    
+    #
+    def lookup(self,
+               key: str
+              ):
+        
+        """
+        A method to look up a cache entry.
+        
+        :param key: The cache key.
+        :type key:  str
+        :returns:   The entry as a dictionary with the keys 'body', 'etag', 'last_modified' and 'age', or None.
+        :rtype:     dict
+        """
+        
+        with closing(self._connect()) as connection:
+            row = connection.execute('SELECT body, etag, last_modified, fetched FROM catalog WHERE key = ?', 
+                                     (key,)
+                                    ).fetchone()
+        
+        if row is None:
+            return None
+        
+        return {'body':          row[0],
+                'etag':          row[1],
+                'last_modified': row[2],
+                'fetched':       row[3],
+                'age':           time.time() - row[3]
+               }
+    
+    #
+    def load(self,
+             key: str,
+             entry: dict
+            ):
+        
+        """
+        A method to decode the body of a cache entry, the result is kept in memory until the 
+        entry is refreshed.
+        
+        :param key:   The cache key.
+        :type key:    str
+        :param entry: The entry as returned by lookup.
+        :type entry:  dict
+        :returns:     The decoded body.
+        :rtype:       Any
+        """
+        
+        with self._lock:
+            decoded = self._decoded.get(key)
+            if (decoded is not None) and (decoded[0] == entry['fetched']):
+                return decoded[1]
+        
+        result = common.json_loads(entry['body'])
+        
+        with self._lock:
+            self._decoded[key] = (entry['fetched'], result)
+        
+        return result
+    
+    #
+    def store(self,
+              key: str,
+              url: str,
+              body: bytes,
+              etag: str          = None,
+              last_modified: str = None
+             ):
+        
+        """
+        A method to store a response body in the cache.
+        
+        :param key:           The cache key.
+        :type key:            str
+        :param url:           The requested URL.
+        :type url:            str
+        :param body:          The raw response body.
+        :type body:           bytes
+        :param etag:          The ETag header of the response.
+        :type etag:           str
+        :param last_modified: The Last-Modified header of the response.
+        :type last_modified:  str
+        """
+        
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        
+        with closing(self._connect()) as connection:
+            with connection:
+                connection.execute('INSERT OR REPLACE INTO catalog VALUES (?, ?, ?, ?, ?, ?)',
+                                   (key, url, etag, last_modified, time.time(), sqlite3.Binary(body))
+                                  )
+        
+        msg = messages.DEBUG_CATALOG_CACHE_STORED.format(url)
+        logger.debug(msg)
+    
+    #
+    def touch(self,
+              key: str
+             ):
+        
+        """
+        A method to mark a cache entry as fresh after a successful revalidation.
+        
+        :param key: The cache key.
+        :type key:  str
+        """
+        
+        fetched = time.time()
+        
+        with closing(self._connect()) as connection:
+            with connection:
+                connection.execute('UPDATE catalog SET fetched = ? WHERE key = ?', (fetched, key))
+        
+        with self._lock:
+            decoded = self._decoded.get(key)
+            if decoded is not None:
+                self._decoded[key] = (fetched, decoded[1])
+    
+    #
+    def clear(self):
+        
+        """
+        A method to remove all entries from the cache.
+        """
+        
+        with closing(self._connect()) as connection:
+            with connection:
+                connection.execute('DELETE FROM catalog')
+        
+        with self._lock:
+            self._decoded = {}
+
+#
+def _catalog_get(cli: cl.Client,
+                 url: str,
+                 verify: bool = constants.GLOBAL_SSL_VERIFY
+                ):
+    
+    """
+    GETs a catalog resource through the global catalog cache (if any) and decodes it.
+    
+    :param cli:        An IBM PAIRS Client.
+    :type cli:         ibmpairs.client.Client
+    :param url:        The URL to GET.
+    :type url:         str
+    :param verify:     SSL verification
+    :type verify:      bool
+    :returns:          The decoded response body.
+    :rtype:            Any
+    :raises Exception: A server error occurred,
+                       the status of the request is not 200.
+    """
+    
+    cache = GLOBAL_CATALOG_CACHE
+    key   = None
+    entry = None
+    
+    if cache is not None:
+        try:
+            key   = cache.key(cli, url)
+            entry = cache.lookup(key)
+            if (entry is not None) and (entry['age'] < cache.ttl):
+                msg = messages.DEBUG_CATALOG_CACHE_HIT.format(url, entry['age'])
+                logger.debug(msg)
+                return cache.load(key, entry)
+        except Exception as e:
+            msg = messages.WARN_CATALOG_CACHE_UNAVAILABLE.format(cache.path, e)
+            logger.warning(msg)
+            cache = None
+            entry = None
+    
+    conditional_headers = {}
+    if entry is not None:
+        if entry['etag'] is not None:
+            conditional_headers['If-None-Match'] = entry['etag']
+        if entry['last_modified'] is not None:
+            conditional_headers['If-Modified-Since'] = entry['last_modified']
+    
+    try:
+        response = cli.get(url             = url,
+                           verify          = verify,
+                           request_headers = conditional_headers if len(conditional_headers) > 0 else None
+                          )
+    except Exception as e:
+        msg = messages.ERROR_CLIENT_UNSPECIFIED_ERROR.format('GET', 'request', url, e)
+        logger.error(msg)
+        raise common.PAWException(msg)
+    
+    if (response.status_code == 304) and (entry is not None):
+        msg = messages.DEBUG_CATALOG_CACHE_REVALIDATED.format(url)
+        logger.debug(msg)
+        try:
+            cache.touch(key)
+        except Exception as e:
+            msg = messages.WARN_CATALOG_CACHE_UNAVAILABLE.format(cache.path, e)
+            logger.warning(msg)
+        return cache.load(key, entry)
+    elif response.status_code != 200:
+        error_message = 'failed'
+        
+        msg = messages.ERROR_CATALOG_RESPOSE_NOT_SUCCESSFUL.format('GET', 'request', url, response.status_code, error_message)
+        logger.error(msg)
+        raise common.PAWException(msg)
+    
+    result = common.response_json(response)
+    
+    if cache is not None:
+        body = getattr(response, 'content', None)
+        if not isinstance(body, (bytes, str)):
+            body = json.dumps(result)
+        headers = getattr(response, 'headers', None) or {}
+        try:
+            cache.store(key, url, body, 
+                        etag          = headers.get('ETag'),
+                        last_modified = headers.get('Last-Modified')
+                       )
+        except Exception as e:
+            msg = messages.WARN_CATALOG_CACHE_UNAVAILABLE.format(cache.path, e)
+            logger.warning(msg)
+    
+    return result
+
+#
+def _catalog_cached_data_layers(cli: cl.Client):
+    
+    """
+    Gets the Data Layers of a fresh cached full Data Layer list without contacting the server.
+    
+    :param cli: An IBM PAIRS Client.
+    :type cli:  ibmpairs.client.Client
+    :returns:   The Data Layer dictionaries by ID, or None if not cached.
+    :rtype:     dict
+    """
+    
+    cache = GLOBAL_CATALOG_CACHE
+    
+    if cache is None:
+        return None
+    
+    try:
+        key   = cache.key(cli, cli.get_host() + constants.CATALOG_DATA_LAYERS_API_FULL)
+        entry = cache.lookup(key)
+        if (entry is None) or (entry['age'] >= cache.ttl):
+            return None
+        data_layers = cache.load(key, entry)
+    except Exception as e:
+        msg = messages.WARN_CATALOG_CACHE_UNAVAILABLE.format(cache.path, e)
+        logger.warning(msg)
+        return None
+    
+    if isinstance(data_layers, dict):
+        data_layers = data_layers.get('data_layers', data_layers.get('layers'))
+    
+    data_layers_by_id = {}
+    
+    for data_layer in data_layers or []:
+        if isinstance(data_layer, dict):
+            data_layers_by_id.setdefault(str(data_layer.get('id')), data_layer)
+    
+    return data_layers_by_id
+
+#
+def _catalog_cached_data_layer(cli: cl.Client,
+                               id: str
+                              ):
+    
+    """
+    Looks up a Data Layer in a fresh cached full Data Layer list without contacting the server.
+    
+    :param cli: An IBM PAIRS Client.
+    :type cli:  ibmpairs.client.Client
+    :param id:  The Data Layer ID.
+    :type id:   str
+    :returns:   The Data Layer dictionary, or None if not cached.
+    :rtype:     dict
+    """
+    
+    data_layers_by_id = _catalog_cached_data_layers(cli)
+    
+    if data_layers_by_id is None:
+        return None
+    
+    return data_layers_by_id.get(id)
+
+#
+async def _catalog_async_get(cli: cl.Client,
+                             url: str,
+                             semaphore: asyncio.Semaphore,
+                             verify: bool = constants.GLOBAL_SSL_VERIFY
+                            ):
+    
+    """
+    GETs a catalog resource over the pooled async session of the client, through the 
+    global catalog cache (if any), and decodes it.
+    
+    :param cli:        An IBM PAIRS Client.
+    :type cli:         ibmpairs.client.Client
+    :param url:        The URL to GET.
+    :type url:         str
+    :param semaphore:  A semaphore bounding the number of concurrent requests.
+    :type semaphore:   asyncio.Semaphore
+    :param verify:     SSL verification
+    :type verify:      bool
+    :returns:          The decoded response body.
+    :rtype:            Any
+    :raises Exception: A server error occurred,
+                       the status of the request is not 200.
+    """
+    
+    cache = GLOBAL_CATALOG_CACHE
+    key   = None
+    entry = None
+    
+    # note: the SQLite cache blocks, it is accessed from a worker thread so that the 
+    # other requests on the event loop proceed
+    if cache is not None:
+        try:
+            key   = cache.key(cli, url)
+            entry = await asyncio.to_thread(cache.lookup, key)
+            if (entry is not None) and (entry['age'] < cache.ttl):
+                msg = messages.DEBUG_CATALOG_CACHE_HIT.format(url, entry['age'])
+                logger.debug(msg)
+                return await asyncio.to_thread(cache.load, key, entry)
+        except Exception as e:
+            msg = messages.WARN_CATALOG_CACHE_UNAVAILABLE.format(cache.path, e)
+            logger.warning(msg)
+            cache = None
+            entry = None
+    
+    conditional_headers = {}
+    if entry is not None:
+        if entry['etag'] is not None:
+            conditional_headers['If-None-Match'] = entry['etag']
+        if entry['last_modified'] is not None:
+            conditional_headers['If-Modified-Since'] = entry['last_modified']
+    
+    try:
+        async with semaphore:
+            response = await cli.async_get(url             = url,
+                                           verify          = verify,
+                                           request_headers = conditional_headers if len(conditional_headers) > 0 else None
+                                          )
+    except Exception as e:
+        msg = messages.ERROR_CLIENT_UNSPECIFIED_ERROR.format('GET', 'request', url, e)
+        logger.error(msg)
+        raise common.PAWException(msg)
+    
+    if (response.status == 304) and (entry is not None):
+        msg = messages.DEBUG_CATALOG_CACHE_REVALIDATED.format(url)
+        logger.debug(msg)
+        try:
+            await asyncio.to_thread(cache.touch, key)
+        except Exception as e:
+            msg = messages.WARN_CATALOG_CACHE_UNAVAILABLE.format(cache.path, e)
+            logger.warning(msg)
+        return await asyncio.to_thread(cache.load, key, entry)
+    elif response.status != 200:
+        error_message = 'failed'
+        
+        msg = messages.ERROR_CATALOG_RESPOSE_NOT_SUCCESSFUL.format('GET', 'request', url, response.status, error_message)
+        logger.error(msg)
+        raise common.PAWException(msg)
+    
+    body = response.body
+    if isinstance(body, (bytes, str)):
+        result = common.json_loads(body)
+    else:
+        result = body
+        body   = json.dumps(result)
+    
+    if cache is not None:
+        headers = getattr(response, 'headers', None) or {}
+        try:
+            await asyncio.to_thread(cache.store, key, url, body, 
+                                    etag          = headers.get('ETag'),
+                                    last_modified = headers.get('Last-Modified')
+                                   )
+        except Exception as e:
+            msg = messages.WARN_CATALOG_CACHE_UNAVAILABLE.format(cache.path, e)
+            logger.warning(msg)
+    
+    return result
+
+GLOBAL_CATALOG_CACHE = CatalogCache() if constants.CATALOG_CACHE_ENABLED else None
+
 #
 def category_from_dict(category_dictionary: dict):
     """
@@ -10334,6 +11152,191 @@ def create_data_layer_property(data_layer_property: DataLayerProperty,
   
     return data_layer_property
 
+#
+async def async_get_data_layers_full(ids: List[str],
+                                     client: cl.Client    = None,
+                                     verify: bool         = constants.GLOBAL_SSL_VERIFY,
+                                     max_concurrency: int = None
+                                    ):
+    """
+    The method gets DataLayers together with their DataLayerDimensions and DataLayerProperties 
+    from the server. All requests are made concurrently over the pooled async session of the 
+    client, at most max_concurrency at a time, and every distinct request is made once.
+    
+    :param ids:             A list of DataLayer IDs.
+    :type ids:              List[int or str]
+    :param client:          An IBM PAIRS client.
+    :type client:           ibmpairs.client.Client 
+    :param verify:          SSL Verification flag.
+    :type verify:           bool
+    :param max_concurrency: The maximum number of concurrent requests, defaults to constants.CATALOG_BULK_CONCURRENCY.
+    :type max_concurrency:  int
+    :returns:               The DataLayers in the order of the IDs, with data_layer_dimensions and data_layer_properties populated.
+    :rtype:                 List[ibmpairs.catalog.DataLayer]
+    :raises Exception:      If a global client is not yet and no client is provided,
+                            a server error occurred,
+                            the status of a request is not 200.
+    """
+    
+    cli = common.set_client(input_client = client,
+                            global_client = cl.GLOBAL_PAIRS_CLIENT)
+    
+    ids        = [common.check_str(id) for id in ids]
+    unique_ids = list(dict.fromkeys(ids))
+    
+    if max_concurrency is None:
+        max_concurrency = constants.CATALOG_BULK_CONCURRENCY
+    
+    msg = messages.DEBUG_CATALOG_BULK_GET.format(len(unique_ids), max_concurrency)
+    logger.debug(msg)
+    
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    in_flight = {}
+    
+    def fetch(url):
+        if url not in in_flight:
+            in_flight[url] = asyncio.ensure_future(_catalog_async_get(cli       = cli,
+                                                                      url       = url,
+                                                                      semaphore = semaphore,
+                                                                      verify    = verify
+                                                                     )
+                                                  )
+        return in_flight[url]
+    
+    # the cached full list (if any) is looked up and decoded once, off the event loop
+    cached_data_layers = await asyncio.to_thread(_catalog_cached_data_layers, cli) or {}
+    
+    async def data_layer_full(id):
+        data_layer_url = cli.get_host() + constants.CATALOG_DATA_LAYERS_API + id
+        
+        data_layer_dict = cached_data_layers.get(id)
+        
+        if data_layer_dict is None:
+            data_layer_dict, dimensions_dict, properties_dict = await asyncio.gather(fetch(data_layer_url),
+                                                                                     fetch(data_layer_url + constants.CATALOG_DATA_LAYERS_API_DIMENSIONS),
+                                                                                     fetch(data_layer_url + constants.CATALOG_DATA_LAYERS_API_PROPERTIES)
+                                                                                    )
+        else:
+            dimensions_dict, properties_dict = await asyncio.gather(fetch(data_layer_url + constants.CATALOG_DATA_LAYERS_API_DIMENSIONS),
+                                                                    fetch(data_layer_url + constants.CATALOG_DATA_LAYERS_API_PROPERTIES)
+                                                                   )
+        
+        data_layer = DataLayer.from_dict(data_layer_dict)
+        
+        data_layer.data_layer_dimensions = DataLayerDimensions.from_dict(dimensions_dict)
+        data_layer.data_layer_dimensions.data_layer_id = id
+        
+        data_layer.data_layer_properties = DataLayerProperties.from_dict(properties_dict)
+        data_layer.data_layer_properties.data_layer_id = id
+        
+        return data_layer
+    
+    try:
+        data_layers = await asyncio.gather(*[data_layer_full(id) for id in unique_ids])
+    finally:
+        # after a failure, do not leave the remaining requests running
+        for future in in_flight.values():
+            future.cancel()
+    
+    data_layers_by_id = dict(zip(unique_ids, data_layers))
+    
+    return [data_layers_by_id[id] for id in ids]
+
+#
+def get_data_layers_full(ids: List[str],
+                         client: cl.Client    = None,
+                         verify: bool         = constants.GLOBAL_SSL_VERIFY,
+                         max_concurrency: int = None
+                        ):
+    """
+    The method gets DataLayers together with their DataLayerDimensions and DataLayerProperties 
+    from the server, see async_get_data_layers_full.
+    
+    :param ids:             A list of DataLayer IDs.
+    :type ids:              List[int or str]
+    :param client:          An IBM PAIRS client.
+    :type client:           ibmpairs.client.Client 
+    :param verify:          SSL Verification flag.
+    :type verify:           bool
+    :param max_concurrency: The maximum number of concurrent requests, defaults to constants.CATALOG_BULK_CONCURRENCY.
+    :type max_concurrency:  int
+    :returns:               The DataLayers in the order of the IDs, with data_layer_dimensions and data_layer_properties populated.
+    :rtype:                 List[ibmpairs.catalog.DataLayer]
+    :raises Exception:      If a global client is not yet and no client is provided,
+                            a server error occurred,
+                            the status of a request is not 200.
+    """
+    
+    cli = common.set_client(input_client = client,
+                            global_client = cl.GLOBAL_PAIRS_CLIENT)
+    
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    
+    if loop and loop.is_running():
+        msg = messages.DEBUG_FOUND_EVENT_LOOP
+        logger.debug(msg)
+        
+        return common.run_async_in_thread(async_get_data_layers_full,
+                                          ids             = ids,
+                                          client          = cli,
+                                          verify          = verify,
+                                          max_concurrency = max_concurrency)
+    else:
+        msg = messages.INFO_STARTING_EVENT_LOOP
+        logger.debug(msg)
+        
+        return cli.run(async_get_data_layers_full(ids             = ids,
+                                                  client          = cli,
+                                                  verify          = verify,
+                                                  max_concurrency = max_concurrency
+                                                 )
+                      )
+    
+#
+def set_catalog_cache(cache = True):
+    
+    """
+    Sets the on-disk catalog cache used by DataSets.get, DataLayers.get, DataLayer.get 
+    and Search.
+    
+    :param cache:      A CatalogCache, True for a CatalogCache with the default settings, 
+                       or None (False) to disable caching.
+    :type cache:       ibmpairs.catalog.CatalogCache or bool
+    :returns:          The catalog cache in use.
+    :rtype:            ibmpairs.catalog.CatalogCache
+    :raises Exception: If the cache is of an unknown type.
+    """
+    
+    global GLOBAL_CATALOG_CACHE
+    
+    if cache is True:
+        cache = CatalogCache()
+    elif (cache is False) or (cache is None):
+        cache = None
+    elif not isinstance(cache, CatalogCache):
+        msg = messages.ERROR_CATALOG_CACHE_TYPE.format(type(cache))
+        logger.error(msg)
+        raise common.PAWException(msg)
+    
+    GLOBAL_CATALOG_CACHE = cache
+    
+    return GLOBAL_CATALOG_CACHE
+
+#
+def get_catalog_cache():
+    
+    """
+    Gets the on-disk catalog cache in use.
+    
+    :returns: The catalog cache, or None if caching is disabled.
+    :rtype:   ibmpairs.catalog.CatalogCache
+    """
+    
+    return GLOBAL_CATALOG_CACHE
+
 #
 def search(search_term: str,
            client: cl.Client = None,
@@ -10,10 +10,12 @@ SPDX-License-Identifier: BSD-3-Clause
 # fold: Import Python Standard Library {{{
 # Python Standard Library:
 from typing import List, Any
+import asyncio
 import json
 import logging
 import os
 import warnings
+import weakref
 #}}}
 # fold: Import ibmpairs Modules {{{
 # ibmpairs Modules:
@@ -26,7 +28,9 @@ from ibmpairs.logger import logger
 # fold: Import Third Party Libraries {{{
 # Third Party Libraries:
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 import aiohttp
 #}}}
 
@@ -42,6 +46,9 @@ else:
 class ClientResponse:
     #_status: int
     #_body: str
+    #_headers: dict
+    #_content_range: str
+    #_bytes_written: int
     
     """
     A representation of a client response.
@@ -50,6 +57,12 @@ class ClientResponse:
     :type headers:            int
     :param body:              A response body.
     :type body:               str or bytes
+    :param headers:           The response headers.
+    :type headers:            dict
+    :param content_range:     The Content-Range of a response streamed to file.
+    :type content_range:      str
+    :param bytes_written:     The number of bytes of a response streamed to file.
+    :type bytes_written:      int
     """
     
     #
@@ -82,11 +95,17 @@ class ClientResponse:
                         
     #
     def __init__(self,
-                 status: int = None,
-                 body: str   = None
+                 status: int        = None,
+                 body: str          = None,
+                 headers: dict      = None,
+                 content_range: str = None,
+                 bytes_written: int = None
                 ) -> None:
-            self._status = status
-            self._body   = body
+            self._status        = status
+            self._body          = body
+            self._headers       = headers
+            self._content_range = content_range
+            self._bytes_written = bytes_written
             
     #       
     def get_status(self):
@@ -121,10 +140,58 @@ class ClientResponse:
     #    
     body = property(get_body, set_body, del_body)
     
+    #       
+    def get_headers(self):
+        return self._headers
+
+    #
+    def set_headers(self, headers):
+        self._headers = common.check_dict(headers)
+        
+    #    
+    def del_headers(self): 
+        del self._headers
+
+    #    
+    headers = property(get_headers, set_headers, del_headers)
+    
+    #       
+    def get_content_range(self):
+        return self._content_range
+
+    #
+    def set_content_range(self, content_range):
+        self._content_range = common.check_str(content_range)
+        
+    #    
+    def del_content_range(self): 
+        del self._content_range
+
+    #    
+    content_range = property(get_content_range, set_content_range, del_content_range)
+    
+    #       
+    def get_bytes_written(self):
+        return self._bytes_written
+
+    #
+    def set_bytes_written(self, bytes_written):
+        self._bytes_written = common.check_int(bytes_written)
+        
+    #    
+    def del_bytes_written(self): 
+        del self._bytes_written
+
+    #    
+    bytes_written = property(get_bytes_written, set_bytes_written, del_bytes_written)
+    
     #
     def from_dict(client_response_dict: Any):
-        status = None
-        body   = None
+        status        = None
+        body          = None
+        headers       = None
+        content_range = None
+        bytes_written = None
         
         common.check_dict(client_response_dict)
         if "status" in client_response_dict:
@@ -136,8 +203,20 @@ class ClientResponse:
                     body = common.check_str(client_response_dict.get("body"))
                 elif isinstance(body, bytes):
                     body = client_response_dict.get("body")
-        return ClientResponse(status = status,
-                              body   = body
+        if "headers" in client_response_dict:
+            if client_response_dict.get("headers") is not None:
+                headers = common.check_dict(client_response_dict.get("headers"))
+        if "content_range" in client_response_dict:
+            if client_response_dict.get("content_range") is not None:
+                content_range = common.check_str(client_response_dict.get("content_range"))
+        if "bytes_written" in client_response_dict:
+            if client_response_dict.get("bytes_written") is not None:
+                bytes_written = common.check_int(client_response_dict.get("bytes_written"))
+        return ClientResponse(status        = status,
+                              body          = body,
+                              headers       = headers,
+                              content_range = content_range,
+                              bytes_written = bytes_written
                              )
 
     #
@@ -147,6 +226,12 @@ class ClientResponse:
             client_response_dict["status"] = self._status
         if self._body is not None:
             client_response_dict["body"] = self._body
+        if self._headers is not None:
+            client_response_dict["headers"] = self._headers
+        if self._content_range is not None:
+            client_response_dict["content_range"] = self._content_range
+        if self._bytes_written is not None:
+            client_response_dict["bytes_written"] = self._bytes_written
         return client_response_dict
  
 #
@@ -159,6 +244,13 @@ class Client:
     #_tenant_id: str
     #_legacy: bool
     #_version: int
+    #_pool_limit: int
+    #_pool_limit_per_host: int
+    #_keepalive_timeout: float
+    #_dns_cache_ttl: int
+    #_pool_connections: int
+    #_pool_maxsize: int
+    #_max_retries: int
     
     """
     A client wrapper for interaction with IBM PAIRS.
@@ -179,6 +271,20 @@ class Client:
     :type legacy:              bool
     :param version:            IBM EIS GA api version (default: 3)
     :type version:             int
+    :param pool_limit:          The total number of simultaneous connections held by the async connection pool.
+    :type pool_limit:           int
+    :param pool_limit_per_host: The number of simultaneous connections to a single host held by the async connection pool.
+    :type pool_limit_per_host:  int
+    :param keepalive_timeout:   How long (seconds) an idle pooled connection is kept alive for reuse.
+    :type keepalive_timeout:    float
+    :param dns_cache_ttl:       How long (seconds) resolved host addresses are cached by the async connection pool.
+    :type dns_cache_ttl:        int
+    :param pool_connections:    The number of host connection pools cached by the requests session.
+    :type pool_connections:     int
+    :param pool_maxsize:        The maximum number of connections kept per host connection pool by the requests session.
+    :type pool_maxsize:         int
+    :param max_retries:         The number of retries (with backoff) of a synchronous request on connection errors and retriable status codes.
+    :type max_retries:          int or urllib3.util.retry.Retry
     """
     
     #
@@ -249,11 +355,34 @@ class Client:
                  client_id: str = None, 
                  tenant_id: str = None,
                  legacy: bool   = None,
-                 version: int   = None
+                 version: int   = None,
+                 pool_limit: int          = constants.CLIENT_POOL_LIMIT,
+                 pool_limit_per_host: int = constants.CLIENT_POOL_LIMIT_PER_HOST,
+                 keepalive_timeout: float = constants.CLIENT_KEEPALIVE_TIMEOUT,
+                 dns_cache_ttl: int       = constants.CLIENT_DNS_CACHE_TTL,
+                 pool_connections: int    = constants.CLIENT_POOL_CONNECTIONS,
+                 pool_maxsize: int        = constants.CLIENT_POOL_MAXSIZE,
+                 max_retries              = constants.CLIENT_MAX_RETRIES
                 ):
             
             self._authentication = authentication
 
+            self._pool_limit          = pool_limit
+            self._pool_limit_per_host = pool_limit_per_host
+            self._keepalive_timeout   = keepalive_timeout
+            self._dns_cache_ttl       = dns_cache_ttl
+
+            # One pooled aiohttp.ClientSession per event loop, an aiohttp session cannot 
+            # be shared between loops (e.g. successive asyncio.run() calls).
+            self._async_sessions = weakref.WeakKeyDictionary()
+
+            self._pool_connections = pool_connections
+            self._pool_maxsize     = pool_maxsize
+            self._max_retries      = max_retries
+
+            # The requests.Session shared by get, put, post and delete, created on first use.
+            self._requests_session = None
+
             if legacy is not None:
                 self._legacy = legacy
             elif ((legacy is None) and ((self._authentication is not None) and (self._authentication.legacy is not None))):
@@ -477,6 +606,340 @@ class Client:
     #    
     version = property(get_version, set_version, del_version)
     
+    #
+    def get_pool_limit(self):
+        return self._pool_limit
+  
+    #
+    def set_pool_limit(self, pool_limit):
+        self._pool_limit = common.check_int(pool_limit)
+      
+    #    
+    def del_pool_limit(self): 
+        del self._pool_limit
+      
+    #    
+    pool_limit = property(get_pool_limit, set_pool_limit, del_pool_limit)
+    
+    #
+    def get_pool_limit_per_host(self):
+        return self._pool_limit_per_host
+  
+    #
+    def set_pool_limit_per_host(self, pool_limit_per_host):
+        self._pool_limit_per_host = common.check_int(pool_limit_per_host)
+      
+    #    
+    def del_pool_limit_per_host(self): 
+        del self._pool_limit_per_host
+      
+    #    
+    pool_limit_per_host = property(get_pool_limit_per_host, set_pool_limit_per_host, del_pool_limit_per_host)
+    
+    #
+    def get_keepalive_timeout(self):
+        return self._keepalive_timeout
+  
+    #
+    def set_keepalive_timeout(self, keepalive_timeout):
+        self._keepalive_timeout = common.check_float(keepalive_timeout)
+      
+    #    
+    def del_keepalive_timeout(self): 
+        del self._keepalive_timeout
+      
+    #    
+    keepalive_timeout = property(get_keepalive_timeout, set_keepalive_timeout, del_keepalive_timeout)
+    
+    #
+    def get_dns_cache_ttl(self):
+        return self._dns_cache_ttl
+  
+    #
+    def set_dns_cache_ttl(self, dns_cache_ttl):
+        self._dns_cache_ttl = common.check_int(dns_cache_ttl)
+      
+    #    
+    def del_dns_cache_ttl(self): 
+        del self._dns_cache_ttl
+      
+    #    
+    dns_cache_ttl = property(get_dns_cache_ttl, set_dns_cache_ttl, del_dns_cache_ttl)
+    
+    #
+    def get_pool_connections(self):
+        return self._pool_connections
+  
+    #
+    def set_pool_connections(self, pool_connections):
+        self._pool_connections = common.check_int(pool_connections)
+      
+    #    
+    def del_pool_connections(self): 
+        del self._pool_connections
+      
+    #    
+    pool_connections = property(get_pool_connections, set_pool_connections, del_pool_connections)
+    
+    #
+    def get_pool_maxsize(self):
+        return self._pool_maxsize
+  
+    #
+    def set_pool_maxsize(self, pool_maxsize):
+        self._pool_maxsize = common.check_int(pool_maxsize)
+      
+    #    
+    def del_pool_maxsize(self): 
+        del self._pool_maxsize
+      
+    #    
+    pool_maxsize = property(get_pool_maxsize, set_pool_maxsize, del_pool_maxsize)
+    
+    #
+    def get_max_retries(self):
+        return self._max_retries
+  
+    #
+    def set_max_retries(self, max_retries):
+        if isinstance(max_retries, Retry):
+            self._max_retries = max_retries
+        else:
+            self._max_retries = common.check_int(max_retries)
+      
+    #    
+    def del_max_retries(self): 
+        del self._max_retries
+      
+    #    
+    max_retries = property(get_max_retries, set_max_retries, del_max_retries)
+    
+    #
+    def __enter__(self):
+        return self
+    
+    #
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    #
+    async def __aenter__(self):
+        return self
+    
+    #
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    #
+    def _pooled_session(self):
+        
+        """
+        An internal method to get (or lazily create) the pooled aiohttp.ClientSession 
+        bound to the running event loop.
+        
+        :returns:                  The pooled aiohttp.ClientSession for the running event loop.
+        :rtype:                    aiohttp.ClientSession
+        """
+        
+        loop = asyncio.get_running_loop()
+        
+        # Sessions left behind by loops that have since been closed (e.g. the loop of a 
+        # previous asyncio.run() without Client.aclose()) can no longer be awaited, detach 
+        # them from their connectors so that the loops are released.
+        for stale_loop in [l for l in list(self._async_sessions.keys()) if l.is_closed()]:
+            self._async_sessions.pop(stale_loop).detach()
+            msg = messages.DEBUG_CLIENT_ASYNC_SESSION_RELEASED.format(id(stale_loop))
+            logger.debug(msg)
+        
+        session = self._async_sessions.get(loop)
+        
+        if (session is None) or (session.closed is True):
+            connector = aiohttp.TCPConnector(limit             = self._pool_limit,
+                                             limit_per_host    = self._pool_limit_per_host,
+                                             keepalive_timeout = self._keepalive_timeout,
+                                             ttl_dns_cache     = self._dns_cache_ttl
+                                            )
+            timeout   = aiohttp.ClientTimeout(constants.CLIENT_TIMEOUT)
+            session   = aiohttp.ClientSession(connector = connector,
+                                              timeout   = timeout
+                                             )
+            self._async_sessions[loop] = session
+            
+            msg = messages.DEBUG_CLIENT_ASYNC_SESSION_CREATED.format(id(loop), self._pool_limit, self._pool_limit_per_host)
+            logger.debug(msg)
+        
+        return session
+    
+    #
+    def _async_request_options(self, 
+                               verify = None
+                              ):
+        
+        """
+        An internal method to build the per request arguments (headers, auth and ssl) 
+        for a call made on a pooled aiohttp.ClientSession.
+        
+        :param verify:             Verify SSL.
+        :type verify:              bool
+        :returns:                  A dictionary of keyword arguments for aiohttp.ClientSession.request.
+        :rtype:                    dict
+        """
+        
+        options = {"headers": dict(self._headers)}
+        
+        if self.authentication_mode(self._authentication) in ['Basic']:
+            options["auth"] = aiohttp.BasicAuth(self._authentication.username, self._authentication.password)
+            
+        if verify is False:
+            options["ssl"] = False
+            
+        return options
+    
+    #
+    def _async_get_options(self,
+                           verify          = None,
+                           request_headers = None
+                          ):
+        
+        """
+        An internal method to build the per request arguments of Client.async_get, 
+        with the request headers added on top of the client headers.
+        """
+        
+        options = self._async_request_options(verify)
+        
+        if request_headers is not None:
+            options["headers"].update(request_headers)
+            
+        return options
+    
+    #
+    def _request_headers(self,
+                         request_headers = None
+                        ):
+        
+        """
+        An internal method to get the headers of a single request, the client headers 
+        with the request headers added on top, without changing the client headers.
+        """
+        
+        if request_headers is None:
+            return self._headers
+        
+        return dict(self._headers, **request_headers)
+    
+    #
+    async def aclose(self):
+        
+        """
+        A method to close the pooled aiohttp.ClientSession(s) held by the client.
+        """
+        
+        for loop, session in list(self._async_sessions.items()):
+            del self._async_sessions[loop]
+            if loop.is_closed():
+                session.detach()
+            elif loop is asyncio.get_running_loop():
+                await session.close()
+            else:
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+            
+            msg = messages.DEBUG_CLIENT_ASYNC_SESSION_RELEASED.format(id(loop))
+            logger.debug(msg)
+    
+    #
+    def run(self,
+            coroutine,
+            debug: bool = None
+           ):
+        
+        """
+        A method to run a coroutine in a new event loop (see asyncio.run), the pooled 
+        aiohttp.ClientSession of that loop is closed before the loop ends.
+        
+        :param coroutine:          The coroutine to run.
+        :type coroutine:           coroutine
+        :param debug:              Whether the event loop runs in debug mode.
+        :type debug:               bool
+        :returns:                  The result of the coroutine.
+        :rtype:                    Any
+        """
+        
+        return asyncio.run(self._closing_session(coroutine),
+                           debug = debug
+                          )
+    
+    #
+    async def _closing_session(self,
+                               coroutine
+                              ):
+        
+        """
+        An internal method to await a coroutine and then close the pooled 
+        aiohttp.ClientSession of the running event loop.
+        """
+        
+        loop = asyncio.get_running_loop()
+        
+        try:
+            return await coroutine
+        finally:
+            session = self._async_sessions.pop(loop, None)
+            if session is not None:
+                await session.close()
+                
+                msg = messages.DEBUG_CLIENT_ASYNC_SESSION_RELEASED.format(id(loop))
+                logger.debug(msg)
+    
+    def requests_session(self):
+        
+        """
+        A method to get (or lazily create) the requests.Session shared by the synchronous 
+        get, put, post and delete calls of the client, so that connections are kept alive 
+        between calls.
+        
+        :returns:                  The pooled requests.Session of the client.
+        :rtype:                    requests.Session
+        """
+        
+        if self._requests_session is None:
+            if isinstance(self._max_retries, Retry):
+                retries = self._max_retries
+            else:
+                # POST is excluded from the default allowed methods, a query submit is never replayed.
+                retries = Retry(total             = self._max_retries,
+                                backoff_factor    = constants.CLIENT_RETRY_BACKOFF_FACTOR,
+                                status_forcelist  = constants.CLIENT_RETRY_STATUS_FORCELIST,
+                                raise_on_status   = False
+                               )
+            
+            adapter = HTTPAdapter(pool_connections = self._pool_connections,
+                                  pool_maxsize     = self._pool_maxsize,
+                                  max_retries      = retries
+                                 )
+            
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            
+            self._requests_session = session
+            
+            msg = messages.DEBUG_CLIENT_SYNC_SESSION_CREATED.format(self._pool_connections, self._pool_maxsize, self._max_retries)
+            logger.debug(msg)
+            
+        return self._requests_session
+    
+    #
+    def close(self):
+        
+        """
+        A method to close the requests.Session held by the client.
+        """
+        
+        if self._requests_session is not None:
+            self._requests_session.close()
+            self._requests_session = None
+    
     def session(self,
                 authentication = None,
                 headers        = None,
@@ -484,7 +947,9 @@ class Client:
                ):
         
         """
-        A wrapper method around aiohttp.ClientSession.
+        A method to get the pooled aiohttp.ClientSession of the client, the session 
+        (and its connection pool) is shared by all async calls made from the same 
+        event loop and is closed by Client.aclose().
         
         :param authentication:     A username for the user.
         :type authentication:      ibmpairs.authentication.Basic or ibmpairs.authentication.OAuth2
@@ -492,10 +957,33 @@ class Client:
         :type headers:             dict
         :param verify:             Verify SSL.
         :type verify:              bool
-        :returns:                  A aiohttp.ClientSession using the attributes provided.
+        :returns:                  The pooled aiohttp.ClientSession for the running event loop.
         :rtype:                    aiohttp.ClientSession
         """
 
+        self._apply_session_options(authentication,
+                                    headers
+                                   )
+
+        return self._pooled_session()
+
+    #
+    def _apply_session_options(self,
+                               authentication = None,
+                               headers        = None
+                              ):
+        
+        """
+        An internal method to set the headers and authentication of the client used by 
+        the async calls, including the bearer token of an OAuth2 authentication.
+        
+        :param authentication:     A username for the user.
+        :type authentication:      ibmpairs.authentication.Basic or ibmpairs.authentication.OAuth2
+        :param headers:            A dictionary of request headers.
+        :type headers:             dict
+        :raises Exception:         The authentication mechanism is not recognized.
+        """
+
         if headers is not None:
             self.set_headers(headers)
             
@@ -509,38 +997,19 @@ class Client:
             self.set_authentication(authentication)
             msg = messages.DEBUG_CLIENT_SET_HEADERS.format(authentication)
             logger.debug(msg)
-                        
-        connector = aiohttp.TCPConnector(ssl = verify)
                                         
         if self.authentication_mode(self._authentication) in ['Basic', 'None']:
-            # If authentication.Basic then get set authenication tuple.
-            if self.authentication_mode(self._authentication) in ['Basic']:
-                authentication = aiohttp.BasicAuth(self._authentication.username, self._authentication.password)
-
-            timeout = aiohttp.ClientTimeout(constants.CLIENT_TIMEOUT)
-            session = aiohttp.ClientSession(connector = connector, 
-                                            auth      = authentication,
-                                            headers   = self._headers,
-                                            timeout   = timeout
-                                           )
+            pass
         elif self.authentication_mode(self._authentication) in ['OAuth2']:
             
             # Add bearer token to headers.
             token = 'Bearer ' + self._authentication.jwt_token
             self.append_header('Authorization', token)
-
-            timeout = aiohttp.ClientTimeout(constants.CLIENT_TIMEOUT)
-            session = aiohttp.ClientSession(connector = connector, 
-                                            headers   = self._headers,
-                                            timeout   = timeout
-                                           )
         else: 
             msg = messages.ERROR_CLIENT_AUTHENTICATION_MECHANISM.format(self.authentication_mode(self._authentication))
             logger.error(msg)
             raise common.PAWException(msg)
 
-        return session
-
     #
     async def async_get(self,
                         url,
@@ -548,7 +1017,8 @@ class Client:
                         authentication                 = None,
                         headers                        = None,
                         verify                         = None,
-                        response_type                  = 'json'
+                        response_type                  = 'json',
+                        request_headers: dict          = None
                        ):
                         
         """
@@ -556,7 +1026,7 @@ class Client:
         
         :param url:                A URL to GET.
         :type url:                 str
-        :param session:            An aiohttp.ClientSession to use for a GET request.
+        :param session:            An aiohttp.ClientSession to use for a GET request, defaults to the pooled session of the client.
         :type session:             aiohttp.ClientSession
         :param authentication:     A username for the user.
         :type authentication:      ibmpairs.authentication.Basic or ibmpairs.authentication.OAuth2
@@ -566,6 +1036,8 @@ class Client:
         :type verify:              bool
         :param response_type:      A response type, defaults to json.
         :type response_type:       str
+        :param request_headers:    A dictionary of headers sent with this request only, they are not kept by the client.
+        :type request_headers:     dict
         :returns:                  An ibmpairs.client.ClientResponse object.
         :rtype:                    ibmpairs.client.ClientResponse
         """
@@ -574,22 +1046,23 @@ class Client:
 
         client_response = ClientResponse()
 
+        self._apply_session_options(authentication, 
+                                    headers
+                                   )
+        
         if session is None:
-            session = self.session(authentication, 
-                                   headers,
-                                   verify
-                                  )
+            session = self._pooled_session()
 
-        async with session.get(url = url
+        async with session.get(url = url,
+                               **self._async_get_options(verify, request_headers)
                               ) as response:
             
-            client_response.status = response.status  
+            client_response.status  = response.status  
+            client_response.headers = dict(response.headers)
             if response_type == 'json':
                 client_response.body   = await response.text()
             else:
                 client_response.body   = await response.read()
-
-            await session.close() 
             
         if ((self._legacy is True) and (client_response.status in (401,403))):
             token_refresh_message = constants.CLIENT_TOKEN_REFRESH_MESSAGE
@@ -609,33 +1082,228 @@ class Client:
         if retry is True:
             self._authentication.refresh_auth_token()
                     
-            session = self.session(self._authentication, 
-                                   headers,
-                                   verify
-                                  )
+            self._apply_session_options(self._authentication, 
+                                        headers
+                                       )
 
-            async with session.get(url = url
+            async with session.get(url = url,
+                                   **self._async_get_options(verify, request_headers)
                                   ) as response:
                             
-                client_response.status = response.status  
+                client_response.status  = response.status  
+                client_response.headers = dict(response.headers)
                 if response_type == 'json':
                     client_response.body   = await response.text()
                 else:
                     client_response.body   = await response.read()
+        
+        return client_response
+    
+    #
+    async def async_get_to_file(self,
+                                url,
+                                file_path: str,
+                                session: aiohttp.ClientSession = None,
+                                authentication                 = None,
+                                headers                        = None,
+                                verify                         = None,
+                                chunk_size: int                = constants.CLIENT_DOWNLOAD_CHUNK_SIZE,
+                                offset: int                    = 0,
+                                if_range: str                  = None,
+                                end: int                       = None,
+                                shared: bool                   = False
+                               ):
+                        
+        """
+        A wrapper method around aiohttp.ClientSession.get that streams a successful 
+        response body to a file in chunks rather than holding it in memory. If an offset 
+        is given the remainder of the body is requested with a Range header and, on a 
+        206 Partial Content response, written to the file from that offset; a 200 
+        response (the server ignored the range) rewrites the file from the start. If an 
+        end is also given only the bytes from offset to end (inclusive) are requested and 
+        written in place (never past end), leaving the rest of a pre-allocated file untouched, 
+        so several ranges of one file can be downloaded concurrently; if the file is shared 
+        by such ranges a 200 response is returned without writing (or truncating) the file 
+        and the caller has to restart. The Content-Range received and the number of bytes 
+        received are returned so the caller can verify the range.
+        
+        :param url:                A URL to GET.
+        :type url:                 str
+        :param file_path:          The path of the file the response body is written to.
+        :type file_path:           str
+        :param session:            An aiohttp.ClientSession to use for a GET request, defaults to the pooled session of the client.
+        :type session:             aiohttp.ClientSession
+        :param authentication:     A username for the user.
+        :type authentication:      ibmpairs.authentication.Basic or ibmpairs.authentication.OAuth2
+        :param headers:            A dictionary of request headers.
+        :type headers:             dict
+        :param verify:             Verify SSL.
+        :type verify:              bool
+        :param chunk_size:         The size (bytes) of the chunks read from the response and written to file.
+        :type chunk_size:          int
+        :param offset:             The byte offset to resume the download from.
+        :type offset:              int
+        :param if_range:           An ETag or Last-Modified validator, the range is only honoured if the resource is unchanged.
+        :type if_range:            str
+        :param end:                The (inclusive) byte offset to end a ranged download at.
+        :type end:                 int
+        :param shared:             The file is written by other concurrent ranged downloads.
+        :type shared:              bool
+        :returns:                  An ibmpairs.client.ClientResponse object with the content_range and bytes_written, the body is only set (to the response text) if the request was unsuccessful.
+        :rtype:                    ibmpairs.client.ClientResponse
+        """
+        
+        self._apply_session_options(authentication, 
+                                    headers
+                                   )
+        
+        if session is None:
+            session = self._pooled_session()
 
-                await session.close()
+        client_response = await self._async_get_to_file(session, 
+                                                        url, 
+                                                        file_path, 
+                                                        verify, 
+                                                        chunk_size,
+                                                        offset,
+                                                        if_range,
+                                                        end,
+                                                        shared
+                                                       )
+            
+        if self._token_refresh_required(client_response):
+            self._authentication.refresh_auth_token()
+                    
+            self._apply_session_options(self._authentication, 
+                                        headers
+                                       )
+
+            client_response = await self._async_get_to_file(session, 
+                                                            url, 
+                                                            file_path, 
+                                                            verify, 
+                                                            chunk_size,
+                                                            offset,
+                                                            if_range,
+                                                            end,
+                                                            shared
+                                                           )
+        
+        return client_response
+    
+    #
+    async def _async_get_to_file(self,
+                                 session: aiohttp.ClientSession,
+                                 url,
+                                 file_path: str,
+                                 verify,
+                                 chunk_size: int,
+                                 offset: int   = 0,
+                                 if_range: str = None,
+                                 end: int      = None,
+                                 shared: bool  = False
+                                ):
+        
+        """
+        An internal method that performs a single streamed GET for Client.async_get_to_file.
+        """
+        
+        client_response = ClientResponse()
+        
+        options = self._async_request_options(verify)
+        
+        if (offset > 0) or (end is not None):
+            options["headers"]["Range"] = 'bytes=' + str(offset) + '-' + ('' if end is None else str(end))
+            if if_range is not None:
+                options["headers"]["If-Range"] = if_range
         
+        async with session.get(url = url,
+                               **options
+                              ) as response:
+            
+            client_response.status        = response.status
+            client_response.headers       = dict(response.headers)
+            client_response.bytes_written = 0
+            
+            if response.headers.get('Content-Range') is not None:
+                client_response.content_range = response.headers.get('Content-Range')
+            
+            if (response.status == 200) and (shared is True):
+                # The whole resource instead of a bounded range, other ranges are writing 
+                # the same file, leave it untouched and let the caller restart.
+                pass
+            elif response.status in (200, 206):
+                if response.status == 206:
+                    f = open(file_path, 'r+b' if os.path.exists(file_path) else 'wb')
+                    if end is None:
+                        # Partial Content, keep the bytes before the offset.
+                        f.seek(offset)
+                        f.truncate()
+                else:
+                    f = open(file_path, 'wb')
+                
+                with f:
+                    if (response.status == 206) and (end is not None):
+                        # A bounded range, written in place without moving a shared file position.
+                        position = offset
+                        async for chunk in response.content.iter_chunked(chunk_size):
+                            # Bytes past the end (a wrong range) must not overwrite other ranges, 
+                            # they are counted and the caller rejects the range.
+                            if position <= end:
+                                _pwrite(f, chunk[:end + 1 - position], position)
+                            position = position + len(chunk)
+                        client_response.bytes_written = position - offset
+                    else:
+                        async for chunk in response.content.iter_chunked(chunk_size):
+                            f.write(chunk)
+                            client_response.bytes_written = client_response.bytes_written + len(chunk)
+            else:
+                client_response.body = await response.text()
+                
         return client_response
     
+    #
+    def _token_refresh_required(self, 
+                                client_response: ClientResponse
+                               ):
+        
+        """
+        An internal method to determine if an unsuccessful ibmpairs.client.ClientResponse 
+        was caused by an expired token, and the request should therefore be retried.
+        
+        :param client_response:    The response to inspect.
+        :type client_response:     ibmpairs.client.ClientResponse
+        :returns:                  A retry indicator.
+        :rtype:                    bool
+        """
+        
+        retry: bool = False
+        
+        if ((self._legacy is True) and (client_response.status in (401,403))):
+            token_refresh_message = constants.CLIENT_TOKEN_REFRESH_MESSAGE
+        elif ((self._legacy is False) and (client_response.status == 500)):
+            token_refresh_message = constants.CLIENT_TOKEN_REFRESH_MESSAGE_APIC
+        else:
+            return retry
+            
+        if client_response.body is not None:
+            response_string = str(client_response.body)
+            if token_refresh_message in response_string:
+                logger.debug(response_string)
+                retry = True
+                
+        return retry
+    
     #
     def get(self, 
             url,
-            headers = None,
-            verify  = True
+            headers         = None,
+            verify          = True,
+            request_headers = None
            ):
             
         """
-        A wrapper method around requests.get.
+        A wrapper method around requests.Session.get, made on the pooled session of the client.
         
         :param url:                A URL to GET.
         :type url:                 str
@@ -643,6 +1311,8 @@ class Client:
         :type headers:             dict
         :param verify:             Verify SSL.
         :type verify:              bool
+        :param request_headers:    A dictionary of headers sent with this request only, they are not kept by the client.
+        :type request_headers:     dict
         :returns:                  A requests.Response object.
         :rtype:                    requests.Response
         """
@@ -665,17 +1335,17 @@ class Client:
             if self.authentication_mode(self._authentication) in ['Basic']:
                 authentication = self._authentication.get_credentials()
                 
-            response = requests.get(url, 
-                                    auth    = authentication,
-                                    headers = self._headers,
-                                    verify  = verify)
+            response = self.requests_session().get(url, 
+                                                   auth    = authentication,
+                                                   headers = self._request_headers(request_headers),
+                                                   verify  = verify)
         elif self.authentication_mode(self._authentication) in ['OAuth2']:
             token = 'Bearer ' + self._authentication.jwt_token
             self.append_header('Authorization', token)
-            response = requests.get(url, 
-                                    headers = self._headers,
-                                    verify  = verify
-                                   )
+            response = self.requests_session().get(url, 
+                                                   headers = self._request_headers(request_headers),
+                                                   verify  = verify
+                                                  )
                                     
             if ((self._legacy is True) and (response.status_code in (401,403))):
                 token_refresh_message = constants.CLIENT_TOKEN_REFRESH_MESSAGE
@@ -696,10 +1366,10 @@ class Client:
                 self._authentication.refresh_auth_token()
                 token = 'Bearer ' + self._authentication.jwt_token
                 self.append_header('Authorization', token)
-                response = requests.get(url, 
-                                        headers = self._headers,
-                                        verify  = verify
-                                       )
+                response = self.requests_session().get(url, 
+                                                       headers = self._request_headers(request_headers),
+                                                       verify  = verify
+                                                      )
         else:
             msg = messages.ERROR_AUTHENTICATION_TYPE_NOT_RECOGNIZED.format(type(self._authentication))
             logger.error(msg)
@@ -716,7 +1386,7 @@ class Client:
            ):
             
         """
-        A wrapper method around requests.put.
+        A wrapper method around requests.Session.put, made on the pooled session of the client.
         
         :param url:                A URL to PUT.
         :type url:                 str
@@ -748,20 +1418,20 @@ class Client:
             if self.authentication_mode(self._authentication) in ['Basic']:
                 authentication = self._authentication.get_credentials()
                 
-            response = requests.put(url, 
-                                    auth    = authentication,
-                                    headers = self._headers,
-                                    data    = body,
-                                    verify  = verify
-                                   )
+            response = self.requests_session().put(url, 
+                                                   auth    = authentication,
+                                                   headers = self._headers,
+                                                   data    = body,
+                                                   verify  = verify
+                                                  )
         elif self.authentication_mode(self._authentication) in ['OAuth2']:
             token = 'Bearer ' + self._authentication.jwt_token
             self.append_header('Authorization', token)
-            response = requests.put(url,
-                                    headers = self._headers,
-                                    data    = body,
-                                    verify  = verify
-                                   )
+            response = self.requests_session().put(url,
+                                                   headers = self._headers,
+                                                   data    = body,
+                                                   verify  = verify
+                                                  )
             
             if ((self._legacy is True) and (response.status_code in (401,403))):
                 token_refresh_message = constants.CLIENT_TOKEN_REFRESH_MESSAGE
@@ -782,11 +1452,11 @@ class Client:
                 self._authentication.refresh_auth_token()
                 token = 'Bearer ' + self._authentication.jwt_token
                 self.append_header('Authorization', token)
-                response = requests.put(url,
-                                        headers = self._headers,
-                                        data    = body,
-                                        verify  = verify
-                                       )
+                response = self.requests_session().put(url,
+                                                       headers = self._headers,
+                                                       data    = body,
+                                                       verify  = verify
+                                                      )
 
         else:
             msg = messages.ERROR_AUTHENTICATION_TYPE_NOT_RECOGNIZED.format(type(self._authentication))
@@ -812,7 +1482,7 @@ class Client:
         :type url:                 str
         :param body:               A body for the POST request.
         :type body:                Any
-        :param session:            An aiohttp.ClientSession to use for a get request.
+        :param session:            An aiohttp.ClientSession to use for a POST request, defaults to the pooled session of the client.
         :type session:             aiohttp.ClientSession
         :param authentication:     A username for the user.
         :type authentication:      ibmpairs.authentication.Basic or ibmpairs.authentication.OAuth2
@@ -828,20 +1498,20 @@ class Client:
                             
         client_response = ClientResponse()
 
+        self._apply_session_options(authentication, 
+                                    headers
+                                   )
+        
         if session is None:
-            session = self.session(authentication, 
-                                   headers,
-                                   verify
-                                  )
+            session = self._pooled_session()
 
         async with session.post(url  = url,
-                                json = body 
+                                json = body,
+                                **self._async_request_options(verify)
                                ) as response:
             
             client_response.status = response.status
             client_response.body   = await response.text()
-
-            await session.close()
             
         if ((self._legacy is True) and (client_response.status in (401,403))):
             token_refresh_message = constants.CLIENT_TOKEN_REFRESH_MESSAGE
@@ -861,19 +1531,17 @@ class Client:
         if retry is True:
             self._authentication.refresh_auth_token()
                     
-            session = self.session(self._authentication, 
-                                   headers,
-                                   verify
-                                  )
+            self._apply_session_options(self._authentication, 
+                                        headers
+                                       )
 
             async with session.post(url  = url,
-                                    json = body 
+                                    json = body,
+                                    **self._async_request_options(verify)
                                    ) as response:
             
                 client_response.status = response.status
                 client_response.body   = await response.text()
-
-                await session.close()
         
         return client_response
 
@@ -886,7 +1554,7 @@ class Client:
             ):
               
         """
-        A wrapper method around requests.post.
+        A wrapper method around requests.Session.post, made on the pooled session of the client.
         
         :param url:                A URL to POST.
         :type url:                 str
@@ -921,21 +1589,21 @@ class Client:
                 authentication = self._authentication.get_credentials()
 
             logger.debug(messages.DEBUG_CLIENT_POST_BASIC.format(body, url))
-            response = requests.post(url,
-                                     auth    = authentication,
-                                     headers = self._headers,
-                                     data    = body,
-                                     verify  = verify
-                                    )
+            response = self.requests_session().post(url,
+                                                    auth    = authentication,
+                                                    headers = self._headers,
+                                                    data    = body,
+                                                    verify  = verify
+                                                   )
         elif auth_mode in ['OAuth2']:
             token = 'Bearer ' + self._authentication.jwt_token
             self.append_header('Authorization', token)
             logger.debug(messages.DEBUG_CLIENT_POST_OAUTH.format(body, url))
-            response = requests.post(url,
-                                     headers = self._headers,
-                                     data    = body,
-                                     verify  = verify
-                                    )
+            response = self.requests_session().post(url,
+                                                    headers = self._headers,
+                                                    data    = body,
+                                                    verify  = verify
+                                                   )
             
             if ((self._legacy is True) and (response.status_code in (401,403))):
                 token_refresh_message = constants.CLIENT_TOKEN_REFRESH_MESSAGE
@@ -957,11 +1625,11 @@ class Client:
                 token = 'Bearer ' + self._authentication.jwt_token
                 self.append_header('Authorization', token)
                 logger.debug(messages.DEBUG_CLIENT_POST_OAUTH.format(body, url))
-                response = requests.post(url,
-                                         headers = self._headers,
-                                         data    = body,
-                                         verify  = verify
-                                        )
+                response = self.requests_session().post(url,
+                                                        headers = self._headers,
+                                                        data    = body,
+                                                        verify  = verify
+                                                       )
         else:
             msg = messages.ERROR_AUTHENTICATION_TYPE_NOT_RECOGNIZED.format(type(self._authentication))
             logger.error(msg)
@@ -977,7 +1645,7 @@ class Client:
               ):
                 
         """
-        A wrapper method around requests.delete.
+        A wrapper method around requests.Session.delete, made on the pooled session of the client.
         
         :param url:                A URL to DELETE.
         :type url:                 str
@@ -1010,19 +1678,19 @@ class Client:
                 authentication = self._authentication.get_credentials()
 
             logger.debug(messages.DEBUG_CLIENT_DELETE_BASIC.format(url))
-            response = requests.delete(url, 
-                                       auth    = authentication,
-                                       headers = self._headers,
-                                       verify  = verify
-                                      )
+            response = self.requests_session().delete(url, 
+                                                      auth    = authentication,
+                                                      headers = self._headers,
+                                                      verify  = verify
+                                                     )
         elif auth_mode in ['OAuth2']:
             token = 'Bearer ' + self._authentication.jwt_token
             self.append_header('Authorization', token)
             logger.debug(messages.DEBUG_CLIENT_DELETE_OAUTH.format(url))
-            response = requests.delete(url,
-                                       headers = self._headers,
-                                       verify  = verify
-                                      )
+            response = self.requests_session().delete(url,
+                                                      headers = self._headers,
+                                                      verify  = verify
+                                                     )
                                         
             if ((self._legacy is True) and (response.status_code in (401,403))):
                 token_refresh_message = constants.CLIENT_TOKEN_REFRESH_MESSAGE
@@ -1044,10 +1712,10 @@ class Client:
                 token = 'Bearer ' + self._authentication.jwt_token
                 self.append_header('Authorization', token)
                 logger.debug(messages.DEBUG_CLIENT_DELETE_OAUTH.format(url))
-                response = requests.delete(url,
-                                           headers = self._headers,
-                                           verify  = verify
-                                          )
+                response = self.requests_session().delete(url,
+                                                          headers = self._headers,
+                                                          verify  = verify
+                                                         )
         else:
             msg = messages.ERROR_AUTHENTICATION_TYPE_NOT_RECOGNIZED.format(type(self._authentication))
             logger.error(msg)
@@ -1088,6 +1756,34 @@ class Client:
         
         return authentication_mode
   
+#
+def _pwrite(f, 
+            data: bytes, 
+            position: int
+           ):
+    
+    """
+    An internal function to write data to an open file at a position, with os.pwrite 
+    where the platform provides it.
+    
+    :param f:          An open binary file.
+    :type f:           file object
+    :param data:       The bytes to write.
+    :type data:        bytes
+    :param position:   The byte offset to write at.
+    :type position:    int
+    """
+    
+    if hasattr(os, 'pwrite'):
+        view = memoryview(data)
+        while len(view) > 0:
+            written  = os.pwrite(f.fileno(), view, position)
+            view     = view[written:]
+            position = position + written
+    else:
+        f.seek(position)
+        f.write(data)
+
 #
 def get_client(host: str          = None,
                username: str      = None,
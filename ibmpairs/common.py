@@ -10,18 +10,44 @@ SPDX-License-Identifier: BSD-3-Clause
 # fold: Import Python Standard Library {{{
 # Python Standard Library:
 import json
+import re
 from typing import Any, Callable, cast, List, Type, TypeVar
 from datetime import datetime
+import uuid
 #}}}
 # fold: Import ibmpairs Modules {{{
 # ibmpairs Modules:
 from ibmpairs.logger import logger
+import ibmpairs.constants as constants
 import ibmpairs.messages as messages
 #}}}
 # fold: Import Third Party Libraries {{{
 # Third Party Libraries:
 import asyncio
 import threading
+import pandas
+
+HAS_ORJSON = False
+try:
+    import orjson
+    HAS_ORJSON = True
+except:
+    pass
+
+HAS_SIMDJSON = False
+try:
+    import simdjson
+    HAS_SIMDJSON = True
+except:
+    pass
+
+HAS_PYARROW = False
+try:
+    import pyarrow
+    import pyarrow.dataset
+    HAS_PYARROW = True
+except:
+    pass
 #}}}
 
 # fold: Exceptions {{{
@@ -309,6 +335,260 @@ def check_str(s: Any) -> str:
     return string
 #}}}
 
+# fold: JSON Methods {{{
+#
+def set_json_decoder(decoder: str = 'auto'):
+    
+    """
+    The method selects the decoder used by json_loads for responses and from_json methods. 
+    'auto' uses orjson or simdjson if either is installed and the standard library json 
+    module otherwise.
+
+    :param decoder:     One of 'auto', 'orjson', 'simdjson' or 'json'.
+    :type decoder:      str
+    :raises Exception:  If the decoder is unknown or not installed.
+    """
+    
+    global _json_decoder, _json_decoder_name
+    
+    decoder = str(decoder).lower()
+    
+    if decoder not in constants.GLOBAL_JSON_DECODER_OPTIONS:
+        msg = messages.ERROR_COMMON_JSON_DECODER_INVALID.format(decoder, constants.GLOBAL_JSON_DECODER_OPTIONS)
+        logger.error(msg)
+        raise PAWException(msg)
+    
+    if decoder == 'auto':
+        if HAS_ORJSON:
+            decoder = 'orjson'
+        elif HAS_SIMDJSON:
+            decoder = 'simdjson'
+        else:
+            decoder = 'json'
+    
+    if ((decoder == 'orjson') and not HAS_ORJSON) or ((decoder == 'simdjson') and not HAS_SIMDJSON):
+        msg = messages.ERROR_COMMON_JSON_DECODER_NOT_INSTALLED.format(decoder)
+        logger.error(msg)
+        raise PAWException(msg)
+    
+    if decoder == 'orjson':
+        _json_decoder = orjson.loads
+    elif decoder == 'simdjson':
+        _json_decoder = simdjson.loads
+    else:
+        _json_decoder = json.loads
+    _json_decoder_name = decoder
+    
+    msg = messages.DEBUG_COMMON_JSON_DECODER.format(decoder)
+    logger.debug(msg)
+
+#
+def get_json_decoder():
+    
+    """
+    The method returns the name of the decoder used by json_loads.
+
+    :returns:           One of 'orjson', 'simdjson' or 'json'.
+    :rtype:             str
+    """
+    
+    return _json_decoder_name
+
+#
+def json_loads(s: Any):
+    
+    """
+    The method decodes a json document with the selected decoder. Documents the decoder 
+    does not accept but the standard library does (NaN and Infinity literals, numbers out 
+    of the range of a double and lone surrogates) are decoded by the standard library instead.
+
+    :param s:           A json document.
+    :type s:            str or bytes
+    :returns:           The decoded document.
+    :rtype:             Any
+    :raises Exception:  If the document is not valid json (a ValueError).
+    """
+    
+    if _json_decoder is json.loads:
+        return json.loads(s)
+    
+    try:
+        return _json_decoder(s)
+    except ValueError as e:
+        if _json_stdlib_only(s, e):
+            return json.loads(s)
+        raise
+
+#
+def _json_stdlib_only(s: Any,
+                      error: ValueError
+                     ):
+    
+    """
+    An internal method to tell whether the selected decoder rejected a json document for 
+    an extension only the standard library accepts, without parsing the document again.
+    """
+    
+    message = str(error).lower()
+    if ('infinity' in message) or ('surrogate' in message):
+        return True
+    
+    tokens = ('NaN', 'Infinity', '-Infinity')
+    if isinstance(s, (bytes, bytearray)):
+        tokens = tuple(token.encode('ascii') for token in tokens)
+    
+    position = getattr(error, 'pos', None)
+    if position is None:
+        return any(token in s for token in tokens[:2])
+    
+    return s[position:position + len(tokens[2])].startswith(tokens)
+
+#
+def looks_like_json(s: Any):
+    
+    """
+    The method tells a json document from other text (e.g. csv) by its first non 
+    whitespace character, without decoding it.
+
+    :param s:           A document.
+    :type s:            str or bytes
+    :returns:           Whether the document starts like a json object or array.
+    :rtype:             bool
+    """
+    
+    if isinstance(s, (bytes, bytearray)):
+        return _JSON_START_BYTES.match(s) is not None
+    else:
+        return _JSON_START.match(s) is not None
+
+_JSON_START       = re.compile(r'\s*[\[{]')
+_JSON_START_BYTES = re.compile(rb'\s*[\[{]')
+
+#
+def response_json(response: Any):
+    
+    """
+    The method decodes the json body of a requests response with json_loads, responses 
+    without a raw body fall back to their own json method.
+
+    :param response:    A response.
+    :type response:     requests.Response
+    :returns:           The decoded body.
+    :rtype:             Any
+    """
+    
+    content = getattr(response, 'content', None)
+    
+    if isinstance(content, (bytes, str)):
+        return json_loads(content)
+    else:
+        return response.json()
+
+_json_decoder      = json.loads
+_json_decoder_name = 'json'
+set_json_decoder(constants.GLOBAL_JSON_DECODER)
+#}}}
+
+# fold: Arrow Methods {{{
+#
+def dataframe_to_arrow(df):
+    
+    """
+    The method converts a pandas DataFrame to an Arrow Table, the index is kept only if it 
+    is not a default range index.
+
+    :param df:          A dataframe.
+    :type df:           pandas.DataFrame
+    :returns:           An Arrow Table.
+    :rtype:             pyarrow.Table
+    :raises Exception:  If pyarrow is not installed.
+    """
+    
+    if not HAS_PYARROW:
+        msg = messages.ERROR_NO_PYARROW
+        logger.error(msg)
+        raise PAWException(msg)
+    
+    return pyarrow.Table.from_pandas(df)
+
+#
+def write_parquet_dataset(df, 
+                          path: str,
+                          partition_by: List[str] = None,
+                          append: bool            = True,
+                          timestamp: str          = 'timestamp'
+                         ):
+    
+    """
+    The method writes a pandas DataFrame to a hive partitioned Parquet dataset, e.g. 
+    path/layer_id=49180/date=2021-07-06/part-<uuid>-0.parquet. A 'date' partition column is 
+    derived from the timestamp column (datetime64 or epoch milliseconds) if it is not a column 
+    already. Each write has its own file names, so that appending adds files to existing 
+    partitions and a dataset can grow across runs.
+
+    :param df:           A dataframe.
+    :type df:            pandas.DataFrame
+    :param path:         The folder of the dataset.
+    :type path:          str
+    :param partition_by: The partition columns.
+    :type partition_by:  List[str]
+    :param append:       Whether to add to the partitions of an existing dataset, rather than 
+                         replace the partitions that are written.
+    :type append:        bool
+    :param timestamp:    The column a date partition is derived from.
+    :type timestamp:     str
+    :returns:            The folder of the dataset.
+    :rtype:              str
+    :raises Exception:   If pyarrow is not installed or a partition column is missing.
+    """
+    
+    if not HAS_PYARROW:
+        msg = messages.ERROR_NO_PYARROW
+        logger.error(msg)
+        raise PAWException(msg)
+    
+    if partition_by is None:
+        partition_by = []
+    
+    columns = {}
+    
+    if (constants.GLOBAL_PARQUET_DATE_COLUMN in partition_by) and (constants.GLOBAL_PARQUET_DATE_COLUMN not in df.columns) and (timestamp in df.columns):
+        timestamps = df[timestamp]
+        if not pandas.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = pandas.to_datetime(timestamps, unit = 'ms', utc = True)
+        columns[constants.GLOBAL_PARQUET_DATE_COLUMN] = timestamps.dt.strftime(constants.GLOBAL_PARQUET_DATE_FORMAT)
+    
+    for column in partition_by:
+        if (column not in df.columns) and (column not in columns):
+            msg = messages.ERROR_COMMON_PARQUET_PARTITION_COLUMN.format(column, list(df.columns))
+            logger.error(msg)
+            raise PAWException(msg)
+        # Partition values are written as directory names.
+        if (column in df.columns) and isinstance(df[column].dtype, pandas.CategoricalDtype):
+            columns[column] = df[column].astype(object)
+    
+    if len(columns) > 0:
+        df = df.assign(**columns)
+    
+    table = pyarrow.Table.from_pandas(df, 
+                                      preserve_index = False
+                                     )
+    
+    pyarrow.dataset.write_dataset(table, 
+                                  base_dir               = path,
+                                  format                 = 'parquet',
+                                  partitioning           = partition_by if len(partition_by) > 0 else None,
+                                  partitioning_flavor    = 'hive' if len(partition_by) > 0 else None,
+                                  basename_template      = 'part-' + uuid.uuid4().hex + '-{i}.parquet',
+                                  existing_data_behavior = 'overwrite_or_ignore' if append else 'delete_matching'
+                                 )
+    
+    msg = messages.INFO_COMMON_PARQUET_WRITTEN.format(len(df), path, partition_by)
+    logger.info(msg)
+    
+    return path
+#}}}
+
 
 #
 def strip_slash(input: str):
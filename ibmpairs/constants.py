@@ -20,6 +20,10 @@ PAW_LOG_LEVEL                 = os.environ.get('PAW_LOG_LEVEL', 'INFO')
 GLOBAL_JSON_REPR_INDENT       = int(os.environ.get('GLOBAL_JSON_REPR_INDENT', 4))
 GLOBAL_JSON_REPR_SORT_KEYS    = os.environ.get('GLOBAL_JSON_REPR_SORT_KEYS', True)
 GLOBAL_SSL_VERIFY             = True
+GLOBAL_JSON_DECODER           = os.environ.get('GLOBAL_JSON_DECODER', 'auto').lower()
+GLOBAL_JSON_DECODER_OPTIONS   = ['auto', 'orjson', 'simdjson', 'json']
+GLOBAL_PARQUET_DATE_COLUMN    = 'date'
+GLOBAL_PARQUET_DATE_FORMAT    = '%Y-%m-%d'
 
 # catalog
 CATALOG_DATA_SETS_API                   = '/datasets/'
@@ -36,6 +40,16 @@ CATALOG_DATA_LAYER_DIMENSION_VALUES_API = '/datalayer_dimension_values/'
 
 CATALOG_DATA_LAYER_PROPERTIES_API       = '/datalayer_properties/'
 
+CATALOG_CACHE_ENABLED                   = os.environ.get('CATALOG_CACHE_ENABLED', "False")
+if CATALOG_CACHE_ENABLED.lower() in ('true', 't', 'yes', 'y', '1', 'on'):
+	CATALOG_CACHE_ENABLED = True
+else:
+	CATALOG_CACHE_ENABLED = False
+CATALOG_CACHE_DIR                       = os.environ.get('CATALOG_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'ibmpairs'))
+CATALOG_CACHE_FILE_NAME                 = 'catalog.sqlite'
+CATALOG_CACHE_TTL                       = int(os.environ.get('CATALOG_CACHE_TTL', 3600))
+CATALOG_BULK_CONCURRENCY                = int(os.environ.get('CATALOG_BULK_CONCURRENCY', 16))
+
 # client
 CLIENT_URL                        = os.environ.get('CLIENT_URL_V3', 'https://api.ibm.com/geospatial/run/na/core/')
 CLIENT_URL_V4                     = os.environ.get('CLIENT_URL_V4', CLIENT_URL + 'v4')
@@ -48,6 +62,16 @@ CLIENT_GET_DEFAULT_RESPONSE_TYPE  = 'json'
 CLIENT_TOKEN_REFRESH_MESSAGE      = 'claim expired'
 CLIENT_TOKEN_REFRESH_MESSAGE_APIC = 'Invalid-JWT-Validate'
 CLIENT_TIMEOUT                    = os.environ.get('CLIENT_TIMEOUT', 3600)
+CLIENT_POOL_LIMIT                 = int(os.environ.get('CLIENT_POOL_LIMIT', 100))
+CLIENT_POOL_LIMIT_PER_HOST        = int(os.environ.get('CLIENT_POOL_LIMIT_PER_HOST', 32))
+CLIENT_KEEPALIVE_TIMEOUT          = float(os.environ.get('CLIENT_KEEPALIVE_TIMEOUT', 60))
+CLIENT_DNS_CACHE_TTL              = int(os.environ.get('CLIENT_DNS_CACHE_TTL', 300))
+CLIENT_POOL_CONNECTIONS           = int(os.environ.get('CLIENT_POOL_CONNECTIONS', 10))
+CLIENT_POOL_MAXSIZE               = int(os.environ.get('CLIENT_POOL_MAXSIZE', 32))
+CLIENT_MAX_RETRIES                = int(os.environ.get('CLIENT_MAX_RETRIES', 3))
+CLIENT_RETRY_BACKOFF_FACTOR       = float(os.environ.get('CLIENT_RETRY_BACKOFF_FACTOR', 0.5))
+CLIENT_RETRY_STATUS_FORCELIST     = [429, 502, 503, 504]
+CLIENT_DOWNLOAD_CHUNK_SIZE        = int(os.environ.get('CLIENT_DOWNLOAD_CHUNK_SIZE', 1024 * 1024))
 
 UPLOAD_API                     = '/uploader/upload'
 UPLOAD_STATUS_API              = '/uploader/upload/'
@@ -88,10 +112,51 @@ QUERY_STATUS_CHECK_INTERVAL    = int(os.environ.get('QUERY_STATUS_CHECK_INTERVAL
 QUERY_STATUS_RUNNING_CODES     = [0, 1, 10, 11, 12]
 QUERY_STATUS_SUCCESS_CODES     = [20]
 QUERY_STATUS_FAILURE_CODES     = [21, 30, 31, 40, 41]
+QUERY_STATUS_FINISHING_CODES   = [11, 12]
+QUERY_STATUS_ADAPTIVE          = os.environ.get('QUERY_STATUS_ADAPTIVE', "True").lower() in ('true', 't', 'yes', 'y', '1', 'on')
+QUERY_STATUS_ADAPTIVE_MIN      = float(os.environ.get('QUERY_STATUS_ADAPTIVE_MIN', 5))
+QUERY_STATUS_ADAPTIVE_CAP      = float(os.environ.get('QUERY_STATUS_ADAPTIVE_CAP', 4))
+QUERY_STATUS_ADAPTIVE_FACTOR   = float(os.environ.get('QUERY_STATUS_ADAPTIVE_FACTOR', 2))
+QUERY_STATUS_ADAPTIVE_JITTER   = float(os.environ.get('QUERY_STATUS_ADAPTIVE_JITTER', 0.1))
+QUERY_JOBS_LIST_API            = 'list?flag=false&page=1&size='
+QUERY_STATUS_POLLER_WORKERS    = int(os.environ.get('QUERY_STATUS_POLLER_WORKERS', 8))
+QUERY_STATUS_POLLER_BULK       = os.environ.get('QUERY_STATUS_POLLER_BULK', "True").lower() in ('true', 't', 'yes', 'y', '1', 'on')
+QUERY_STATUS_POLLER_BULK_SIZE  = int(os.environ.get('QUERY_STATUS_POLLER_BULK_SIZE', 500))
+QUERY_STATUS_POLLER_HORIZON    = float(os.environ.get('QUERY_STATUS_POLLER_HORIZON', 5))
 QUERY_DOWNLOAD_DEFAULT_FOLDER  = 'download'
+QUERY_DOWNLOAD_STREAM          = os.environ.get('QUERY_DOWNLOAD_STREAM', "False").lower() in ('true', 't', 'yes', 'y', '1', 'on')
+QUERY_DOWNLOAD_SNIFF_BYTES     = 64
+QUERY_DOWNLOAD_ZIP_SIGNATURES  = [b'PK\x03\x04', b'PK\x05\x06', b'PK\x07\x08']
+QUERY_DOWNLOAD_PART_EXTENSION  = '.part'
+QUERY_DOWNLOAD_RESUME_ATTEMPTS = int(os.environ.get('QUERY_DOWNLOAD_RESUME_ATTEMPTS', 5))
+QUERY_DOWNLOAD_RESUME_INTERVAL = int(os.environ.get('QUERY_DOWNLOAD_RESUME_INTERVAL', 5))
+QUERY_DOWNLOAD_SEGMENTS        = int(os.environ.get('QUERY_DOWNLOAD_SEGMENTS', 1))
+QUERY_DOWNLOAD_SEGMENT_SIZE    = int(os.environ.get('QUERY_DOWNLOAD_SEGMENT_SIZE', 8 * 1024 * 1024))
+QUERY_DOWNLOAD_EXTRACT         = os.environ.get('QUERY_DOWNLOAD_EXTRACT', 'all').lower()
+QUERY_DOWNLOAD_EXTRACT_OPTIONS = ['all', 'lazy']
+QUERY_DOWNLOAD_EXTRACT_WORKERS = int(os.environ.get('QUERY_DOWNLOAD_EXTRACT_WORKERS', 4))
+QUERY_DOWNLOAD_EXTRACT_LARGE   = int(os.environ.get('QUERY_DOWNLOAD_EXTRACT_LARGE', 16 * 1024 * 1024))
+QUERY_OUTPUT_INFO_FILE_NAME    = 'output.info'
 QUERY_WORKER_DEBUG             = os.environ.get('QUERY_WORKER_DEBUG', "False")
 QUERY_WORKER_DEBUG             = False
 QUERY_ID_PATTERN               = "[0-9]{10}_[0-9]{8}"
+# Point query data columns: the column name, the keys of a json row and the dtype.
+QUERY_POINT_DATA_COLUMNS       = [("layer_id",    ("layerId", "layer_id"),     "id"),
+                                  ("layer_name",  ("layerName", "layer_name"), "category"),
+                                  ("dataset",     ("dataset",),                "category"),
+                                  ("timestamp",   ("timestamp",),              "int"),
+                                  ("longitude",   ("longitude",),              "float"),
+                                  ("latitude",    ("latitude",),               "float"),
+                                  ("region",      ("region",),                 "category"),
+                                  ("value",       ("value",),                  "value"),
+                                  ("unit",        ("unit",),                   "category"),
+                                  ("property",    ("property",),               "category"),
+                                  ("aggregation", ("aggregation",),            "category"),
+                                  ("alias",       ("alias",),                  "category")
+                                 ]
+QUERY_POINT_CSV_ENGINE         = os.environ.get('QUERY_POINT_CSV_ENGINE', 'auto').lower()
+QUERY_POINT_PARQUET_PARTITIONS = ['layer_id', 'date']
+QUERY_RASTER_EXTENSIONS        = ['.tif', '.tiff']
 
 #
 IBM_CLOUD_OBJECT_STORE_CONTROL_URL = 'control.cloud-object-storage.cloud.ibm.com'
@@ -10,6 +10,7 @@ SPDX-License-Identifier: BSD-3-Clause
 # general messages
 ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED = 'The json input type \'{}\' for {} is not recognized, the type must be in [\'str\', \'dict\'].'
 ERROR_NO_RASTERIO = 'rasterio is not available on your system, please install rasterio to use this method.'
+ERROR_NO_PYARROW = 'pyarrow is not available on your system, please install pyarrow to use this method.'
 
 # authentication messages
 INFO_AUTHENTICATION_API_KEY_NOT_FOUND_IN_FILE = 'The api key for the user \'{}\' in file \'{}\' could not be found or set for the host \'{}\'.'
@@ -102,6 +103,16 @@ INFO_CATALOG_DATA_LAYER_PROPERTY_CREATE_SUCCESS = 'The Data Layer Property creat
 
 ERROR_CATALOG_VECTOR_DATA_LAYER_FROM_FILE_NOT_FOUND = 'The vector data layer definition file \'{}\' was not found.'
 
+ERROR_CATALOG_ID_NOT_FOUND = 'The {} attribute does not contain an element with the id \'{}\'.'
+ERROR_CATALOG_ID_MULTIPLE = 'The {} attribute has multiple elements with the id \'{}\'- this id should be unique.'
+
+DEBUG_CATALOG_CACHE_HIT = 'The catalog cache served \'{}\' (age: {:.0f} seconds).'
+DEBUG_CATALOG_CACHE_REVALIDATED = 'The catalog cache entry for \'{}\' was revalidated by the server.'
+DEBUG_CATALOG_CACHE_STORED = 'The catalog cache stored \'{}\'.'
+WARN_CATALOG_CACHE_UNAVAILABLE = 'The catalog cache \'{}\' could not be used, error message: {}'
+ERROR_CATALOG_CACHE_TYPE = 'The catalog cache must be a CatalogCache or None, not {}.'
+DEBUG_CATALOG_BULK_GET = 'Getting {} Data Layers with their dimensions and properties ({} concurrent requests).'
+
 # client messages
 DEBUG_CLIENT_POST_BASIC = 'POSTing {} to url {} using basic auth.'
 DEBUG_CLIENT_POST_OAUTH = 'POSTing {} to url {} using oauth.'
@@ -110,6 +121,9 @@ DEBUG_CLIENT_DELETE_OAUTH = 'DELETE of {} using oauth.'
 ERROR_CLIENT_AUTHENTICATION_MECHANISM = 'The authentication mechanism {} was not recognized.'
 DEBUG_CLIENT_SET_HEADERS = 'The headers for the client set to {}.'
 DEBUG_CLIENT_SET_AUTHENTICATION = 'The authentication for the client was set to {}.'
+DEBUG_CLIENT_ASYNC_SESSION_CREATED = 'A pooled aiohttp session was created for the event loop {} (limit: {}, limit per host: {}).'
+DEBUG_CLIENT_ASYNC_SESSION_RELEASED = 'The pooled aiohttp session for the event loop {} was released.'
+DEBUG_CLIENT_SYNC_SESSION_CREATED = 'A pooled requests session was created (pool connections: {}, pool maxsize: {}, max retries: {}).'
 
 ERROR_CLIENT_UNSPECIFIED_ERROR = 'The {} {} to {} encountered an unspecified error contacting the server; the request was unsuccessful, error message: {}'
 INFO_BASIC_AUTH_ASSUMPTION = 'The client authentication method is assumed to be Basic auth as password, or password file was specified.'
@@ -130,6 +144,11 @@ ERROR_COMMON_CHECK_INT = 'The type \'{}\' of \'{}\' is invalid, the type should
 ERROR_COMMON_CHECK_FLOAT = 'The type \'{}\' of \'{}\' is invalid, the type should be in [\'float\', \'str\', \'int\'].'
 ERROR_COMMON_STR_TO_INT = 'The value \'{}\' is a string rather than an int and cannot be cast to int.'
 ERROR_COMMON_STR_TO_FLOAT = 'The value \'{}\' is a string rather than a float and cannot be cast to float.'
+ERROR_COMMON_JSON_DECODER_INVALID = 'The json decoder \'{}\' is invalid, the decoder should be in {}.'
+ERROR_COMMON_JSON_DECODER_NOT_INSTALLED = 'The json decoder \'{}\' is not installed, please install it or choose another decoder.'
+DEBUG_COMMON_JSON_DECODER = 'The json decoder is \'{}\'.'
+ERROR_COMMON_PARQUET_PARTITION_COLUMN = 'The partition column \'{}\' is not a column of the dataframe, the columns are {}.'
+INFO_COMMON_PARQUET_WRITTEN = 'Wrote {} rows to the parquet dataset \'{}\' partitioned by {}.'
 ERROR_COMMON_INT_TO_STR = 'The value \'{}\' is an int rather than a string and cannot be cast to string.'
 ERROR_COMMON_FLOAT_TO_STR = 'The value \'{}\' is a float rather than a string and cannot be cast to string.'
 ERROR_COMMON_INT_TO_FLOAT = 'The value \'{}\' is an int rather than a float and cannot be cast to float.'
@@ -164,6 +183,8 @@ ERROR_QUERY_FAILED = 'The query {} failed, error {} {}'
 INFO_QUERY_STATUS = 'The query {} has the status {}.'
 ERROR_QUERY_UNKNOWN_STATE = 'The query {} completed with the unknown status_code {}.'
 ERROR_QUERY_STATUS_HTTP_RESPONSE_CODE = 'Unable to check query status - HTTP response code {}.'
+DEBUG_QUERY_STATUS_POLLER_ROUND = 'The status of {} queries was checked, {} of them from the query job list.'
+DEBUG_QUERY_STATUS_POLLER_NO_BULK = 'The query job list could not be used to check statuses ({}), statuses will be checked per query.'
 ERROR_QUERY_DELETED = 'The query {} has been deleted and therefore cannot be downloaded.'
 INFO_QUERY_DOWNLOAD_PATH_SET = 'The query download folder is set to the path {}.'
 WARN_QUERY_DOWNLOAD_PATH_CREATE = 'The query download folder {} was not present on the operating system as either a fixed or relative path. Attempting to create.'
@@ -178,7 +199,20 @@ ERROR_POINT_QUERY_DOWNLOAD_UNSUCCESSFUL = 'The online point query could not be s
 INFO_QUERY_DOWNLOAD_FILE_UNZIP = 'The query zip {} will be unzipped to the following path {}.'
 INFO_QUERY_DOWNLOAD_FILE_UNZIPPED = 'The query zip {} was successfully unzipped to {}.'
 ERROR_QUERY_DOWNLOAD_UNSUCCESSFUL_UNZIP = 'The query zip {} could not be unzipped to {}, the operation failed.'
+INFO_QUERY_DOWNLOAD_FILE_UNZIP_MEMBERS = 'The query zip {} has {} members, {} were selected for unzipping.'
+INFO_QUERY_DOWNLOAD_FILE_LAZY = 'The query zip {} was kept, its members will be unzipped on demand.'
+ERROR_QUERY_DOWNLOAD_EXTRACT_INVALID = "The extract option '{}' is not valid, it must be one of {}."
+ERROR_QUERY_DOWNLOAD_ZIP_NOT_FOUND = 'The query zip {} could not be found, the Query result must be downloaded first.'
 ERROR_QUERY_DOWNLOAD_REQUEST_NOT_SUCCESSFUL = 'The {} {} call to {} failed with status code: {}, message: {}.'
+INFO_QUERY_DOWNLOAD_SEGMENTED = 'The download of query {} ({} bytes) will be made in {} concurrent segments.'
+INFO_QUERY_DOWNLOAD_NO_RANGES = 'The server did not accept a byte range for query {}, the download was made as a single stream.'
+INFO_QUERY_DOWNLOAD_RESUME_PART = 'A partial download {} of {} bytes was found, the download of query {} will be resumed from that offset.'
+WARN_QUERY_DOWNLOAD_INTERRUPTED = 'The download of query {} was interrupted after {} bytes ({}), attempting to resume.'
+WARN_QUERY_DOWNLOAD_RESTART = 'The partial download {} of query {} could not be resumed (status code: {}), restarting the download.'
+WARN_QUERY_DOWNLOAD_RANGE_MISMATCH = 'The partial download {} of query {} requested the bytes {}-{} but received the range {} ({} bytes), resuming the download.'
+ERROR_QUERY_DOWNLOAD_RESUME_EXHAUSTED = 'The download of query {} failed after {} attempts, the partial download {} is kept and will be resumed by the next download.'
+ERROR_QUERY_DOWNLOAD_SIZE_MISMATCH = 'The download of query {} is {} bytes, the server declared {} bytes.'
+ERROR_QUERY_DOWNLOAD_CHECKSUM_MISMATCH = 'The {} checksum of the download of query {} does not match the value declared by the server.'
 ERROR_QUERY_EXCEED_MAX_WORKERS = 'The number of workers specified \'{}\' is greater than the maxmimum value\'{}\', please decrease.'
 ERROR_QUERY_STATUS_INTERVAL = 'The status_interval specified \'{}\' is less than the minimum value \'{}\', please increase.'
 INFO_QUERY_RUNNER_MUST_CHECK_STATUS = 'The status must be checked in order to query and download.'
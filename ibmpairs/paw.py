@@ -35,6 +35,7 @@ except NameError:
         string_type = str
 # parallel processing
 import concurrent.futures
+import contextlib
 # make reading file pointer streams in Python 2 and 3
 import codecs
 # modules needed
@@ -60,7 +61,7 @@ from shapely.geometry import shape, box, Point
 import re
 import logging
 import itertools
-import tempfile
+import uuid
 # file system abstraction
 import fs
 from fs.osfs import OSFS
@@ -89,6 +90,8 @@ except:
         except Exception as e:
                 raise ImportError('Neither GDAL nor PIL could be imported.')
 import ibmpairs.authentication as authentication
+import ibmpairs.common as common
+import ibmpairs.constants as constants
 #}}}
 # fold: global parameters{{{
 ## PAIRS query meta data information file
@@ -405,6 +408,10 @@ class PAIRSQuery(object):
         RASTER_FILE_EXTENSION        = PAIRS_GEOTIFF_FILE_EXTENSION
         VECTOR_FILE_EXTENSION        = PAIRS_CSV_FILE_EXTENSION
         PAIRS_POINT_QUERY_RESP_FORMAT= 'text/csv' # 'application/json' # as alternative for JSON return
+        RASTER_KEEP_DTYPE            = False
+        PAIRS_NUM_PARALLEL_LAYER_LOADS= min(8, os.cpu_count() or 1)
+        VECTOR_CHUNK_SIZE            = 100000
+        RASTER_MASK_BLOCK_SIZE       = 1048576
 
         def __init__(
                 self, query,
@@ -559,6 +566,8 @@ class PAIRSQuery(object):
                 self.queryFS                    = None
                 # variable for query result data stream
                 self._queryStream               = None
+                # number of readers keeping the data source open (e.g. parallel layer loading)
+                self._holdDataSource            = 0
                 # define whether or not to use virtual disk in memory for query result
                 self.inMemory                   = inMemory
 
@@ -706,6 +715,8 @@ class PAIRSQuery(object):
                 :returns:       function actually attached and/or opened the data source
                 :rtype:         bool
                 """
+                if self._holdDataSource and not force:
+                        return False
                 if not KEEP_QUERY_SOURCE_DIR_OPEN or force:
                         if force: logger.debug("Enforcing data source to open.")
                         hasOpened=False
@@ -778,7 +789,7 @@ class PAIRSQuery(object):
                 :returns:       function performed closing
                 :rtype:         bool
                 """
-                if not (KEEP_QUERY_SOURCE_DIR_OPEN or self.inMemory) or force:
+                if not (KEEP_QUERY_SOURCE_DIR_OPEN or self.inMemory or self._holdDataSource) or force:
                         try:
                                 self.queryFS.close()
                         except:
@@ -1762,12 +1773,15 @@ class PAIRSQuery(object):
                                 "Unable to convert Pandas dataframe to GeoDataframe: '{}'".format(e)
                         )
 
-        def split_property_string_column(self):
+        def split_property_string_column(self, inferTypes=False):
                 """
                 Split the property string into multiple pandas vector dataframe columns.
 
                 *note:* Applies with CSV vector data import only.
 
+                :param inferTypes:  convert property columns with numeric values only to numeric
+                                                        data types, otherwise all property values are kept as strings
+                :type inferTypes:   bool
                 :raises Exception:  if existing columns clash with the generation of property
                                                         columns produced here
                 """
@@ -1781,14 +1795,7 @@ class PAIRSQuery(object):
                 )
                 if len(propertyCols)>0:
                         # split the property column (assumption: there is just one)
-                        split = pandas.DataFrame(
-                                self.vdf[propertyCols[0]].apply(
-                                        lambda x: dict(
-                                                item.split(PROPERTY_STRING_SPLIT_CHAR2, 1)
-                                                for item in x.split(PROPERTY_STRING_SPLIT_CHAR1)
-                                        ) if isinstance(x, string_type) else {}
-                                ).tolist()
-                        )
+                        split = self._split_property_strings(self.vdf[propertyCols[0]], inferTypes=inferTypes)
                         # check that there was no previous call of this function or there
                         # is no column existing with the name of any property split
                         doubledCols = list(set(self.vdf.columns.intersection(split.columns)))
@@ -1807,6 +1814,55 @@ class PAIRSQuery(object):
                                 logger.error(msg)
                                 raise Exception(msg)
 
+        @staticmethod
+        def _split_property_strings(propertyStrings, inferTypes=False):
+                """
+                Split property strings of the form `key1:value1;key2:value2` into columns.
+
+                *note:* The key set is determined once for all rows, rows not providing a
+                key get a missing value, and for keys repeated within a row the last value wins.
+
+                :param propertyStrings:     property strings, non-string entries are ignored
+                :type propertyStrings:      pandas.Series
+                :param inferTypes:          convert columns with numeric values only to numeric data types
+                :type inferTypes:           bool
+                :returns:                   one column per property key, ordered by first appearance,
+                                                                        with a range index aligned to the rows of `propertyStrings`
+                :rtype:                     pandas.DataFrame
+                """
+                # note: the string accessor yields missing values for non-string entries
+                propertyStrings = pandas.Series(
+                        propertyStrings.to_numpy(dtype=object), dtype=object,
+                )
+                # one row per key-value pair, labeled with the position of the original row
+                try:
+                        items = propertyStrings.str.split(PROPERTY_STRING_SPLIT_CHAR1).explode()
+                        items = items[items.str.contains(PROPERTY_STRING_SPLIT_CHAR2, regex=False, na=False)]
+                except AttributeError:
+                        # no string entries at all
+                        items = []
+                if len(items) == 0:
+                        return pandas.DataFrame(index=pandas.RangeIndex(len(propertyStrings)))
+                keyValues = items.str.split(PROPERTY_STRING_SPLIT_CHAR2, n=1, expand=True)
+                keyValues.columns = ['key', 'value']
+                keyValues['row'] = keyValues.index
+                # note: the column order has to be taken before the duplicates are dropped
+                keys = pandas.unique(keyValues['key'])
+                keyValues = keyValues.drop_duplicates(subset=['row', 'key'], keep='last')
+                split = keyValues.pivot(index='row', columns='key', values='value')
+                split = split.reindex(
+                        index   = pandas.RangeIndex(len(propertyStrings)),
+                        columns = keys,
+                )
+                split.columns.name = None
+                if inferTypes:
+                        for col in split.columns:
+                                try:
+                                        split[col] = pandas.to_numeric(split[col])
+                                except (ValueError, TypeError):
+                                        pass
+                return split
+
         def query_pairs_polygon(self, polyID):
                 """
                 Uses PAIRS API to obtain the polygon that corresponds to a given AoI ID.
@@ -2066,7 +2122,7 @@ class PAIRSQuery(object):
                         finally:
                                 self._closeDataSource()
 
-        def create_layer(self, fileName, layerMeta, defaultExtension=u''):
+        def create_layer(self, fileName, layerMeta, defaultExtension=u'', keepDtype=None):
                 """
                 Load layer data such as raster or vector data.
 
@@ -2077,8 +2133,28 @@ class PAIRSQuery(object):
                 :type layerMeta:            dict
                 :param defaultExtension:    sets default extension for data layer types not specified
                 :type defaultExtension:     str
+                :param keepDtype:           keep the raster's source data type and mask no-data pixels
+                                                                        with a `numpy.ma.MaskedArray` instead of converting to
+                                                                        `numpy.float64` with `numpy.nan` as no-data value,
+                                                                        defaults to `RASTER_KEEP_DTYPE` if `None`
+                :type keepDtype:            bool
                 :raises Exception:          if layer data cannot be loaded from query ZIP file
                 """
+                layerData = self._load_layer(fileName, layerMeta, defaultExtension=defaultExtension, keepDtype=keepDtype)
+                # assign loaded data to object's data dictionary
+                if layerData is not None:
+                        self.data[fileName] = layerData
+
+        def _load_layer(self, fileName, layerMeta, defaultExtension=u'', keepDtype=None):
+                """
+                Load layer data without assigning it to `self.data`, cf. `create_layer()`.
+
+                :returns:                   loaded layer data, `None` if vector data could not be loaded
+                :rtype:                     numpy.ndarray or pandas.DataFrame
+                """
+                if keepDtype is None:
+                        keepDtype = self.RASTER_KEEP_DTYPE
+                layerData = None
                 # convert timestamp information (if any)
                 if PAIRS_META_TIMESTAMP_NAME in layerMeta.keys() \
                 and not isinstance(layerMeta[PAIRS_META_TIMESTAMP_NAME], datetime.datetime):
@@ -2100,38 +2176,23 @@ class PAIRSQuery(object):
                 if layerMeta['layerType'] == PAIRS_RASTER_QUERY_NAME \
                      and not PAIRS_JSON_SPAT_AGG_KEY in layerMeta:
                         if HAS_GDAL:
-                                # note: Unforetunately GDAL does not allow to directly take Python
-                                # binary file streams, thus one needs to inefficiently write back
-                                # to local temporary file to get a physical file name one can and over
-                                # with a file name string
                                 self._openDataSource()
+                                memFilePath = None
                                 try:
-                                        # extract data to temporary file from ZIP
-                                        # note: it looks like having the delete option causes issues on Windows machines
-                                        # therefore we extract to the standard temporary directory and hope for the OS
-                                        # to clean up, and that sufficient disk space is provided in the temporary directory
-                                        tempFilePath = None
-                                        with tempfile.NamedTemporaryFile('wb', delete=False,) as tf: #dir=self.downloadDir)
-                                                with self.queryFS.open(layerDataPath, 'rb') as zf:
-                                                        tf.write(zf.read())
-                                                tf.flush()
-                                                # record path of temporary file
-                                                tempFilePath = tf.name
-                                                # directly read from data path
-                                                ds = gdal.Open(tf.name)
-                                                a  = numpy.array(ds.GetRasterBand(1).ReadAsArray(), dtype=numpy.float64)
-                                                ds = None
-                                        # try to expliticly remove the temporary file used to load the data
-                                        if tempFilePath is not None:
-                                                try:
-                                                        os.remove(tempFilePath)
-                                                except:
-                                                        pass
+                                        # note: GDAL does not take Python binary file streams, thus we
+                                        # hand over a path in GDAL's virtual file systems instead of
+                                        # writing the raster to a local temporary file first
+                                        gdalPath, memFilePath = self._gdal_raster_path(layerDataPath)
+                                        ds = gdal.Open(gdalPath)
+                                        a  = ds.GetRasterBand(1).ReadAsArray()
+                                        ds = None
                                 except Exception as e:
                                         logger.error(
                                                 "Unable to load '{}' from '{}' into NumPy array using GDAL: {}".format(fileName, self.zipFilePath, e)
                                         )
                                 finally:
+                                        if memFilePath is not None:
+                                                gdal.Unlink(memFilePath)
                                         self._closeDataSource()
                         else:
                                 self._openDataSource()
@@ -2139,27 +2200,14 @@ class PAIRSQuery(object):
                                         logger.warning(
                                                 "GDAL is not available for proper GeoTiff loading, default to standard PIL module to load raster data."
                                         )
-                                        # note: it seems we (unfortunately) have to temporarily write/export
-                                        # the image to load to the local file system first, because directly
-                                        # reading the multi-wrapped virtual file handler with PIL.Image.open()
-                                        # is extremely slow
-                                        # TODO: explore more elegant options (problem with stream-buffer size?)
-                                        tempFilePath = None
-                                        with tempfile.NamedTemporaryFile('wb', delete=False,) as tf:
-                                                # write raster data/image to temporary file
-                                                with self.queryFS.open(layerDataPath, 'rb') as zf:
-                                                        tf.write(zf.read())
-                                                tf.flush()
-                                                # load temporary file with PIL into NumPy array
-                                                with open(tf.name, 'rb') as f:
-                                                        im = PIL.Image.open(f)
-                                                        a = numpy.array(im).astype(numpy.float64)
-                                        # try to expliticly remove the temporary file used to load the data
-                                        if tempFilePath is not None:
-                                                try:
-                                                        os.remove(tempFilePath)
-                                                except:
-                                                        pass
+                                        # note: the member stream is handed to PIL directly, only streams
+                                        # PIL cannot seek in are read at once into an in-memory stream
+                                        with self.queryFS.openbin(layerDataPath) as zf:
+                                                if zf.seekable():
+                                                        a = numpy.array(PIL.Image.open(zf))
+                                                else:
+                                                        with io.BytesIO(zf.read()) as f:
+                                                                a = numpy.array(PIL.Image.open(f))
                                 except Exception as e:
                                         logger.error(
                                                 "Unable to load '{}' from '{}' into NumPy array using PIL: {}".format(fileName, self.zipFilePath, e)
@@ -2168,70 +2216,40 @@ class PAIRSQuery(object):
                                         self._closeDataSource()
                         # mask no-data value
                         if 'details' in layerMeta and 'pixelNoDataVal' in layerMeta['details']:
-                                a[a==numpy.float64(layerMeta['details']['pixelNoDataVal'])] = numpy.nan
+                                noDataVal = layerMeta['details']['pixelNoDataVal']
                         else:
                                 logger.warning(
                                                 "Unable to identify pixel no-data value, using default '{}'.".format(PAIRS_DEFAULT_NODATA_VALUE)
                                 )
-                                a[a==numpy.float64(PAIRS_DEFAULT_NODATA_VALUE)] = numpy.nan
-                        # assign loaded data to object's data dictionary
-                        self.data[fileName] = a
+                                noDataVal = PAIRS_DEFAULT_NODATA_VALUE
+                        layerData = self._mask_nodata(
+                                a, noDataVal, keepDtype=keepDtype, blockSize=self.RASTER_MASK_BLOCK_SIZE,
+                        )
                 # load vector data (note: CSV file format assumed)
                 elif layerMeta['layerType'] == PAIRS_VECTOR_QUERY_NAME \
                         or PAIRS_JSON_SPAT_AGG_KEY in layerMeta:
                         self._openDataSource()
                         try:
-                                with self.queryFS.open(layerDataPath, 'rb') as f:
-                                        # spatial aggregation vector data
-                                        if PAIRS_JSON_SPAT_AGG_KEY in layerMeta:
-                                                logger.info('Identified spatial aggregation data.')
-                                                self.data[fileName] = pandas.read_csv(
+                                # spatial aggregation vector data
+                                if PAIRS_JSON_SPAT_AGG_KEY in layerMeta:
+                                        logger.info('Identified spatial aggregation data.')
+                                        with self.queryFS.open(layerDataPath, 'rb') as f:
+                                                layerData = pandas.read_csv(
                                                         f,
                                                         header      = 0,
                                                         index_col   = False,
                                                         quotechar   = PAIRS_VECTOR_CSV_QUOTE_CHAR,
                                                 )
-                                        # *conventional* PAIRS vector data
-                                        else:
-                                                try:
-                                                        self.data[fileName] = pandas.read_csv(
-                                                                f,
-                                                                header      = 0,
-                                                                index_col   = False,
-                                                                quotechar   = PAIRS_VECTOR_CSV_QUOTE_CHAR,
-                                                                parse_dates = {
-                                                                        PAIRS_VECTOR_TIMESTAMP_COLUMN_NAME: [PAIRS_VECTOR_CSV_TIMESTAMP_COL_NUM]
-                                                                },
-                                                        )
-                                                except:
-                                                        # catch clash due to same timestamp column naming (Pandas bug)
-                                                        with self.queryFS.open(layerDataPath, 'rb') as f2:
-                                                                self.data[fileName] = pandas.read_csv(
-                                                                        f2,
-                                                                        header      = 0,
-                                                                        index_col   = False,
-                                                                        quotechar   = PAIRS_VECTOR_CSV_QUOTE_CHAR,
-                                                                        parse_dates = [PAIRS_VECTOR_CSV_TIMESTAMP_COL_NUM],
-                                                                )
+                                # *conventional* PAIRS vector data
+                                else:
+                                        with self._vector_csv(layerDataPath) as layerData:
                                                 logger.info(
                                                         "'{}' from '{}' loaded into Pandas dataframe.".format(layerDataPath, self.zipFilePath)
                                                 )
-                                                # check if timestamp column is completely empty, and if so,
-                                                # assign the timestamp from the meta data
-                                                try:
-                                                        if self.data[fileName][PAIRS_VECTOR_TIMESTAMP_COLUMN_NAME].apply(
-                                                                lambda t: isinstance(t, pandas._libs.tslibs.nattype.NaTType)
-                                                        ).all() and PAIRS_VECTOR_TIMESTAMP_COLUMN_NAME in layerMeta.keys():
-                                                                self.data[fileName][PAIRS_VECTOR_TIMESTAMP_COLUMN_NAME] = layerMeta[PAIRS_META_TIMESTAMP_NAME]
-                                                                logger.info(
-                                                                        "Successfully populated timestamp column '{}' with '{}'.".format(
-                                                                                PAIRS_VECTOR_TIMESTAMP_COLUMN_NAME,
-                                                                                layerMeta[PAIRS_META_TIMESTAMP_NAME]
-                                                                        )
-                                                                )
-                                                except:
-                                                        # silently pass if this bonus option does not work
-                                                        pass
+                                        # check if timestamp column is completely empty, and if so,
+                                        # assign the timestamp from the meta data
+                                        if self._vector_timestamp_missing(layerData, layerMeta):
+                                                self._fill_vector_timestamp(layerData, layerMeta)
                         except Exception as e:
                                 logger.error(
                                         "Unable to load '{}' from '{}' into Pandas dataframe: {}".format(layerDataPath, self.zipFilePath, e)
@@ -2243,20 +2261,355 @@ class PAIRSQuery(object):
                         logger.error(msg)
                         raise Exception(msg)
 
-        def create_layers(self, defaultExtension=u''):
+                return layerData
+
+        def _gdal_raster_path(self, layerDataPath):
+                """
+                Get a path GDAL can open a raster of the query result from.
+
+                The raster is read directly from the query ZIP file on disk through GDAL's
+                `/vsizip/` file system. Rasters not available on disk (e.g. for in-memory
+                queries) are copied into GDAL's `/vsimem/` file system.
+
+                :param layerDataPath:       path of the raster file within the query data source
+                :type layerDataPath:        str
+                :returns:                   GDAL path to open, and the `/vsimem/` path to unlink
+                                                                        after use (`None` if nothing needs cleanup)
+                :rtype:                     (str, str)
+                """
+                # query ZIP file on local disk
+                if self.zipFilePath is not None \
+                and self.fs is not None and self.fs.hassyspath(self.zipFilePath):
+                        return u'/vsizip/{}/{}'.format(
+                                self.fs.getsyspath(self.zipFilePath),
+                                layerDataPath,
+                        ), None
+                # query data in local directory
+                if self.queryFS.hassyspath(layerDataPath):
+                        return self.queryFS.getsyspath(layerDataPath), None
+                # query data in memory
+                memFilePath = u'/vsimem/{}/{}'.format(uuid.uuid4().hex, os.path.basename(layerDataPath))
+                with self.queryFS.open(layerDataPath, 'rb') as zf:
+                        gdal.FileFromMemBuffer(memFilePath, zf.read())
+                return memFilePath, memFilePath
+
+        @staticmethod
+        def _mask_nodata(a, noDataVal, keepDtype=False, blockSize=None):
+                """
+                Mask no-data pixels of a raster array.
+
+                :param a:                   raster data as loaded from file
+                :type a:                    numpy.ndarray
+                :param noDataVal:           pixel no-data value
+                :type noDataVal:            float
+                :param keepDtype:           keep the data type of `a` and return a masked array
+                                                                        (a view on `a`), otherwise convert to `numpy.float64` and
+                                                                        set no-data pixels to `numpy.nan` in place
+                :type keepDtype:            bool
+                :param blockSize:           number of pixels compared to the no-data value at once when
+                                                                        setting `numpy.nan` in place, defaults to
+                                                                        `RASTER_MASK_BLOCK_SIZE` if `None`
+                :type blockSize:            int
+                :returns:                   masked raster data
+                :rtype:                     numpy.ndarray or numpy.ma.MaskedArray
+                """
+                if keepDtype:
+                        # note: the mask is stored as one byte per pixel, and it collapses to
+                        # `numpy.ma.nomask` if no pixel is masked at all
+                        a = numpy.ma.masked_where(numpy.equal(a, noDataVal), a, copy=False)
+                        try:
+                                a.fill_value = noDataVal
+                        except (TypeError, ValueError, OverflowError):
+                                # no-data value not representable in the raster's data type
+                                pass
+                else:
+                        a = a.astype(numpy.float64, copy=False)
+                        noDataVal = numpy.float64(noDataVal)
+                        if numpy.isnan(noDataVal):
+                                return a
+                        if blockSize is None:
+                                blockSize = PAIRSQuery.RASTER_MASK_BLOCK_SIZE
+                        # compare blocks of rows such that the boolean temporary never
+                        # spans the whole raster
+                        rows = numpy.atleast_1d(a)
+                        step = max(1, blockSize // max(1, rows[0:1].size))
+                        for i in range(0, len(rows), step):
+                                block = rows[i:i+step]
+                                numpy.putmask(block, block==noDataVal, numpy.nan)
+                return a
+
+        def layer_as_float(self, fileName, dtype=numpy.float64):
+                """
+                Get raster layer data as floating point array with `numpy.nan` for no-data pixels.
+
+                :param fileName:            the key to identify a data layer, cf. `self.data`
+                :type fileName:             str
+                :param dtype:               floating point data type to promote to
+                :type dtype:                numpy.dtype
+                :returns:                   raster data with no-data pixels set to `numpy.nan`
+                :rtype:                     numpy.ndarray
+                :raises Exception:          if the layer is not a loaded raster layer
+                """
+                a = self.data.get(fileName) if self.data is not None else None
+                if not isinstance(a, numpy.ndarray):
+                        msg = "No raster data loaded for layer '{}'.".format(fileName)
+                        logger.error(msg)
+                        raise Exception(msg)
+                if isinstance(a, numpy.ma.MaskedArray):
+                        return a.astype(dtype).filled(numpy.nan)
+                else:
+                        return a.astype(dtype, copy=False)
+
+        def _vector_csv_timestamp_column(self, layerDataPath):
+                """
+                Get the name of the timestamp column in the header of *conventional* PAIRS vector data.
+
+                :param layerDataPath:       path of the vector data in the query data source
+                :type layerDataPath:        str
+                :returns:                   the column name, `None` if there is no such column
+                :rtype:                     str
+                """
+                with self.queryFS.open(layerDataPath, 'rb') as f:
+                        header = pandas.read_csv(
+                                f,
+                                header      = 0,
+                                index_col   = False,
+                                quotechar   = PAIRS_VECTOR_CSV_QUOTE_CHAR,
+                                nrows       = 0,
+                        ).columns
+                if len(header) > PAIRS_VECTOR_CSV_TIMESTAMP_COL_NUM:
+                        return header[PAIRS_VECTOR_CSV_TIMESTAMP_COL_NUM]
+                return None
+
+        @contextlib.contextmanager
+        def _vector_csv(self, layerDataPath, columns=None, chunkSize=None):
+                """
+                Read *conventional* PAIRS vector data, the timestamp column is parsed and named
+                `PAIRS_VECTOR_TIMESTAMP_COLUMN_NAME` where pandas supports it.
+
+                :param layerDataPath:       path of the vector data in the query data source
+                :type layerDataPath:        str
+                :param columns:             names of the columns to load, all columns if `None`
+                :type columns:              list
+                :param chunkSize:           number of rows read per chunk, all rows at once if `None`
+                :type chunkSize:            int
+                :returns:                   context of the data, or of an iterator of data chunks
+                                                                        if `chunkSize` is set (the file is closed on exit)
+                :rtype:                     pandas.DataFrame or iterator of pandas.DataFrame
+                """
+                # note: the timestamp column is addressed by name, positions would shift with `columns`
+                timestampCol = self._vector_csv_timestamp_column(layerDataPath)
+                if columns is not None and timestampCol not in columns:
+                        timestampCol = None
+                def read(f, parseDates):
+                        data = pandas.read_csv(
+                                f,
+                                header      = 0,
+                                index_col   = False,
+                                quotechar   = PAIRS_VECTOR_CSV_QUOTE_CHAR,
+                                usecols     = columns,
+                                parse_dates = parseDates,
+                                chunksize   = chunkSize,
+                        )
+                        if chunkSize is not None:
+                                # parse the first chunk right away to catch a failing date parsing here
+                                data = itertools.chain(list(itertools.islice(data, 1)), data)
+                        return data
+                f = self.queryFS.open(layerDataPath, 'rb')
+                try:
+                        if timestampCol is None:
+                                data = read(f, None)
+                        else:
+                                try:
+                                        data = read(f, {PAIRS_VECTOR_TIMESTAMP_COLUMN_NAME: [timestampCol]})
+                                except:
+                                        # catch clash due to same timestamp column naming (Pandas bug)
+                                        f.close()
+                                        f = self.queryFS.open(layerDataPath, 'rb')
+                                        data = read(f, [timestampCol])
+                        yield data
+                finally:
+                        f.close()
+
+        @staticmethod
+        def _vector_timestamp_missing(layerData, layerMeta):
+                """
+                Check if the timestamp column of vector data is completely empty and can be
+                populated from the layer meta data.
+
+                :param layerData:           vector data
+                :type layerData:            pandas.DataFrame
+                :param layerMeta:           meta data of the layer
+                :type layerMeta:            dict
+                :rtype:                     bool
+                """
+                try:
+                        return PAIRS_VECTOR_TIMESTAMP_COLUMN_NAME in layerMeta.keys() \
+                        and layerData[PAIRS_VECTOR_TIMESTAMP_COLUMN_NAME].apply(
+                                lambda t: isinstance(t, pandas._libs.tslibs.nattype.NaTType)
+                        ).all()
+                except:
+                        return False
+
+        @staticmethod
+        def _fill_vector_timestamp(layerData, layerMeta):
+                """
+                Populate the timestamp column of vector data from the layer meta data.
+
+                :param layerData:           vector data, modified in place
+                :type layerData:            pandas.DataFrame
+                :param layerMeta:           meta data of the layer
+                :type layerMeta:            dict
+                """
+                try:
+                        layerData[PAIRS_VECTOR_TIMESTAMP_COLUMN_NAME] = layerMeta[PAIRS_META_TIMESTAMP_NAME]
+                        logger.info(
+                                "Successfully populated timestamp column '{}' with '{}'.".format(
+                                        PAIRS_VECTOR_TIMESTAMP_COLUMN_NAME,
+                                        layerMeta[PAIRS_META_TIMESTAMP_NAME]
+                                )
+                        )
+                except:
+                        # silently pass if this bonus option does not work
+                        pass
+
+        def iter_layer_chunks(self, fileName, chunkSize=None, columns=None, predicate=None):
+                """
+                Stream vector or spatial aggregation data of a layer in chunks.
+
+                In contrast to `create_layer()` the data is read in batches of rows directly
+                from the query data source, and it is not stored in `self.data`. Otherwise the
+                chunks are the same, i.e. their concatenation equals the data of `create_layer()`.
+
+                :param fileName:            the key to identify a data layer, cf. `self.metadata`
+                :type fileName:             str
+                :param chunkSize:           number of rows read per chunk,
+                                                                        defaults to `VECTOR_CHUNK_SIZE` if `None`
+                :type chunkSize:            int
+                :param columns:             names of the columns (in the CSV header) to load, all columns if `None`
+                :type columns:              list
+                :param predicate:           function taking a chunk and returning a boolean mask of the rows to keep,
+                                                                        chunks without any row left are skipped
+                :type predicate:            function
+                :returns:                   generator of data chunks
+                :rtype:                     generator of pandas.DataFrame
+                :raises Exception:          if the layer is unknown or is not vector data
+                """
+                if chunkSize is None:
+                        chunkSize = self.VECTOR_CHUNK_SIZE
+                # Make sure that the layer listing exists
+                if self.metadata is None:
+                        self.list_layers()
+                if self.metadata is None or fileName not in self.metadata:
+                        msg = "Unknown layer '{}'.".format(fileName)
+                        logger.error(msg)
+                        raise Exception(msg)
+                layerMeta = self.metadata[fileName]
+                if not (layerMeta.get('layerType') == PAIRS_VECTOR_QUERY_NAME or PAIRS_JSON_SPAT_AGG_KEY in layerMeta):
+                        msg = "Layer '{}' is not vector data, chunks can be read from vector data only.".format(fileName)
+                        logger.error(msg)
+                        raise Exception(msg)
+                layerDataPath = fileName + self.VECTOR_FILE_EXTENSION
+
+                self._openDataSource()
+                self._holdDataSource += 1
+                try:
+                        # spatial aggregation vector data
+                        if PAIRS_JSON_SPAT_AGG_KEY in layerMeta:
+                                with self.queryFS.open(layerDataPath, 'rb') as f:
+                                        reader = pandas.read_csv(
+                                                f,
+                                                header      = 0,
+                                                index_col   = False,
+                                                quotechar   = PAIRS_VECTOR_CSV_QUOTE_CHAR,
+                                                usecols     = columns,
+                                                chunksize   = chunkSize,
+                                        )
+                                        with reader:
+                                                for chunk in reader:
+                                                        if predicate is not None:
+                                                                chunk = chunk[predicate(chunk)]
+                                                                if len(chunk) == 0:
+                                                                        continue
+                                                        yield chunk
+                        # *conventional* PAIRS vector data
+                        else:
+                                fillTimestamp = None
+                                with self._vector_csv(layerDataPath, columns=columns, chunkSize=chunkSize) as reader:
+                                        for chunk in reader:
+                                                # as in `create_layer()` the timestamp is populated from the meta
+                                                # data if it is missing from all rows, not only from this chunk
+                                                if fillTimestamp is None:
+                                                        fillTimestamp = self._vector_timestamp_missing(chunk, layerMeta)
+                                                        if fillTimestamp:
+                                                                with self._vector_csv(
+                                                                        layerDataPath,
+                                                                        columns     = [self._vector_csv_timestamp_column(layerDataPath)],
+                                                                        chunkSize   = chunkSize,
+                                                                ) as timestamps:
+                                                                        fillTimestamp = all(
+                                                                                self._vector_timestamp_missing(t, layerMeta) for t in timestamps
+                                                                        )
+                                                if fillTimestamp:
+                                                        self._fill_vector_timestamp(chunk, layerMeta)
+                                                if predicate is not None:
+                                                        chunk = chunk[predicate(chunk)]
+                                                        if len(chunk) == 0:
+                                                                continue
+                                                yield chunk
+                finally:
+                        self._holdDataSource -= 1
+                        self._closeDataSource()
+
+        def create_layers(self, defaultExtension=u'', keepDtype=None, numWorkers=None):
                 """
                 From PAIRS query ZIP file generate Python data structures for layers in memory.
 
+                *note*: Layers are loaded in parallel threads, decompression and GeoTiff decoding
+                release the GIL. `self.data` is populated in the order of `self.metadata`
+                regardless of the number of workers.
+
                 :param defaultExtension:    sets default extension for data layer types not specified
                 :type defaultExtension:     str
+                :param keepDtype:           keep the source data type of raster layers, cf. `create_layer()`
+                :type keepDtype:            bool
+                :param numWorkers:          number of layers to load in parallel,
+                                                                        defaults to `PAIRS_NUM_PARALLEL_LAYER_LOADS` if `None`
+                :type numWorkers:           int
                 """
+                if numWorkers is None:
+                        numWorkers = self.PAIRS_NUM_PARALLEL_LAYER_LOADS
                 # Make sure that the layer listing exists
                 if self.metadata is None:
                         self.list_layers()
                 # no raster data availabile?
                 if self.metadata is not None:
-                        for fileName, layerMeta in self.metadata.items():
-                                self.create_layer(fileName, layerMeta, defaultExtension=defaultExtension)
+                        layers = list(self.metadata.items())
+                        if numWorkers > 1 and len(layers) > 1:
+                                # open the data source once and share it among all workers
+                                self._openDataSource()
+                                self._holdDataSource += 1
+                                try:
+                                        with concurrent.futures.ThreadPoolExecutor(
+                                                max_workers=min(numWorkers, len(layers))
+                                        ) as pool:
+                                                layerDataList = pool.map(
+                                                        lambda layer: self._load_layer(
+                                                                layer[0], layer[1],
+                                                                defaultExtension    = defaultExtension,
+                                                                keepDtype           = keepDtype,
+                                                        ),
+                                                        layers
+                                                )
+                                                for (fileName, layerMeta), layerData in zip(layers, layerDataList):
+                                                        if layerData is not None:
+                                                                self.data[fileName] = layerData
+                                finally:
+                                        self._holdDataSource -= 1
+                                        self._closeDataSource()
+                        else:
+                                for fileName, layerMeta in layers:
+                                        self.create_layer(fileName, layerMeta, defaultExtension=defaultExtension, keepDtype=keepDtype)
 
 # }}}
 
@@ -2276,6 +2629,7 @@ class PAIRSTimeSeries(object):
         DATAFRAME_LATITUDE_NAME         = 'latitude'
         DATAFRAME_LONGITUDE_NAME        = 'longitude'
         DATAFRAME_TIMESTAMP_NAME        = 'timestamp'
+        DATAFRAME_LAYER_NAME            = 'layer'
         # PAIRS related configuration settings
         PAIRS_TIMESERIES_ENDPOINT       = 'v2/timeseries'
         PAIRS_QUERY_RETRIES             = 10
@@ -2658,4 +3012,70 @@ class PAIRSTimeSeries(object):
 
 
                         return fullDf
+
+        def to_long_dataframe(self, df):
+                """
+                Reshape a time series dataframe of `get_dataframe` into one row per layer and point in time.
+
+                :param df:          time series, one column per layer as returned by `get_dataframe`
+                :type df:           pandas.DataFrame
+                :returns:           table with the columns longitude, latitude, timestamp, layer and value
+                :rtype:             pandas.DataFrame
+                """
+                if not isinstance(df.index, pandas.RangeIndex):
+                        df = df.reset_index()
+                longDf = df.melt(
+                        id_vars     = [
+                                self.DATAFRAME_LONGITUDE_NAME,
+                                self.DATAFRAME_LATITUDE_NAME,
+                                self.DATAFRAME_TIMESTAMP_NAME,
+                        ],
+                        var_name    = self.DATAFRAME_LAYER_NAME,
+                        value_name  = self.PAIRS_JSON_VALUE_KEY_NAME,
+                ).dropna(subset=[self.PAIRS_JSON_VALUE_KEY_NAME])
+                longDf[self.DATAFRAME_LAYER_NAME] = longDf[self.DATAFRAME_LAYER_NAME].astype('category')
+                return longDf.reset_index(drop=True)
+
+        def to_arrow(self, df):
+                """
+                Convert a time series dataframe of `get_dataframe` into an Arrow table, one row per layer and point in time.
+
+                :param df:          time series as returned by `get_dataframe`
+                :type df:           pandas.DataFrame
+                :returns:           table with the columns longitude, latitude, timestamp, layer and value
+                :rtype:             pyarrow.Table
+                :raises Exception:  in case pyarrow is not installed
+                """
+                return common.dataframe_to_arrow(self.to_long_dataframe(df))
+
+        def to_parquet(
+                self,
+                df,
+                path,
+                partitionBy = None,
+                append      = True,
+        ):
+                """
+                Write a time series dataframe of `get_dataframe` to a Parquet dataset partitioned by layer and date,
+                appending to the dataset in `path` if it exists.
+
+                :param df:          time series as returned by `get_dataframe`
+                :type df:           pandas.DataFrame
+                :param path:        folder of the dataset
+                :type path:         str
+                :param partitionBy: partition columns, defaults to layer and the date of the timestamp
+                :type partitionBy:  list
+                :param append:      whether to add to existing partitions rather than replace the ones written
+                :type append:       bool
+                :returns:           folder of the dataset
+                :rtype:             str
+                :raises Exception:  in case pyarrow is not installed
+                """
+                return common.write_parquet_dataset(
+                        self.to_long_dataframe(df),
+                        path         = path,
+                        partition_by = [self.DATAFRAME_LAYER_NAME, constants.GLOBAL_PARQUET_DATE_COLUMN] if partitionBy is None else partitionBy,
+                        append       = append,
+                        timestamp    = self.DATAFRAME_TIMESTAMP_NAME,
+                )
 #}}}
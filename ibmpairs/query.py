@@ -16,6 +16,14 @@ import warnings
 import re
 from typing import List, Any
 from io import StringIO, BytesIO
+import base64
+import hashlib
+import fnmatch
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
 #}}}
 # fold: Import ibmpairs Modules {{{
 # ibmpairs Modules:
@@ -55,6 +63,14 @@ try:
 except:
     pass
 
+HAS_RASTERIO = False
+try:
+    import rasterio
+    import rasterio.windows
+    HAS_RASTERIO = True
+except:
+    pass
+
 #
 class Aggregation:
     #_aoi: List[str]
@@ -165,7 +181,7 @@ class Aggregation:
         if isinstance(aggregation_json, dict):
             aggregation = Aggregation.from_dict(aggregation_json)
         elif isinstance(aggregation_json, str):
-            aggregation_dict = json.loads(aggregation_json)
+            aggregation_dict = common.json_loads(aggregation_json)
             aggregation = Aggregation.from_dict(aggregation_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(aggregation_json), "aggregation_json")
@@ -374,7 +390,7 @@ class Dimension:
         if isinstance(dimension_json, dict):
             dimension = Dimension.from_dict(dimension_json)
         elif isinstance(dimension_json, str):
-            dimension_dict = json.loads(dimension_json)
+            dimension_dict = common.json_loads(dimension_json)
             dimension = Dimension.from_dict(dimension_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(dimension_json), "dimension_json")
@@ -557,7 +573,7 @@ class Filter:
         if isinstance(filter_json, dict):
             filter_ = Filter.from_dict(filter_json)
         elif isinstance(filter_json, str):
-            filter_dict = json.loads(filter_json)
+            filter_dict = common.json_loads(filter_json)
             filter_ = Filter.from_dict(filter_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(filter_json), "filter_json")
@@ -739,7 +755,7 @@ class Interval:
         if isinstance(interval_json, dict):
             interval = Interval.from_dict(interval_json)
         elif isinstance(interval_json, str):
-            interval_dict = json.loads(interval_json)
+            interval_dict = common.json_loads(interval_json)
             interval = Interval.from_dict(interval_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(interval_json), "interval_json")
@@ -895,7 +911,7 @@ class Temporal:
         if isinstance(temporal_json, dict):
             temporal = Temporal.from_dict(temporal_json)
         elif isinstance(temporal_json, str):
-            temporal_dict = json.loads(temporal_json)
+            temporal_dict = common.json_loads(temporal_json)
             temporal = Temporal.from_dict(temporal_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(temporal_json), "temporal_json")
@@ -1360,7 +1376,7 @@ class Layer:
         if isinstance(layer_json, dict):
             layer = Layer.from_dict(layer_json)
         elif isinstance(layer_json, str):
-            layer_dict = json.loads(layer_json)
+            layer_dict = common.json_loads(layer_json)
             layer = Layer.from_dict(layer_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(layer_json), "layer_json")
@@ -1555,7 +1571,7 @@ class Notification:
         if isinstance(notification_json, dict):
             notification = Notification.from_dict(notification_json)
         elif isinstance(notification_json, str):
-            notification_dict = json.loads(notification_json)
+            notification_dict = common.json_loads(notification_json)
             notification = Notification.from_dict(notification_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(notification_json), "notification_json")
@@ -1683,7 +1699,7 @@ class Polygon:
         if isinstance(polygon_json, dict):
             polygon = Polygon.from_dict(polygon_json)
         elif isinstance(polygon_json, str):
-            polygon_dict = json.loads(polygon_json)
+            polygon_dict = common.json_loads(polygon_json)
             polygon = Polygon.from_dict(polygon_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(polygon_json), "polygon_json")
@@ -1981,7 +1997,7 @@ class Spatial:
         if isinstance(spatial_json, dict):
             spatial = Spatial.from_dict(spatial_json)
         elif isinstance(spatial_json, str):
-            spatial_dict = json.loads(spatial_json)
+            spatial_dict = common.json_loads(spatial_json)
             spatial = Spatial.from_dict(spatial_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(spatial_json), "spatial_json")
@@ -2191,7 +2207,7 @@ class Upload:
         if isinstance(upload_json, dict):
             upload = Upload.from_dict(upload_json)
         elif isinstance(upload_json, str):
-            upload_dict = json.loads(upload_json)
+            upload_dict = common.json_loads(upload_json)
             upload = Upload.from_dict(upload_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(upload_json), "upload_json")
@@ -2622,7 +2638,7 @@ class QueryResponseData:
         if isinstance(query_response_data_json, dict):
             query_response_data = QueryResponseData.from_dict(query_response_data_json)
         elif isinstance(query_response_data_json, str):
-            query_response_data_dict = json.loads(query_response_data_json)
+            query_response_data_dict = common.json_loads(query_response_data_json)
             query_response_data = QueryResponseData.from_dict(query_response_data_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(query_response_data_json), "query_response_data_json")
@@ -2641,6 +2657,130 @@ class QueryResponseData:
       
         return json.dumps(self.to_dict())
         
+#
+def _range_received(response: cl.ClientResponse,
+                    first: int,
+                    last: int
+                   ):
+    
+    """
+    The function checks that a ranged download to file received exactly the requested bytes, 
+    i.e. a 206 response whose Content-Range is first-last and as many bytes as that range.
+    
+    :param response:  The response of ibmpairs.client.Client.async_get_to_file.
+    :type response:   ibmpairs.client.ClientResponse
+    :param first:     The first byte of the range.
+    :type first:      int
+    :param last:      The last byte (inclusive) of the range.
+    :type last:       int
+    :returns:         The range was received.
+    :rtype:           bool
+    """
+    
+    match = re.match(r'^\s*bytes\s+(\d+)-(\d+)/', response.content_range or '')
+    
+    return ((response.status == 206) and (match is not None) and 
+            (int(match.group(1)) == first) and (int(match.group(2)) == last) and 
+            (response.bytes_written == last - first + 1))
+
+#
+def _point_data_column(values: list, 
+                       kind: str
+                      ):
+    
+    """
+    The function converts the values of one column of point query data to an array.
+    
+    :param values:  The values of the column.
+    :type values:   list
+    :param kind:    One of 'id', 'int', 'float', 'value' or 'category'.
+    :type kind:     str
+    :returns:       The column.
+    :rtype:         numpy.ndarray or pandas.Categorical
+    """
+    
+    if kind == 'category':
+        return pandas.Categorical([None if value is None else str(value) for value in values])
+    
+    if kind in ['id', 'int']:
+        column = None
+        if None not in values:
+            try:
+                column = np.array(values, dtype = np.int64)
+            except (TypeError, ValueError, OverflowError):
+                pass
+        if column is None:
+            column = pandas.array(pandas.to_numeric(pandas.Series(values, dtype = object)), dtype = "Int64")
+        if kind == 'id':
+            return pandas.Categorical(column)
+        return column
+    
+    try:
+        return np.array([np.nan if value is None else value for value in values], dtype = np.float64)
+    except (TypeError, ValueError):
+        if kind == 'value':
+            return pandas.Categorical([None if value is None else str(value) for value in values])
+        raise
+
+#
+def _point_data_csv(data: str,
+                    engine: str = constants.QUERY_POINT_CSV_ENGINE
+                   ):
+    
+    """
+    The function reads compact csv point query data with the dtypes of the json columns, 
+    see constants.QUERY_POINT_DATA_COLUMNS: the header names of a json row are renamed 
+    and layer_id is a category of integers.
+    
+    :param data:    The csv.
+    :type data:     str
+    :param engine:  The pandas.read_csv engine, 'auto' uses pyarrow if it is installed.
+    :type engine:   str
+    :returns:       The data.
+    :rtype:         pandas.DataFrame
+    """
+    
+    if engine == 'auto':
+        engine = 'pyarrow' if common.HAS_PYARROW else 'c'
+    
+    dtypes  = {}
+    names   = {}
+    for column, keys, kind in constants.QUERY_POINT_DATA_COLUMNS:
+        for key in set(keys + (column,)):
+            if kind in ['id', 'int']:
+                dtypes[key] = 'int64'
+            elif kind == 'float':
+                dtypes[key] = 'float64'
+            elif kind == 'category':
+                dtypes[key] = 'category'
+            if key != column:
+                names[key] = column
+    
+    if engine == 'pyarrow':
+        buffer = BytesIO(data.encode('utf-8'))
+    else:
+        buffer = StringIO(data)
+    
+    try:
+        df = pandas.read_csv(buffer, 
+                             dtype  = dtypes, 
+                             engine = engine
+                            )
+    except (TypeError, ValueError):
+        # Missing integers, read them as nullable integers.
+        buffer.seek(0)
+        df = pandas.read_csv(buffer, 
+                             dtype  = {key: ('Int64' if dtype == 'int64' else dtype) for key, dtype in dtypes.items()}, 
+                             engine = engine
+                            )
+    
+    df = df.rename(columns = names)
+    
+    if 'layer_id' in df.columns:
+        df['layer_id'] = df['layer_id'].astype('category')
+    
+    return df
+
 #
 class QueryResponse:
     #_id: str
@@ -2707,6 +2847,10 @@ class QueryResponse:
         self._data    = data
         self._message = message
         self._info    = info
+        # The rows of a json response, QueryResponseData objects are only built on access.
+        self._data_rows  = None
+        # The dataframe of data_as_dataframe(release = True).
+        self._data_frame = None
     
     #
     def get_id(self):
@@ -2740,10 +2884,15 @@ class QueryResponse:
     
     # 
     def get_data(self):
+        if (self._data is None) and (self._data_rows is not None):
+            self._data      = common.from_list(self._data_rows, QueryResponseData.from_dict)
+            self._data_rows = None
         return self._data
 
     #
     def set_data(self, data):
+        self._data_rows  = None
+        self._data_frame = None
         if isinstance(data, str):
             self._data = data
         else:
@@ -2798,11 +2947,12 @@ class QueryResponse:
         :raises Exception:             if not a dictionary.
         """
         
-        id      = None
-        url     = None
-        data    = None
-        message = None
-        info    = None
+        id        = None
+        url       = None
+        data      = None
+        data_rows = None
+        message   = None
+        info      = None
         
         common.check_dict(query_response_dict)
         if "id" in query_response_dict:
@@ -2816,19 +2966,21 @@ class QueryResponse:
                 if isinstance(query_response_dict.get("data"), str):
                     data = query_response_dict.get("data")
                 else:
-                    data = common.from_list(query_response_dict.get("data"), QueryResponseData.from_dict)
+                    data_rows = common.check_list(query_response_dict.get("data"))
         if "message" in query_response_dict:
             if query_response_dict.get("message") is not None:
                 message = common.check_str(query_response_dict.get("message"))
         if "info" in query_response_dict:
             if query_response_dict.get("info") is not None:
                 info = Info.from_dict(query_response_dict.get("info"))
-        return QueryResponse(id      = id,
-                             url     = url,
-                             data    = data,
-                             message = message,
-                             info    = info
-                            )
+        query_response = QueryResponse(id      = id,
+                                       url     = url,
+                                       data    = data,
+                                       message = message,
+                                       info    = info
+                                      )
+        query_response._data_rows = data_rows
+        return query_response
 
     #
     def to_dict(self):
@@ -2844,7 +2996,7 @@ class QueryResponse:
             query_response_dict["id"] = self._id
         if self._url is not None:
             query_response_dict["url"] = self._url
-        if self._data is not None:
+        if self.data is not None:
             if isinstance(self._data, str):
                 query_response_dict["data"] = self._data
             else:
@@ -2854,6 +3006,115 @@ class QueryResponse:
         if self._info is not None:
             query_response_dict["info"] = common.class_to_dict(self._info, Info)
         return query_response_dict
+    
+    #
+    def has_data(self):
+        
+        """
+        A method to check whether the response holds data, without building its rows.
+                    
+        :rtype:                     bool
+        """
+        
+        return (self._data is not None) or (self._data_rows is not None) or (self._data_frame is not None)
+    
+    #
+    def _data_document(self):
+        
+        """
+        An internal method to write the data of the response as a document: a csv response as 
+        it is and the rows of a json response or its dataframe as a json array, without 
+        building QueryResponseData objects.
+                    
+        :returns:                   The document, None if the response holds no rows.
+        :rtype:                     str
+        """
+        
+        if self._data_frame is not None:
+            if len(self._data_frame) == 0:
+                return None
+            return self._data_frame.to_json(orient = 'records')
+        elif isinstance(self._data, str):
+            if len(self._data) == 0:
+                return None
+            return self._data
+        elif self._data_rows is not None:
+            rows = self._data_rows
+        elif self._data is not None:
+            rows = [common.class_to_dict(item, QueryResponseData) for item in self._data]
+        else:
+            return None
+        
+        if len(rows) == 0:
+            return None
+        return json.dumps(rows)
+    
+    #
+    def data_as_dataframe(self,
+                          timestamp_as_datetime: bool = False,
+                          release: bool               = False,
+                          engine: str                 = constants.QUERY_POINT_CSV_ENGINE
+                         ):
+        
+        """
+        A method to load the data of the response into a pandas DataFrame. The rows of a json 
+        response are read column by column, without building a QueryResponseData per row, and 
+        a compact csv response by pandas.read_csv with the same dtypes: layer_id is a category, 
+        timestamp an integer, longitude and latitude floats, value a float if every value is 
+        numeric and the repeated strings (layer_name, dataset, region, unit, property, 
+        aggregation, alias) categories.
+        
+        :param timestamp_as_datetime:   Whether the timestamp (epoch milliseconds) is converted to datetime64 in UTC.
+        :type timestamp_as_datetime:    bool
+        :param release:                 Whether the raw data is released once it is read, the dataframe is kept and 
+                                        returned by later calls while data returns None.
+        :type release:                  bool
+        :param engine:                  The pandas.read_csv engine of a csv response, 'auto' uses pyarrow if it is installed.
+        :type engine:                   str
+        :returns:                       A dataframe of the data.
+        :rtype:                         pandas.DataFrame
+        :raises Exception:              if the response holds no data.
+        """
+        
+        if not self.has_data():
+            msg = messages.ERROR_QUERY_NO_POINT_DATA
+            logger.error(msg)
+            raise common.PAWException(msg)
+        
+        if self._data_frame is not None:
+            df = self._data_frame
+        elif isinstance(self._data, str):
+            df = _point_data_csv(self._data, 
+                                 engine = engine
+                                )
+        else:
+            if self._data_rows is not None:
+                rows = self._data_rows
+            else:
+                rows = [query_response_data.to_dict() for query_response_data in self._data]
+            
+            columns = {}
+            for column, keys, kind in constants.QUERY_POINT_DATA_COLUMNS:
+                values = [row.get(keys[0], row.get(keys[-1])) for row in rows]
+                if all(value is None for value in values):
+                    continue
+                columns[column] = _point_data_column(values, kind)
+            
+            df = pandas.DataFrame(columns)
+        
+        if release is True:
+            self._data_frame = df
+            self._data       = None
+            self._data_rows  = None
+        
+        if (timestamp_as_datetime is True) and ('timestamp' in df.columns):
+            df = df.assign(timestamp = pandas.to_datetime(df['timestamp'], 
+                                                          unit = 'ms', 
+                                                          utc  = True
+                                                         )
+                          )
+        
+        return df
         
     #
     def from_json(query_response_json: Any, 
@@ -2875,7 +3136,7 @@ class QueryResponse:
             if compact_csv:
                 query_response = QueryResponse(data = query_response_json)
             else:
-                query_response_dict = json.loads(query_response_json)
+                query_response_dict = common.json_loads(query_response_json)
                 query_response = QueryResponse.from_dict(query_response_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(query_response_json), "query_response_json")
@@ -3436,7 +3697,7 @@ class QueryJob:
         if isinstance(query_job_json, dict):
             query_job = QueryJob.from_dict(query_job_json)
         elif isinstance(query_job_json, str):
-            query_job_dict = json.loads(query_job_json)
+            query_job_dict = common.json_loads(query_job_json)
             query_job = QueryJob.from_dict(query_job_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(query_job_json), "query_job_json")
@@ -3598,7 +3859,7 @@ class QueryJobs:
         if isinstance(query_jobs_json, dict):
             query_jobs = QueryJobs.from_dict(query_jobs_json)
         elif isinstance(query_jobs_json, str):
-            query_jobs_dict = json.loads(query_jobs_json)
+            query_jobs_dict = common.json_loads(query_jobs_json)
             query_jobs = QueryJobs.from_dict(query_jobs_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(query_jobs_json), "query_jobs_json")
@@ -4178,7 +4439,7 @@ class QueryJobLayer:
         if isinstance(query_job_layer_json, dict):
             query_job_layer = QueryJobLayer.from_dict(query_job_layer_json)
         elif isinstance(query_job_layer_json, str):
-            query_job_layer_dict = json.loads(query_job_layer_json)
+            query_job_layer_dict = common.json_loads(query_job_layer_json)
             query_job_layer = QueryJobLayer.from_dict(query_job_layer_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(query_job_layer_json), "query_job_layer_json")
@@ -4312,7 +4573,7 @@ class QueryJobLayers:
         if isinstance(query_job_layers_json, dict):
             query_job_layers = QueryJobLayers.from_dict(query_job_layers_json)
         elif isinstance(query_job_layers_json, str):
-            query_job_layers_dict = json.loads(query_job_layers_json)
+            query_job_layers_dict = common.json_loads(query_job_layers_json)
             query_job_layers = QueryJobLayers.from_dict(query_job_layers_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(query_job_layers_json), "query_job_layers_json")
@@ -4466,7 +4727,7 @@ class Options:
         if isinstance(options_json, dict):
             options = Options.from_dict(options_json)
         elif isinstance(options_json, str):
-            options_dict = json.loads(options_json)
+            options_dict = common.json_loads(options_json)
             options = Options.from_dict(options_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(options_json), "options_json")
@@ -4648,7 +4909,7 @@ class Processor:
         if isinstance(processor_json, dict):
             processor = Processor.from_dict(processor_json)
         elif isinstance(processor_json, str):
-            processor_dict = json.loads(processor_json)
+            processor_dict = common.json_loads(processor_json)
             processor = Processor.from_dict(processor_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(processor_json), "processor_json")
@@ -4980,7 +5241,7 @@ class Info:
         if isinstance(info_json, dict):
             info = Info.from_dict(info_json)
         elif isinstance(info_json, str):
-            info_dict = json.loads(info_json)
+            info_dict = common.json_loads(info_json)
             info = Info.from_dict(info_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(info_json), "info_json")
@@ -5820,7 +6081,7 @@ class Query:
         if isinstance(query_json, dict):
             query = Query.from_dict(query_json)
         elif isinstance(query_json, str):
-            query_dict = json.loads(query_json)
+            query_dict = common.json_loads(query_json)
             query = Query.from_dict(query_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(query_json), "query_json")
@@ -6061,26 +6322,196 @@ class Query:
                 continue
         
         return layer_files
+    
+    #
+    def list_members(self):
+      
+        """
+        A method to list the members of a downloaded Query result zip without unzipping it.
+        
+        :returns:          A list of member names in the Query result zip.
+        :rtype:            List[str]
+        :raises Exception: the Query result zip could not be found.
+        """
+        
+        with zipfile.ZipFile(self._download_zip_path(), 'r') as z:
+            return [info.filename for info in z.infolist() if not info.is_dir()]
+    
+    #
+    def open_member(self,
+                    member: str
+                   ):
+      
+        """
+        A method to open a member of a downloaded Query result zip for reading, without 
+        unzipping it to disk.
+        
+        :param member:     The name of the member.
+        :type member:      str
+        :returns:          A binary file object of the member, to be closed by the caller.
+        :rtype:            zipfile.ZipExtFile
+        :raises Exception: the Query result zip could not be found,
+                           the member is not in the zip.
+        """
+        
+        # The member keeps the underlying file open after the ZipFile is closed.
+        with zipfile.ZipFile(self._download_zip_path(), 'r') as z:
+            return z.open(member, 'r')
+    
+    #
+    def extract_members(self,
+                        members: List[str] = None
+                       ):
+      
+        """
+        A method to unzip members of a downloaded Query result zip on demand, for example 
+        after a download with extract = 'lazy'.
+        
+        :param members:    A list of member globs or layer ids to extract, defaults to all members.
+        :type members:     List[str]
+        :returns:          A list of file paths of the extracted members.
+        :rtype:            List[str]
+        :raises Exception: the Query result zip could not be found.
+        """
+        
+        return self._extract_download(download_zip    = self._download_zip_path(),
+                                      download_target = self.get_download_folder() + self.get_download_file_name(),
+                                      members         = members
+                                     )
+    
+    #
+    def raster_layers(self,
+                      members: List[str] = None
+                     ):
+      
+        """
+        A method to open the rasters of a downloaded Query result as RasterLayers, which read 
+        windows of the raster on demand in its own dtype rather than loading it whole. A raster 
+        that has not been unzipped (e.g. after a download with extract = 'lazy') is read from 
+        the Query result zip.
+        
+        :param members:    A list of member globs or layer ids, defaults to all rasters.
+        :type members:     List[str]
+        :returns:          The rasters by file name without extension.
+        :rtype:            dict[str, ibmpairs.query.RasterLayer]
+        :raises Exception: rasterio is not installed, 
+                           the Query result could not be found.
+        """
+        
+        if not HAS_RASTERIO:
+            msg = messages.ERROR_NO_RASTERIO
+            logger.error(msg)
+            raise common.PAWException(msg)
+        
+        directory = self.get_download_folder() + self.get_download_file_name()
+        paths     = []
+        
+        try:
+            download_zip = self._download_zip_path()
+        except common.PAWException:
+            if not os.path.isdir(directory):
+                raise
+            download_zip = None
+        
+        if download_zip is not None:
+            with zipfile.ZipFile(download_zip, 'r') as z:
+                for info in self._select_download_members(z, members):
+                    if os.path.isfile(os.path.join(directory, info.filename)):
+                        paths.append(os.path.join(directory, info.filename))
+                    else:
+                        paths.append('zip://' + os.path.abspath(download_zip) + '!/' + info.filename)
+        else:
+            paths = self.list_files()
         
-    def point_data_as_dataframe(self):
+        raster_layers = {}
+        for path in paths:
+            name, extension = os.path.splitext(os.path.basename(path))
+            if extension.lower() in constants.QUERY_RASTER_EXTENSIONS:
+                raster_layers[name] = RasterLayer(path = path,
+                                                  name = name
+                                                 )
         
-        if self.submit_response.data is None:
+        return raster_layers
+    
+    #
+    def point_data_as_dataframe(self,
+                                timestamp_as_datetime: bool = False,
+                                release: bool               = False,
+                                engine: str                 = constants.QUERY_POINT_CSV_ENGINE
+                               ):
+        
+        """
+        A method to load the point data of the query, see QueryResponse.data_as_dataframe.
+        
+        :param timestamp_as_datetime:   Whether the timestamp (epoch milliseconds) is converted to datetime64 in UTC.
+        :type timestamp_as_datetime:    bool
+        :param release:                 Whether the raw data is released from submit_response once it is read.
+        :type release:                  bool
+        :param engine:                  The pandas.read_csv engine of compact csv data, 'auto' uses pyarrow if it is installed.
+        :type engine:                   str
+        :returns:                       A dataframe of the point data.
+        :rtype:                         pandas.DataFrame
+        :raises Exception:              if there is no point data or it could not be loaded.
+        """
+        
+        if (self.submit_response is None) or (not self.submit_response.has_data()):
             msg = messages.ERROR_QUERY_NO_POINT_DATA
             logger.error(msg)
             raise common.PAWException(msg)
         else:
             try:
-                if isinstance(self.submit_response.to_dict()["data"], str):
-                    df = pandas.read_csv(StringIO(str(self.submit_response.to_dict()["data"])))
-                    df.columns = ['layer_id' if x=='layerId' else x for x in df.columns]
-                    return df 
-                else:
-                    return pandas.DataFrame(self.submit_response.to_dict()["data"])
+                return self.submit_response.data_as_dataframe(timestamp_as_datetime = timestamp_as_datetime,
+                                                              release               = release,
+                                                              engine                = engine
+                                                             )
             except Exception as e:
                 msg = messages.ERROR_QUERY_COULD_NOT_LOAD_POINT_QUERY.format(e)
                 logger.error(msg)
                 raise common.PAWException(msg)
 
+    #
+    def point_data_as_arrow(self):
+        
+        """
+        A method to load the point data of the query into an Arrow Table, with the dtypes of 
+        point_data_as_dataframe.
+        
+        :returns:                       A table of the point data.
+        :rtype:                         pyarrow.Table
+        :raises Exception:              if there is no point data, it could not be loaded or pyarrow is not installed.
+        """
+        
+        return common.dataframe_to_arrow(self.point_data_as_dataframe())
+    
+    #
+    def point_data_to_parquet(self,
+                              path: str,
+                              partition_by: List[str] = constants.QUERY_POINT_PARQUET_PARTITIONS,
+                              append: bool            = True
+                             ):
+        
+        """
+        A method to write the point data of the query to a partitioned Parquet dataset, see 
+        ibmpairs.common.write_parquet_dataset.
+        
+        :param path:                    The folder of the dataset.
+        :type path:                     str
+        :param partition_by:            The partition columns, by default the layer and the date of the timestamp.
+        :type partition_by:             List[str]
+        :param append:                  Whether to add to the partitions of an existing dataset, rather than replace 
+                                        the partitions that are written.
+        :type append:                   bool
+        :returns:                       The folder of the dataset.
+        :rtype:                         str
+        :raises Exception:              if there is no point data, it could not be loaded or pyarrow is not installed.
+        """
+        
+        return common.write_parquet_dataset(self.point_data_as_dataframe(),
+                                            path         = path,
+                                            partition_by = partition_by,
+                                            append       = append
+                                           )
+
     #
     def submit(self,
                client: cl.Client = None,
@@ -6129,12 +6560,12 @@ class Query:
         else:
             msg = messages.INFO_STARTING_EVENT_LOOP
             logger.debug(msg)
-            asyncio.run(self.async_submit(query       = self, 
-                                          client      = cli,
-                                          verify      = verify,
-                                          compact_csv = compact_csv
-                                         )
-                       )
+            cli.run(self.async_submit(query       = self, 
+                                      client      = cli,
+                                      verify      = verify,
+                                      compact_csv = compact_csv
+                                     )
+                   )
         
         return self
                 
@@ -6196,13 +6627,13 @@ class Query:
         else:
             msg = messages.INFO_STARTING_EVENT_LOOP
             logger.debug(msg)
-            asyncio.run(self.async_status(query           = self, 
-                                          client          = cli,
-                                          poll            = poll,
-                                          status_interval = status_interval,
-                                          verify          = verify
-                                         )
-                       )
+            cli.run(self.async_status(query           = self, 
+                                      client          = cli,
+                                      poll            = poll,
+                                      status_interval = status_interval,
+                                      verify          = verify
+                                     )
+                   )
         
         return self
     
@@ -6214,7 +6645,11 @@ class Query:
                  download_folder      = None,
                  download_file_name   = None,
                  verify: bool         = constants.GLOBAL_SSL_VERIFY,
-                 online: bool         = False
+                 online: bool         = False,
+                 stream: bool         = constants.QUERY_DOWNLOAD_STREAM,
+                 segments: int        = constants.QUERY_DOWNLOAD_SEGMENTS,
+                 extract: str         = constants.QUERY_DOWNLOAD_EXTRACT,
+                 members: List[str]   = None
                 ):
                   
         """
@@ -6234,6 +6669,14 @@ class Query:
         :type verify:              bool
         :param online:             Whether a point queries data should be returned to submit_response.data.
         :type online:              bool
+        :param stream:             Whether a bulk result should be streamed to disk in chunks rather than held in memory.
+        :type stream:              bool
+        :param segments:           The number of byte ranges a streamed result is downloaded in concurrently, 1 disables segmented downloads.
+        :type segments:            int
+        :param extract:            How a bulk result zip is extracted, 'all' (the members selected by members) or 'lazy' (kept as a zip, see Query.extract_members).
+        :type extract:             str
+        :param members:            A list of member globs or layer ids to extract, defaults to all members.
+        :type members:             List[str]
         :raises Exception:         A ibmpairs.client.Client is not found, 
                                    the Query status failed, 
                                    the download folder could not be made or identified, 
@@ -6267,22 +6710,30 @@ class Query:
                                                             download_folder    = download_folder,
                                                             download_file_name = download_file_name,
                                                             verify             = verify,
-                                                            online             = online)
+                                                            online             = online,
+                                                            stream             = stream,
+                                                            segments           = segments,
+                                                            extract            = extract,
+                                                            members            = members)
             
             msg = messages.INFO_FOUND_EVENT_LOOP_COMPLETED_TASK.format("download")
             logger.info(msg)
         else:
             msg = messages.INFO_STARTING_EVENT_LOOP
             logger.debug(msg)        
-            asyncio.run(self.async_download(query              = self, 
-                                            client             = cli,
-                                            status_interval    = status_interval,
-                                            download_folder    = download_folder,
-                                            download_file_name = download_file_name,
-                                            verify             = verify,
-                                            online             = online
-                                           )
-                       )
+            cli.run(self.async_download(query              = self, 
+                                        client             = cli,
+                                        status_interval    = status_interval,
+                                        download_folder    = download_folder,
+                                        download_file_name = download_file_name,
+                                        verify             = verify,
+                                        online             = online,
+                                        stream             = stream,
+                                        segments           = segments,
+                                        extract            = extract,
+                                        members            = members
+                                       )
+                   )
         
         return self
                 
@@ -6342,14 +6793,14 @@ class Query:
         else:
             msg = messages.INFO_STARTING_EVENT_LOOP
             logger.debug(msg)
-            asyncio.run(self.async_submit_and_check_status(query              = self, 
-                                                           client             = cli,
-                                                           poll               = poll,
-                                                           status_interval    = status_interval,
-                                                           verify             = verify,
-                                                           compact_csv        = compact_csv
-                                                          )
-                       )
+            cli.run(self.async_submit_and_check_status(query              = self, 
+                                                       client             = cli,
+                                                       poll               = poll,
+                                                       status_interval    = status_interval,
+                                                       verify             = verify,
+                                                       compact_csv        = compact_csv
+                                                      )
+                   )
         
         return self
                 
@@ -6362,7 +6813,11 @@ class Query:
                                   download_folder      = 'download',
                                   download_file_name   = None,
                                   verify: bool         = constants.GLOBAL_SSL_VERIFY,
-                                  online: bool         = False
+                                  online: bool         = False,
+                                  stream: bool         = constants.QUERY_DOWNLOAD_STREAM,
+                                  segments: int        = constants.QUERY_DOWNLOAD_SEGMENTS,
+                                  extract: str         = constants.QUERY_DOWNLOAD_EXTRACT,
+                                  members: List[str]   = None
                                  ):
                                   
         """
@@ -6384,6 +6839,14 @@ class Query:
         :type verify:              bool
         :param online:             Whether a point queries data should be returned to submit_response.data.
         :type online:              bool
+        :param stream:             Whether a bulk result should be streamed to disk in chunks rather than held in memory.
+        :type stream:              bool
+        :param segments:           The number of byte ranges a streamed result is downloaded in concurrently, 1 disables segmented downloads.
+        :type segments:            int
+        :param extract:            How a bulk result zip is extracted, 'all' (the members selected by members) or 'lazy' (kept as a zip, see Query.extract_members).
+        :type extract:             str
+        :param members:            A list of member globs or layer ids to extract, defaults to all members.
+        :type members:             List[str]
         :param compact_csv:        A flag to indicate the return of a compact csv format.
         :type compact_csv:         bool
         :raises Exception:         A ibmpairs.client.Client is not found, 
@@ -6420,21 +6883,29 @@ class Query:
                                                                              download_folder    = download_folder,
                                                                              download_file_name = download_file_name,
                                                                              verify             = verify,
-                                                                             online             = online)
+                                                                             online             = online,
+                                                                             stream             = stream,
+                                                                             segments           = segments,
+                                                                             extract            = extract,
+                                                                             members            = members)
             
             msg = messages.INFO_FOUND_EVENT_LOOP_COMPLETED_TASK.format("check_status_and_download")
             logger.info(msg)
         else:
             msg = messages.INFO_STARTING_EVENT_LOOP
             logger.debug(msg)
-            asyncio.run(self.async_check_status_and_download(query              = self, 
-                                                             client             = cli,
-                                                             poll               = poll,
-                                                             status_interval    = status_interval,
-                                                             download_folder    = download_folder,
-                                                             download_file_name = download_file_name,
-                                                             verify             = verify,
-                                                             online             = online))
+            cli.run(self.async_check_status_and_download(query              = self, 
+                                                         client             = cli,
+                                                         poll               = poll,
+                                                         status_interval    = status_interval,
+                                                         download_folder    = download_folder,
+                                                         download_file_name = download_file_name,
+                                                         verify             = verify,
+                                                         online             = online,
+                                                         stream             = stream,
+                                                         segments           = segments,
+                                                         extract            = extract,
+                                                         members            = members))
         
         return self
                 
@@ -6447,7 +6918,11 @@ class Query:
                                          download_file_name   = None,
                                          verify: bool         = constants.GLOBAL_SSL_VERIFY,
                                          compact_csv: bool    = False,
-                                         online: bool         = False
+                                         online: bool         = False,
+                                         stream: bool         = constants.QUERY_DOWNLOAD_STREAM,
+                                         segments: int        = constants.QUERY_DOWNLOAD_SEGMENTS,
+                                         extract: str         = constants.QUERY_DOWNLOAD_EXTRACT,
+                                         members: List[str]   = None
                                         ):
                                           
         """
@@ -6469,6 +6944,14 @@ class Query:
         :type compact_csv:         bool
         :param online:             Whether a point queries data should be returned to submit_response.data.
         :type online:              bool
+        :param stream:             Whether a bulk result should be streamed to disk in chunks rather than held in memory.
+        :type stream:              bool
+        :param segments:           The number of byte ranges a streamed result is downloaded in concurrently, 1 disables segmented downloads.
+        :type segments:            int
+        :param extract:            How a bulk result zip is extracted, 'all' (the members selected by members) or 'lazy' (kept as a zip, see Query.extract_members).
+        :type extract:             str
+        :param members:            A list of member globs or layer ids to extract, defaults to all members.
+        :type members:             List[str]
         :raises Exception:         A ibmpairs.client.Client is not found, 
                                    the Query status failed, 
                                    the download folder could not be made or identified, 
@@ -6501,7 +6984,11 @@ class Query:
                                                                                     download_file_name = download_file_name,
                                                                                     verify             = verify,
                                                                                     compact_csv        = compact_csv,
-                                                                                    online             = online)
+                                                                                    online             = online,
+                                                                                    stream             = stream,
+                                                                                    segments           = segments,
+                                                                                    extract            = extract,
+                                                                                    members            = members)
             
             msg = messages.INFO_FOUND_EVENT_LOOP_COMPLETED_TASK.format("submit_check_status_and_download")
             logger.info(msg)
@@ -6509,15 +6996,19 @@ class Query:
         else:
             msg = messages.INFO_STARTING_EVENT_LOOP
             logger.debug(msg)
-            asyncio.run(self.async_submit_check_status_and_download(query              = self, 
-                                                                    client             = cli,
-                                                                    poll               = poll,
-                                                                    status_interval    = status_interval,
-                                                                    download_folder    = download_folder,
-                                                                    download_file_name = download_file_name,
-                                                                    verify             = verify,
-                                                                    compact_csv        = compact_csv,
-                                                                    online             = online))
+            cli.run(self.async_submit_check_status_and_download(query              = self, 
+                                                                client             = cli,
+                                                                poll               = poll,
+                                                                status_interval    = status_interval,
+                                                                download_folder    = download_folder,
+                                                                download_file_name = download_file_name,
+                                                                verify             = verify,
+                                                                compact_csv        = compact_csv,
+                                                                online             = online,
+                                                                stream             = stream,
+                                                                segments           = segments,
+                                                                extract            = extract,
+                                                                members            = members))
         
         return self
 
@@ -6611,7 +7102,7 @@ class Query:
         else:
             msg = messages.INFO_QUERY_MERGE_SUCCESS.format(other_id, base_id)
             logger.info(msg)
-            query_merge_json = response.json()
+            query_merge_json = common.response_json(response)
 
             self.merge_response = query_job_layers_from_dict(query_merge_json)
             self.merge_status   = "SUCCEEDED"
@@ -6727,11 +7218,14 @@ class Query:
                            client: cl.Client    = None,
                            poll: bool           = True,
                            status_interval: int = QUERY_STATUS_CHECK_INTERVAL,
-                           verify: bool         = constants.GLOBAL_SSL_VERIFY
+                           verify: bool         = constants.GLOBAL_SSL_VERIFY,
+                           poller               = None
                           ):
                             
         """
-        An asynchronous method to check the status of a Query.
+        An asynchronous method to check the status of a Query. When polling, the interval 
+        between checks adapts to the status of the Query (see QueryStatusSchedule) unless 
+        QUERY_STATUS_ADAPTIVE is disabled.
         
         :param query:           The Query to check the status of.
         :type query:            ibmpairs.query.Query
@@ -6743,6 +7237,8 @@ class Query:
         :type status_interval:  int
         :param verify:          SSL verification
         :type verify:           bool
+        :param poller:          A QueryStatusPoller to check the status on a shared schedule, defaults to a check every status_interval.
+        :type poller:           ibmpairs.query.QueryStatusPoller
         :raises Exception:      A ibmpairs.client.Client is not found, 
                                 query is not present, 
                                 the Query failed, 
@@ -6770,15 +7266,21 @@ class Query:
                 raise common.PAWException(msg)
         
             incomplete = True
+            
+            schedule = QueryStatusSchedule(status_interval = status_interval)
+            delay    = None
 
             while incomplete:
                 
                 try:
-                    response = await cli.async_get(url = cli.get_host() +
-                                                         constants.QUERY_JOBS_API +
-                                                         str(query.id),
-                                                   verify = verify
-                                                  )
+                    if poller is not None:
+                        response = await poller.status(query.id, delay)
+                    else:
+                        response = await cli.async_get(url = cli.get_host() +
+                                                             constants.QUERY_JOBS_API +
+                                                             str(query.id),
+                                                       verify = verify
+                                                      )
                 except Exception as e:
                     msg = messages.ERROR_CLIENT_UNSPECIFIED_ERROR.format('GET', 'request', cli.get_host() + constants.QUERY_JOBS_API + str(query.id), e)
                     logger.error(msg)
@@ -6838,8 +7340,10 @@ class Query:
                     
                     raise common.PAWException(msg)
                 
-                if poll == True:
-                    await asyncio.sleep(status_interval)
+                if (poll == True) and (incomplete is True):
+                    delay = schedule.next(query.status_response)
+                    if poller is None:
+                        await asyncio.sleep(delay)
         
         else:
             msg = messages.INFO_REAL_TIME_POINT_QUERY_STATUS_SKIP
@@ -6897,63 +7401,620 @@ class Query:
                 incomplete = False
     
     #
-    async def async_download(self,
-                             query,
-                             client: cl.Client    = None,
-                             status_interval: int = QUERY_STATUS_CHECK_INTERVAL,
-                             download_folder      = None,
-                             download_file_name   = None,
-                             verify: bool         = constants.GLOBAL_SSL_VERIFY,
-                             online               = False
-                            ):
+    def _sniff_download_format(self,
+                               file_path: str
+                              ):
+        
+        """
+        An internal method to determine the format of a downloaded Query result from its first bytes.
+        
+        :param file_path:  The path of the downloaded file.
+        :type file_path:   str
+        :returns:          The format of the file, one of 'zip', 'json' or 'csv'.
+        :rtype:            str
+        """
+        
+        with open(file_path, 'rb') as f:
+            head = f.read(constants.QUERY_DOWNLOAD_SNIFF_BYTES)
+        
+        if any(head.startswith(signature) for signature in constants.QUERY_DOWNLOAD_ZIP_SIGNATURES):
+            return 'zip'
+        elif head.lstrip(b'\xef\xbb\xbf \t\r\n')[:1] in (b'{', b'['):
+            return 'json'
+        else:
+            return 'csv'
     
+    #
+    def _download_checksums(self,
+                            headers: dict,
+                            status: int
+                           ):
+        
         """
-        An asynchronous method to download and unzip a Query result.
+        An internal method to collect the checksums a server declared for a Query result 
+        download from the Digest, Repr-Digest and (for a full 200 response) Content-MD5 headers.
         
-        :param query:              The Query to check the status of and download.
-        :type query:               ibmpairs.query.Query
-        :param client:             An IBM PAIRS Client.
-        :type client:              ibmpairs.client.Client
-        :param status_interval:    How often the async run operation should call back.
-        :type status_interval:     int
-        :param download_folder:    A download folder (fixed or relative).
-        :type download_folder:     str
-        :param download_file_name: A file name for the download.
-        :type download_file_name:  str
-        :param verify:             SSL verification
-        :type verify:              bool
-        :param online:             Whether a point queries data should be returned to submit_response.data.
-        :type online:              bool
-        :raises Exception:         A ibmpairs.client.Client is not found, 
-                                   query is not present, 
-                                   the Query status failed, 
-                                   the download folder could not be made or identified, 
-                                   the download failed, 
-                                   error making request to server, 
-                                   the status of the request is not 200.
+        :param headers:    The response headers (lower case keys).
+        :type headers:     dict
+        :param status:     The response status.
+        :type status:      int
+        :returns:          A dictionary of base64 encoded digests keyed by hashlib algorithm name.
+        :rtype:            dict
         """
-
-        online_skip = False
+        
+        algorithms = {'md5': 'md5', 'sha': 'sha1', 'sha-256': 'sha256', 'sha-512': 'sha512'}
+        checksums  = {}
+        
+        for header in ['digest', 'repr-digest']:
+            if headers.get(header) is not None:
+                for entry in headers.get(header).split(','):
+                    if '=' in entry:
+                        name, value = entry.strip().split('=', 1)
+                        if name.lower() in algorithms:
+                            checksums[algorithms[name.lower()]] = value.strip(':')
+        
+        # Content-MD5 describes the body of this response only, which is the whole file on a 200.
+        if (status == 200) and (headers.get('content-md5') is not None):
+            checksums['md5'] = headers.get('content-md5')
+        
+        return checksums
     
-        cli = common.set_client(input_client  = client,
-                                global_client = cl.GLOBAL_PAIRS_CLIENT,
-                                self_client   = self._client)
+    #
+    def _file_digest(self,
+                     file_path: str,
+                     algorithm: str
+                    ):
+        
+        """
+        An internal method to calculate the base64 encoded digest of a file in chunks.
+        
+        :param file_path:  The path of the file.
+        :type file_path:   str
+        :param algorithm:  A hashlib algorithm name.
+        :type algorithm:   str
+        :returns:          The base64 encoded digest.
+        :rtype:            str
+        """
+        
+        digest = hashlib.new(algorithm)
+        
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(constants.CLIENT_DOWNLOAD_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        
+        return base64.b64encode(digest.digest()).decode('ascii')
     
-        self.download_status = "SKIPPED"
+    #
+    def _download_zip_path(self):
+        
+        """
+        An internal method to get the path of the downloaded Query result zip.
+        
+        :returns:          The path of the Query result zip.
+        :rtype:            str
+        :raises Exception: the Query result zip could not be found.
+        """
+        
+        download_zip = None
+        
+        if (self.get_download_folder() is not None) and (self.get_download_file_name() is not None):
+            download_zip = self.get_download_folder() + self.get_download_file_name() + '.zip'
+        
+        if (download_zip is None) or (not os.path.isfile(download_zip)):
+            msg = messages.ERROR_QUERY_DOWNLOAD_ZIP_NOT_FOUND.format(download_zip)
+            logger.error(msg)
+            raise common.PAWException(msg)
+        
+        return download_zip
     
-        bulk = self.is_bulk()
+    #
+    def _select_download_members(self,
+                                 z: zipfile.ZipFile,
+                                 members: List[str] = None
+                                ):
+        
+        """
+        An internal method to select the members of a Query result zip to extract. A filter 
+        entry selects the members whose name (or base name) matches it as a glob, or, if it is 
+        a layer id listed in output.info, the files of that layer.
+        
+        :param z:          An open Query result zip.
+        :type z:           zipfile.ZipFile
+        :param members:    A list of member globs or layer ids, defaults to all members.
+        :type members:     List[str]
+        :returns:          The selected members.
+        :rtype:            List[zipfile.ZipInfo]
+        """
+        
+        infos = [info for info in z.infolist() if not info.is_dir()]
+        
+        if members is None:
+            return infos
+        
+        members  = [str(member) for member in members]
+        prefixes = []
+        
+        if constants.QUERY_OUTPUT_INFO_FILE_NAME in z.namelist():
+            try:
+                output_info = common.json_loads(z.read(constants.QUERY_OUTPUT_INFO_FILE_NAME))
+            except ValueError:
+                output_info = {}
+            for output_file in output_info.get("files", []):
+                if (str(output_file.get("datalayerId")) in members) and (output_file.get("name") is not None):
+                    # The member names replace the ':' of the timestamp.
+                    prefixes.append(output_file.get("name").replace(':', '_'))
+        
+        return [info for info in infos 
+                if any(fnmatch.fnmatch(info.filename, member) or 
+                       fnmatch.fnmatch(os.path.basename(info.filename), member) for member in members) or 
+                   any(info.filename.startswith(prefix) for prefix in prefixes)]
     
-        if bulk is True:
+    #
+    def _extract_download_member(self,
+                                 download_zip: str,
+                                 member: str,
+                                 download_target: str
+                                ):
+        
+        """
+        An internal method to extract a single member of a Query result zip with its own 
+        handle on the zip, so that members can be extracted on several threads.
+        
+        :param download_zip:    The path of the Query result zip.
+        :type download_zip:     str
+        :param member:          The name of the member.
+        :type member:           str
+        :param download_target: The folder to extract to.
+        :type download_target:  str
+        :returns:               The path of the extracted member.
+        :rtype:                 str
+        """
+        
+        with zipfile.ZipFile(download_zip, 'r') as z:
+            return z.extract(member, download_target)
+    
+    #
+    def _extract_download(self,
+                          download_zip: str,
+                          download_target: str,
+                          members: List[str] = None
+                         ):
+        
+        """
+        An internal method to extract the selected members of a Query result zip. Members 
+        of at least QUERY_DOWNLOAD_EXTRACT_LARGE bytes are decompressed concurrently on a 
+        pool of QUERY_DOWNLOAD_EXTRACT_WORKERS threads, the rest in turn.
+        
+        :param download_zip:    The path of the Query result zip.
+        :type download_zip:     str
+        :param download_target: The folder to extract to.
+        :type download_target:  str
+        :param members:         A list of member globs or layer ids, defaults to all members.
+        :type members:          List[str]
+        :returns:               A list of file paths of the extracted members.
+        :rtype:                 List[str]
+        """
+        
+        paths = {}
+        
+        with zipfile.ZipFile(download_zip, 'r') as z:
+            selected = self._select_download_members(z, members)
             
-            self.download_status = "INDETERMINATE"
+            msg = messages.INFO_QUERY_DOWNLOAD_FILE_UNZIP_MEMBERS.format(download_zip, len([info for info in z.infolist() if not info.is_dir()]), len(selected))
+            logger.info(msg)
             
-            # Assumes if bulk is True and submit_response already has a data entry the query is pseudo interactive
-            # and that the submit step has already performed the action.
-            if ((query.submit_response is not None) and (query.submit_response.data is not None)):
-                
-                online      = True
-                online_skip = True
-                
+            large = [info.filename for info in selected if info.file_size >= constants.QUERY_DOWNLOAD_EXTRACT_LARGE]
+            
+            for info in selected:
+                if info.filename not in large:
+                    paths[info.filename] = z.extract(info, download_target)
+        
+        if len(large) > 1:
+            with ThreadPoolExecutor(max_workers = min(len(large), constants.QUERY_DOWNLOAD_EXTRACT_WORKERS)) as executor:
+                for member, path in zip(large, executor.map(lambda member: self._extract_download_member(download_zip, member, download_target), large)):
+                    paths[member] = path
+        elif len(large) == 1:
+            paths[large[0]] = self._extract_download_member(download_zip, large[0], download_target)
+        
+        return [paths[info.filename] for info in selected]
+    
+    #
+    async def _async_segmented_download(self,
+                                        query,
+                                        client: cl.Client,
+                                        download_url: str,
+                                        part_path: str,
+                                        segments: int,
+                                        verify: bool = constants.GLOBAL_SSL_VERIFY
+                                       ):
+        
+        """
+        An internal method to download a Query result as concurrent byte ranges over the pooled 
+        session of the client. A first range of QUERY_DOWNLOAD_SEGMENT_SIZE bytes probes the 
+        server: if it is not honoured (a 200 response) the whole result has been streamed already, 
+        otherwise the file is pre-allocated to the declared size and the remainder is split into 
+        at most the given number of segments, each written in place. If a segment fails the file 
+        is truncated to the contiguous bytes downloaded so that it can be resumed.
+        
+        :param query:              The Query to download.
+        :type query:               ibmpairs.query.Query
+        :param client:             An IBM PAIRS Client.
+        :type client:              ibmpairs.client.Client
+        :param download_url:       The download URL of the Query.
+        :type download_url:        str
+        :param part_path:          The path of the partial file.
+        :type part_path:           str
+        :param segments:           The number of byte ranges to download concurrently.
+        :type segments:            int
+        :param verify:             SSL verification
+        :type verify:              bool
+        :returns:                  The response to the first range, with the headers of the result.
+        :rtype:                    ibmpairs.client.ClientResponse
+        :raises Exception:         a segment could not be downloaded.
+        """
+        
+        segment_size = constants.QUERY_DOWNLOAD_SEGMENT_SIZE
+        
+        response = await client.async_get_to_file(url       = download_url,
+                                                  file_path = part_path,
+                                                  verify    = verify,
+                                                  offset    = 0,
+                                                  end       = segment_size - 1
+                                                 )
+        
+        if response.status == 200:
+            msg = messages.INFO_QUERY_DOWNLOAD_NO_RANGES.format(query.id)
+            logger.info(msg)
+        
+        if response.status != 206:
+            return response
+        
+        headers = {key.lower(): value for key, value in (response.headers or {}).items()}
+        total   = headers.get('content-range', '').rpartition('/')[2]
+        
+        if total.isdigit() and not _range_received(response, 0, min(segment_size, int(total)) - 1):
+            # The first range is not what was requested, nothing written can be trusted.
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise aiohttp.ClientPayloadError(messages.WARN_QUERY_DOWNLOAD_RANGE_MISMATCH.format(part_path, query.id, 0, min(segment_size, int(total)) - 1, response.content_range, response.bytes_written))
+        
+        if (not total.isdigit()) or (headers.get('accept-ranges', 'bytes').lower() == 'none'):
+            # The size of the result is unknown, continue as a single stream.
+            return await client.async_get_to_file(url       = download_url,
+                                                  file_path = part_path,
+                                                  verify    = verify,
+                                                  offset    = os.path.getsize(part_path)
+                                                 )
+        
+        total     = int(total)
+        start     = os.path.getsize(part_path)
+        remaining = total - start
+        
+        if remaining <= 0:
+            return response
+        
+        count      = max(1, min(segments, -(-remaining // segment_size)))
+        boundaries = [start + ((remaining * i) // count) for i in range(count + 1)]
+        
+        msg = messages.INFO_QUERY_DOWNLOAD_SEGMENTED.format(query.id, total, count)
+        logger.info(msg)
+        
+        os.truncate(part_path, total)
+        
+        results = await asyncio.gather(*[client.async_get_to_file(url       = download_url,
+                                                                  file_path = part_path,
+                                                                  verify    = verify,
+                                                                  offset    = boundaries[i],
+                                                                  end       = boundaries[i + 1] - 1,
+                                                                  if_range  = headers.get('etag', headers.get('last-modified')),
+                                                                  shared    = True
+                                                                 ) for i in range(count)],
+                                        return_exceptions = True
+                                       )
+        
+        contiguous = start
+        failure    = None
+        
+        for i, result in enumerate(results):
+            if isinstance(result, BaseException):
+                failure = result
+            elif result.status != 206:
+                # The range was not honoured (the result changed or an error), nothing written 
+                # to the file can be trusted.
+                contiguous = 0
+                failure    = aiohttp.ClientPayloadError(messages.WARN_QUERY_DOWNLOAD_RESTART.format(part_path, query.id, result.status))
+                break
+            elif not _range_received(result, boundaries[i], boundaries[i + 1] - 1):
+                # A different or short range (e.g. from a proxy), the file is only good up 
+                # to this segment.
+                if failure is None:
+                    failure = aiohttp.ClientPayloadError(messages.WARN_QUERY_DOWNLOAD_RANGE_MISMATCH.format(part_path, query.id, boundaries[i], boundaries[i + 1] - 1, result.content_range, result.bytes_written))
+            if failure is None:
+                contiguous = boundaries[i + 1]
+        
+        if failure is not None:
+            if contiguous > 0:
+                os.truncate(part_path, contiguous)
+            elif os.path.exists(part_path):
+                os.remove(part_path)
+            raise failure
+        
+        return response
+    
+    #
+    async def _async_stream_download(self,
+                                     query,
+                                     client: cl.Client,
+                                     download_zip: str,
+                                     verify: bool  = constants.GLOBAL_SSL_VERIFY,
+                                     segments: int = constants.QUERY_DOWNLOAD_SEGMENTS
+                                    ):
+        
+        """
+        An internal method to stream a Query result to disk in chunks. The result is written to a 
+        partial ('.part') file next to the target; an interrupted transfer is resumed from the size 
+        of the partial file with an HTTP Range request, both within this call and by a later download 
+        to the same target. Once complete, the size (and the checksum, if the server declares one) is 
+        verified, the format is sniffed from the first bytes and the file is atomically renamed to 
+        the target path. With more than one segment a fresh download is fetched as concurrent byte 
+        ranges, see Query._async_segmented_download.
+        
+        :param query:              The Query to download.
+        :type query:               ibmpairs.query.Query
+        :param client:             An IBM PAIRS Client.
+        :type client:              ibmpairs.client.Client
+        :param download_zip:       The target path of the zip.
+        :type download_zip:        str
+        :param verify:             SSL verification
+        :type verify:              bool
+        :param segments:           The number of byte ranges to download concurrently.
+        :type segments:            int
+        :returns:                  A zipped indicator and the path the result was saved to.
+        :rtype:                    (bool, str)
+        :raises Exception:         error making request to server, 
+                                   the status of the request is not 200 or 206,
+                                   the download could not be completed within the resume attempts,
+                                   the size or checksum of the download is incorrect,
+                                   the download could not be saved.
+        """
+        
+        download_url = client.get_host() + constants.QUERY_JOBS_API + str(query.id) + constants.QUERY_JOBS_DOWNLOAD_API
+        part_path    = download_zip + constants.QUERY_DOWNLOAD_PART_EXTENSION
+        
+        expected_size = None
+        checksums     = {}
+        validator     = None
+        attempts      = 0
+        complete      = False
+        segmented     = False
+        
+        if os.path.exists(part_path):
+            msg = messages.INFO_QUERY_DOWNLOAD_RESUME_PART.format(part_path, os.path.getsize(part_path), query.id)
+            logger.info(msg)
+        
+        while complete is False:
+            
+            if attempts > constants.QUERY_DOWNLOAD_RESUME_ATTEMPTS:
+                self.download_status = "FAILED"
+                
+                msg = messages.ERROR_QUERY_DOWNLOAD_RESUME_EXHAUSTED.format(query.id, attempts, part_path)
+                logger.error(msg)
+                raise common.PAWException(msg)
+            
+            offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            
+            try:
+                if (segments > 1) and (offset == 0) and (segmented is False):
+                    # Only a fresh download is segmented, a retry continues as a single stream.
+                    segmented = True
+                    response  = await self._async_segmented_download(query        = query,
+                                                                     client       = client,
+                                                                     download_url = download_url,
+                                                                     part_path    = part_path,
+                                                                     segments     = segments,
+                                                                     verify       = verify
+                                                                    )
+                else:
+                    response = await client.async_get_to_file(url       = download_url,
+                                                              file_path = part_path,
+                                                              verify    = verify,
+                                                              offset    = offset,
+                                                              if_range  = validator
+                                                             )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                attempts = attempts + 1
+                
+                msg = messages.WARN_QUERY_DOWNLOAD_INTERRUPTED.format(query.id, os.path.getsize(part_path) if os.path.exists(part_path) else 0, e)
+                logger.warning(msg)
+                
+                await asyncio.sleep(constants.QUERY_DOWNLOAD_RESUME_INTERVAL)
+                continue
+            except Exception as e:
+                self.download_status = "FAILED"
+                msg = messages.ERROR_CLIENT_UNSPECIFIED_ERROR.format('GET', 'request', download_url, e)
+                logger.error(msg)
+                raise common.PAWException(msg)
+            
+            headers = {key.lower(): value for key, value in (response.headers or {}).items()}
+            
+            if (response.status == 416) and (offset > 0):
+                # The range starts at or beyond the end of the result, the partial download is 
+                # either already complete or belongs to a different result.
+                total = headers.get('content-range', '').rpartition('/')[2]
+                
+                if total.isdigit() and (int(total) == offset):
+                    expected_size = offset
+                    complete      = True
+                else:
+                    attempts = attempts + 1
+                    
+                    msg = messages.WARN_QUERY_DOWNLOAD_RESTART.format(part_path, query.id, response.status)
+                    logger.warning(msg)
+                    
+                    os.remove(part_path)
+                    
+            elif response.status not in (200, 206):
+                self.download_status = "FAILED"
+                
+                msg = messages.ERROR_QUERY_DOWNLOAD_REQUEST_NOT_SUCCESSFUL.format('GET', 'request', constants.QUERY_JOBS_API + str(query.id) + constants.QUERY_JOBS_DOWNLOAD_API, response.status, response.body)
+                logger.error(msg)
+                raise common.PAWException(msg)
+                
+            else:
+                validator = headers.get('etag', headers.get('last-modified'))
+                checksums.update(self._download_checksums(headers, response.status))
+                
+                if response.status == 206:
+                    total = headers.get('content-range', '').rpartition('/')[2]
+                    if total.isdigit():
+                        expected_size = int(total)
+                elif headers.get('content-length', '').isdigit():
+                    expected_size = int(headers.get('content-length'))
+                
+                size = os.path.getsize(part_path)
+                
+                if (expected_size is None) or (size == expected_size):
+                    complete = True
+                elif size < expected_size:
+                    # The body ended early without an error, resume from where it stopped.
+                    attempts = attempts + 1
+                    
+                    msg = messages.WARN_QUERY_DOWNLOAD_INTERRUPTED.format(query.id, size, str(expected_size) + ' bytes expected')
+                    logger.warning(msg)
+                else:
+                    self.download_status = "FAILED"
+                    
+                    os.remove(part_path)
+                    
+                    msg = messages.ERROR_QUERY_DOWNLOAD_SIZE_MISMATCH.format(query.id, size, expected_size)
+                    logger.error(msg)
+                    raise common.PAWException(msg)
+        
+        loop = asyncio.get_running_loop()
+        
+        for algorithm, checksum in checksums.items():
+            digest = await loop.run_in_executor(None, self._file_digest, part_path, algorithm)
+            
+            if digest != checksum:
+                self.download_status = "FAILED"
+                
+                os.remove(part_path)
+                
+                msg = messages.ERROR_QUERY_DOWNLOAD_CHECKSUM_MISMATCH.format(algorithm, query.id)
+                logger.error(msg)
+                raise common.PAWException(msg)
+        
+        try:
+            download_format = self._sniff_download_format(part_path)
+            
+            msg = messages.INFO_QUERY_FORMAT.format(query.id, download_format)
+            logger.info(msg)
+            
+            if download_format != 'zip':
+                download_zip = download_zip[:-4] + '.' + download_format
+            
+            msg = messages.INFO_QUERY_DOWNLOAD_FILE_SAVE.format(query.id, download_zip)
+            logger.info(msg)
+            
+            os.replace(part_path, download_zip)
+            
+            msg = messages.INFO_QUERY_DOWNLOAD_FILE_SAVED.format(query.id, download_zip)
+            logger.info(msg)
+        except Exception:
+            self.download_status = "FAILED"
+            
+            msg = messages.ERROR_QUERY_DOWNLOAD_UNSUCCESSFUL.format(query.id, download_zip)
+            logger.error(msg)
+            raise common.PAWException(msg)
+        
+        # Point results (json or csv) are small and are also returned to submit_response.
+        if download_format == 'json':
+            with open(download_zip, 'r') as f:
+                query.submit_response = query_response_from_json(f.read())
+        elif download_format == 'csv':
+            with open(download_zip, 'r') as f:
+                query.submit_response.data = f.read()
+        
+        return (download_format == 'zip'), download_zip
+    
+    #
+    async def async_download(self,
+                             query,
+                             client: cl.Client    = None,
+                             status_interval: int = QUERY_STATUS_CHECK_INTERVAL,
+                             download_folder      = None,
+                             download_file_name   = None,
+                             verify: bool         = constants.GLOBAL_SSL_VERIFY,
+                             online               = False,
+                             stream               = constants.QUERY_DOWNLOAD_STREAM,
+                             segments             = constants.QUERY_DOWNLOAD_SEGMENTS,
+                             extract              = constants.QUERY_DOWNLOAD_EXTRACT,
+                             members              = None,
+                             poller               = None
+                            ):
+    
+        """
+        An asynchronous method to download and unzip a Query result.
+        
+        :param query:              The Query to check the status of and download.
+        :type query:               ibmpairs.query.Query
+        :param client:             An IBM PAIRS Client.
+        :type client:              ibmpairs.client.Client
+        :param status_interval:    How often the async run operation should call back.
+        :type status_interval:     int
+        :param download_folder:    A download folder (fixed or relative).
+        :type download_folder:     str
+        :param download_file_name: A file name for the download.
+        :type download_file_name:  str
+        :param verify:             SSL verification
+        :type verify:              bool
+        :param online:             Whether a point queries data should be returned to submit_response.data.
+        :type online:              bool
+        :param stream:             Whether a bulk result should be streamed to disk in chunks rather than held in memory.
+        :type stream:              bool
+        :param segments:           The number of byte ranges a streamed result is downloaded in concurrently, 1 disables segmented downloads.
+        :type segments:            int
+        :param extract:            How a bulk result zip is extracted, 'all' (the members selected by members) or 'lazy' (kept as a zip, see Query.extract_members).
+        :type extract:             str
+        :param members:            A list of member globs or layer ids to extract, defaults to all members.
+        :type members:             List[str]
+        :param poller:             A QueryStatusPoller to check the status on a shared schedule, defaults to a check every status_interval.
+        :type poller:              ibmpairs.query.QueryStatusPoller
+        :raises Exception:         A ibmpairs.client.Client is not found, 
+                                   query is not present, 
+                                   the Query status failed, 
+                                   the download folder could not be made or identified, 
+                                   the download failed, 
+                                   error making request to server, 
+                                   the status of the request is not 200.
+        """
+
+        online_skip = False
+    
+        cli = common.set_client(input_client  = client,
+                                global_client = cl.GLOBAL_PAIRS_CLIENT,
+                                self_client   = self._client)
+        
+        if extract not in constants.QUERY_DOWNLOAD_EXTRACT_OPTIONS:
+            msg = messages.ERROR_QUERY_DOWNLOAD_EXTRACT_INVALID.format(extract, constants.QUERY_DOWNLOAD_EXTRACT_OPTIONS)
+            logger.error(msg)
+            raise common.PAWException(msg)
+    
+        self.download_status = "SKIPPED"
+    
+        bulk = self.is_bulk()
+    
+        if bulk is True:
+            
+            self.download_status = "INDETERMINATE"
+            
+            # Assumes if bulk is True and submit_response already has a data entry the query is pseudo interactive
+            # and that the submit step has already performed the action.
+            if ((query.submit_response is not None) and (query.submit_response.has_data())):
+                
+                online      = True
+                online_skip = True
+                
                 msg = messages.WARN_QUERY_INTERACTIVE_ALREADY_PERFORMED
                 logger.info(msg)
                 
@@ -6977,7 +8038,8 @@ class Query:
                 await query.async_status(query  = query,
                                          client = cli,
                                          poll   = False,
-                                         verify = verify
+                                         verify = verify,
+                                         poller = poller
                                         )
                 
                 # Queued(0)
@@ -7019,11 +8081,9 @@ class Query:
                                     logger.error(msg)
                                     raise common.PAWException(msg)
                                 else:
-                                    # json
+                                    # json, the body is only decoded once
                                     try:
-                                        json.loads(response.body)
-
-                                        resp = query_response_from_json(response.body)
+                                        resp = query_response_from_dict(common.json_loads(response.body))
                                         resp.id = query.id
                                         query.submit_response = resp
                                     # csv
@@ -7046,90 +8106,111 @@ class Query:
                             incomplete = False
                             
                     else:
-                        try:
-                            response = await cli.async_get(url           = cli.get_host() +
-                                                                           constants.QUERY_JOBS_API +
-                                                                           str(query.id) + 
-                                                                           constants.QUERY_JOBS_DOWNLOAD_API,
-                                                           verify        = verify,
-                                                           response_type = 'bytes'
-                                                          )
+                        if stream is True:
+                            zipped, download_zip = await self._async_stream_download(query        = query,
+                                                                                     client       = cli,
+                                                                                     download_zip = download_zip,
+                                                                                     verify       = verify,
+                                                                                     segments     = segments
+                                                                                    )
+                        else:
+                            try:
+                                response = await cli.async_get(url           = cli.get_host() +
+                                                                               constants.QUERY_JOBS_API +
+                                                                               str(query.id) + 
+                                                                               constants.QUERY_JOBS_DOWNLOAD_API,
+                                                               verify        = verify,
+                                                               response_type = 'bytes'
+                                                              )
                                                         
-                            if response.status != 200:
-                                self.download_status = "FAILED"
+                                if response.status != 200:
+                                    self.download_status = "FAILED"
                                 
-                                msg = messages.ERROR_QUERY_DOWNLOAD_REQUEST_NOT_SUCCESSFUL.format('GET', 'request', constants.QUERY_JOBS_API + str(query.id) + constants.QUERY_JOBS_DOWNLOAD_API, response.status, response.body)
+                                    msg = messages.ERROR_QUERY_DOWNLOAD_REQUEST_NOT_SUCCESSFUL.format('GET', 'request', constants.QUERY_JOBS_API + str(query.id) + constants.QUERY_JOBS_DOWNLOAD_API, response.status, response.body)
+                                    logger.error(msg)
+                                    raise common.PAWException(msg)
+                                
+                            except Exception as e:
+                                self.download_status = "FAILED"
+                                msg = messages.ERROR_CLIENT_UNSPECIFIED_ERROR.format('GET', 'request', cli.get_host() + constants.QUERY_JOBS_API + str(query.id) + constants.QUERY_JOBS_DOWNLOAD_API, e)
                                 logger.error(msg)
                                 raise common.PAWException(msg)
-                                
-                        except Exception as e:
-                            self.download_status = "FAILED"
-                            msg = messages.ERROR_CLIENT_UNSPECIFIED_ERROR.format('GET', 'request', cli.get_host() + constants.QUERY_JOBS_API + str(query.id) + constants.QUERY_JOBS_DOWNLOAD_API, e)
-                            logger.error(msg)
-                            raise common.PAWException(msg)
                             
-                        # Default zipped = true
-                        zipped = False
+                            # Default zipped = true
+                            zipped = False
 
-                        result = response.body
+                            result = response.body
                             
-                        # Download file
-                        try:
-                            if zipfile.is_zipfile(BytesIO(response.body)):
-                                zipped = True
+                            # Download file
+                            try:
+                                if zipfile.is_zipfile(BytesIO(response.body)):
+                                    zipped = True
 
-                                msg = messages.INFO_QUERY_FORMAT.format(query.id, 'zip')
-                                logger.info(msg)
+                                    msg = messages.INFO_QUERY_FORMAT.format(query.id, 'zip')
+                                    logger.info(msg)
                                 
-                            else:
-                                try:
-                                    json.loads(response.body)
-                          
-                                    download_zip = download_zip[:-4] + '.json'
-                                    zipped = False
+                                else:
+                                    query_response_dict = None
                                     
-                                    msg = messages.INFO_QUERY_FORMAT.format(query.id, 'json')
-                                    logger.info(msg)
+                                    # csv is told from json by its first character, it is not decoded
+                                    if common.looks_like_json(response.body):
+                                        try:
+                                            query_response_dict = common.json_loads(response.body)
+                                        except ValueError as e:
+                                            query_response_dict = None
+                                    
+                                    if query_response_dict is not None:
+                                        download_zip = download_zip[:-4] + '.json'
+                                        zipped = False
+                                    
+                                        msg = messages.INFO_QUERY_FORMAT.format(query.id, 'json')
+                                        logger.info(msg)
 
-                                    query.submit_response = query_response_from_json(response.body.decode("utf-8"))
+                                        query.submit_response = query_response_from_dict(query_response_dict)
                                     
-                                except ValueError as e:
-                                    download_zip = download_zip[:-4] + '.csv'
-                                    zipped = False
+                                    else:
+                                        download_zip = download_zip[:-4] + '.csv'
+                                        zipped = False
                                     
-                                    msg = messages.INFO_QUERY_FORMAT.format(query.id, 'csv')
-                                    logger.info(msg)
+                                        msg = messages.INFO_QUERY_FORMAT.format(query.id, 'csv')
+                                        logger.info(msg)
                                     
-                                    query.submit_response.data = response.body.decode("utf-8")
+                                        query.submit_response.data = response.body.decode("utf-8")
 
-                            msg = messages.INFO_QUERY_DOWNLOAD_FILE_SAVE.format(query.id, download_zip)
-                            logger.info(msg)
+                                msg = messages.INFO_QUERY_DOWNLOAD_FILE_SAVE.format(query.id, download_zip)
+                                logger.info(msg)
                             
-                            with open(download_zip, 'wb') as f:
-                                f.write(result)
-                            f.close
+                                with open(download_zip, 'wb') as f:
+                                    f.write(result)
+                                f.close
                             
-                            msg = messages.INFO_QUERY_DOWNLOAD_FILE_SAVED.format(query.id, download_zip)
-                            logger.info(msg)
+                                msg = messages.INFO_QUERY_DOWNLOAD_FILE_SAVED.format(query.id, download_zip)
+                                logger.info(msg)
                             
-                        except:
-                            self.download_status = "FAILED"
+                            except:
+                                self.download_status = "FAILED"
                             
-                            msg = messages.ERROR_QUERY_DOWNLOAD_UNSUCCESSFUL.format(query.id, download_zip)
-                            logger.error(msg)
-                            raise common.PAWException(msg)
+                                msg = messages.ERROR_QUERY_DOWNLOAD_UNSUCCESSFUL.format(query.id, download_zip)
+                                logger.error(msg)
+                                raise common.PAWException(msg)
                             
-                            incomplete = False
+                                incomplete = False
                             
                         # Unzip file
                         try:
-                            if zipped:
+                            if zipped and (extract == 'lazy'):
+                                msg = messages.INFO_QUERY_DOWNLOAD_FILE_LAZY.format(download_zip)
+                                logger.info(msg)
+                            elif zipped:
                                 msg = messages.INFO_QUERY_DOWNLOAD_FILE_UNZIP.format(download_zip, download_target)
                                 logger.info(msg)
                             
-                                with zipfile.ZipFile(download_zip, 'r') as z:
-                                    z.extractall(download_target)
-                                z.close
+                                await asyncio.get_running_loop().run_in_executor(None, 
+                                                                                 self._extract_download, 
+                                                                                 download_zip, 
+                                                                                 download_target, 
+                                                                                 members
+                                                                                )
                             
                                 msg = messages.INFO_QUERY_DOWNLOAD_FILE_UNZIPPED.format(download_zip, download_target)
                                 logger.info(msg)
@@ -7141,7 +8222,7 @@ class Query:
                         except:
                             self.download_status = "FAILED"
                             
-                            messages.ERROR_QUERY_DOWNLOAD_UNSUCCESSFUL_UNZIP.format(download_zip, download_target)
+                            msg = messages.ERROR_QUERY_DOWNLOAD_UNSUCCESSFUL_UNZIP.format(download_zip, download_target)
                             logger.error(msg)
                             raise common.PAWException(msg)
                             
@@ -7149,7 +8230,8 @@ class Query:
                             
                 elif query.status_response.status_code in [0, 1, 10, 11, 12]:
                     await query.async_status(query  = query,
-                                             client = cli
+                                             client = cli,
+                                             poller = poller
                                             )
                     
                 elif query.status_response.status_code == 31:
@@ -7169,13 +8251,18 @@ class Query:
                     raise common.PAWException(msg)
                     
                     incomplete = False
-                    
-                await asyncio.sleep(status_interval)
+                
+                # A poller waits for its own schedule.
+                if (incomplete is True) and (poller is None):
+                    await asyncio.sleep(status_interval)
                 
         if bulk is False:
-            if self.submit_response is not None and self.submit_response.data is not None:
+            if self.submit_response is not None and self.submit_response.has_data():
+                
+                  # The rows are written as they were received, not as QueryResponseData objects.
+                  result = self.submit_response._data_document()
                 
-                  if len(self.submit_response.data) > 0:
+                  if result is not None:
                         
                       if download_folder is not None:
                           self.download_folder        = common.ensure_slash(download_folder, -1)
@@ -7183,15 +8270,10 @@ class Query:
                           if self.download_folder is None:
                               self.download_folder    = common.ensure_slash(constants.QUERY_DOWNLOAD_DEFAULT_FOLDER, -1)
                               
-                      result = str(self.submit_response.data)
-                      
                       file_format = '.json'
                     
-                      # json
-                      try:
-                          json.loads(str(self.submit_response.data))
-                      # csv
-                      except ValueError as e:
+                      # json, only a csv response does not start like json
+                      if not common.looks_like_json(result):
                           file_format = '.csv'
                                 
                       if download_file_name is not None:
@@ -7238,7 +8320,8 @@ class Query:
                                             poll: bool           = True,
                                             status_interval: int = QUERY_STATUS_CHECK_INTERVAL,
                                             verify: bool         = constants.GLOBAL_SSL_VERIFY,
-                                            compact_csv: bool    = False
+                                            compact_csv: bool    = False,
+                                            poller               = None
                                            ):
                                             
         """
@@ -7256,6 +8339,8 @@ class Query:
         :type verify:           bool
         :param compact_csv:     A flag to indicate the return of a compact csv format.
         :type compact_csv:      bool
+        :param poller:          A QueryStatusPoller to check the status on a shared schedule, defaults to a check every status_interval.
+        :type poller:           ibmpairs.query.QueryStatusPoller
         :raises Exception:      A ibmpairs.client.Client is not found, 
                                 query is not present, 
                                 the Query failed, 
@@ -7277,7 +8362,8 @@ class Query:
                                 client          = cli,
                                 poll            = poll,
                                 status_interval = status_interval,
-                                verify          = verify
+                                verify          = verify,
+                                poller          = poller
                                )
     
     #
@@ -7289,7 +8375,12 @@ class Query:
                                               download_folder      = None,
                                               download_file_name   = None,
                                               verify: bool         = constants.GLOBAL_SSL_VERIFY,
-                                              online: bool         = False
+                                              online: bool         = False,
+                                              stream: bool         = constants.QUERY_DOWNLOAD_STREAM,
+                                              segments: int        = constants.QUERY_DOWNLOAD_SEGMENTS,
+                                              extract: str         = constants.QUERY_DOWNLOAD_EXTRACT,
+                                              members: List[str]   = None,
+                                              poller               = None
                                              ):
         
         """
@@ -7311,6 +8402,16 @@ class Query:
         :type verify:              bool
         :param online:             Whether a point queries data should be returned to submit_response.data.
         :type online:              bool
+        :param stream:             Whether a bulk result should be streamed to disk in chunks rather than held in memory.
+        :type stream:              bool
+        :param segments:           The number of byte ranges a streamed result is downloaded in concurrently, 1 disables segmented downloads.
+        :type segments:            int
+        :param extract:            How a bulk result zip is extracted, 'all' (the members selected by members) or 'lazy' (kept as a zip, see Query.extract_members).
+        :type extract:             str
+        :param members:            A list of member globs or layer ids to extract, defaults to all members.
+        :type members:             List[str]
+        :param poller:             A QueryStatusPoller to check the status on a shared schedule, defaults to a check every status_interval.
+        :type poller:              ibmpairs.query.QueryStatusPoller
         :raises Exception:         A ibmpairs.client.Client is not found, 
                                    query is not present, 
                                    the Query status failed, 
@@ -7328,7 +8429,8 @@ class Query:
                                 client          = cli,
                                 poll            = poll,
                                 status_interval = status_interval,
-                                verify          = verify
+                                verify          = verify,
+                                poller          = poller
                                )
                             
         await self.async_download(query              = query, 
@@ -7337,7 +8439,12 @@ class Query:
                                   download_folder    = download_folder,
                                   download_file_name = download_file_name,
                                   verify             = verify,
-                                  online             = online
+                                  online             = online,
+                                  stream             = stream,
+                                  segments           = segments,
+                                  extract            = extract,
+                                  members            = members,
+                                  poller             = poller
                                  )
 
     #
@@ -7350,7 +8457,12 @@ class Query:
                                                      download_file_name   = None,
                                                      verify: bool         = constants.GLOBAL_SSL_VERIFY,
                                                      compact_csv: bool    = False,
-                                                     online: bool         = False
+                                                     online: bool         = False,
+                                                     stream: bool         = constants.QUERY_DOWNLOAD_STREAM,
+                                                     segments: int        = constants.QUERY_DOWNLOAD_SEGMENTS,
+                                                     extract: str         = constants.QUERY_DOWNLOAD_EXTRACT,
+                                                     members: List[str]   = None,
+                                                     poller               = None
                                                     ):
 
         """
@@ -7374,6 +8486,16 @@ class Query:
         :type compact_csv:         bool
         :param online:             Whether a point queries data should be returned to submit_response.data.
         :type online:              bool
+        :param stream:             Whether a bulk result should be streamed to disk in chunks rather than held in memory.
+        :type stream:              bool
+        :param segments:           The number of byte ranges a streamed result is downloaded in concurrently, 1 disables segmented downloads.
+        :type segments:            int
+        :param extract:            How a bulk result zip is extracted, 'all' (the members selected by members) or 'lazy' (kept as a zip, see Query.extract_members).
+        :type extract:             str
+        :param members:            A list of member globs or layer ids to extract, defaults to all members.
+        :type members:             List[str]
+        :param poller:             A QueryStatusPoller to check the status on a shared schedule, defaults to a check every status_interval.
+        :type poller:              ibmpairs.query.QueryStatusPoller
         :raises Exception:         A ibmpairs.client.Client is not found, 
                                    query is not present, 
                                    the Query status failed, 
@@ -7397,7 +8519,8 @@ class Query:
                                 client          = cli,
                                 poll            = poll,
                                 status_interval = status_interval,
-                                verify          = verify
+                                verify          = verify,
+                                poller          = poller
                                )
                             
         await self.async_download(query              = query, 
@@ -7406,124 +8529,857 @@ class Query:
                                   download_folder    = download_folder,
                                   download_file_name = download_file_name,
                                   verify             = verify,
-                                  online             = online
+                                  online             = online,
+                                  stream             = stream,
+                                  segments           = segments,
+                                  extract            = extract,
+                                  members            = members,
+                                  poller             = poller
                                  )
     
 #
-async def query_worker(queries: List[Query],
-                       client: cl.Client,
-                       status_interval: int = QUERY_STATUS_CHECK_INTERVAL,
-                       workers: int         = QUERY_DEFAULT_WORKERS,
-                       submit: bool         = True,
-                       status: bool         = True,
-                       download: bool       = True,
-                       verify: bool         = constants.GLOBAL_SSL_VERIFY,
-                       compact_csv: bool    = False,
-                       online: bool         = False
-                      ):
-                        
+class RasterLayer:
+    #_path: str
+    #_name: str
+    
     """
-    An asynchronous method to operate and await a number of submit, status and download calls.
+    A lazy view of a raster of a Query result. The raster is opened with rasterio on first 
+    use and only the windows that are indexed or read are loaded, in the dtype of the file, 
+    so that a large raster does not have to fit in memory: layer[1000:2000, 500:1500] reads 
+    one window, blocks() iterates over the internal tiles of the file. The path may be a 
+    file or a member of a zip (zip://<zip>!/<member>).
     
-    :param queries:         A list of queries.
-    :type queries:          List[ibmpairs.query.Query]
-    :param client:          An IBM PAIRS Client.
-    :type client:           ibmpairs.client.Client
-    :param status_interval: How often the async run operation should call back.
-    :type status_interval:  int
-    :param workers:         How many async operations should run contemporaneously.
-    :type workers:          int
-    :param submit:          Whether submit should be run.
-    :type submit:           bool
-    :param status:          Whether status check should be run.
-    :type status:           bool
-    :param download:        Whether download should be run.
-    :type download:         bool
-    :param verify:          SSL verification
-    :type verify:           bool
-    :param compact_csv:     A flag to indicate the return of a compact csv format.
-    :type compact_csv:      bool
-    :param online:          Whether a point queries data should be returned to submit_response.data.
-    :type online:           bool
-    :returns:               A list of queries.
-    :rtype:                 List[ibmpairs.query.Query]
+    :param path:    The path of the raster.
+    :type path:     str
+    :param name:    The name of the raster.
+    :type name:     str
     """
     
-    cli = common.set_client(input_client = client,
-                            global_client = cl.GLOBAL_PAIRS_CLIENT)
+    #
+    def __str__(self):
+        
+        """
+        The method creates a string representation of the internal class structure.
+        
+        :returns:       A string representation of the internal class structure.
+        :rtype:         str
+        """
+        
+        return json.dumps({"path": self._path, "name": self._name}, 
+                          indent    = constants.GLOBAL_JSON_REPR_INDENT, 
+                          sort_keys = constants.GLOBAL_JSON_REPR_SORT_KEYS)
     
-    cli.session()
-
-    tasks = set()
-    for query in queries:
-        if len(tasks) >= workers:
-            # Wait for some download to finish before adding a new one
-            _done, tasks = await asyncio.wait(tasks, 
-                                              return_when = asyncio.FIRST_COMPLETED
-                                             )
-        if ((submit and status and download) or ((submit and download) and not (status))):
-            msg = messages.INFO_QUERY_RUNNER_MUST_CHECK_STATUS
-            logger.info(msg)
-            tasks.add(asyncio.create_task(query.async_submit_check_status_and_download(query = query, 
-                                                                                       client = cli,
-                                                                                       status_interval = status_interval,
-                                                                                       verify = verify,
-                                                                                       compact_csv = compact_csv,
-                                                                                       online = online
-                                                                                      )))
-        elif (status and download) and not (submit):
-            tasks.add(asyncio.create_task(query.async_submit_and_check_status(query = query, 
-                                                                              client = cli,
-                                                                              status_interval = status_interval,
-                                                                              verify = verify,
-                                                                              compact_csv = compact_csv
-                                                                             )))
-        elif (submit and status) and not (download):
-            tasks.add(asyncio.create_task(query.async_check_status_and_download(query = query, 
-                                                                                client = cli,
-                                                                                status_interval = status_interval,
-                                                                                verify = verify,
-                                                                                online = online
-                                                                               )))
-        elif (status) and not (submit and download):
-            tasks.add(asyncio.create_task(query.async_status(query = query, 
-                                                             client = cli,
-                                                             status_interval = status_interval,
-                                                             verify = verify
-                                                            )))
-        elif (download) and not (submit and status):
-            tasks.add(asyncio.create_task(query.async_download(query = query, 
-                                                               client = cli,
-                                                               status_interval = status_interval,
-                                                               verify = verify,
-                                                               online = online
-                                                              )))
-        else:
-            msg = messages.ERROR_QUERY_RUNNER_CHOICE_INVALID.format(submit, status, download)
+    #
+    def __repr__(self):
+        return self.__str__()
+    
+    #
+    def __init__(self,
+                 path: str = None,
+                 name: str = None
+                ):
+        self._path    = path
+        self._name    = name
+        self._dataset = None
+    
+    #
+    def get_path(self):
+        return self._path
+    
+    #
+    path = property(get_path)
+    
+    #
+    def get_name(self):
+        return self._name
+    
+    #
+    name = property(get_name)
+    
+    #
+    def open(self):
+        
+        """
+        A method to open the raster, which is otherwise done on first use.
+        
+        :returns:          The RasterLayer.
+        :rtype:            ibmpairs.query.RasterLayer
+        :raises Exception: rasterio is not installed.
+        """
+        
+        if not HAS_RASTERIO:
+            msg = messages.ERROR_NO_RASTERIO
             logger.error(msg)
             raise common.PAWException(msg)
+        
+        if self._dataset is None:
+            self._dataset = rasterio.open(self._path)
+        
+        return self
+    
+    #
+    def close(self):
+        
+        """
+        A method to close the raster.
+        """
+        
+        if self._dataset is not None:
+            self._dataset.close()
+            self._dataset = None
+    
+    #
+    def __enter__(self):
+        return self.open()
+    
+    #
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    #
+    def get_dataset(self):
+        return self.open()._dataset
+    
+    #
+    dataset = property(get_dataset)
+    
+    #
+    def get_shape(self):
+        return (self.dataset.height, self.dataset.width)
+    
+    #
+    shape = property(get_shape)
+    
+    #
+    def get_dtype(self):
+        return np.dtype(self.dataset.dtypes[0])
+    
+    #
+    dtype = property(get_dtype)
+    
+    #
+    def get_nodata(self):
+        return self.dataset.nodata
+    
+    #
+    nodata = property(get_nodata)
+    
+    #
+    def get_count(self):
+        return self.dataset.count
+    
+    #
+    count = property(get_count)
+    
+    #
+    def get_transform(self):
+        return self.dataset.transform
+    
+    #
+    transform = property(get_transform)
+    
+    #
+    def get_crs(self):
+        return self.dataset.crs
+    
+    #
+    crs = property(get_crs)
+    
+    #
+    def read(self,
+             window = None,
+             band: int     = 1,
+             masked: bool  = False
+            ):
+        
+        """
+        A method to read a window of a band of the raster in the dtype of the file.
+        
+        :param window:     A rasterio Window or ((row_start, row_stop), (col_start, col_stop)), defaults to the whole band.
+        :type window:      rasterio.windows.Window or tuple
+        :param band:       The band, starting at 1.
+        :type band:        int
+        :param masked:     Whether nodata should be masked.
+        :type masked:      bool
+        :returns:          The window.
+        :rtype:            numpy.ndarray or numpy.ma.MaskedArray
+        """
+        
+        if (window is not None) and not isinstance(window, rasterio.windows.Window):
+            window = rasterio.windows.Window.from_slices(*window)
+        
+        return self.dataset.read(band, 
+                                 window = window, 
+                                 masked = masked
+                                )
+    
+    #
+    def __getitem__(self, key):
+        
+        """
+        A method to read the window of band 1 selected by the key, e.g. layer[0:256, 0:256].
+        
+        :param key:        A pair of slices or integers, rows then columns.
+        :type key:         tuple
+        :returns:          The window.
+        :rtype:            numpy.ndarray
+        """
+        
+        if not isinstance(key, tuple):
+            key = (key, slice(None))
+        
+        ranges = []
+        steps  = []
+        for index, size in zip(key, self.shape):
+            if isinstance(index, slice):
+                start, stop, step = index.indices(size)
+                if step < 0:
+                    start, stop = stop + 1, start + 1
+                ranges.append((start, max(start, stop)))
+                steps.append(slice(None, None, step))
+            else:
+                index = int(index) + size if int(index) < 0 else int(index)
+                if not (0 <= index < size):
+                    raise IndexError(index)
+                ranges.append((index, index + 1))
+                steps.append(0)
+        
+        array = self.read(window = tuple(ranges))
+        
+        return array[tuple(steps)]
+    
+    #
+    def blocks(self,
+               band: int    = 1,
+               masked: bool = False
+              ):
+        
+        """
+        A method to iterate over the internal blocks (tiles or strips) of a band, reading one 
+        block at a time.
+        
+        :param band:       The band, starting at 1.
+        :type band:        int
+        :param masked:     Whether nodata should be masked.
+        :type masked:      bool
+        :returns:          Pairs of the window and the data of each block.
+        :rtype:            Iterator[Tuple[rasterio.windows.Window, numpy.ndarray]]
+        """
+        
+        for _, window in self.dataset.block_windows(band):
+            yield window, self.read(window = window, 
+                                    band   = band, 
+                                    masked = masked
+                                   )
+
+#
+class QueryStatusSchedule:
+    #_status_interval: int
+    #_adaptive: bool
+    
+    """
+    The intervals between the status checks of a Query. With adaptive set the checks are 
+    tight after submit, after every status change and while the result is being written 
+    or packaged; while a query is queued (or running without progress) the interval grows 
+    exponentially, and while it reports progress it is half of the estimated time to finish. 
+    The interval is at least QUERY_STATUS_ADAPTIVE_MIN seconds (and never less than 
+    QUERY_MIN_STATUS_INTERVAL), at most QUERY_STATUS_ADAPTIVE_CAP times the status_interval 
+    and jittered so that queries submitted together spread out. 
+    Without adaptive every interval is the status_interval.
+    
+    :param status_interval: The status interval.
+    :type status_interval:  int
+    :param adaptive:        Whether the interval should adapt to the status of the query.
+    :type adaptive:         bool
+    """
+    
+    #
+    def __init__(self,
+                 status_interval: int = QUERY_STATUS_CHECK_INTERVAL,
+                 adaptive: bool       = constants.QUERY_STATUS_ADAPTIVE
+                ):
+        self._status_interval = status_interval
+        self._adaptive        = adaptive
+        
+        # Never below the minimum status interval enforced for batches, to protect the server.
+        self._minimum     = max(min(constants.QUERY_STATUS_ADAPTIVE_MIN, status_interval), constants.QUERY_MIN_STATUS_INTERVAL)
+        self._maximum     = max(status_interval * constants.QUERY_STATUS_ADAPTIVE_CAP, self._minimum)
+        self._interval    = None
+        self._status_code = None
+        self._progress    = None
+    
+    #
+    def next(self,
+             query_job
+            ):
+        
+        """
+        A method to get the interval until the next status check.
+        
+        :param query_job:  The latest status of the query.
+        :type query_job:   ibmpairs.query.QueryJob
+        :returns:          The interval in seconds.
+        :rtype:            float
+        """
+        
+        if self._adaptive is False:
+            return self._status_interval
+        
+        status_code = query_job.status_code if query_job is not None else None
+        percent     = query_job.ex_percent if query_job is not None else None
+        now         = time.monotonic()
+        eta         = None
+        
+        if (self._interval is None) or (status_code != self._status_code):
+            self._status_code = status_code
+            self._progress    = None
+            interval          = self._minimum
+        elif status_code in constants.QUERY_STATUS_FINISHING_CODES:
+            interval = self._minimum
+        else:
+            if (percent is not None) and (0 < percent < 100):
+                if (self._progress is None) or (percent < self._progress[1]):
+                    self._progress = (now, percent)
+                elif (percent > self._progress[1]) and (now > self._progress[0]):
+                    eta = (100 - percent) * (now - self._progress[0]) / (percent - self._progress[1])
+            
+            if eta is not None:
+                interval = eta / 2
+            else:
+                interval = self._interval * constants.QUERY_STATUS_ADAPTIVE_FACTOR
+        
+        self._interval = min(max(interval, self._minimum), self._maximum)
+        
+        jitter = random.uniform(-constants.QUERY_STATUS_ADAPTIVE_JITTER, constants.QUERY_STATUS_ADAPTIVE_JITTER)
+        
+        return min(max(self._interval * (1 + jitter), self._minimum), self._maximum)
+
+#
+class QueryStatusPoller:
+    #_client: ibmpairs.client.Client
+    #_status_interval: int
+    #_workers: int
+    #_verify: bool
+    #_bulk: bool
+    
+    """
+    A poller that checks the status of many in flight Queries on one schedule. The first 
+    check of a query is made at once, later checks wait for the round in which they are due, 
+    in which the statuses of all waiting queries are gathered together: from the query job 
+    list where possible, otherwise (and to confirm a finished query) with at most workers 
+    concurrent requests. The waiting coroutines are then woken with their response.
+    
+    :param client:          An IBM PAIRS Client.
+    :type client:           ibmpairs.client.Client
+    :param status_interval: The interval between rounds.
+    :type status_interval:  int
+    :param workers:         How many status requests should run contemporaneously.
+    :type workers:          int
+    :param verify:          SSL verification
+    :type verify:           bool
+    :param bulk:            Whether the query job list should be used to check many statuses at once.
+    :type bulk:             bool
+    """
+    
+    #
+    def __init__(self,
+                 client: cl.Client    = None,
+                 status_interval: int = QUERY_STATUS_CHECK_INTERVAL,
+                 workers: int         = constants.QUERY_STATUS_POLLER_WORKERS,
+                 verify: bool         = constants.GLOBAL_SSL_VERIFY,
+                 bulk: bool           = constants.QUERY_STATUS_POLLER_BULK
+                ):
+        self._client          = common.set_client(input_client  = client,
+                                                  global_client = cl.GLOBAL_PAIRS_CLIENT)
+        self._status_interval = status_interval
+        self._workers         = workers
+        self._verify          = verify
+        self._bulk            = bulk
+        
+        self._waiters   = {}
+        self._seen      = set()
+        self._task      = None
+        self._wake      = None
+        self._semaphore = None
+    
+    #
+    async def status(self,
+                     query_id: str,
+                     delay: float = None
+                    ):
+        
+        """
+        A method to get the status of a query, at once for the first check of a query (or the 
+        first after it finished) and otherwise in the first round after the delay.
+        
+        :param query_id:   The id of the query.
+        :type query_id:    str
+        :param delay:      The delay in seconds, defaults to the status interval of the poller.
+        :type delay:       float
+        :returns:          The response of the status request.
+        :rtype:            ibmpairs.client.ClientResponse
+        """
+        
+        query_id = str(query_id)
+        
+        if query_id not in self._seen:
+            self._seen.add(query_id)
+            response = (await self._fetch([query_id]))[query_id]
+            self._forget_finished(query_id, response)
+            return response
+        
+        loop   = asyncio.get_running_loop()
+        future = loop.create_future()
+        due    = loop.time() + (self._status_interval if delay is None else delay)
+        
+        self._waiters.setdefault(query_id, []).append((due, future))
+        
+        if self._wake is None:
+            self._wake = asyncio.Event()
+        self._wake.set()
+        
+        if (self._task is None) or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        
+        return await future
+    
+    #
+    def _forget_finished(self,
+                         query_id: str,
+                         response: cl.ClientResponse
+                        ):
+        
+        """
+        An internal method to stop tracking a query once it is no longer running, so that a 
+        later check (for example before its download) is made at once.
+        """
+        
+        status_code = None
+        
+        if response.status == 200:
+            try:
+                status_code = query_job_from_json(response.body).status_code
+            except Exception:
+                status_code = None
+        
+        if status_code not in constants.QUERY_STATUS_RUNNING_CODES:
+            self._seen.discard(query_id)
+    
+    #
+    async def _run(self):
+        
+        """
+        An internal method that runs rounds while queries are waiting. A round is made when the 
+        first waiting query is due and includes every query due within QUERY_STATUS_POLLER_HORIZON 
+        seconds of it. A failed round is handed to the waiting coroutines of the round.
+        """
+        
+        loop = asyncio.get_running_loop()
+        
+        while len(self._waiters) > 0:
+            due = min(entry[0] for entries in self._waiters.values() for entry in entries)
+            
+            self._wake.clear()
+            try:
+                # A query that registers in the meantime may be due earlier.
+                await asyncio.wait_for(self._wake.wait(), timeout = max(0, due - loop.time()))
+                continue
+            except asyncio.TimeoutError:
+                pass
+            
+            horizon = loop.time() + constants.QUERY_STATUS_POLLER_HORIZON
+            waiters = {query_id: entries for query_id, entries in self._waiters.items() 
+                       if min(entry[0] for entry in entries) <= horizon}
             
+            for query_id in waiters:
+                del self._waiters[query_id]
+            
+            try:
+                responses = await self._fetch(list(waiters.keys()))
+            except asyncio.CancelledError:
+                self._cancel_waiters(waiters)
+                raise
+            except Exception as e:
+                for entries in waiters.values():
+                    for _due, future in entries:
+                        if not future.done():
+                            future.set_exception(e)
+                continue
+            
+            for query_id, entries in waiters.items():
+                self._forget_finished(query_id, responses[query_id])
+                for _due, future in entries:
+                    if not future.done():
+                        future.set_result(responses[query_id])
+    
+    #
+    def _cancel_waiters(self,
+                        waiters: dict
+                       ):
+        
+        """
+        An internal method to cancel the futures of waiting coroutines.
+        """
+        
+        for entries in waiters.values():
+            for _due, future in entries:
+                future.cancel()
+    
+    #
+    async def aclose(self):
+        
+        """
+        A method to stop the rounds of the poller, coroutines still waiting for a status are cancelled.
+        """
+        
+        task, self._task = self._task, None
+        
+        if (task is not None) and (not task.done()):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        
+        waiters, self._waiters = self._waiters, {}
+        self._cancel_waiters(waiters)
+    
+    #
+    async def _fetch(self,
+                     query_ids: List[str]
+                    ):
+        
+        """
+        An internal method to get the status responses of a number of queries.
+        
+        :param query_ids:  The ids of the queries.
+        :type query_ids:   List[str]
+        :returns:          The response of each query keyed by id.
+        :rtype:            dict
+        """
+        
+        responses = {}
+        
+        if (self._bulk is True) and (len(query_ids) > 1):
+            responses = await self._fetch_bulk(query_ids)
+        
+        bulk_count = len(responses)
+        
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._workers)
+        
+        async def fetch_one(query_id):
+            async with self._semaphore:
+                try:
+                    return await self._client.async_get(url    = self._client.get_host() +
+                                                                 constants.QUERY_JOBS_API +
+                                                                 query_id,
+                                                        verify = self._verify
+                                                       )
+                except Exception as e:
+                    msg = messages.ERROR_CLIENT_UNSPECIFIED_ERROR.format('GET', 'request', self._client.get_host() + constants.QUERY_JOBS_API + query_id, e)
+                    logger.error(msg)
+                    return cl.ClientResponse(status = -999, 
+                                             body = r"""{"status":"Unspecified Server Error"}"""
+                                            )
+        
+        remaining = [query_id for query_id in query_ids if query_id not in responses]
+        
+        for query_id, response in zip(remaining, await asyncio.gather(*[fetch_one(query_id) for query_id in remaining])):
+            responses[query_id] = response
+        
+        msg = messages.DEBUG_QUERY_STATUS_POLLER_ROUND.format(len(query_ids), bulk_count)
+        logger.debug(msg)
+        
+        return responses
+    
+    #
+    async def _fetch_bulk(self,
+                          query_ids: List[str]
+                         ):
+        
+        """
+        An internal method to get the status of running queries from the query job list. Queries 
+        that are missing from the list or no longer running are left to be checked one by one, 
+        which returns their full status. If the list cannot be used it is not tried again.
+        
+        :param query_ids:  The ids of the queries.
+        :type query_ids:   List[str]
+        :returns:          The response of each running query found in the list keyed by id.
+        :rtype:            dict
+        """
+        
+        responses = {}
+        
+        size = min(2 * len(query_ids), constants.QUERY_STATUS_POLLER_BULK_SIZE)
+        
+        try:
+            response = await self._client.async_get(url    = self._client.get_host() +
+                                                             constants.QUERY_JOBS_API +
+                                                             constants.QUERY_JOBS_LIST_API +
+                                                             str(size),
+                                                    verify = self._verify
+                                                   )
+            if response.status != 200:
+                raise common.PAWException(response.status)
+            query_job_list = query_jobs_from_json(response.body).query_job_list or []
+        except Exception as e:
+            msg = messages.DEBUG_QUERY_STATUS_POLLER_NO_BULK.format(e)
+            logger.debug(msg)
+            self._bulk = False
+            return responses
+        
+        for query_job in query_job_list:
+            if (query_job.id in query_ids) and (query_job.status_code in constants.QUERY_STATUS_RUNNING_CODES):
+                responses[query_job.id] = cl.ClientResponse(status = 200,
+                                                            body   = query_job.to_json()
+                                                           )
+        
+        return responses
+
+#
+async def async_iter_batch_query(queries: List[Query],
+                                 client: cl.Client,
+                                 status_interval: int  = QUERY_STATUS_CHECK_INTERVAL,
+                                 workers: int          = QUERY_DEFAULT_WORKERS,
+                                 submit: bool          = True,
+                                 status: bool          = True,
+                                 download: bool        = True,
+                                 verify: bool          = constants.GLOBAL_SSL_VERIFY,
+                                 compact_csv: bool     = False,
+                                 online: bool          = False,
+                                 stream: bool          = constants.QUERY_DOWNLOAD_STREAM,
+                                 segments: int         = constants.QUERY_DOWNLOAD_SEGMENTS,
+                                 extract: str          = constants.QUERY_DOWNLOAD_EXTRACT,
+                                 members: List[str]    = None,
+                                 submit_workers: int   = None,
+                                 download_workers: int = None
+                                ):
+                        
+    """
+    An asynchronous generator that runs a number of queries through the submit, status and 
+    download pipeline of query_worker, yielding each query as soon as its pipeline finishes 
+    rather than once all of them have. Each item is a tuple of the query and the exception 
+    that stopped its pipeline, or None if it succeeded. Queries that have not finished are 
+    cancelled if the generator is closed early.
+    
+    :param queries:          A list of queries.
+    :type queries:           List[ibmpairs.query.Query]
+    :param client:           An IBM PAIRS Client.
+    :type client:            ibmpairs.client.Client
+    :param status_interval:  How often the async run operation should call back.
+    :type status_interval:   int
+    :param workers:          The default of submit_workers and download_workers.
+    :type workers:           int
+    :param submit:           Whether submit should be run.
+    :type submit:            bool
+    :param status:           Whether status check should be run.
+    :type status:            bool
+    :param download:         Whether download should be run.
+    :type download:          bool
+    :param verify:           SSL verification
+    :type verify:            bool
+    :param compact_csv:      A flag to indicate the return of a compact csv format.
+    :type compact_csv:       bool
+    :param online:           Whether a point queries data should be returned to submit_response.data.
+    :type online:            bool
+    :param stream:           Whether a bulk result should be streamed to disk in chunks rather than held in memory.
+    :type stream:            bool
+    :param segments:         The number of byte ranges a streamed result is downloaded in concurrently, 1 disables segmented downloads.
+    :type segments:          int
+    :param extract:          How a bulk result zip is extracted, 'all' (the members selected by members) or 'lazy' (kept as a zip, see Query.extract_members).
+    :type extract:           str
+    :param members:          A list of member globs or layer ids to extract, defaults to all members.
+    :type members:           List[str]
+    :param submit_workers:   How many submits should run contemporaneously, defaults to workers.
+    :type submit_workers:    int
+    :param download_workers: How many downloads should run contemporaneously, defaults to workers.
+    :type download_workers:  int
+    :returns:                Tuples of a query and None or the exception it failed with, in order of completion.
+    :rtype:                  AsyncIterator[Tuple[ibmpairs.query.Query, Exception]]
+    :raises Exception:       the choice of submit, status and download is invalid.
+    """
+    
+    cli = common.set_client(input_client = client,
+                            global_client = cl.GLOBAL_PAIRS_CLIENT)
+    
+    cli.session()
+    
+    if not (status or download):
+        msg = messages.ERROR_QUERY_RUNNER_CHOICE_INVALID.format(submit, status, download)
+        logger.error(msg)
+        raise common.PAWException(msg)
+    
+    if (submit and download) and not (status):
+        msg = messages.INFO_QUERY_RUNNER_MUST_CHECK_STATUS
+        logger.info(msg)
+    
+    # One status schedule for all of the queries in flight.
+    poller = QueryStatusPoller(client          = cli,
+                               status_interval = status_interval,
+                               verify          = verify
+                              )
+    
+    submit_semaphore   = asyncio.Semaphore(submit_workers if submit_workers is not None else workers)
+    download_semaphore = asyncio.Semaphore(download_workers if download_workers is not None else workers)
+    
+    async def pipeline(query):
+        if submit:
+            async with submit_semaphore:
+                await query.async_submit(query       = query, 
+                                         client      = cli,
+                                         verify      = verify,
+                                         compact_csv = compact_csv
+                                        )
+        
+        # A download waits for the result here, without holding a download worker.
+        await query.async_status(query           = query, 
+                                 client          = cli,
+                                 status_interval = status_interval,
+                                 verify          = verify,
+                                 poller          = poller
+                                )
+        
+        if download:
+            async with download_semaphore:
+                await query.async_download(query           = query, 
+                                           client          = cli,
+                                           status_interval = status_interval,
+                                           verify          = verify,
+                                           online          = online,
+                                           stream          = stream,
+                                           segments        = segments,
+                                           extract         = extract,
+                                           members         = members,
+                                           poller          = poller
+                                          )
+    
+    async def run(query):
+        # Failures are reported by each stage and recorded on the query, they do not stop the others.
+        try:
+            await pipeline(query)
+        except Exception as e:
+            return query, e
+        return query, None
+    
+    tasks = [asyncio.ensure_future(run(query)) for query in queries]
+    
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await poller.aclose()
 
-    # Wait for the remaining uploads to finish
-    await asyncio.wait(tasks)
+#
+async def query_worker(queries: List[Query],
+                       client: cl.Client,
+                       status_interval: int  = QUERY_STATUS_CHECK_INTERVAL,
+                       workers: int          = QUERY_DEFAULT_WORKERS,
+                       submit: bool          = True,
+                       status: bool          = True,
+                       download: bool        = True,
+                       verify: bool          = constants.GLOBAL_SSL_VERIFY,
+                       compact_csv: bool     = False,
+                       online: bool          = False,
+                       stream: bool          = constants.QUERY_DOWNLOAD_STREAM,
+                       segments: int         = constants.QUERY_DOWNLOAD_SEGMENTS,
+                       extract: str          = constants.QUERY_DOWNLOAD_EXTRACT,
+                       members: List[str]    = None,
+                       submit_workers: int   = None,
+                       download_workers: int = None
+                      ):
+                        
+    """
+    An asynchronous method to operate and await a number of submit, status and download calls. 
+    Each query runs through a pipeline of stages with their own concurrency limits: at most 
+    submit_workers submits and download_workers downloads run contemporaneously, while the 
+    status of every query in flight is checked by one QueryStatusPoller, so that any number 
+    of queries can wait for their result without holding a worker. The pipeline itself is 
+    async_iter_batch_query, drained here until every query has finished.
+    
+    :param queries:          A list of queries.
+    :type queries:           List[ibmpairs.query.Query]
+    :param client:           An IBM PAIRS Client.
+    :type client:            ibmpairs.client.Client
+    :param status_interval:  How often the async run operation should call back.
+    :type status_interval:   int
+    :param workers:          The default of submit_workers and download_workers.
+    :type workers:           int
+    :param submit:           Whether submit should be run.
+    :type submit:            bool
+    :param status:           Whether status check should be run.
+    :type status:            bool
+    :param download:         Whether download should be run.
+    :type download:          bool
+    :param verify:           SSL verification
+    :type verify:            bool
+    :param compact_csv:      A flag to indicate the return of a compact csv format.
+    :type compact_csv:       bool
+    :param online:           Whether a point queries data should be returned to submit_response.data.
+    :type online:            bool
+    :param stream:           Whether a bulk result should be streamed to disk in chunks rather than held in memory.
+    :type stream:            bool
+    :param segments:         The number of byte ranges a streamed result is downloaded in concurrently, 1 disables segmented downloads.
+    :type segments:          int
+    :param extract:          How a bulk result zip is extracted, 'all' (the members selected by members) or 'lazy' (kept as a zip, see Query.extract_members).
+    :type extract:           str
+    :param members:          A list of member globs or layer ids to extract, defaults to all members.
+    :type members:           List[str]
+    :param submit_workers:   How many submits should run contemporaneously, defaults to workers.
+    :type submit_workers:    int
+    :param download_workers: How many downloads should run contemporaneously, defaults to workers.
+    :type download_workers:  int
+    :returns:                A list of queries.
+    :rtype:                  List[ibmpairs.query.Query]
+    :raises Exception:       the choice of submit, status and download is invalid.
+    """
+    
+    async for query, error in async_iter_batch_query(queries          = queries,
+                                                     client           = client,
+                                                     status_interval  = status_interval,
+                                                     workers          = workers,
+                                                     submit           = submit,
+                                                     status           = status,
+                                                     download         = download,
+                                                     verify           = verify,
+                                                     compact_csv      = compact_csv,
+                                                     online           = online,
+                                                     stream           = stream,
+                                                     segments         = segments,
+                                                     extract          = extract,
+                                                     members          = members,
+                                                     submit_workers   = submit_workers,
+                                                     download_workers = download_workers
+                                                    ):
+        pass
 
     return(queries)
 
 #
 def batch_query(queries: List[Query],
-                client: cl.Client    = None,
-                status_interval: int = QUERY_STATUS_CHECK_INTERVAL,
-                workers: int         = QUERY_DEFAULT_WORKERS,
-                submit: bool         = True,
-                status: bool         = True,
-                download: bool       = True,
-                verify: bool         = constants.GLOBAL_SSL_VERIFY,
-                compact_csv: bool    = False,
-                online: bool         = False
+                client: cl.Client     = None,
+                status_interval: int  = QUERY_STATUS_CHECK_INTERVAL,
+                workers: int          = QUERY_DEFAULT_WORKERS,
+                submit: bool          = True,
+                status: bool          = True,
+                download: bool        = True,
+                verify: bool          = constants.GLOBAL_SSL_VERIFY,
+                compact_csv: bool     = False,
+                online: bool          = False,
+                stream: bool          = constants.QUERY_DOWNLOAD_STREAM,
+                segments: int         = constants.QUERY_DOWNLOAD_SEGMENTS,
+                extract: str          = constants.QUERY_DOWNLOAD_EXTRACT,
+                members: List[str]    = None,
+                submit_workers: int   = None,
+                download_workers: int = None
                ):
                 
     """
-    A method to gather a number of batched queries using the query_worker method.
+    A method to gather a number of batched queries using the query_worker method. The number 
+    of queries in flight is not limited, only the submit and download stages are.
     
     :param queries:         A list of queries.
     :type queries:          List[ibmpairs.query.Query]
@@ -7531,7 +9387,7 @@ def batch_query(queries: List[Query],
     :type client:           ibmpairs.client.Client
     :param status_interval: How often the async run operation should call back.
     :type status_interval:  int
-    :param workers:         How many async operations should run contemporaneously.
+    :param workers:         The default of submit_workers and download_workers.
     :type workers:          int
     :param submit:          Whether submit should be run.
     :type submit:           bool
@@ -7545,6 +9401,18 @@ def batch_query(queries: List[Query],
     :type compact_csv:      bool
     :param online:             Whether a point queries data should be returned to submit_response.data.
     :type online:              bool
+    :param stream:             Whether a bulk result should be streamed to disk in chunks rather than held in memory.
+    :type stream:              bool
+    :param segments:           The number of byte ranges a streamed result is downloaded in concurrently, 1 disables segmented downloads.
+    :type segments:            int
+    :param extract:            How a bulk result zip is extracted, 'all' (the members selected by members) or 'lazy' (kept as a zip, see Query.extract_members).
+    :type extract:             str
+    :param members:            A list of member globs or layer ids to extract, defaults to all members.
+    :type members:             List[str]
+    :param submit_workers:     How many submits should run contemporaneously, defaults to workers.
+    :type submit_workers:      int
+    :param download_workers:   How many downloads should run contemporaneously, defaults to workers.
+    :type download_workers:    int
     :returns:               A list of queries.
     :rtype:                 List[ibmpairs.query.Query]
     """
@@ -7557,10 +9425,16 @@ def batch_query(queries: List[Query],
         logger.error(msg)
         raise common.PAWException(msg)
 
-    if workers > constants.QUERY_MAX_WORKERS:
-        msg = messages.ERROR_QUERY_EXCEED_MAX_WORKERS.format(workers, constants.QUERY_MAX_WORKERS)
-        logger.error(msg)
-        raise common.PAWException(msg)
+    if submit_workers is None:
+        submit_workers = workers
+    if download_workers is None:
+        download_workers = workers
+
+    for stage_workers in [submit_workers, download_workers]:
+        if stage_workers > constants.QUERY_MAX_WORKERS:
+            msg = messages.ERROR_QUERY_EXCEED_MAX_WORKERS.format(stage_workers, constants.QUERY_MAX_WORKERS)
+            logger.error(msg)
+            raise common.PAWException(msg)
 
     #logger.debug('Commencing upload run.')
 
@@ -7576,16 +9450,22 @@ def batch_query(queries: List[Query],
         msg = messages.INFO_FOUND_EVENT_LOOP_STARTING_TASK.format("batch_query")
         logger.info(msg)
       
-        result = common.run_async_in_thread(query_worker, queries         = queries, 
-                                                          client          = cli,
-                                                          status_interval = status_interval,
-                                                          workers         = workers,
-                                                          submit          = submit,
-                                                          status          = status,
-                                                          download        = download,
-                                                          verify          = verify,
-                                                          compact_csv     = compact_csv,
-                                                          online          = online
+        result = common.run_async_in_thread(query_worker, queries          = queries, 
+                                                          client           = cli,
+                                                          status_interval  = status_interval,
+                                                          workers          = workers,
+                                                          submit           = submit,
+                                                          status           = status,
+                                                          download         = download,
+                                                          verify           = verify,
+                                                          compact_csv      = compact_csv,
+                                                          online           = online,
+                                                          stream           = stream,
+                                                          segments         = segments,
+                                                          extract          = extract,
+                                                          members          = members,
+                                                          submit_workers   = submit_workers,
+                                                          download_workers = download_workers
                                             )
       
         msg = messages.INFO_FOUND_EVENT_LOOP_COMPLETED_TASK.format("batch_query")
@@ -7593,22 +9473,207 @@ def batch_query(queries: List[Query],
     else:
         msg = messages.INFO_STARTING_EVENT_LOOP
         logger.debug(msg)
-        result = asyncio.run(query_worker(queries         = queries, 
-                                          client          = cli,
-                                          status_interval = status_interval,
-                                          workers         = workers,
-                                          submit          = submit,
-                                          status          = status,
-                                          download        = download,
-                                          verify          = verify,
-                                          compact_csv     = compact_csv,
-                                          online          = online
-                                         ),
-                             debug = constants.QUERY_WORKER_DEBUG
-                            )
+        result = cli.run(query_worker(queries          = queries, 
+                                      client           = cli,
+                                      status_interval  = status_interval,
+                                      workers          = workers,
+                                      submit           = submit,
+                                      status           = status,
+                                      download         = download,
+                                      verify           = verify,
+                                      compact_csv      = compact_csv,
+                                      online           = online,
+                                      stream           = stream,
+                                      segments         = segments,
+                                      extract          = extract,
+                                      members          = members,
+                                      submit_workers   = submit_workers,
+                                      download_workers = download_workers
+                                     ),
+                         debug = constants.QUERY_WORKER_DEBUG
+                        )
 
     return(result)
 
+#
+def iter_batch_query(queries: List[Query],
+                     client: cl.Client     = None,
+                     status_interval: int  = QUERY_STATUS_CHECK_INTERVAL,
+                     workers: int          = QUERY_DEFAULT_WORKERS,
+                     submit: bool          = True,
+                     status: bool          = True,
+                     download: bool        = True,
+                     verify: bool          = constants.GLOBAL_SSL_VERIFY,
+                     compact_csv: bool     = False,
+                     online: bool          = False,
+                     stream: bool          = constants.QUERY_DOWNLOAD_STREAM,
+                     segments: int         = constants.QUERY_DOWNLOAD_SEGMENTS,
+                     extract: str          = constants.QUERY_DOWNLOAD_EXTRACT,
+                     members: List[str]    = None,
+                     submit_workers: int   = None,
+                     download_workers: int = None
+                    ):
+                     
+    """
+    A method to run a number of batched queries, as batch_query does, while yielding each 
+    query as soon as its download has finished. Each item is a tuple of the query and the 
+    exception that stopped it, or None if it succeeded, so that results can be used while 
+    the rest of the batch is still running. The queries run on an event loop in a separate 
+    thread, the method can therefore be used whether or not an event loop is running.
+    
+    :param queries:         A list of queries.
+    :type queries:          List[ibmpairs.query.Query]
+    :param client:          An IBM PAIRS Client.
+    :type client:           ibmpairs.client.Client
+    :param status_interval: How often the async run operation should call back.
+    :type status_interval:  int
+    :param workers:         The default of submit_workers and download_workers.
+    :type workers:          int
+    :param submit:          Whether submit should be run.
+    :type submit:           bool
+    :param status:          Whether status check should be run.
+    :type status:           bool
+    :param download:        Whether download should be run.
+    :type download:         bool
+    :param verify:          SSL verification
+    :type verify:           bool
+    :param compact_csv:     A flag to indicate the return of a compact csv format.
+    :type compact_csv:      bool
+    :param online:             Whether a point queries data should be returned to submit_response.data.
+    :type online:              bool
+    :param stream:             Whether a bulk result should be streamed to disk in chunks rather than held in memory.
+    :type stream:              bool
+    :param segments:           The number of byte ranges a streamed result is downloaded in concurrently, 1 disables segmented downloads.
+    :type segments:            int
+    :param extract:            How a bulk result zip is extracted, 'all' (the members selected by members) or 'lazy' (kept as a zip, see Query.extract_members).
+    :type extract:             str
+    :param members:            A list of member globs or layer ids to extract, defaults to all members.
+    :type members:             List[str]
+    :param submit_workers:     How many submits should run contemporaneously, defaults to workers.
+    :type submit_workers:      int
+    :param download_workers:   How many downloads should run contemporaneously, defaults to workers.
+    :type download_workers:    int
+    :returns:               Tuples of a query and None or the exception it failed with, in order of completion.
+    :rtype:                 Iterator[Tuple[ibmpairs.query.Query, Exception]]
+    :raises Exception:      the status interval is too short or the number of workers exceeds the maximum.
+    """
+                
+    cli = common.set_client(input_client = client,
+                            global_client = cl.GLOBAL_PAIRS_CLIENT)
+
+    if status_interval < constants.QUERY_MIN_STATUS_INTERVAL:
+        msg = messages.ERROR_QUERY_STATUS_INTERVAL.format(status_interval, constants.QUERY_MIN_STATUS_INTERVAL)
+        logger.error(msg)
+        raise common.PAWException(msg)
+
+    if submit_workers is None:
+        submit_workers = workers
+    if download_workers is None:
+        download_workers = workers
+
+    for stage_workers in [submit_workers, download_workers]:
+        if stage_workers > constants.QUERY_MAX_WORKERS:
+            msg = messages.ERROR_QUERY_EXCEED_MAX_WORKERS.format(stage_workers, constants.QUERY_MAX_WORKERS)
+            logger.error(msg)
+            raise common.PAWException(msg)
+
+    results = queue.Queue()
+    running = {}
+    done    = object()
+    
+    async def produce():
+        running['loop'] = asyncio.get_running_loop()
+        running['task'] = asyncio.current_task()
+        try:
+            generator = async_iter_batch_query(queries          = queries,
+                                               client           = cli,
+                                               status_interval  = status_interval,
+                                               workers          = workers,
+                                               submit           = submit,
+                                               status           = status,
+                                               download         = download,
+                                               verify           = verify,
+                                               compact_csv      = compact_csv,
+                                               online           = online,
+                                               stream           = stream,
+                                               segments         = segments,
+                                               extract          = extract,
+                                               members          = members,
+                                               submit_workers   = submit_workers,
+                                               download_workers = download_workers
+                                              )
+            try:
+                async for result in generator:
+                    results.put(result)
+            finally:
+                await generator.aclose()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            results.put(e)
+        finally:
+            results.put(done)
+    
+    thread = threading.Thread(target = asyncio.run, 
+                              args   = (produce(),), 
+                              daemon = True
+                             )
+    thread.start()
+    
+    try:
+        while True:
+            result = results.get()
+            if result is done:
+                break
+            if isinstance(result, Exception):
+                raise result
+            yield result
+    finally:
+        # Closing the iterator early cancels the queries that have not finished.
+        if thread.is_alive() and ('loop' in running):
+            running['loop'].call_soon_threadsafe(running['task'].cancel)
+        thread.join()
+
+#
+def point_data_to_parquet(queries: List[Query],
+                          path: str,
+                          partition_by: List[str] = constants.QUERY_POINT_PARQUET_PARTITIONS,
+                          append: bool            = True
+                         ):
+    
+    """
+    A method to write the point data of a number of queries, such as those returned by 
+    batch_query or iter_batch_query, to one partitioned Parquet dataset. Queries without 
+    point data are skipped. With append the dataset grows across batch_query runs.
+    
+    :param queries:         A list of queries.
+    :type queries:          List[ibmpairs.query.Query]
+    :param path:            The folder of the dataset.
+    :type path:             str
+    :param partition_by:    The partition columns, by default the layer and the date of the timestamp.
+    :type partition_by:     List[str]
+    :param append:          Whether to add to the partitions of an existing dataset, rather than replace 
+                            the partitions that are written.
+    :type append:           bool
+    :returns:               The folder of the dataset.
+    :rtype:                 str
+    :raises Exception:      if no query has point data or pyarrow is not installed.
+    """
+    
+    frames = [query.point_data_as_dataframe() for query in queries 
+              if (query.submit_response is not None) and query.submit_response.has_data()]
+    
+    if len(frames) == 0:
+        msg = messages.ERROR_QUERY_NO_POINT_DATA
+        logger.error(msg)
+        raise common.PAWException(msg)
+    
+    return common.write_parquet_dataset(pandas.concat(frames, ignore_index = True),
+                                        path         = path,
+                                        partition_by = partition_by,
+                                        append       = append
+                                       )
+
 #
 class Group:
     #_id: int
@@ -7746,7 +9811,7 @@ class Group:
         if isinstance(group_json, dict):
             group = Group.from_dict(group_json)
         elif isinstance(group_json, str):
-            group_dict = json.loads(group_json)
+            group_dict = common.json_loads(group_json)
             group = Group.from_dict(group_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(group_json), "group_json")
@@ -8037,7 +10102,7 @@ class User:
         if isinstance(user_json, dict):
             user = User.from_dict(user_json)
         elif isinstance(user_json, str):
-            user_dict = json.loads(user_json)
+            user_dict = common.json_loads(user_json)
             user = User.from_dict(user_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(user_json), "user_json")
@@ -8453,7 +10518,7 @@ class QueryHistory:
         if isinstance(query_history_json, dict):
             query_history = QueryHistory.from_dict(query_history_json)
         elif isinstance(query_history_json, str):
-            query_history_dict = json.loads(query_history_json)
+            query_history_dict = common.json_loads(query_history_json)
             query_history = QueryHistory.from_dict(query_history_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(query_history_json), "query_history_json")
@@ -8522,7 +10587,7 @@ class QueryHistory:
             raise common.PAWException(msg)
           
         else:
-            query_history_json = response.json()
+            query_history_json = common.response_json(response)
             query_history = query_history_from_dict(query_history_json)
             
             return query_history
@@ -8755,7 +10820,7 @@ class LatestQueries:
         if isinstance(latest_queries_json, dict):
             latest_queries = LatestQueries.from_dict(latest_queries_json)
         elif isinstance(latest_queries_json, str):
-            latest_queries_dict = json.loads(latest_queries_json)
+            latest_queries_dict = common.json_loads(latest_queries_json)
             latest_queries = LatestQueries.from_dict(latest_queries_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(latest_queries_json), "latest_queries_json")
@@ -8826,7 +10891,7 @@ class LatestQueries:
         else:
             lq: List[Query] = []
             
-            query_jobs_json = response.json() 
+            query_jobs_json = common.response_json(response) 
             query_jobs = query_jobs_from_dict(query_jobs_json)
             query_job_list = query_jobs.query_job_list
           
@@ -9227,7 +11292,7 @@ class QueryOutputInfoFile:
         if isinstance(query_output_info_file_json, dict):
             query_output_info_file = QueryOutputInfoFile.from_dict(query_output_info_file_json)
         elif isinstance(query_output_info_file_json, str):
-            query_output_info_file_dict = json.loads(query_output_info_file_json)
+            query_output_info_file_dict = common.json_loads(query_output_info_file_json)
             query_output_info_file = QueryOutputInfoFile.from_dict(query_output_info_file_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(query_output_info_file_json), "query_output_info_file_json")
@@ -9570,7 +11635,7 @@ class AOI:
         if isinstance(aoi_json, dict):
             aoi = AOI.from_dict(aoi_json)
         elif isinstance(aoi_json, str):
-            aoi_dict = json.loads(aoi_json)
+            aoi_dict = common.json_loads(aoi_json)
             aoi = AOI.from_dict(aoi_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(aoi_json), "aoi_json")
@@ -9905,7 +11970,7 @@ class AOIs:
         if isinstance(aois_json, dict):
             aois = AOIs.from_dict(aois_json)
         elif isinstance(aois_json, str):
-            aois_dict = json.loads(aois_json)
+            aois_dict = common.json_loads(aois_json)
             aois = AOIs.from_dict(aois_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(aois_json), "aois_json")
@@ -10019,7 +12084,7 @@ class AOIs:
             logger.error(msg)
             raise common.PAWException(msg)
         else:
-            aois = AOIs.from_dict(response.json())
+            aois = AOIs.from_dict(common.response_json(response))
             self._aois = aois.aois
 
             return self
@@ -10058,7 +12123,7 @@ class AOIs:
             logger.error(msg)
             raise common.PAWException(msg)
         else:
-            aoi_df = pandas.DataFrame(response.json())
+            aoi_df = pandas.DataFrame(common.response_json(response))
             
             aoi_df = aoi_df.fillna("")
             
@@ -10183,7 +12248,11 @@ def download(query: Any           = None,
              download_folder      = None,
              download_file_name   = None,
              verify: bool         = constants.GLOBAL_SSL_VERIFY,
-             online: bool         = False
+             online: bool         = False,
+             stream: bool         = constants.QUERY_DOWNLOAD_STREAM,
+             segments: int        = constants.QUERY_DOWNLOAD_SEGMENTS,
+             extract: str         = constants.QUERY_DOWNLOAD_EXTRACT,
+             members: List[str]   = None
             ):
                 
     """
@@ -10205,6 +12274,14 @@ def download(query: Any           = None,
     :type verify:              bool
     :param online:             Whether a point queries data should be returned to submit_response.data.
     :type online:              bool
+    :param stream:             Whether a bulk result should be streamed to disk in chunks rather than held in memory.
+    :type stream:              bool
+    :param segments:           The number of byte ranges a streamed result is downloaded in concurrently, 1 disables segmented downloads.
+    :type segments:            int
+    :param extract:            How a bulk result zip is extracted, 'all' (the members selected by members) or 'lazy' (kept as a zip, see Query.extract_members).
+    :type extract:             str
+    :param members:            A list of member globs or layer ids to extract, defaults to all members.
+    :type members:             List[str]
     :returns:                  A query object.
     :rtype:                    ibmpairs.query.Query
     :raises Exception:         A ibmpairs.client.Client is not found, 
@@ -10234,7 +12311,11 @@ def download(query: Any           = None,
                    download_folder    = download_folder,
                    download_file_name = download_file_name,
                    verify             = verify,
-                   online             = online
+                   online             = online,
+                   stream             = stream,
+                   segments           = segments,
+                   extract            = extract,
+                   members            = members
                   )
     
     return query
@@ -10302,7 +12383,11 @@ def check_status_and_download(query: Any           = None,
                               download_folder      = 'download',
                               download_file_name   = None,
                               verify: bool         = constants.GLOBAL_SSL_VERIFY,
-                              online: bool         = False
+                              online: bool         = False,
+                              stream: bool         = constants.QUERY_DOWNLOAD_STREAM,
+                              segments: int        = constants.QUERY_DOWNLOAD_SEGMENTS,
+                              extract: str         = constants.QUERY_DOWNLOAD_EXTRACT,
+                              members: List[str]   = None
                              ):
                                 
     """
@@ -10326,6 +12411,14 @@ def check_status_and_download(query: Any           = None,
     :type verify:              bool
     :param online:             Whether a point queries data should be returned to submit_response.data.
     :type online:              bool
+    :param stream:             Whether a bulk result should be streamed to disk in chunks rather than held in memory.
+    :type stream:              bool
+    :param segments:           The number of byte ranges a streamed result is downloaded in concurrently, 1 disables segmented downloads.
+    :type segments:            int
+    :param extract:            How a bulk result zip is extracted, 'all' (the members selected by members) or 'lazy' (kept as a zip, see Query.extract_members).
+    :type extract:             str
+    :param members:            A list of member globs or layer ids to extract, defaults to all members.
+    :type members:             List[str]
     :returns:                  A query object.
     :rtype:                    ibmpairs.query.Query
     :raises Exception:         A ibmpairs.client.Client is not found, 
@@ -10356,7 +12449,11 @@ def check_status_and_download(query: Any           = None,
                                     download_folder    = download_folder,
                                     download_file_name = download_file_name,
                                     verify             = verify,
-                                    online             = online
+                                    online             = online,
+                                    stream             = stream,
+                                    segments           = segments,
+                                    extract            = extract,
+                                    members            = members
                                    )
     
     return query
@@ -10369,7 +12466,11 @@ def submit_check_status_and_download(query: Any,
                                      download_file_name   = None,
                                      verify: bool         = constants.GLOBAL_SSL_VERIFY,
                                      compact_csv: bool    = False,
-                                     online: bool         = False
+                                     online: bool         = False,
+                                     stream: bool         = constants.QUERY_DOWNLOAD_STREAM,
+                                     segments: int        = constants.QUERY_DOWNLOAD_SEGMENTS,
+                                     extract: str         = constants.QUERY_DOWNLOAD_EXTRACT,
+                                     members: List[str]   = None
                                     ):
 
     """
@@ -10393,6 +12494,14 @@ def submit_check_status_and_download(query: Any,
     :type compact_csv:         bool
     :param online:             Whether a point queries data should be returned to submit_response.data.
     :type online:              bool
+    :param stream:             Whether a bulk result should be streamed to disk in chunks rather than held in memory.
+    :type stream:              bool
+    :param segments:           The number of byte ranges a streamed result is downloaded in concurrently, 1 disables segmented downloads.
+    :type segments:            int
+    :param extract:            How a bulk result zip is extracted, 'all' (the members selected by members) or 'lazy' (kept as a zip, see Query.extract_members).
+    :type extract:             str
+    :param members:            A list of member globs or layer ids to extract, defaults to all members.
+    :type members:             List[str]
     :returns:                  A query object.
     :rtype:                    ibmpairs.query.Query
     :raises Exception:         A ibmpairs.client.Client is not found, 
@@ -10425,7 +12534,11 @@ def submit_check_status_and_download(query: Any,
                                            download_file_name = download_file_name,
                                            verify             = verify,
                                            compact_csv        = compact_csv,
-                                           online             = online
+                                           online             = online,
+                                           stream             = stream,
+                                           segments           = segments,
+                                           extract            = extract,
+                                           members            = members
                                           )
     
     return query
@@ -172,7 +172,7 @@ class ServiceParameters:
         if isinstance(service_parameters_json, dict):
             service_parameters = ServiceParameters.from_dict(service_parameters_json)
         elif isinstance(service_parameters_json, str):
-            service_parameters_dict = json.loads(service_parameters_json)
+            service_parameters_dict = common.json_loads(service_parameters_json)
             service_parameters = ServiceParameters.from_dict(service_parameters_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(service_parameters_json), "service_parameters_json")
@@ -437,7 +437,7 @@ class UploadInfo:
         if isinstance(upload_info_json, dict):
             upload_info = UploadInfo.from_dict(upload_info_json)
         elif isinstance(upload_info_json, str):
-            upload_info_dict = json.loads(upload_info_json)
+            upload_info_dict = common.json_loads(upload_info_json)
             upload_info = UploadInfo.from_dict(upload_info_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(upload_info_json), "upload_info_json")
@@ -647,7 +647,7 @@ class Summary:
         if isinstance(summary_json, dict):
             summary = Summary.from_dict(summary_json)
         elif isinstance(summary_json, str):
-            summary_dict = json.loads(summary_json)
+            summary_dict = common.json_loads(summary_json)
             summary = Summary.from_dict(summary_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(summary_json), "summary_json")
@@ -803,7 +803,7 @@ class UploadResponse:
         if isinstance(upload_response_json, dict):
             upload_response = UploadResponse.from_dict(upload_response_json)
         elif isinstance(upload_response_json, str):
-            upload_response_dict = json.loads(upload_response_json)
+            upload_response_dict = common.json_loads(upload_response_json)
             upload_response = UploadResponse.from_dict(upload_response_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(upload_response_json), "upload_response_json")
@@ -1067,7 +1067,7 @@ class UploadStatusResponse:
         if isinstance(upload_status_response_json, dict):
             upload_status_response = UploadStatusResponse.from_dict(upload_status_response_json)
         elif isinstance(upload_status_response_json, str):
-            upload_status_response_dict = json.loads(upload_status_response_json)
+            upload_status_response_dict = common.json_loads(upload_status_response_json)
             upload_status_response = UploadStatusResponse.from_dict(upload_status_response_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(upload_status_response_json), "upload_status_response_json")
@@ -1310,7 +1310,7 @@ class ConvParamsDict:
         if isinstance(conv_params_dict_json, dict):
             conv_params_dict = ConvParamsDict.from_dict(conv_params_dict_json)
         elif isinstance(conv_params_dict_json, str):
-            conv_params_dict_dict = json.loads(conv_params_dict_json)
+            conv_params_dict_dict = common.json_loads(conv_params_dict_json)
             conv_params_dict = ConvParamsDict.from_dict(conv_params_dict_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(conv_params_dict_json), "conv_params_dict_json")
@@ -1477,7 +1477,7 @@ class PdalPreprocessingJSON:
         if isinstance(pdal_preprocessing_json_json, dict):
             pdal_preprocessing_json = PdalPreprocessingJSON.from_dict(pdal_preprocessing_json_json)
         elif isinstance(pdal_preprocessing_json_json, str):
-            pdal_preprocessing_json_dict = json.loads(pdal_preprocessing_json_json)
+            pdal_preprocessing_json_dict = common.json_loads(pdal_preprocessing_json_json)
             pdal_preprocessing_json = PdalPreprocessingJSON.from_dict(pdal_preprocessing_json_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(pdal_preprocessing_json_json), "pdal_preprocessing_json_json")
@@ -1720,7 +1720,7 @@ class Options:
         if isinstance(options_json, dict):
             options = Options.from_dict(options_json)
         elif isinstance(options_json, str):
-            options_dict = json.loads(options_json)
+            options_dict = common.json_loads(options_json)
             options = Options.from_dict(options_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(options_json), "options_json")
@@ -1933,7 +1933,7 @@ class Preprocessing:
         if isinstance(preprocessing_json, dict):
             preprocessing = Preprocessing.from_dict(preprocessing_json)
         elif isinstance(preprocessing_json, str):
-            preprocessing_dict = json.loads(preprocessing_json)
+            preprocessing_dict = common.json_loads(preprocessing_json)
             preprocessing = Preprocessing.from_dict(preprocessing_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(preprocessing_json), "preprocessing_json")
@@ -2965,7 +2965,7 @@ class Upload:
         if isinstance(upload_json, dict):
             upload = Upload.from_dict(upload_json)
         elif isinstance(upload_json, str):
-            upload_dict = json.loads(upload_json)
+            upload_dict = common.json_loads(upload_json)
             upload = Upload.from_dict(upload_dict)
         else:
             msg = messages.ERROR_FROM_JSON_TYPE_NOT_RECOGNIZED.format(type(upload_json), "upload_json")
@@ -3097,11 +3097,11 @@ class Upload:
         else:
             msg = messages.INFO_STARTING_EVENT_LOOP
             logger.info(msg)
-            asyncio.run(self.async_submit(upload = self, 
-                                          client = cli,
-                                          verify = verify
-                                         )
-                       )
+            cli.run(self.async_submit(upload = self, 
+                                      client = cli,
+                                      verify = verify
+                                     )
+                   )
 
     #
     def status(self,
@@ -3160,13 +3160,13 @@ class Upload:
         else:
             msg = messages.INFO_STARTING_EVENT_LOOP
             logger.info(msg)
-            asyncio.run(self.async_status(upload          = self,
-                                          client          = cli,
-                                          poll            = poll,
-                                          status_interval = status_interval,
-                                          verify          = verify
-                                          )
-                       )
+            cli.run(self.async_status(upload          = self,
+                                      client          = cli,
+                                      poll            = poll,
+                                      status_interval = status_interval,
+                                      verify          = verify
+                                      )
+                   )
     
     #
     def submit_and_check_status(self,
@@ -3223,13 +3223,13 @@ class Upload:
         else:
             msg = messages.INFO_STARTING_EVENT_LOOP
             logger.info(msg)
-            asyncio.run(self.async_submit_and_check_status(upload          = self,
-                                                           client          = cli,
-                                                           poll            = poll,
-                                                           status_interval = status_interval,
-                                                           verify          = verify
-                                                          )
-                       )
+            cli.run(self.async_submit_and_check_status(upload          = self,
+                                                       client          = cli,
+                                                       poll            = poll,
+                                                       status_interval = status_interval,
+                                                       verify          = verify
+                                                      )
+                   )
             
     async def async_submit(self,
                            upload,
@@ -3603,14 +3603,14 @@ def batch_upload(uploads: List[Upload],
     else:
         msg = messages.INFO_STARTING_EVENT_LOOP
         logger.info(msg)
-        result = asyncio.run(upload_worker(uploads         = uploads, 
-                                           client          = cli,
-                                           status_interval = status_interval,
-                                           workers         = workers,
-                                           verify          = verify
-                                          ),
-                              debug = constants.UPLOAD_WORKER_DEBUG
-                             )
+        result = cli.run(upload_worker(uploads         = uploads, 
+                                       client          = cli,
+                                       status_interval = status_interval,
+                                       workers         = workers,
+                                       verify          = verify
+                                      ),
+                          debug = constants.UPLOAD_WORKER_DEBUG
+                         )
 
     return(result)
     
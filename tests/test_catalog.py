@@ -7,7 +7,11 @@ SPDX-License-Identifier: BSD-3-Clause
 """
 # fold: Import Python Standard Library {{{
 # Python Standard Library:
+import asyncio
 import json
+import os
+import shutil
+import tempfile
 #}}}
 # fold: Import ibmpairs Modules {{{
 # ibmpairs Modules:
@@ -15,6 +19,8 @@ from ibmpairs.logger import logger
 import ibmpairs.authentication as authentication
 import ibmpairs.catalog as catalog
 import ibmpairs.client as cl
+import ibmpairs.constants as constants
+import ibmpairs.messages as messages
 #}}}
 # fold: Import Third Party Libraries {{{
 # Third Party Libraries:
@@ -8221,3 +8227,487 @@ class DataLayersUnitTest(unittest.TestCase):
             got_exception5 = True
 
         self.assertTrue(got_exception5)
+
+#
+class CatalogCacheUnitTest(unittest.TestCase):
+    
+    #
+    def setUp(self):
+        self.logger = logger
+        self.logger.info('setup')
+        self.cache_dir = tempfile.mkdtemp()
+        self.requests  = []
+    
+    #
+    def tearDown(self):
+        catalog.set_catalog_cache(None)
+        shutil.rmtree(self.cache_dir, ignore_errors = True)
+        self.logger.info('teardown')
+    
+    #
+    def mocked_requests_get(self, *args, **kwargs):
+        
+        url     = kwargs["url"]
+        headers = kwargs.get("request_headers") or {}
+        self.requests.append((url, headers.get('If-None-Match')))
+        
+        class MockResponse:
+            def __init__(self, json_data, status_code):
+                self.json_data   = json_data
+                self.status_code = status_code
+                self.content     = json.dumps(json_data).encode('utf-8') if json_data is not None else b''
+                self.headers     = {'ETag': '"v1"'}
+
+            def json(self):
+                return self.json_data
+        
+        if headers.get('If-None-Match') == '"v1"':
+            return MockResponse(None, 304)
+        elif url == "https://api.ibm.com/geospatial/run/na/core/v3/datalayers/full":
+            return MockResponse(data_layers_dict, 200)
+        elif url == "https://api.ibm.com/geospatial/run/na/core/v3/datasets/full":
+            return MockResponse(data_sets_dict, 200)
+        else:
+            return MockResponse({}, 404)
+    
+    #
+    def test_catalog_cache(self):
+        
+        self.logger.info('test_catalog_cache')
+        
+        client = cl.Client()
+        client_headers = dict(client.get_headers())
+        
+        cache = catalog.set_catalog_cache(catalog.CatalogCache(path = os.path.join(self.cache_dir, 'catalog.sqlite'),
+                                                               ttl  = 3600
+                                                              ))
+        self.assertIs(catalog.get_catalog_cache(), cache)
+        
+        with mock.patch('ibmpairs.client.Client.get', side_effect = self.mocked_requests_get):
+            
+            self.logger.info('test_catalog_cache: fetch and serve from cache')
+            
+            result = catalog.get_data_layers(client = client)
+            self.assertEqual(result["string2"].id, "string2")
+            result = catalog.get_data_layers(client = client)
+            self.assertEqual(result["string2"].id, "string2")
+            self.assertEqual(1, len(self.requests))
+            
+            self.logger.info('test_catalog_cache: data layer from cached list')
+            
+            data_layer = catalog.DataLayer().get(id = "string2", client = client)
+            self.assertEqual(data_layer.name, "string2")
+            self.assertEqual(1, len(self.requests))
+            
+            self.logger.info('test_catalog_cache: shared by processes through the cache file')
+            
+            catalog.set_catalog_cache(catalog.CatalogCache(path = cache.path))
+            result = catalog.DataSets().get(client = client)
+            self.assertEqual(result["string2"].id, "string2")
+            self.assertEqual(2, len(self.requests))
+            result = catalog.get_data_layers(client = client)
+            self.assertEqual(2, len(self.requests))
+            
+            self.logger.info('test_catalog_cache: revalidate expired entries')
+            
+            catalog.get_catalog_cache().ttl = 0
+            result = catalog.get_data_layers(client = client)
+            self.assertEqual(result["string"].id, "string")
+            self.assertEqual(("https://api.ibm.com/geospatial/run/na/core/v3/datalayers/full", '"v1"'), self.requests[-1])
+            self.assertEqual(client_headers, client.get_headers())
+            
+            self.logger.info('test_catalog_cache: other users do not share entries')
+            
+            catalog.get_catalog_cache().ttl = 3600
+            client.set_tenant_id('other')
+            result = catalog.get_data_layers(client = client)
+            self.assertEqual(("https://api.ibm.com/geospatial/run/na/core/v3/datalayers/full", None), self.requests[-1])
+            
+            self.logger.info('test_catalog_cache: disabled')
+            
+            catalog.set_catalog_cache(False)
+            count = len(self.requests)
+            catalog.get_data_layers(client = client)
+            self.assertEqual(count + 1, len(self.requests))
+        
+        got_exception = False
+        
+        try:
+            catalog.set_catalog_cache('cache')
+        except Exception as ex:
+            self.assertEqual(str(ex), "The catalog cache must be a CatalogCache or None, not <class 'str'>.")
+            got_exception = True
+        
+        self.assertTrue(got_exception)
+
+    #
+    def test_catalog_cache_async(self):
+
+        self.logger.info('test_catalog_cache_async')
+
+        async def mocked_async_get(*args, **kwargs):
+
+            class MockResponse:
+                def __init__(self, body, status):
+                    self.body    = body
+                    self.status  = status
+                    self.headers = {'ETag': '"v1"', 'Last-Modified': 'Fri, 01 Feb 2019 12:00:00 GMT'}
+
+            url     = kwargs["url"]
+            headers = kwargs.get("request_headers") or {}
+            self.requests.append((url, headers.get('If-None-Match'), headers.get('If-Modified-Since')))
+
+            if headers.get('If-None-Match') == '"v1"':
+                return MockResponse('', 304)
+
+            id = url.split('/datalayers/')[1].split('/')[0]
+
+            if url.endswith('/datalayer_dimensions'):
+                return MockResponse(json.dumps([{"id": id + "1", "order": 0, "full_name": "dimension " + id}]), 200)
+            elif url.endswith('/datalayer_properties'):
+                return MockResponse(json.dumps([{"id": id + "2", "order": 0, "full_name": "property " + id}]), 200)
+            else:
+                return MockResponse(json.dumps({"id": id, "name": "layer " + id}), 200)
+
+        client = cl.Client(host = 'https://api.ibm.com')
+        client_headers = dict(client.get_headers())
+
+        cache = catalog.set_catalog_cache(catalog.CatalogCache(path = os.path.join(self.cache_dir, 'catalog.sqlite'),
+                                                               ttl  = 3600
+                                                              ))
+
+        with mock.patch('ibmpairs.client.Client.async_get', side_effect = mocked_async_get):
+
+            self.logger.info('test_catalog_cache_async: fetch and serve from cache')
+
+            data_layers = catalog.get_data_layers_full(ids = ["1"], client = client)
+            self.assertEqual("layer 1", data_layers[0].name)
+            self.assertEqual(3, len(self.requests))
+            self.assertEqual([None], list(set(request[1] for request in self.requests)))
+
+            key   = cache.key(client, self.requests[0][0])
+            entry = cache.lookup(key)
+            self.assertEqual('"v1"', entry['etag'])
+            self.assertEqual('Fri, 01 Feb 2019 12:00:00 GMT', entry['last_modified'])
+
+            data_layers = catalog.get_data_layers_full(ids = ["1"], client = client)
+            self.assertEqual("layer 1", data_layers[0].name)
+            self.assertEqual(3, len(self.requests))
+
+            self.logger.info('test_catalog_cache_async: revalidate expired entries')
+
+            cache.ttl = 0
+            data_layers = catalog.get_data_layers_full(ids = ["1"], client = client)
+            self.assertEqual("layer 1", data_layers[0].name)
+            self.assertEqual("dimension 1", data_layers[0].data_layer_dimensions["dimension 1"].full_name)
+            self.assertEqual(6, len(self.requests))
+            for request in self.requests[3:]:
+                self.assertEqual(('"v1"', 'Fri, 01 Feb 2019 12:00:00 GMT'), request[1:])
+            self.assertGreater(cache.lookup(key)['fetched'], entry['fetched'])
+            self.assertEqual(client_headers, client.get_headers())
+            
+            self.logger.info('test_catalog_cache_async: data layers from the cached list')
+            
+            cache.ttl = 3600
+            full_url = client.get_host() + constants.CATALOG_DATA_LAYERS_API_FULL
+            cache.store(cache.key(client, full_url), full_url, json.dumps(data_layers_dict))
+            count = len(self.requests)
+            
+            with mock.patch('ibmpairs.catalog._catalog_cached_data_layers', wraps = catalog._catalog_cached_data_layers) as cached_data_layers:
+                data_layers = catalog.get_data_layers_full(ids = ["string", "string2", "string"], client = client)
+            
+            self.assertEqual(1, cached_data_layers.call_count)
+            self.assertEqual(["string", "string2", "string"], [data_layer.id for data_layer in data_layers])
+            self.assertEqual("dimension string2", data_layers[1].data_layer_dimensions["dimension string2"].full_name)
+            self.assertEqual(count + 4, len(self.requests))
+            self.assertEqual([], [request for request in self.requests[count:] if request[0].endswith('/string')])
+
+#
+class CatalogIndexUnitTest(unittest.TestCase):
+    
+    #
+    def setUp(self):
+        self.logger = logger
+        self.logger.info('setup')
+    
+    #
+    def tearDown(self):
+        self.logger.info('teardown')
+    
+    #
+    def test_data_layers_index(self):
+        
+        self.logger.info('test_data_layers_index')
+        
+        data_layers = catalog.data_layers_from_dict(data_layers_dict)
+        
+        self.assertEqual(data_layers["string2"].id, "string2")
+        self.assertEqual(data_layers.get_by_id("string").name, "string")
+        
+        self.logger.info('test_data_layers_index: list mutations')
+        
+        data_layers.data_layers.append(catalog.DataLayer(id = 3, name = "string3"))
+        self.assertEqual(data_layers["string3"].id, 3)
+        self.assertEqual(data_layers.get_by_id(3).name, "string3")
+        
+        data_layers["string3"].name = "string4"
+        self.assertEqual(data_layers["string4"].id, 3)
+        
+        data_layers.data_layers[:] = [catalog.DataLayer(id = 5, name = "string5")]
+        self.assertEqual(data_layers["string5"].id, 5)
+        
+        self.logger.info('test_data_layers_index: duplicates and unknown names')
+        
+        data_layers.data_layers.append(catalog.DataLayer(id = 5, name = "string5"))
+        
+        got_exception = False
+        try:
+            data_layers["string5"]
+        except Exception as ex:
+            self.assertEqual(str(ex), "The DataLayers object has multiple layers with the name 'string5'- this name should be unique.")
+            got_exception = True
+        self.assertTrue(got_exception)
+        
+        got_exception = False
+        try:
+            data_layers.get_by_id(5)
+        except Exception as ex:
+            self.assertEqual(str(ex), "The data_layers attribute has multiple elements with the id '5'- this id should be unique.")
+            got_exception = True
+        self.assertTrue(got_exception)
+        
+        self.logger.info('test_data_layers_index: duplicates by in place replacement')
+        
+        data_layers.data_layers[:] = [catalog.DataLayer(id = 6, name = "a"), catalog.DataLayer(id = 7, name = "b")]
+        self.assertEqual(data_layers["a"].id, 6)
+        
+        data_layers.data_layers[1] = catalog.DataLayer(id = 8, name = "a")
+        
+        got_exception = False
+        try:
+            data_layers["a"]
+        except Exception as ex:
+            self.assertEqual(str(ex), messages.ERROR_CATALOG_DATA_LAYERS_MULTIPLE_IDENTICAL_NAMES.format("a"))
+            got_exception = True
+        self.assertTrue(got_exception)
+        
+        got_exception = False
+        try:
+            data_layers["string"]
+        except Exception as ex:
+            got_exception = True
+        self.assertTrue(got_exception)
+        
+        got_exception = False
+        try:
+            data_layers.get_by_id("string")
+        except Exception as ex:
+            self.assertEqual(str(ex), "The data_layers attribute does not contain an element with the id 'string'.")
+            got_exception = True
+        self.assertTrue(got_exception)
+    
+    #
+    def test_data_sets_index(self):
+        
+        self.logger.info('test_data_sets_index')
+        
+        data_sets = catalog.data_sets_from_dict(data_sets_dict)
+        
+        self.assertEqual(data_sets["string2"].id, "string2")
+        self.assertEqual(data_sets.get_by_id("string2").name, "string2")
+
+#
+class CatalogDataFrameUnitTest(unittest.TestCase):
+    
+    #
+    def setUp(self):
+        self.logger = logger
+        self.logger.info('setup')
+    
+    #
+    def tearDown(self):
+        self.logger.info('teardown')
+    
+    #
+    def test_data_layers_display_sorted_and_cached(self):
+        
+        self.logger.info('test_data_layers_display_sorted_and_cached')
+        
+        data_layers = catalog.DataLayers(data_layers = [catalog.DataLayer(id = "3", name = "c", type = "Raster"),
+                                                        catalog.DataLayer(id = "1", name = "a", type = "VectorPoint"),
+                                                        catalog.DataLayer(id = "2", name = "b")
+                                                       ])
+        
+        df = data_layers.display(columns = ['id', 'name', 'type'])
+        self.assertEqual(["1", "2", "3"], df['id'].tolist())
+        self.assertEqual(["a", "b", "c"], df['name'].tolist())
+        self.assertEqual("Vector", df['type'][0])
+        self.assertEqual("Raster", df['type'][2])
+        self.assertEqual([0, 1, 2], df.index.tolist())
+        
+        self.logger.info('test_data_layers_display_sorted_and_cached: cached copies')
+        
+        df.columns = ['x', 'y', 'z']
+        df2 = data_layers.display(columns = ['id', 'name', 'type'])
+        self.assertEqual(['id', 'name', 'type'], list(df2.columns))
+        
+        data_layers["a"].name = "d"
+        self.assertEqual("a", data_layers.display(columns = ['id', 'name', 'type'])['name'][0])
+        self.assertEqual("d", data_layers.display(columns = ['id', 'name', 'type'], refresh = True)['name'][0])
+        
+        data_layers.data_layers.append(catalog.DataLayer(id = "0", name = "e"))
+        self.assertEqual(["0", "1", "2", "3"], data_layers.display(columns = ['id', 'name'])['id'].tolist())
+        
+        self.logger.info('test_data_layers_display_sorted_and_cached: mixed id types')
+        
+        data_sets = catalog.DataSets(data_sets = [catalog.DataSet(id = 10, name = "x"),
+                                                  catalog.DataSet(id = "2", name = "y")
+                                                 ])
+        self.assertEqual(["x", "y"], data_sets.display()['name'].tolist())
+        
+        self.assertEqual(0, len(catalog.DataSets(data_sets = []).display()))
+
+#
+class SearchIndexUnitTest(unittest.TestCase):
+    
+    #
+    def setUp(self):
+        self.logger = logger
+        self.logger.info('setup')
+    
+    #
+    def tearDown(self):
+        self.logger.info('teardown')
+    
+    #
+    def test_search(self):
+        
+        self.logger.info('test_search')
+        
+        data_sets = catalog.DataSets(data_sets = [catalog.DataSet(id = "1", name = "ERA5", description_short = "Reanalysis weather data"),
+                                                  catalog.DataSet(id = "2", name = "Sentinel 2", description_short = "Satellite imagery")
+                                                 ])
+        data_layers = catalog.DataLayers(data_layers = [catalog.DataLayer(id = "49423", dataset_id = "1", name = "Temperature", description_short = "Air temperature at 2m", unit = "K"),
+                                                        catalog.DataLayer(id = "49424", dataset_id = "1", name = "Wind speed", description_short = "Wind speed at 10m", unit = "m/s"),
+                                                        catalog.DataLayer(id = "49360", dataset_id = "2", name = "Band 4", description_short = "Red band, temperature independent"),
+                                                        catalog.DataLayer(id = "49361", dataset_id = "2", name = "Band 8", description_short = "Near infrared")
+                                                       ])
+        
+        search = catalog.Search(client      = cl.Client(),
+                                data_sets   = data_sets,
+                                data_layers = data_layers
+                               )
+        
+        self.logger.info('test_search: ranked and prefix matches')
+        
+        result = search.data_layers(search_term = "temp")
+        self.assertEqual(["49423", "49360"], result['data_layer_id'].tolist())
+        self.assertEqual([0, 1], result.index.tolist())
+        
+        result = search.data_layers(search_term = "band red")
+        self.assertEqual(["49360"], result['data_layer_id'].tolist())
+        
+        result = search.data_layers(search_term = "era5 wind")
+        self.assertEqual(["49424"], result['data_layer_id'].tolist())
+        
+        self.logger.info('test_search: quotes and substrings')
+        
+        self.assertEqual(0, len(search.data_layers(search_term = 'te"mp')))
+        self.assertEqual(["49361"], search.data_layers(search_term = "infra")['data_layer_id'].tolist())
+        self.assertEqual(["49361"], search.data_layers(search_term = "frared")['data_layer_id'].tolist())
+        
+        self.logger.info('test_search: ids')
+        
+        self.assertEqual(["49360", "49361"], search.data_layers(search_term = "4936")['data_layer_id'].tolist())
+        self.assertEqual(["49360", "49361"], search.data_sets(search_term = "2")['data_layer_id'].tolist())
+        
+        self.logger.info('test_search: data sets and all')
+        
+        result = search.data_sets(search_term = "satellite")
+        self.assertEqual(["49360", "49361"], result['data_layer_id'].tolist())
+        
+        result = search.all(search_term = "sentinel")
+        self.assertEqual(["49360", "49361"], result['data_layer_id'].tolist())
+        
+        self.logger.info('test_search: new snapshot')
+        
+        data_layers.data_layers.append(catalog.DataLayer(id = "49500", dataset_id = "2", name = "Band 11", description_short = "Short wave infrared"))
+        self.assertEqual(["49361", "49500"], search.data_layers(search_term = "infrared")['data_layer_id'].tolist())
+
+#
+class DataLayersFullUnitTest(unittest.TestCase):
+    
+    #
+    def setUp(self):
+        self.logger = logger
+        self.logger.info('setup')
+    
+    #
+    def tearDown(self):
+        self.logger.info('teardown')
+    
+    #
+    def test_get_data_layers_full(self):
+        
+        self.logger.info('test_get_data_layers_full')
+        
+        urls    = []
+        running = [0, 0]
+        
+        async def mocked_async_get(*args, **kwargs):
+            
+            class MockResponse:
+                def __init__(self, body, status):
+                    self.body   = body
+                    self.status = status
+            
+            url = kwargs["url"]
+            urls.append(url)
+            
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+            
+            id = url.split('/datalayers/')[1].split('/')[0]
+            
+            if id == '0':
+                return MockResponse('{"message": "not found"}', 404)
+            elif url.endswith('/datalayer_dimensions'):
+                return MockResponse(json.dumps([{"id": id + "1", "order": 0, "full_name": "dimension " + id}]), 200)
+            elif url.endswith('/datalayer_properties'):
+                return MockResponse(json.dumps([{"id": id + "2", "order": 0, "full_name": "property " + id}]), 200)
+            else:
+                return MockResponse(json.dumps({"id": id, "name": "layer " + id}), 200)
+        
+        client = cl.Client(host = 'https://api.ibm.com')
+        
+        with mock.patch('ibmpairs.client.Client.async_get', side_effect = mocked_async_get):
+            
+            data_layers = catalog.get_data_layers_full(ids             = ["3", 1, "2", "3"],
+                                                       client          = client,
+                                                       max_concurrency = 2
+                                                      )
+            
+            self.assertEqual(["3", "1", "2", "3"], [data_layer.id for data_layer in data_layers])
+            self.assertIs(data_layers[0], data_layers[3])
+            self.assertEqual("layer 1", data_layers[1].name)
+            self.assertEqual("dimension 2", data_layers[2].data_layer_dimensions["dimension 2"].full_name)
+            self.assertEqual("2", data_layers[2].data_layer_dimensions.data_layer_id)
+            self.assertEqual("property 3", data_layers[0].data_layer_properties.get_by_id("32").full_name)
+            self.assertEqual(9, len(urls))
+            self.assertEqual(9, len(set(urls)))
+            self.assertLessEqual(running[1], 2)
+            
+            self.logger.info('test_get_data_layers_full: failure')
+            
+            got_exception = False
+            
+            try:
+                catalog.get_data_layers_full(ids    = ["4", "0"],
+                                             client = client
+                                            )
+            except Exception as ex:
+                got_exception = True
+            
+            self.assertTrue(got_exception)
@@ -7,7 +7,11 @@ SPDX-License-Identifier: BSD-3-Clause
 """
 # fold: Import Python Standard Library {{{
 # Python Standard Library:
+import gc
 import json
+import os
+import tempfile
+import weakref
 #}}}
 # fold: Import ibmpairs Modules {{{
 # ibmpairs Modules:
@@ -352,13 +356,19 @@ class ClientUnitTest(unittest.TestCase):
             
         self.assertFalse(got_exception)
 
+    @mock.patch('requests.Session.get', 
+                side_effect=mocked_requests_get
+               )
     @mock.patch('requests.get', 
                 side_effect=mocked_requests_get
                )
+    @mock.patch('requests.Session.post', 
+                side_effect=mocked_requests_post
+               )
     @mock.patch('requests.post', 
                 side_effect=mocked_requests_post
                )
-    def test_client_get(self, mock_post, mock_get):
+    def test_client_get(self, mock_post, mock_session_post, mock_get, mock_session_get):
         self.logger.info('test_client_get')
         
         basic = authentication.Basic(username = "email@domain.com",
@@ -428,10 +438,13 @@ class ClientUnitTest(unittest.TestCase):
         self.assertEqual(client.authentication.oauth2_return.access_token, "thisisnotanewaccesstoken")
         self.assertEqual(client.authentication.oauth2_return.refresh_token, "thisisnotanewrefreshtoken")
     
+    @mock.patch('requests.Session.post', 
+                side_effect=mocked_requests_post
+               )
     @mock.patch('requests.post', 
                 side_effect=mocked_requests_post
                )
-    def test_client_post(self, mock_post):
+    def test_client_post(self, mock_post, mock_session_post):
         self.logger.info('test_client_post')
         
         basic = authentication.Basic(username = "email@domain.com",
@@ -504,13 +517,19 @@ class ClientUnitTest(unittest.TestCase):
         self.assertEqual(client.authentication.oauth2_return.access_token, "thisisnotanewaccesstoken")
         self.assertEqual(client.authentication.oauth2_return.refresh_token, "thisisnotanewrefreshtoken")
     
+    @mock.patch('requests.Session.put', 
+                side_effect=mocked_requests_put
+               )
     @mock.patch('requests.put', 
                 side_effect=mocked_requests_put
                )
+    @mock.patch('requests.Session.post', 
+                side_effect=mocked_requests_post
+               )
     @mock.patch('requests.post', 
                 side_effect=mocked_requests_post
                )
-    def test_client_put(self, mock_post, mock_put):
+    def test_client_put(self, mock_post, mock_session_post, mock_put, mock_session_put):
         self.logger.info('test_client_put')
         
         basic = authentication.Basic(username = "email@domain.com",
@@ -583,13 +602,19 @@ class ClientUnitTest(unittest.TestCase):
         self.assertEqual(client.authentication.oauth2_return.access_token, "thisisnotanewaccesstoken")
         self.assertEqual(client.authentication.oauth2_return.refresh_token, "thisisnotanewrefreshtoken")
         
+    @mock.patch('requests.Session.delete', 
+                side_effect=mocked_requests_delete
+               )
     @mock.patch('requests.delete', 
                 side_effect=mocked_requests_delete
                )
+    @mock.patch('requests.Session.post', 
+                side_effect=mocked_requests_post
+               )
     @mock.patch('requests.post', 
                 side_effect=mocked_requests_post
                )
-    def test_client_delete(self, mock_post, mock_delete):
+    def test_client_delete(self, mock_post, mock_session_post, mock_delete, mock_session_delete):
         self.logger.info('test_client_delete')
         
         basic = authentication.Basic(username = "email@domain.com",
@@ -659,13 +684,19 @@ class ClientUnitTest(unittest.TestCase):
         self.assertEqual(client.authentication.oauth2_return.access_token, "thisisnotanewaccesstoken")
         self.assertEqual(client.authentication.oauth2_return.refresh_token, "thisisnotanewrefreshtoken")
     
+    @mock.patch('requests.Session.get', 
+                side_effect=mocked_requests_get
+               )
     @mock.patch('requests.get', 
                 side_effect=mocked_requests_get
                )
+    @mock.patch('requests.Session.post', 
+                side_effect=mocked_requests_post
+               )
     @mock.patch('requests.post', 
                 side_effect=mocked_requests_post
                )
-    def test_client_get(self, mock_post, mock_get):
+    def test_client_get(self, mock_post, mock_session_post, mock_get, mock_session_get):
         self.logger.info('test_client_refresh_apic')
         
         oauth2 = authentication.OAuth2(api_key   = 'thisisnotanapikeyapic',
@@ -693,4 +724,252 @@ class ClientUnitTest(unittest.TestCase):
         self.assertEqual(resp.json(), r'''{"message":"success"}''')
         self.assertEqual(client.authentication.jwt_token, "thisisnotanaccesstokenapic")
 
-        
\ No newline at end of file
+        
+    def test_client_async_session_pool(self):
+        self.logger.info('test_client_async_session_pool')
+        
+        basic = authentication.Basic(username = "email@domain.com",
+                                     password = "thisisnotapassword"
+                                    )
+        
+        client = cl.Client(authentication      = basic,
+                           pool_limit          = 10,
+                           pool_limit_per_host = 4
+                          )
+        
+        async def sessions():
+            first  = client.session()
+            second = client.session()
+            limit_per_host = first.connector.limit_per_host
+            await client.aclose()
+            return first, second, limit_per_host
+        
+        first, second, limit_per_host = asyncio.run(sessions())
+        
+        self.assertIs(first, second)
+        self.assertEqual(limit_per_host, 4)
+        self.assertTrue(first.closed)
+        self.assertEqual(len(client._async_sessions), 0)
+        
+        self.logger.info('test_client_async_session_pool: new event loop')
+        
+        async def session():
+            return client.session()
+        
+        third  = asyncio.run(session())
+        fourth = asyncio.run(session())
+        
+        # the session of a closed loop is released by the next use of the client
+        self.assertIsNot(third, fourth)
+        self.assertTrue(third.closed)
+        self.assertFalse(fourth.closed)
+        self.assertEqual(len(client._async_sessions), 1)
+        
+        async def context():
+            async with client as c:
+                return c.session()
+        
+        fifth = asyncio.run(context())
+        
+        self.assertTrue(fourth.closed)
+        self.assertTrue(fifth.closed)
+        self.assertEqual(len(client._async_sessions), 0)
+        
+        self.logger.info('test_client_async_session_pool: event loops are collected')
+        
+        del third, fourth, fifth
+        
+        loops = []
+        
+        async def loop_session():
+            async with client:
+                loops.append(weakref.ref(asyncio.get_running_loop()))
+                return client.session().closed
+        
+        for i in range(3):
+            self.assertFalse(asyncio.run(loop_session()))
+        
+        gc.collect()
+        
+        self.assertEqual([l() for l in loops], [None, None, None])
+        self.assertEqual(len(client._async_sessions), 0)
+        
+        async def leave_session():
+            loops.append(weakref.ref(asyncio.get_running_loop()))
+            client.session()
+        
+        asyncio.run(leave_session())
+        
+        self.assertEqual(len(client._async_sessions), 1)
+        asyncio.run(loop_session())
+        gc.collect()
+        
+        self.assertIsNone(loops[3]())
+        self.assertEqual(len(client._async_sessions), 0)
+        
+        self.logger.info('test_client_async_session_pool: run closes the session of its loop')
+        
+        async def run_session():
+            return client.session()
+        
+        sixth = client.run(run_session())
+        
+        self.assertTrue(sixth.closed)
+        self.assertEqual(len(client._async_sessions), 0)
+    
+    def test_client_get_request_headers(self):
+        self.logger.info('test_client_get_request_headers')
+        
+        basic = authentication.Basic(username = "email@domain.com",
+                                     password = "thisisnotapassword"
+                                    )
+        
+        client = cl.Client(authentication = basic,
+                           legacy         = True
+                          )
+        client.set_headers({'Content-Type': 'application/json'})
+        
+        sent = []
+        
+        def mocked_session_get(url, **kwargs):
+            sent.append(dict(kwargs['headers']))
+            return mock.Mock(status_code = 200)
+        
+        with mock.patch('requests.Session.get', side_effect = mocked_session_get):
+            client.get(url             = 'https://api.ibm.com/resource',
+                       request_headers = {'If-None-Match': '"v1"'}
+                      )
+            client.get(url = 'https://api.ibm.com/resource')
+        
+        self.assertEqual({'Content-Type': 'application/json', 'If-None-Match': '"v1"'}, sent[0])
+        self.assertEqual({'Content-Type': 'application/json'}, sent[1])
+        self.assertEqual({'Content-Type': 'application/json'}, client.get_headers())
+    
+    def test_client_requests_session_pool(self):
+        self.logger.info('test_client_requests_session_pool')
+        
+        basic = authentication.Basic(username = "email@domain.com",
+                                     password = "thisisnotapassword"
+                                    )
+        
+        client = cl.Client(authentication   = basic,
+                           pool_connections = 2,
+                           pool_maxsize     = 5,
+                           max_retries      = 4
+                          )
+        
+        session = client.requests_session()
+        
+        self.assertIs(session, client.requests_session())
+        
+        adapter = session.get_adapter("https://pairs.res.ibm.com")
+        
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 5)
+        self.assertEqual(adapter.max_retries.total, 4)
+        self.assertNotIn('POST', adapter.max_retries.allowed_methods)
+        
+        with client as c:
+            c.requests_session()
+        
+        self.assertIsNone(client._requests_session)
+        self.assertIsNot(session, client.requests_session())
+    
+    def test_client_async_get_to_file_range(self):
+        self.logger.info('test_client_async_get_to_file_range')
+        
+        class MockContent:
+            def __init__(self, data):
+                self.data = data
+            
+            async def iter_chunked(self, chunk_size):
+                for i in range(0, len(self.data), chunk_size):
+                    yield self.data[i:i + chunk_size]
+        
+        class MockResponse:
+            def __init__(self, status, headers, data):
+                self.status  = status
+                self.headers = headers
+                self.content = MockContent(data)
+            
+            async def __aenter__(self):
+                return self
+            
+            async def __aexit__(self, exc_type, exc, tb):
+                return False
+            
+            async def text(self):
+                return ''
+        
+        class MockSession:
+            def __init__(self, response):
+                self.response = response
+            
+            def get(self, url, **kwargs):
+                return self.response
+        
+        client = cl.Client()
+        
+        with tempfile.TemporaryDirectory() as folder:
+            file_path = os.path.join(folder, 'download.zip.part')
+            
+            with open(file_path, 'wb') as f:
+                f.write(b'.' * 32)
+            
+            self.logger.info('test_client_async_get_to_file_range: in range')
+            
+            response = asyncio.run(client.async_get_to_file(url        = 'https://pairs.res.ibm.com/download',
+                                                            file_path  = file_path,
+                                                            session    = MockSession(MockResponse(206, {'Content-Range': 'bytes 8-15/32'}, b'a' * 8)),
+                                                            chunk_size = 3,
+                                                            offset     = 8,
+                                                            end        = 15,
+                                                            shared     = True
+                                                           ))
+            
+            self.assertEqual(response.content_range, 'bytes 8-15/32')
+            self.assertEqual(response.bytes_written, 8)
+            
+            self.logger.info('test_client_async_get_to_file_range: too many bytes are counted but not written')
+            
+            response = asyncio.run(client.async_get_to_file(url        = 'https://pairs.res.ibm.com/download',
+                                                            file_path  = file_path,
+                                                            session    = MockSession(MockResponse(206, {'Content-Range': 'bytes 16-31/32'}, b'b' * 16)),
+                                                            chunk_size = 3,
+                                                            offset     = 16,
+                                                            end        = 23,
+                                                            shared     = True
+                                                           ))
+            
+            self.assertEqual(response.content_range, 'bytes 16-31/32')
+            self.assertEqual(response.bytes_written, 16)
+            
+            self.logger.info('test_client_async_get_to_file_range: a 200 does not touch a shared file')
+            
+            response = asyncio.run(client.async_get_to_file(url        = 'https://pairs.res.ibm.com/download',
+                                                            file_path  = file_path,
+                                                            session    = MockSession(MockResponse(200, {}, b'c' * 32)),
+                                                            offset     = 24,
+                                                            end        = 31,
+                                                            shared     = True
+                                                           ))
+            
+            self.assertEqual(response.status, 200)
+            self.assertIsNone(response.content_range)
+            self.assertEqual(response.bytes_written, 0)
+            
+            with open(file_path, 'rb') as f:
+                self.assertEqual(f.read(), b'.' * 8 + b'a' * 8 + b'b' * 8 + b'.' * 8)
+            
+            self.logger.info('test_client_async_get_to_file_range: no pooled session is created for a given session')
+            
+            with mock.patch('ibmpairs.client.Client._pooled_session', side_effect = AssertionError('pooled session created')):
+                response = asyncio.run(client.async_get_to_file(url       = 'https://pairs.res.ibm.com/download',
+                                                                file_path = file_path,
+                                                                session   = MockSession(MockResponse(206, {'Content-Range': 'bytes 0-7/32'}, b'd' * 8)),
+                                                                offset    = 0,
+                                                                end       = 7,
+                                                                shared    = True
+                                                               ))
+            
+            self.assertEqual(response.bytes_written, 8)
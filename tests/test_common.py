@@ -8,6 +8,12 @@ SPDX-License-Identifier: BSD-3-Clause
 
 import unittest
 import json
+import math
+import os
+import shutil
+import tempfile
+from unittest import mock
+import pandas
 
 from ibmpairs.logger import logger
 import ibmpairs.common as common
@@ -300,6 +306,91 @@ class CommonUnitTest(unittest.TestCase):
         
         self.assertEqual(common.ensure_protocol('abc.123'), 'https://abc.123')
 
+    def test_json_loads(self):
+        
+        self.logger.info('test_json_loads')
+        
+        decoder = common.get_json_decoder()
+        
+        try:
+            for json_decoder in ['json'] + (['orjson'] if common.HAS_ORJSON else []) + (['simdjson'] if common.HAS_SIMDJSON else []):
+                common.set_json_decoder(json_decoder)
+                
+                self.assertEqual(common.get_json_decoder(), json_decoder)
+                self.assertEqual(common.json_loads('{"id": "1", "data": [1, 2.5]}'), {"id": "1", "data": [1, 2.5]})
+                self.assertEqual(common.json_loads(b'{"id": "1"}'), {"id": "1"})
+                # NaN is accepted as the standard library does.
+                self.assertTrue(math.isnan(common.json_loads('{"value": NaN}')["value"]))
+                
+                self.assertEqual(common.json_loads('[1e400, -Infinity]'), [float('inf'), float('-inf')])
+                
+                # A document that is not json is not decoded again by the standard library.
+                with mock.patch('json.loads', wraps=json.loads) as json_loads:
+                    with self.assertRaises(ValueError):
+                        common.json_loads('layerId,timestamp,value\n16100,1421528400000,NaN')
+                    self.assertEqual(json_loads.call_count, 0)
+        finally:
+            common.set_json_decoder(decoder)
+        
+        with self.assertRaises(common.PAWException):
+            common.set_json_decoder('unknown')
+        
+        self.assertEqual(common.get_json_decoder(), decoder)
+
+    def test_looks_like_json(self):
+        
+        self.logger.info('test_looks_like_json')
+        
+        self.assertTrue(common.looks_like_json('{"id": "1"}'))
+        self.assertTrue(common.looks_like_json(b' \n [1, 2]'))
+        self.assertFalse(common.looks_like_json('layerId,timestamp\n16100,1421528400000'))
+        self.assertFalse(common.looks_like_json(b'"layerId","timestamp"'))
+        self.assertFalse(common.looks_like_json(''))
+
+    @unittest.skipIf(
+        not common.HAS_PYARROW,
+        "pyarrow is not installed."
+    )
+    def test_write_parquet_dataset(self):
+        
+        self.logger.info('test_write_parquet_dataset')
+        
+        import pyarrow.dataset
+        
+        df = pandas.DataFrame({"layer_id":  pandas.Categorical([49180, 49180, 49181]),
+                               "timestamp": [1625544000000, 1625630400000, 1625544000000],
+                               "value":     [1.5, 2.5, 3.5]
+                              })
+        
+        self.assertEqual(common.dataframe_to_arrow(df).num_rows, 3)
+        
+        path = tempfile.mkdtemp()
+        
+        try:
+            common.write_parquet_dataset(df, path, ["layer_id", "date"])
+            
+            self.assertTrue(os.path.isdir(os.path.join(path, "layer_id=49180", "date=2021-07-06")))
+            self.assertTrue(os.path.isdir(os.path.join(path, "layer_id=49181", "date=2021-07-06")))
+            
+            self.logger.info('test_write_parquet_dataset: append')
+            
+            common.write_parquet_dataset(df, path, ["layer_id", "date"])
+            
+            self.assertEqual(pyarrow.dataset.dataset(path, partitioning = "hive").count_rows(), 6)
+            
+            self.logger.info('test_write_parquet_dataset: replace')
+            
+            common.write_parquet_dataset(df, path, ["layer_id", "date"], append = False)
+            
+            self.assertEqual(pyarrow.dataset.dataset(path, partitioning = "hive").count_rows(), 3)
+            
+            self.logger.info('test_write_parquet_dataset: unknown partition column')
+            
+            with self.assertRaises(common.PAWException):
+                common.write_parquet_dataset(df, path, ["region"])
+        finally:
+            shutil.rmtree(path)
+
     def ensure_api_path(self):
         
         self.logger.info('test_ensure_api_path')
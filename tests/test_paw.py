@@ -29,9 +29,10 @@ SPDX-License-Identifier: BSD-3-Clause
 # fold: imports{{{
 import pytest
 # general imports
-import sys, os, time, glob, tempfile
+import sys, os, io, time, glob, tempfile, shutil
 # Python unit testing
 import unittest
+import unittest.mock
 # compare files
 import filecmp
 # requests module
@@ -54,6 +55,18 @@ import zipfile
 # handling scientific data
 import numpy
 import pandas
+HAS_PIL = False
+try:
+    import PIL.Image
+    HAS_PIL = True
+except:
+    pass
+HAS_GDAL = False
+try:
+    from osgeo import gdal
+    HAS_GDAL = True
+except:
+    pass
 # handle geometric data
 import shapely
 # string type compatibility with Python 2 and 3
@@ -622,6 +635,34 @@ class TestPointQuery(unittest.TestCase):
         testPointQuery.set_timestamp_column('timestamp')
         # set point coordinate columns
         testPointQuery.set_lat_lon_columns('latitude', 'longitude', 'geometry')
+
+    def test_split_property_strings(self):
+        """
+        Tests splitting property strings into columns.
+        """
+        propertyStrings = pandas.Series(
+            ['a:1;b:x', None, 'b:2;c:3.5;a:9;a:7', 'd:e:f', numpy.nan],
+            index=[4, 3, 2, 1, 0],
+        )
+        split = paw.PAIRSQuery._split_property_strings(propertyStrings)
+        self.assertEqual(['a', 'b', 'c', 'd'], list(split.columns))
+        self.assertEqual(list(range(5)), list(split.index))
+        self.assertEqual(['1', '7'], split['a'].dropna().tolist())
+        self.assertEqual([0, 2], list(split['a'].dropna().index))
+        self.assertEqual('e:f', split['d'][3])
+        self.assertTrue(split.iloc[4].isna().all())
+        # numeric columns
+        split = paw.PAIRSQuery._split_property_strings(propertyStrings, inferTypes=True)
+        self.assertTrue(pandas.api.types.is_float_dtype(split['c']))
+        self.assertEqual(3.5, split['c'][2])
+        self.assertFalse(pandas.api.types.is_numeric_dtype(split['b']))
+        # a key repeated within a row keeps the position of its first appearance
+        split = paw.PAIRSQuery._split_property_strings(pandas.Series(['a:1;b:x;a:2', 'c:3']))
+        self.assertEqual(['a', 'b', 'c'], list(split.columns))
+        self.assertEqual('2', split['a'][0])
+        # no properties at all
+        split = paw.PAIRSQuery._split_property_strings(pandas.Series([None, 1]))
+        self.assertEqual((2, 0), split.shape)
 #}}}
 
 # fold: test PAIRS raster and vector queries{{{
@@ -645,6 +686,8 @@ class TestPollQuery(unittest.TestCase):
     # fold: test environment setup#{{{
     @classmethod
     def setUpClass(cls):
+        # download query results to a temporary directory
+        cls.downloadDir = tempfile.TemporaryDirectory()
         # mock polls till finished
         cls.pollsTillRasterFinished = 2
         cls.pollsTillAggFinished    = 2
@@ -904,6 +947,7 @@ class TestPollQuery(unittest.TestCase):
             cls.pairsServerMock.stop()
         except:
             pass
+        cls.downloadDir.cleanup()
     #}}}
 
 
@@ -978,6 +1022,7 @@ class TestPollQuery(unittest.TestCase):
                 overwriteExisting   = not searchExist,
                 verifySSL           = VERIFY_SSL,
                 authType            = 'api-key',
+                downloadDir         = self.downloadDir.name,
             )
         else:
             testRasterQuery = paw.PAIRSQuery(
@@ -991,6 +1036,7 @@ class TestPollQuery(unittest.TestCase):
                 inMemory            = inMemory,
                 overwriteExisting   = not searchExist,
                 verifySSL           = VERIFY_SSL,
+                downloadDir         = self.downloadDir.name,
             )
         # check that query got submitted
         testRasterQuery.submit()
@@ -1137,6 +1183,146 @@ class TestPollQuery(unittest.TestCase):
         Test reloading previously queried data with PAIRS query ID (in-memory storage).
         """
         self.raster_query(mode='reload', inMemory=True)
+    def test_raster_layers_keep_dtype(self):
+        """
+        Test loading raster layers with their source data type and masked no-data pixels.
+        """
+        testRasterQuery = paw.PAIRSQuery(
+            self.PAIRS_RASTER_ZIP_PATH,
+            WEB_PROTOCOL+'://'+PAIRS_SERVER,
+            auth            = PAIRS_CREDENTIALS,
+            baseURI         = PAIRS_BASE_URI,
+            verifySSL       = VERIFY_SSL,
+        )
+        testRasterQuery.list_layers()
+        testRasterQuery.create_layers()
+        floatData = dict(testRasterQuery.data)
+        testRasterQuery.create_layers(keepDtype=True)
+        for name, a in testRasterQuery.data.items():
+            self.assertIsInstance(a, numpy.ma.MaskedArray)
+            self.assertEqual(numpy.float32, a.dtype)
+            self.assertEqual(
+                numpy.isnan(floatData[name]).sum(),
+                numpy.ma.count_masked(a),
+            )
+            numpy.testing.assert_array_equal(
+                floatData[name],
+                testRasterQuery.layer_as_float(name),
+            )
+        # mask integer data with a no-data value out of range of the data type
+        a = paw.PAIRSQuery._mask_nodata(
+            numpy.array([[0, 255], [1, 2]], dtype=numpy.uint8), -9999., keepDtype=True,
+        )
+        self.assertEqual(numpy.uint8, a.dtype)
+        self.assertEqual(0, numpy.ma.count_masked(a))
+        a = paw.PAIRSQuery._mask_nodata(
+            numpy.array([[0, 255], [1, 2]], dtype=numpy.uint8), 255, keepDtype=True,
+        )
+        self.assertEqual(1, numpy.ma.count_masked(a))
+        # mask in blocks of rows smaller than the raster
+        data = numpy.arange(70, dtype=numpy.float64).reshape(7, 10) % 4
+        a = paw.PAIRSQuery._mask_nodata(data, 3., blockSize=25)
+        self.assertIs(data, a)
+        self.assertEqual(17, numpy.isnan(a).sum())
+        numpy.testing.assert_array_equal(
+            numpy.isnan(a), (numpy.arange(70) % 4 == 3).reshape(7, 10),
+        )
+        a = paw.PAIRSQuery._mask_nodata(numpy.array([3, 1, 3], dtype=numpy.int16), 3, blockSize=1)
+        self.assertEqual(numpy.float64, a.dtype)
+        self.assertEqual(2, numpy.isnan(a).sum())
+        with self.assertRaises(Exception):
+            testRasterQuery.layer_as_float('unknown')
+    @unittest.skipIf(not HAS_PIL, "PIL is not installed")
+    def test_raster_layers_parallel(self):
+        """
+        Test loading multiple raster layers in parallel.
+        """
+        # compile a query ZIP file with multiple raster layers of distinct values
+        with zipfile.ZipFile(self.PAIRS_RASTER_ZIP_PATH) as zf:
+            layerName = json.loads(zf.read('output.info').decode('utf-8'))['files'][0]['name']
+            details = zf.read(layerName.replace(':', '_') + '.tiff.json')
+        tempDir = tempfile.mkdtemp()
+        zipPath = os.path.join(tempDir, '12_07_2018T18_39_36-1544202000_23976939.zip')
+        names = ['layer{}-10_31_2018T12_00_00'.format(i) for i in range(6)]
+        with zipfile.ZipFile(zipPath, 'w') as zf:
+            zf.writestr('output.info', json.dumps({
+                'files': [
+                    {'name': name, 'datalayerId': str(i), 'timestamp': 1540987200000, 'layerType': 'raster'}
+                    for i, name in enumerate(names)
+                ]
+            }))
+            for i, name in enumerate(names):
+                buf = io.BytesIO()
+                PIL.Image.fromarray(numpy.full((8, 8), i, dtype=numpy.float32)).save(buf, format='TIFF')
+                zf.writestr(name + '.tiff', buf.getvalue())
+                zf.writestr(name + '.tiff.json', details)
+        testRasterQuery = paw.PAIRSQuery(
+            zipPath,
+            WEB_PROTOCOL+'://'+PAIRS_SERVER,
+            auth            = PAIRS_CREDENTIALS,
+            baseURI         = PAIRS_BASE_URI,
+            verifySSL       = VERIFY_SSL,
+        )
+        testRasterQuery.list_layers()
+        testRasterQuery.create_layers(numWorkers=4)
+        self.assertEqual(names, list(testRasterQuery.data.keys()))
+        for i, name in enumerate(names):
+            self.assertTrue((testRasterQuery.data[name] == i).all())
+        # sequential loading yields the same result
+        parallelData = testRasterQuery.data
+        testRasterQuery.data = dict()
+        testRasterQuery.create_layers(numWorkers=1)
+        self.assertEqual(names, list(testRasterQuery.data.keys()))
+        for name in names:
+            numpy.testing.assert_array_equal(parallelData[name], testRasterQuery.data[name])
+        self.assertIsNone(testRasterQuery.queryFS)
+    @unittest.skipIf(not HAS_PIL, "PIL is not installed")
+    def test_raster_layers_pil_stream(self):
+        """
+        Test loading raster data with PIL from seekable and non-seekable member streams.
+        """
+        testRasterQuery = paw.PAIRSQuery(
+            self.PAIRS_RASTER_ZIP_PATH,
+            WEB_PROTOCOL+'://'+PAIRS_SERVER,
+            auth            = PAIRS_CREDENTIALS,
+            baseURI         = PAIRS_BASE_URI,
+            verifySSL       = VERIFY_SSL,
+        )
+        testRasterQuery.list_layers()
+        with unittest.mock.patch.object(paw, 'HAS_GDAL', False):
+            testRasterQuery.create_layers()
+            seekableData = testRasterQuery.data
+            testRasterQuery.data = dict()
+            with unittest.mock.patch('fs.zipfs._ZipExtFile.seekable', return_value=False):
+                testRasterQuery.create_layers()
+        self.assertTrue(len(seekableData) > 0)
+        self.assertEqual(list(seekableData.keys()), list(testRasterQuery.data.keys()))
+        for name, a in seekableData.items():
+            numpy.testing.assert_array_equal(a, testRasterQuery.data[name])
+    @unittest.skipIf(not HAS_GDAL, "GDAL is not installed")
+    def test_raster_layers_gdal_path(self):
+        """
+        Test raster files are handed to GDAL via its virtual file systems.
+        """
+        testRasterQuery = paw.PAIRSQuery(
+            self.PAIRS_RASTER_ZIP_PATH,
+            WEB_PROTOCOL+'://'+PAIRS_SERVER,
+            auth            = PAIRS_CREDENTIALS,
+            baseURI         = PAIRS_BASE_URI,
+            verifySSL       = VERIFY_SSL,
+        )
+        testRasterQuery.list_layers()
+        testRasterQuery._openDataSource()
+        try:
+            for name in testRasterQuery.metadata:
+                gdalPath, memFilePath = testRasterQuery._gdal_raster_path(name + '.tiff')
+                self.assertIsNone(memFilePath)
+                self.assertEqual(
+                    '/vsizip/{}/{}.tiff'.format(os.path.abspath(self.PAIRS_RASTER_ZIP_PATH), name),
+                    gdalPath,
+                )
+        finally:
+            testRasterQuery._closeDataSource()
     #}}}
 
     # fold: test vector queries #{{{
@@ -1227,6 +1413,7 @@ class TestPollQuery(unittest.TestCase):
                 overwriteExisting   = not searchExist,
                 verifySSL           = VERIFY_SSL,
                 authType            = 'api-key',
+                downloadDir         = self.downloadDir.name,
             )
         else:
             testVectorQuery = paw.PAIRSQuery(
@@ -1240,6 +1427,7 @@ class TestPollQuery(unittest.TestCase):
                 inMemory            = inMemory,
                 overwriteExisting   = not searchExist,
                 verifySSL           = VERIFY_SSL,
+                downloadDir         = self.downloadDir.name,
             )
         # check that query got submitted
         testVectorQuery.submit()
@@ -1388,6 +1576,84 @@ class TestPollQuery(unittest.TestCase):
         Test reloading previously queried vector data with PAIRS query ID (in-memory storage).
         """
         self.vector_query(mode='reload', inMemory=True)
+    def test_vector_layer_chunks(self):
+        """
+        Test streaming vector data in chunks.
+        """
+        testVectorQuery = paw.PAIRSQuery(
+            self.PAIRS_VECTOR_ZIP_PATH,
+            WEB_PROTOCOL+'://'+PAIRS_SERVER,
+            auth            = PAIRS_CREDENTIALS,
+            baseURI         = PAIRS_BASE_URI,
+            verifySSL       = VERIFY_SSL,
+        )
+        testVectorQuery.create_layers()
+        name = os.path.splitext(paw.PAIRS_VECTOR_CSV_FILE_NAME)[0]
+        vdf = testVectorQuery.data[name]
+        # all rows in chunks of fixed size
+        chunks = list(testVectorQuery.iter_layer_chunks(name, chunkSize=3))
+        self.assertEqual([3]*(len(vdf)//3) + ([len(vdf)%3] if len(vdf)%3 else []), [len(c) for c in chunks])
+        self.assertEqual(list(vdf.columns), list(chunks[0].columns))
+        self.assertTrue(pandas.api.types.is_datetime64_any_dtype(chunks[0]['Time']))
+        # column projection and row filter
+        chunks = list(
+            testVectorQuery.iter_layer_chunks(
+                name,
+                chunkSize   = 3,
+                columns     = ['Region', 'Value'],
+                predicate   = lambda df: df['Value'] > 4,
+            )
+        )
+        df = pandas.concat(chunks)
+        self.assertEqual(['Region', 'Value'], list(df.columns))
+        self.assertEqual(vdf[vdf['Value'] > 4]['Region'].tolist(), df['Region'].tolist())
+        self.assertTrue(all(len(c) > 0 for c in chunks))
+        # data source got closed
+        self.assertIsNone(testVectorQuery.queryFS)
+        with self.assertRaises(Exception):
+            list(testVectorQuery.iter_layer_chunks('unknown'))
+        # the chunks make up the data of create_layer()
+        pandas.testing.assert_frame_equal(
+            vdf, pandas.concat(testVectorQuery.iter_layer_chunks(name, chunkSize=3), ignore_index=True)
+        )
+        # timestamp column named as in create_layer(), populated from the meta data if empty in all rows
+        with zipfile.ZipFile(self.PAIRS_VECTOR_ZIP_PATH) as z:
+            members = {n: z.read(n) for n in z.namelist()}
+        lines = members[paw.PAIRS_VECTOR_CSV_FILE_NAME].decode('utf-8').splitlines()
+        for emptyRows in [len(lines), 3]:
+            csvLines = [lines[0].replace(',Time,', ','+paw.PAIRS_VECTOR_TIMESTAMP_COLUMN_NAME+',')]
+            for i, line in enumerate(lines[1:]):
+                values = line.split(',')
+                if i < emptyRows:
+                    values[paw.PAIRS_VECTOR_CSV_TIMESTAMP_COL_NUM] = ''
+                csvLines.append(','.join(values))
+            tempDir = tempfile.mkdtemp()
+            zipPath = os.path.join(tempDir, 'vector.zip')
+            with zipfile.ZipFile(zipPath, 'w') as z:
+                for n, data in members.items():
+                    z.writestr(n, '\n'.join(csvLines)+'\n' if n == paw.PAIRS_VECTOR_CSV_FILE_NAME else data)
+            testQuery = paw.PAIRSQuery(
+                zipPath,
+                WEB_PROTOCOL+'://'+PAIRS_SERVER,
+                auth            = PAIRS_CREDENTIALS,
+                baseURI         = PAIRS_BASE_URI,
+                verifySSL       = VERIFY_SSL,
+            )
+            testQuery.list_layers()
+            testQuery.metadata[name][paw.PAIRS_META_TIMESTAMP_NAME] = 1549022400000
+            testQuery.create_layers()
+            data = testQuery.data[name]
+            df = pandas.concat(testQuery.iter_layer_chunks(name, chunkSize=3), ignore_index=True)
+            col = paw.PAIRS_VECTOR_TIMESTAMP_COLUMN_NAME
+            if emptyRows == len(lines):
+                pandas.testing.assert_frame_equal(data, df)
+                self.assertTrue(data[col].notna().all())
+            else:
+                # a chunk without any timestamp infers its own data type
+                self.assertEqual(list(data.columns), list(df.columns))
+                self.assertEqual(data[col].isna().tolist(), df[col].isna().tolist())
+                self.assertEqual(3, df[col].isna().sum())
+            shutil.rmtree(tempDir)
 
 
     @pytest.mark.run(order=5)
@@ -1639,6 +1905,7 @@ class TestPollQuery(unittest.TestCase):
             auth        = PAIRS_CREDENTIALS,
             baseURI     = PAIRS_BASE_URI,
             verifySSL   = VERIFY_SSL,
+            downloadDir = self.downloadDir.name,
         )
         testMockQuery.submit()
         testMockQuery.poll_till_finished(printStatus=True)
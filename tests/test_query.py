@@ -17,6 +17,7 @@ from datetime import datetime
 # ibmpairs Modules:
 from ibmpairs.logger import logger
 import ibmpairs.client as client
+import ibmpairs.common as common
 import ibmpairs.external.ibm as ibm_cos
 import ibmpairs.query as query_module
 #}}}
@@ -25,9 +26,15 @@ import ibmpairs.query as query_module
 import responses
 import unittest
 from unittest import mock
+import aiohttp
 import asyncio
+import base64
 import hashlib
+import numpy as np
+import pandas
 import shutil
+import tempfile
+import zipfile
 #}}}
 
 # test_favorite, test_unfavorite
@@ -618,6 +625,81 @@ async def mocked_download_async_get(*args, **kwargs):
         
         return MockResponse(return_json, 200)
 
+# test_download_stream
+async def mocked_download_async_get_to_file(*args, **kwargs):
+    
+    url       = kwargs.get("url")
+    file_path = kwargs.get("file_path")
+    offset    = kwargs.get("offset", 0)
+    end       = kwargs.get("end")
+    
+    class MockResponse:
+        def __init__(self, body, status_code, headers, bytes_written = 0):
+            self.body          = body
+            self.status        = status_code
+            self.headers       = headers
+            self.content_range = headers.get('Content-Range')
+            self.bytes_written = bytes_written
+    
+    files = {'https://api.ibm.com/geospatial/run/na/core/v3/queryjobs/1625544000_31302646/download': '1625544000_31302646.zip',
+             'https://api.ibm.com/geospatial/run/na/core/v3/queryjobs/1702468800_05116057/download': '1702468800_05116057.csv',
+             'https://api.ibm.com/geospatial/run/na/core/v3/queryjobs/1702468800_05212195/download': '1702468800_05212195.json'
+            }
+    
+    if url in files:
+        with open(os.path.join('tests/data/v2', files[url]), 'rb') as f:
+            data = f.read()
+        digest = 'md5=' + base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+        if (offset > 0) or (end is not None):
+            last = len(data) - 1 if end is None else min(end, len(data) - 1)
+            with open(file_path, 'r+b' if os.path.exists(file_path) else 'wb') as f:
+                f.seek(offset)
+                if end is None:
+                    f.truncate()
+                f.write(data[offset:last + 1])
+            return MockResponse(None, 206, {'Content-Length': str(last + 1 - offset),
+                                            'Content-Range': 'bytes ' + str(offset) + '-' + str(last) + '/' + str(len(data)),
+                                            'ETag': '"' + files[url] + '"',
+                                            'Digest': digest}, last + 1 - offset)
+        else:
+            with open(file_path, 'wb') as f:
+                f.write(data)
+            return MockResponse(None, 200, {'Content-Length': str(len(data)),
+                                            'ETag': '"' + files[url] + '"',
+                                            'Digest': digest}, len(data))
+    else:
+        return MockResponse(json.dumps({"status": "Error: 404 Not Found."}), 404, {})
+
+async def mocked_download_async_get_to_file_interrupted(*args, **kwargs):
+    
+    if kwargs.get("offset", 0) == 0:
+        with open(kwargs.get("file_path"), 'wb') as f:
+            with open('tests/data/v2/1625544000_31302646.zip', 'rb') as z:
+                f.write(z.read(1000))
+        raise aiohttp.ClientPayloadError('Response payload is not completed')
+    else:
+        return await mocked_download_async_get_to_file(*args, **kwargs)
+
+short_range_tracker = 0
+
+async def mocked_download_async_get_to_file_short_range(*args, **kwargs):
+    
+    global short_range_tracker
+    
+    response = await mocked_download_async_get_to_file(*args, **kwargs)
+    
+    if (kwargs.get("shared") is True) and (short_range_tracker == 0):
+        # A proxy cut the first segment short, the pre-sized file still has its full size.
+        short_range_tracker   = 1
+        first, last           = kwargs.get("offset"), kwargs.get("end")
+        response.content_range = 'bytes ' + str(first) + '-' + str(last - 10) + '/' + response.content_range.rpartition('/')[2]
+        response.bytes_written = last - 10 - first + 1
+        with open(kwargs.get("file_path"), 'r+b') as f:
+            f.seek(last - 9)
+            f.write(b'\x00' * 10)
+    
+    return response
+
 query_jobs_list_merge_success = [
     {
         "datalayer": "string",
@@ -2722,6 +2804,83 @@ class QueryResponseUnitTest(unittest.TestCase):
             got_exception = True
 
         self.assertFalse(got_exception)
+    
+    #    
+    def test_query_response_data_as_dataframe(self):
+        self.logger.info('test_query_response_data_as_dataframe')
+        
+        query_response = query_module.QueryResponse
+        
+        self.logger.info('test_query_response_data_as_dataframe: json')
+        
+        point_response = query_response.from_dict({"id": "string",
+                                                   "data": [{"layerId": 49180, "layerName": "Temperature", "timestamp": 1421528400000, 
+                                                             "longitude": 139.7, "latitude": 35.7, "value": "273.9"},
+                                                            {"layerId": 49180, "layerName": "Temperature", "timestamp": 1421614800000, 
+                                                             "longitude": 139.7, "latitude": 35.7, "value": "274.5"}
+                                                           ]
+                                                  })
+        
+        df = point_response.data_as_dataframe()
+        
+        self.assertEqual(list(df.columns), ["layer_id", "layer_name", "timestamp", "longitude", "latitude", "value"])
+        self.assertEqual(str(df["layer_id"].dtype), "category")
+        self.assertEqual(df["layer_id"].tolist(), [49180, 49180])
+        self.assertEqual(str(df["timestamp"].dtype), "int64")
+        self.assertEqual(str(df["longitude"].dtype), "float64")
+        self.assertEqual(str(df["value"].dtype), "float64")
+        self.assertEqual(str(df["layer_name"].dtype), "category")
+        self.assertEqual(df["value"].tolist(), [273.9, 274.5])
+        # The rows are only built as objects when data is read.
+        self.assertEqual(point_response.data[1].timestamp, 1421614800000)
+        self.assertTrue(point_response.data_as_dataframe().equals(df))
+        
+        self.logger.info('test_query_response_data_as_dataframe: non-numeric values')
+        
+        df = query_response.from_dict(query_response_dict).data_as_dataframe()
+        
+        self.assertEqual(str(df["value"].dtype), "category")
+        self.assertEqual(df["value"].tolist(), ["string"])
+        
+        self.logger.info('test_query_response_data_as_dataframe: csv')
+        
+        csv_response = query_response.from_dict(query_response_csv_dict)
+        df = csv_response.data_as_dataframe()
+        
+        self.assertEqual(list(df.columns), ["layer_id", "timestamp", "longitude", "latitude", "value", "region", "property", "alias"])
+        self.assertEqual(df["layer_id"].tolist(), [16100])
+        self.assertEqual(str(df["layer_id"].dtype), "category")
+        self.assertEqual(str(df["timestamp"].dtype), "int64")
+        self.assertEqual(str(df["region"].dtype), "category")
+        
+        self.logger.info('test_query_response_data_as_dataframe: csv as datetime, released')
+        
+        df = csv_response.data_as_dataframe(timestamp_as_datetime = True, 
+                                            release               = True
+                                           )
+        
+        self.assertEqual(str(df["timestamp"].dtype), "datetime64[ms, UTC]")
+        self.assertEqual(df["timestamp"].iloc[0], pandas.Timestamp(1421528400000, unit = "ms", tz = "UTC"))
+        self.assertIsNone(csv_response.data)
+        self.assertTrue(csv_response.has_data())
+        self.assertEqual(str(csv_response.data_as_dataframe()["timestamp"].dtype), "int64")
+        
+        self.logger.info('test_query_response_data_as_dataframe: csv with missing timestamps')
+        
+        df = query_response(data = "layerId,timestamp,value\n16100,,2.5\n").data_as_dataframe()
+        
+        self.assertEqual(str(df["timestamp"].dtype), "Int64")
+        
+        self.logger.info('test_query_response_data_as_dataframe: no data')
+        
+        got_exception = False
+        
+        try:
+            query_response(id = "string").data_as_dataframe()
+        except Exception as ex:
+            got_exception = True
+        
+        self.assertTrue(got_exception)
  
 query_job_dict = {
     "id": "string",
@@ -4403,6 +4562,10 @@ class QueryUnitTest(unittest.TestCase):
     def setUp(self):
         self.logger = logger
         self.logger.info('setup')
+        # the environment above is too late if ibmpairs.constants was imported before
+        patcher = mock.patch('ibmpairs.constants.QUERY_MIN_STATUS_INTERVAL', 1)
+        patcher.start()
+        self.addCleanup(patcher.stop)
     
     #
     def tearDown(self):
@@ -5405,6 +5568,164 @@ class QueryUnitTest(unittest.TestCase):
         self.assertEqual(query_async_status_no_id.status_response.status, "The query id was not present in the query object.")
 
 
+    @mock.patch('ibmpairs.constants.QUERY_STATUS_ADAPTIVE_JITTER', 0)
+    def test_status_schedule(self):
+        self.logger.info('test_status_schedule')
+        
+        self.logger.info('test_status_schedule: fixed')
+        
+        schedule = query_module.QueryStatusSchedule(status_interval = 30, adaptive = False)
+        self.assertEqual(schedule.next(query_module.QueryJob(status_code = 0)), 30)
+        self.assertEqual(schedule.next(query_module.QueryJob(status_code = 0)), 30)
+        
+        self.logger.info('test_status_schedule: backoff while queued, capped')
+        
+        schedule = query_module.QueryStatusSchedule(status_interval = 30, adaptive = True)
+        self.assertEqual([schedule.next(query_module.QueryJob(status_code = 0)) for i in range(7)], [5, 10, 20, 40, 80, 120, 120])
+        
+        self.logger.info('test_status_schedule: tight after a transition and while packaging')
+        
+        self.assertEqual(schedule.next(query_module.QueryJob(status_code = 10)), 5)
+        self.assertEqual(schedule.next(query_module.QueryJob(status_code = 12)), 5)
+        self.assertEqual(schedule.next(query_module.QueryJob(status_code = 12)), 5)
+        
+        self.logger.info('test_status_schedule: half of the time to finish while progressing')
+        
+        schedule = query_module.QueryStatusSchedule(status_interval = 30, adaptive = True)
+        with mock.patch('time.monotonic', side_effect = [0, 100, 200]):
+            schedule.next(query_module.QueryJob(status_code = 10, ex_percent = 10))
+            schedule.next(query_module.QueryJob(status_code = 10, ex_percent = 10))
+            self.assertEqual(schedule.next(query_module.QueryJob(status_code = 10, ex_percent = 60)), 40)
+        
+        self.logger.info('test_status_schedule: never below the minimum status interval')
+        
+        with mock.patch('ibmpairs.constants.QUERY_MIN_STATUS_INTERVAL', 15), \
+             mock.patch('ibmpairs.constants.QUERY_STATUS_ADAPTIVE_JITTER', 0.1):
+            for status_interval in [1, 10, 30]:
+                schedule = query_module.QueryStatusSchedule(status_interval = status_interval, adaptive = True)
+                status_codes = [0, 0, 1, 10, 10, 11, 11, 12, 12, 12, 20]
+                with mock.patch('time.monotonic', side_effect = range(0, 1100, 100)):
+                    intervals = [schedule.next(query_module.QueryJob(status_code = status_code, ex_percent = 10 * i)) 
+                                 for i, status_code in enumerate(status_codes)]
+                self.assertGreaterEqual(min(intervals), 15)
+        
+    def test_status_poller(self):
+        self.logger.info('test_status_poller')
+        
+        c = client.Client() 
+        
+        state = {'status_code': 10, 'urls': []}
+        
+        async def mocked_poller_async_get(*args, **kwargs):
+            
+            url = kwargs.get("url")
+            state['urls'].append(url)
+            
+            status = {10: "Running(10)", 20: "Succeeded(20)"}[state['status_code']]
+            
+            class MockResponse:
+                def __init__(self, body, status_code):
+                    self.body   = body
+                    self.status = status_code
+            
+            if 'list?' in url:
+                return MockResponse(json.dumps({"totPages": 1, 
+                                                "queryJobList": [{"id": query_id, "status": status, "statusCode": state['status_code']} for query_id in ['A', 'B', 'C']]
+                                               }), 200)
+            else:
+                return MockResponse(json.dumps({"id": url.rsplit('/', 1)[1], "status": status, "statusCode": state['status_code']}), 200)
+        
+        async def run(poller):
+            return await asyncio.gather(poller.status('A'), poller.status('B'))
+        
+        with mock.patch('ibmpairs.client.Client.async_get', side_effect = mocked_poller_async_get):
+            
+            self.logger.info('test_status_poller: the first check is made at once')
+            
+            poller = query_module.QueryStatusPoller(client = c, status_interval = 0)
+            
+            responses = asyncio.run(run(poller))
+            self.assertEqual([r.status for r in responses], [200, 200])
+            self.assertEqual(len(state['urls']), 2)
+            self.assertFalse(any('list?' in url for url in state['urls']))
+            
+            self.logger.info('test_status_poller: running queries are checked together from the job list')
+            
+            state['urls'] = []
+            
+            responses = asyncio.run(run(poller))
+            self.assertEqual([query_module.query_job_from_json(r.body).status_code for r in responses], [10, 10])
+            self.assertEqual(len(state['urls']), 1)
+            self.assertTrue('list?' in state['urls'][0])
+            
+            self.logger.info('test_status_poller: finished queries are confirmed one by one')
+            
+            state['urls']        = []
+            state['status_code'] = 20
+            
+            responses = asyncio.run(run(poller))
+            self.assertEqual([query_module.query_job_from_json(r.body).status for r in responses], ["Succeeded(20)", "Succeeded(20)"])
+            self.assertEqual(len(state['urls']), 3)
+            
+            self.logger.info('test_status_poller: a finished query is checked at once')
+            
+            state['urls'] = []
+            
+            asyncio.run(run(poller))
+            self.assertEqual(len(state['urls']), 2)
+            self.assertFalse(any('list?' in url for url in state['urls']))
+            
+            self.logger.info('test_status_poller: fall back without a job list')
+            
+            state['urls']        = []
+            state['status_code'] = 10
+            
+            poller = query_module.QueryStatusPoller(client = c, status_interval = 0, bulk = False)
+            
+            asyncio.run(run(poller))
+            asyncio.run(run(poller))
+            self.assertEqual(len(state['urls']), 4)
+            self.assertFalse(any('list?' in url for url in state['urls']))
+            
+            self.logger.info('test_status_poller: a failed round is handed to its waiters')
+            
+            async def failed_round(poller):
+                await poller.status('D')
+                with mock.patch.object(poller, '_fetch', side_effect = RuntimeError('round failed')):
+                    try:
+                        await poller.status('D', delay = 0)
+                    except RuntimeError as e:
+                        error = e
+                    await asyncio.sleep(0)
+                    return error, poller._task
+            
+            poller = query_module.QueryStatusPoller(client = c, status_interval = 0)
+            
+            error, task = asyncio.run(failed_round(poller))
+            self.assertEqual(str(error), 'round failed')
+            self.assertTrue(task.done())
+            self.assertIsNone(task.exception())
+            
+            self.logger.info('test_status_poller: closed while queries are waiting')
+            
+            async def closed(poller):
+                await poller.status('E')
+                waiting = asyncio.ensure_future(poller.status('E', delay = 3600))
+                await asyncio.sleep(0)
+                task = poller._task
+                await poller.aclose()
+                try:
+                    await waiting
+                except asyncio.CancelledError:
+                    return task, True
+                return task, False
+            
+            poller = query_module.QueryStatusPoller(client = c, status_interval = 0)
+            
+            task, cancelled = asyncio.run(closed(poller))
+            self.assertTrue(cancelled)
+            self.assertTrue(task.cancelled())
+
     @mock.patch('ibmpairs.client.Client.async_get', 
                 side_effect=mocked_status_async_get
                )    
@@ -5733,6 +6054,62 @@ class QueryUnitTest(unittest.TestCase):
         self.assertTrue(got_exception)
         
         self.assertEqual(query_async_download_deleted.download_status, "FAILED")
+    
+    #
+    def test_async_download_point_data(self):
+        self.logger.info('test_async_download_point_data: json rows')
+        
+        c      = client.Client() 
+        query  = query_module.Query
+        
+        rows = [{"layerId": "49180", "timestamp": 1421528400000, "longitude": 139.7, "latitude": 35.7, "value": "273.9"}]
+        
+        download_folder = tempfile.mkdtemp()
+        
+        try:
+            query_point = query(spatial         = query_module.Spatial(type = 'point', coordinates = [35.7, 139.7]),
+                                submit_response = query_module.QueryResponse.from_dict({"data": rows})
+                               )
+            asyncio.run(query_point.async_download(query              = query_point,
+                                                   client             = c,
+                                                   download_folder    = download_folder,
+                                                   download_file_name = 'point'
+                                                  )
+                       )
+            
+            self.assertEqual(query_point.download_status, "SUCCEEDED")
+            with open(os.path.join(download_folder, 'point.json')) as f:
+                self.assertEqual(json.load(f), rows)
+            # The rows are written without being built as QueryResponseData objects.
+            self.assertIsNone(query_point.submit_response._data)
+            
+            self.logger.info('test_async_download_point_data: released dataframe')
+            
+            query_point.submit_response.data_as_dataframe(release = True)
+            asyncio.run(query_point.async_download(query              = query_point,
+                                                   client             = c,
+                                                   download_folder    = download_folder,
+                                                   download_file_name = 'point_dataframe'
+                                                  )
+                       )
+            
+            with open(os.path.join(download_folder, 'point_dataframe.json')) as f:
+                self.assertEqual(json.load(f)[0]["timestamp"], 1421528400000)
+            
+            self.logger.info('test_async_download_point_data: csv')
+            
+            query_point.submit_response = query_module.QueryResponse(data = "layerId,timestamp,value\n49180,1421528400000,273.9\n")
+            asyncio.run(query_point.async_download(query              = query_point,
+                                                   client             = c,
+                                                   download_folder    = download_folder,
+                                                   download_file_name = 'point'
+                                                  )
+                       )
+            
+            with open(os.path.join(download_folder, 'point.csv')) as f:
+                self.assertEqual(f.read(), "layerId,timestamp,value\n49180,1421528400000,273.9\n")
+        finally:
+            shutil.rmtree(download_folder)
         
     @mock.patch('ibmpairs.client.Client.async_get', 
                 side_effect=mocked_download_async_get
@@ -5853,6 +6230,349 @@ class QueryUnitTest(unittest.TestCase):
         if os.path.isfile(os.path.join(os.getcwd(), 'download/1702468800_05212195.json')):
             os.remove(os.path.join(os.getcwd(), 'download/1702468800_05212195.json'))
 
+    @mock.patch('ibmpairs.client.Client.async_get_to_file', 
+                side_effect=mocked_download_async_get_to_file
+               )
+    @mock.patch('ibmpairs.client.Client.async_get', 
+                side_effect=mocked_download_async_get
+               )
+    def test_download_stream(self, mock_get, mock_get_to_file):
+        self.logger.info('test_download_stream: zip success')
+        
+        c      = client.Client() 
+        query  = query_module.Query
+        
+        query_download = None
+        
+        got_exception = False
+        
+        try:
+            query_download = query.from_dict(query_dict_download_status_20_no_point_values)
+            query_download.id = '1625544000_31302646'
+            query_download.download(client             = c,
+                                    download_folder    = '/tmp',
+                                    download_file_name = 'ibmpairs_unit_test_stream',
+                                    stream             = True
+                                   )
+        except Exception as ex:
+            got_exception = True
+            
+        self.assertFalse(got_exception)
+        
+        self.assertEqual(query_download.download_status, "SUCCEEDED")
+        self.assertTrue(os.path.isfile("/tmp/ibmpairs_unit_test_stream.zip"))
+        self.assertTrue(os.path.isdir("/tmp/ibmpairs_unit_test_stream"))
+        self.assertEqual([f for f in os.listdir('/tmp') if f.startswith('.ibmpairs_unit_test_stream')], [])
+        
+        self.logger.info('removing \'/tmp/ibmpairs_unit_test_stream.zip\'')
+        if os.path.isfile('/tmp/ibmpairs_unit_test_stream.zip'):
+            os.remove('/tmp/ibmpairs_unit_test_stream.zip')
+        self.logger.info('removing \'/tmp/ibmpairs_unit_test_stream\'')
+        if os.path.exists('/tmp/ibmpairs_unit_test_stream'):
+            shutil.rmtree('/tmp/ibmpairs_unit_test_stream')
+        
+        self.logger.info('test_download_stream: csv success')
+        
+        got_exception = False
+        
+        try:
+            query_download = query.from_dict(query_dict_download_status_20_no_point_values)
+            query_download.id = '1702468800_05116057'
+            query_download.download(client = c,
+                                    stream = True
+                                   )
+        except Exception as ex:
+            got_exception = True
+            
+        self.assertFalse(got_exception)
+        
+        self.assertEqual(query_download.download_status, "SUCCEEDED")
+        self.assertTrue(os.path.isfile(os.path.join(os.getcwd(), 'download/1702468800_05116057.csv')))
+        self.assertTrue(query_download.submit_response.data.startswith(open('tests/data/v2/1702468800_05116057.csv').read()[:16]))
+        
+        self.logger.info('removing \'download/1702468800_05116057.csv\'')
+        if os.path.isfile(os.path.join(os.getcwd(), 'download/1702468800_05116057.csv')):
+            os.remove(os.path.join(os.getcwd(), 'download/1702468800_05116057.csv'))
+        
+        self.logger.info('test_download_stream: json success')
+        
+        got_exception = False
+        
+        try:
+            query_download = query.from_dict(query_dict_download_status_20_no_point_values)
+            query_download.id = '1702468800_05212195'
+            query_download.download(client = c,
+                                    stream = True
+                                   )
+        except Exception as ex:
+            got_exception = True
+            
+        self.assertFalse(got_exception)
+        
+        self.assertEqual(query_download.download_status, "SUCCEEDED")
+        self.assertTrue(os.path.isfile(os.path.join(os.getcwd(), 'download/1702468800_05212195.json')))
+        
+        self.logger.info('removing \'download/1702468800_05212195.json\'')
+        if os.path.isfile(os.path.join(os.getcwd(), 'download/1702468800_05212195.json')):
+            os.remove(os.path.join(os.getcwd(), 'download/1702468800_05212195.json'))
+
+    @mock.patch('ibmpairs.constants.QUERY_DOWNLOAD_RESUME_INTERVAL', 0)
+    @mock.patch('ibmpairs.client.Client.async_get_to_file', 
+                side_effect=mocked_download_async_get_to_file_interrupted
+               )
+    @mock.patch('ibmpairs.client.Client.async_get', 
+                side_effect=mocked_download_async_get
+               )
+    def test_download_stream_resume(self, mock_get, mock_get_to_file):
+        self.logger.info('test_download_stream_resume: interrupted download resumed')
+        
+        c      = client.Client() 
+        query  = query_module.Query
+        
+        query_download = None
+        
+        got_exception = False
+        
+        try:
+            query_download = query.from_dict(query_dict_download_status_20_no_point_values)
+            query_download.id = '1625544000_31302646'
+            query_download.download(client             = c,
+                                    download_folder    = '/tmp',
+                                    download_file_name = 'ibmpairs_unit_test_resume',
+                                    stream             = True
+                                   )
+        except Exception as ex:
+            got_exception = True
+            
+        self.assertFalse(got_exception)
+        
+        self.assertEqual(query_download.download_status, "SUCCEEDED")
+        self.assertEqual(mock_get_to_file.call_count, 2)
+        self.assertEqual(mock_get_to_file.call_args.kwargs.get('offset'), 1000)
+        self.assertFalse(os.path.isfile("/tmp/ibmpairs_unit_test_resume.zip.part"))
+        with open("/tmp/ibmpairs_unit_test_resume.zip", 'rb') as f:
+            with open('tests/data/v2/1625544000_31302646.zip', 'rb') as z:
+                self.assertEqual(f.read(), z.read())
+        
+        self.logger.info('removing \'/tmp/ibmpairs_unit_test_resume.zip\'')
+        if os.path.isfile('/tmp/ibmpairs_unit_test_resume.zip'):
+            os.remove('/tmp/ibmpairs_unit_test_resume.zip')
+        self.logger.info('removing \'/tmp/ibmpairs_unit_test_resume\'')
+        if os.path.exists('/tmp/ibmpairs_unit_test_resume'):
+            shutil.rmtree('/tmp/ibmpairs_unit_test_resume')
+        
+        self.logger.info('test_download_stream_resume: checksum mismatch')
+        
+        with open('/tmp/ibmpairs_unit_test_resume.zip.part', 'wb') as f:
+            f.write(b'PK\x03\x04' + b'\x00' * 996)
+        
+        got_exception = False
+        
+        try:
+            query_download = query.from_dict(query_dict_download_status_20_no_point_values)
+            query_download.id = '1625544000_31302646'
+            query_download.download(client             = c,
+                                    download_folder    = '/tmp',
+                                    download_file_name = 'ibmpairs_unit_test_resume',
+                                    stream             = True
+                                   )
+        except Exception as ex:
+            got_exception = True
+            
+        self.assertTrue(got_exception)
+        self.assertEqual(query_download.download_status, "FAILED")
+        self.assertFalse(os.path.isfile("/tmp/ibmpairs_unit_test_resume.zip.part"))
+        self.assertFalse(os.path.isfile("/tmp/ibmpairs_unit_test_resume.zip"))
+
+    @mock.patch('ibmpairs.constants.QUERY_DOWNLOAD_SEGMENT_SIZE', 256)
+    @mock.patch('ibmpairs.client.Client.async_get_to_file', 
+                side_effect=mocked_download_async_get_to_file
+               )
+    @mock.patch('ibmpairs.client.Client.async_get', 
+                side_effect=mocked_download_async_get
+               )
+    def test_download_stream_segmented(self, mock_get, mock_get_to_file):
+        self.logger.info('test_download_stream_segmented: success')
+        
+        c      = client.Client() 
+        query  = query_module.Query
+        
+        query_download = None
+        
+        got_exception = False
+        
+        try:
+            query_download = query.from_dict(query_dict_download_status_20_no_point_values)
+            query_download.id = '1625544000_31302646'
+            query_download.download(client             = c,
+                                    download_folder    = '/tmp',
+                                    download_file_name = 'ibmpairs_unit_test_segmented',
+                                    stream             = True,
+                                    segments           = 4
+                                   )
+        except Exception as ex:
+            got_exception = True
+            
+        self.assertFalse(got_exception)
+        
+        self.assertEqual(query_download.download_status, "SUCCEEDED")
+        self.assertEqual(mock_get_to_file.call_count, 5)
+        self.assertEqual(sorted([call.kwargs.get('offset') for call in mock_get_to_file.call_args_list])[:2], [0, 256])
+        with open("/tmp/ibmpairs_unit_test_segmented.zip", 'rb') as f:
+            with open('tests/data/v2/1625544000_31302646.zip', 'rb') as z:
+                self.assertEqual(f.read(), z.read())
+        
+        self.logger.info('removing \'/tmp/ibmpairs_unit_test_segmented.zip\'')
+        if os.path.isfile('/tmp/ibmpairs_unit_test_segmented.zip'):
+            os.remove('/tmp/ibmpairs_unit_test_segmented.zip')
+        self.logger.info('removing \'/tmp/ibmpairs_unit_test_segmented\'')
+        if os.path.exists('/tmp/ibmpairs_unit_test_segmented'):
+            shutil.rmtree('/tmp/ibmpairs_unit_test_segmented')
+
+    @mock.patch('ibmpairs.constants.QUERY_DOWNLOAD_RESUME_INTERVAL', 0)
+    @mock.patch('ibmpairs.constants.QUERY_DOWNLOAD_SEGMENT_SIZE', 256)
+    @mock.patch('ibmpairs.client.Client.async_get_to_file', 
+                side_effect=mocked_download_async_get_to_file_short_range
+               )
+    @mock.patch('ibmpairs.client.Client.async_get', 
+                side_effect=mocked_download_async_get
+               )
+    def test_download_stream_segmented_short_range(self, mock_get, mock_get_to_file):
+        self.logger.info('test_download_stream_segmented_short_range')
+        
+        global short_range_tracker
+        short_range_tracker = 0
+        
+        c      = client.Client() 
+        query  = query_module.Query
+        
+        query_download = None
+        
+        got_exception = False
+        
+        try:
+            query_download = query.from_dict(query_dict_download_status_20_no_point_values)
+            query_download.id = '1625544000_31302646'
+            query_download.download(client             = c,
+                                    download_folder    = '/tmp',
+                                    download_file_name = 'ibmpairs_unit_test_short_range',
+                                    stream             = True,
+                                    segments           = 4
+                                   )
+        except Exception as ex:
+            got_exception = True
+            
+        self.assertFalse(got_exception)
+        
+        # the short segment was rejected and downloaded again from its first byte
+        self.assertEqual(query_download.download_status, "SUCCEEDED")
+        self.assertGreater(mock_get_to_file.call_count, 5)
+        self.assertEqual(mock_get_to_file.call_args_list[5].kwargs.get('offset'), 256)
+        with open("/tmp/ibmpairs_unit_test_short_range.zip", 'rb') as f:
+            with open('tests/data/v2/1625544000_31302646.zip', 'rb') as z:
+                self.assertEqual(f.read(), z.read())
+        
+        self.logger.info('removing \'/tmp/ibmpairs_unit_test_short_range.zip\'')
+        if os.path.isfile('/tmp/ibmpairs_unit_test_short_range.zip'):
+            os.remove('/tmp/ibmpairs_unit_test_short_range.zip')
+        self.logger.info('removing \'/tmp/ibmpairs_unit_test_short_range\'')
+        if os.path.exists('/tmp/ibmpairs_unit_test_short_range'):
+            shutil.rmtree('/tmp/ibmpairs_unit_test_short_range')
+
+    @mock.patch('ibmpairs.client.Client.async_get_to_file', 
+                side_effect=mocked_download_async_get_to_file
+               )
+    @mock.patch('ibmpairs.client.Client.async_get', 
+                side_effect=mocked_download_async_get
+               )
+    def test_download_extract(self, mock_get, mock_get_to_file):
+        self.logger.info('test_download_extract: member filter')
+        
+        c      = client.Client() 
+        query  = query_module.Query
+        
+        query_download = None
+        
+        got_exception = False
+        
+        try:
+            query_download = query.from_dict(query_dict_download_status_20_no_point_values)
+            query_download.id = '1625544000_31302646'
+            query_download.download(client             = c,
+                                    download_folder    = '/tmp',
+                                    download_file_name = 'ibmpairs_unit_test_extract',
+                                    stream             = True,
+                                    members            = ['*.csv']
+                                   )
+        except Exception as ex:
+            got_exception = True
+            
+        self.assertFalse(got_exception)
+        
+        self.assertEqual(query_download.download_status, "SUCCEEDED")
+        self.assertEqual(os.listdir('/tmp/ibmpairs_unit_test_extract'), ['Vector_Data_Output.csv'])
+        
+        shutil.rmtree('/tmp/ibmpairs_unit_test_extract')
+        os.remove('/tmp/ibmpairs_unit_test_extract.zip')
+        
+        self.logger.info('test_download_extract: lazy')
+        
+        got_exception = False
+        
+        try:
+            query_download = query.from_dict(query_dict_download_status_20_no_point_values)
+            query_download.id = '1625544000_31302646'
+            query_download.download(client             = c,
+                                    download_folder    = '/tmp',
+                                    download_file_name = 'ibmpairs_unit_test_extract',
+                                    stream             = True,
+                                    extract            = 'lazy'
+                                   )
+        except Exception as ex:
+            got_exception = True
+            
+        self.assertFalse(got_exception)
+        
+        self.assertEqual(query_download.download_status, "SUCCEEDED")
+        self.assertFalse(os.path.exists('/tmp/ibmpairs_unit_test_extract'))
+        self.assertEqual(sorted(query_download.list_members()), ['STATUS', 'Vector_Data_Output.csv'])
+        with query_download.open_member('Vector_Data_Output.csv') as f:
+            with zipfile.ZipFile('tests/data/v2/1625544000_31302646.zip') as z:
+                self.assertEqual(f.read(), z.read('Vector_Data_Output.csv'))
+        self.assertEqual(query_download.extract_members(['STATUS']), ['/tmp/ibmpairs_unit_test_extract/STATUS'])
+        self.assertEqual(os.listdir('/tmp/ibmpairs_unit_test_extract'), ['STATUS'])
+        
+        shutil.rmtree('/tmp/ibmpairs_unit_test_extract')
+        os.remove('/tmp/ibmpairs_unit_test_extract.zip')
+        
+        self.logger.info('test_download_extract: layer id, parallel')
+        
+        shutil.copyfile('tests/data/v1/12_07_2018T18_39_36-1544202000_23976938.zip', '/tmp/ibmpairs_unit_test_extract.zip')
+        
+        with mock.patch('ibmpairs.constants.QUERY_DOWNLOAD_EXTRACT_LARGE', 0):
+            files = query_download.extract_members(['92', 'output.info'])
+        
+        self.assertEqual(sorted([os.path.basename(f) for f in files]), ['Daily US weather (PRISM)-Daily Maximum Temperature-10_31_2018T12_00_00.tiff', 
+                                                                        'Daily US weather (PRISM)-Daily Maximum Temperature-10_31_2018T12_00_00.tiff.json', 
+                                                                        'output.info'])
+        self.assertTrue(all(os.path.isfile(f) for f in files))
+        
+        shutil.rmtree('/tmp/ibmpairs_unit_test_extract')
+        os.remove('/tmp/ibmpairs_unit_test_extract.zip')
+        
+        self.logger.info('test_download_extract: invalid option')
+        
+        got_exception = False
+        
+        try:
+            query_download.download(client  = c,
+                                    extract = 'none'
+                                   )
+        except Exception as ex:
+            got_exception = True
+            
+        self.assertTrue(got_exception)
+
     @mock.patch('ibmpairs.client.Client.async_get', 
                 side_effect=mocked_download_async_get
                )
@@ -5926,6 +6646,178 @@ class QueryUnitTest(unittest.TestCase):
         if os.path.exists(os.path.join(os.getcwd(), 'download/1625544000_31302646')):
             shutil.rmtree(os.path.join(os.getcwd(), 'download/1625544000_31302646'))
 
+
+    @mock.patch('ibmpairs.client.Client.async_get', 
+                side_effect=mocked_download_async_get
+               )
+    @mock.patch('ibmpairs.client.Client.async_post', 
+                side_effect=mocked_submit_async_post
+               )
+    def test_batch_query(self, mock_post, mock_get):
+        self.logger.info('test_batch_query')
+        
+        c      = client.Client() 
+        query  = query_module.Query
+        
+        self.logger.info('test_batch_query: more queries in flight than workers')
+        
+        queries = []
+        for i in range(12):
+            q = query.from_dict(query_dict)
+            q.name               = "1625544000_31302646"
+            q.spatial.type       = "square"
+            q.download_folder    = "/tmp"
+            q.download_file_name = "ibmpairs_unit_test_batch_" + str(i)
+            queries.append(q)
+        
+        got_exception = False
+        
+        try:
+            result = query_module.batch_query(queries          = queries,
+                                              client           = c,
+                                              status_interval  = 15,
+                                              submit_workers   = 2,
+                                              download_workers = 3
+                                             )
+        except Exception as ex:
+            got_exception = True
+            
+        self.assertFalse(got_exception)
+        self.assertEqual(len(result), 12)
+        self.assertEqual([q.download_status for q in result], ["SUCCEEDED"] * 12)
+        self.assertEqual(mock_post.call_count, 12)
+        
+        for i in range(12):
+            if os.path.isfile('/tmp/ibmpairs_unit_test_batch_' + str(i) + '.zip'):
+                os.remove('/tmp/ibmpairs_unit_test_batch_' + str(i) + '.zip')
+            if os.path.exists('/tmp/ibmpairs_unit_test_batch_' + str(i)):
+                shutil.rmtree('/tmp/ibmpairs_unit_test_batch_' + str(i))
+        
+        self.logger.info('test_batch_query: stage workers above the maximum')
+        
+        got_exception = False
+        
+        try:
+            query_module.batch_query(queries         = queries,
+                                     client          = c,
+                                     status_interval = 15,
+                                     submit_workers  = 9
+                                    )
+        except Exception as ex:
+            got_exception = True
+            
+        self.assertTrue(got_exception)
+        
+        self.logger.info('test_batch_query: invalid choice')
+        
+        got_exception = False
+        
+        try:
+            query_module.batch_query(queries         = queries,
+                                     client          = c,
+                                     status_interval = 15,
+                                     status          = False,
+                                     download        = False
+                                    )
+        except Exception as ex:
+            got_exception = True
+            
+        self.assertTrue(got_exception)
+    
+    @mock.patch('ibmpairs.client.Client.async_get', 
+                side_effect=mocked_download_async_get
+               )
+    @mock.patch('ibmpairs.client.Client.async_post', 
+                side_effect=mocked_submit_async_post
+               )
+    def test_iter_batch_query(self, mock_post, mock_get):
+        self.logger.info('test_iter_batch_query')
+        
+        c      = client.Client() 
+        query  = query_module.Query
+        
+        self.logger.info('test_iter_batch_query: results with a failure')
+        
+        queries = []
+        for i in range(4):
+            q = query.from_dict(query_dict)
+            q.name               = "1625544000_31302646"
+            q.spatial.type       = "square"
+            q.download_folder    = "/tmp"
+            q.download_file_name = "ibmpairs_unit_test_iter_" + str(i)
+            queries.append(q)
+        
+        # A download folder below a file cannot be created.
+        queries[2].download_folder = "/dev/null/ibmpairs_unit_test_iter"
+        
+        got_exception = False
+        
+        try:
+            results = list(query_module.iter_batch_query(queries          = queries,
+                                                         client           = c,
+                                                         status_interval  = 15,
+                                                         submit_workers   = 2,
+                                                         download_workers = 2
+                                                        ))
+        except Exception as ex:
+            got_exception = True
+            
+        self.assertFalse(got_exception)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(set(id(q) for q, error in results), set(id(q) for q in queries))
+        for q, error in results:
+            if q is queries[2]:
+                self.assertIsNotNone(error)
+            else:
+                self.assertIsNone(error)
+                self.assertEqual(q.download_status, "SUCCEEDED")
+        
+        self.logger.info('test_iter_batch_query: closed early')
+        
+        iterator = query_module.iter_batch_query(queries         = queries[:2],
+                                                 client          = c,
+                                                 status_interval = 15
+                                                )
+        with mock.patch('ibmpairs.query.QueryStatusPoller.aclose', autospec = True, side_effect = query_module.QueryStatusPoller.aclose) as poller_aclose:
+            q, error = next(iterator)
+            iterator.close()
+        self.assertIn(q, queries[:2])
+        self.assertEqual(poller_aclose.call_count, 1)
+        
+        for i in range(4):
+            if os.path.isfile('/tmp/ibmpairs_unit_test_iter_' + str(i) + '.zip'):
+                os.remove('/tmp/ibmpairs_unit_test_iter_' + str(i) + '.zip')
+            if os.path.exists('/tmp/ibmpairs_unit_test_iter_' + str(i)):
+                shutil.rmtree('/tmp/ibmpairs_unit_test_iter_' + str(i))
+        
+        self.logger.info('test_iter_batch_query: async generator')
+        
+        async def collect():
+            return [result async for result in query_module.async_iter_batch_query(queries         = queries[:1],
+                                                                                   client          = c,
+                                                                                   status_interval = 15,
+                                                                                   download        = False
+                                                                                  )]
+        
+        results = asyncio.run(collect())
+        self.assertEqual(len(results), 1)
+        self.assertIsNone(results[0][1])
+        
+        self.logger.info('test_iter_batch_query: invalid choice')
+        
+        got_exception = False
+        
+        try:
+            list(query_module.iter_batch_query(queries         = queries,
+                                               client          = c,
+                                               status_interval = 15,
+                                               status          = False,
+                                               download        = False
+                                              ))
+        except Exception as ex:
+            got_exception = True
+            
+        self.assertTrue(got_exception)
     
     @mock.patch('ibmpairs.client.Client.async_get', 
                 side_effect=mocked_download_async_get
@@ -6102,6 +6994,86 @@ class QueryUnitTest(unittest.TestCase):
         self.assertEqual(query_merge_success.merge_status, "SUCCEEDED")
     
     #
+    @unittest.skipIf(
+        not query_module.HAS_RASTERIO,
+        "rasterio is not installed."
+    )
+    def test_raster_layers(self):
+        self.logger.info('test_raster_layers')
+        
+        c      = client.Client() 
+        query  = query_module.Query
+        
+        folder = tempfile.mkdtemp()
+        shutil.copy(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'v1', '12_07_2018T18_39_36-1544202000_23976938.zip'),
+                    os.path.join(folder, 'ibmpairs_unit_test_raster.zip'))
+        
+        query_raster = query.from_dict(query_dict)
+        query_raster.download_folder    = folder + '/'
+        query_raster.download_file_name = 'ibmpairs_unit_test_raster'
+        
+        try:
+            self.logger.info('test_raster_layers: from the zip')
+            
+            raster_layers = query_raster.raster_layers()
+            
+            self.assertEqual(list(raster_layers.keys()), ['Daily US weather (PRISM)-Daily Maximum Temperature-10_31_2018T12_00_00'])
+            
+            with list(raster_layers.values())[0] as raster_layer:
+                self.assertTrue(raster_layer.path.startswith('zip://'))
+                self.assertEqual(raster_layer.shape, (32, 32))
+                self.assertEqual(raster_layer.dtype, np.float32)
+                
+                band = raster_layer.read()
+                
+                self.assertEqual(band.dtype, np.float32)
+                self.assertTrue(np.array_equal(raster_layer[2:5, 1:4], band[2:5, 1:4]))
+                self.assertTrue(np.array_equal(raster_layer[::-2, 3], band[::-2, 3]))
+                self.assertTrue(np.array_equal(raster_layer[-1], band[-1]))
+                self.assertEqual(sum(block.size for window, block in raster_layer.blocks()), band.size)
+            
+            self.logger.info('test_raster_layers: unzipped')
+            
+            query_raster.extract_members(['*.tiff'])
+            raster_layer = list(query_raster.raster_layers().values())[0]
+            
+            self.assertFalse(raster_layer.path.startswith('zip://'))
+            self.assertTrue(np.array_equal(raster_layer[0:8, 0:8], band[0:8, 0:8]))
+            raster_layer.close()
+        finally:
+            shutil.rmtree(folder)
+        
+    @unittest.skipIf(
+        not common.HAS_PYARROW,
+        "pyarrow is not installed."
+    )
+    def test_point_data_to_parquet(self):
+        self.logger.info('test_point_data_to_parquet')
+        
+        import pyarrow.dataset
+        
+        c      = client.Client() 
+        query  = query_module.Query
+        
+        queries = []
+        for layer_id in [16100, 16101]:
+            q = query.from_dict(query_dict)
+            q.submit_response.data = "layerId,timestamp,longitude,latitude,value\n" + str(layer_id) + ",1421528400000,139.7,35.7,273.9"
+            queries.append(q)
+        
+        self.assertEqual(queries[0].point_data_as_arrow().num_rows, 1)
+        
+        path = tempfile.mkdtemp()
+        
+        try:
+            queries[0].point_data_to_parquet(path)
+            query_module.point_data_to_parquet(queries + [query.from_dict(query_dict)], path)
+            
+            self.assertTrue(os.path.isdir(os.path.join(path, "layer_id=16101", "date=2015-01-17")))
+            self.assertEqual(pyarrow.dataset.dataset(path, partitioning = "hive").count_rows(), 3)
+        finally:
+            shutil.rmtree(path)
+        
     def test_point_data_as_dataframe_csv(self):
         self.logger.info('test_point_data_as_dataframe_csv')
         
@@ -6137,6 +7109,12 @@ class QueryUnitTest(unittest.TestCase):
         
         self.logger.info('test_point_query_online_intransparent_batch: 200')
         
+        # online point queries are downloaded on submit to the relative default folder
+        download_folder = tempfile.TemporaryDirectory()
+        self.addCleanup(download_folder.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(download_folder.name)
+        
         c      = client.Client() 
         query  = query_module.Query
         